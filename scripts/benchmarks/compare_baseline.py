@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""Compare a pytest-benchmark run against the committed machine-tagged baseline.
+
+Reads the ``--benchmark-json`` output of a run, finds the saved baselines for
+the same machine tag under ``--storage`` (pytest-benchmark's
+``<storage>/<system>-<implementation>-<major.minor>-<bits>bit/NNNN_<name>.json``
+layout, e.g. ``tests/performance/baselines/Linux-CPython-3.11-64bit/``) and
+prints a markdown table of median changes. For each benchmark the newest
+saved run that contains it is the baseline.
+
+A benchmark whose median grew by more than ``--threshold`` percent (default
+10) is flagged as a regression and the script exits 1; benchmarks without a
+baseline are reported as new and never fail the comparison. Fully offline:
+it only reads JSON files.
+
+Usage::
+
+    uv run python scripts/benchmarks/compare_baseline.py out/benchmarks.json \\
+        [--storage tests/performance/baselines] [--threshold 10] [--output report.md]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+DEFAULT_STORAGE = Path("tests/performance/baselines")
+DEFAULT_THRESHOLD_PCT = 10.0
+
+
+@dataclass(frozen=True)
+class Comparison:
+    """Median of one benchmark in the current run against its baseline."""
+
+    fullname: str
+    group: str | None
+    current_median: float
+    baseline_median: float | None
+    baseline_source: str | None
+
+    @property
+    def change_pct(self) -> float | None:
+        if not self.baseline_median:
+            return None
+        return (self.current_median - self.baseline_median) / self.baseline_median * 100.0
+
+    def is_regression(self, threshold_pct: float) -> bool:
+        change = self.change_pct
+        return change is not None and change > threshold_pct
+
+
+def machine_tag(machine_info: dict[str, Any]) -> str:
+    """Return pytest-benchmark's storage directory name for *machine_info*."""
+    version = ".".join(str(machine_info["python_version"]).split(".")[:2])
+    bits = machine_info.get("cpu", {}).get("bits", 64)
+    return f"{machine_info['system']}-{machine_info['python_implementation']}-{version}-{bits}bit"
+
+
+def load_baselines(tag_dir: Path) -> dict[str, tuple[float, str]]:
+    """Map each benchmark fullname to ``(median, saved run file)`` from the newest run holding it."""
+    baselines: dict[str, tuple[float, str]] = {}
+    if not tag_dir.is_dir():
+        return baselines
+    for saved in sorted(tag_dir.glob("*.json")):
+        try:
+            document = json.loads(saved.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            continue
+        for bench in document.get("benchmarks", []):
+            baselines[bench["fullname"]] = (float(bench["stats"]["median"]), saved.name)
+    return baselines
+
+
+def compare(current: dict[str, Any], baselines: dict[str, tuple[float, str]]) -> list[Comparison]:
+    """Pair every benchmark of the *current* run with its baseline median."""
+    rows: list[Comparison] = []
+    for bench in current.get("benchmarks", []):
+        baseline = baselines.get(bench["fullname"])
+        rows.append(
+            Comparison(
+                fullname=bench["fullname"],
+                group=bench.get("group"),
+                current_median=float(bench["stats"]["median"]),
+                baseline_median=baseline[0] if baseline else None,
+                baseline_source=baseline[1] if baseline else None,
+            )
+        )
+    return sorted(rows, key=lambda row: (row.group or "", row.fullname))
+
+
+def _ms(seconds: float | None) -> str:
+    return "-" if seconds is None else f"{seconds * 1000:.3f}"
+
+
+def render_report(rows: list[Comparison], *, tag: str, threshold_pct: float) -> str:
+    """Return the markdown comparison report."""
+    regressions = [row for row in rows if row.is_regression(threshold_pct)]
+    lines = [
+        f"## Benchmark comparison ({tag})",
+        "",
+        f"{len(rows)} benchmarks, {len(regressions)} regressed by more than {threshold_pct:g}% (median).",
+        "",
+        "| Status | Group | Benchmark | Baseline median (ms) | Current median (ms) | Change |",
+        "| --- | --- | --- | ---: | ---: | ---: |",
+    ]
+    for row in rows:
+        change = row.change_pct
+        if change is None:
+            status = "new"
+        elif row.is_regression(threshold_pct):
+            status = "REGRESSION"
+        elif change < -threshold_pct:
+            status = "improved"
+        else:
+            status = "ok"
+        change_text = "-" if change is None else f"{change:+.1f}%"
+        name = row.fullname.rsplit("::", 1)[-1]
+        lines.append(f"| {status} | {row.group or '-'} | `{name}` | {_ms(row.baseline_median)} | {_ms(row.current_median)} | {change_text} |")
+    return "\n".join(lines) + "\n"
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Compare a pytest-benchmark JSON run against the committed baseline.")
+    parser.add_argument("current", type=Path, help="--benchmark-json output of the run to check.")
+    parser.add_argument("--storage", type=Path, default=DEFAULT_STORAGE, help=f"Baseline storage root (default: {DEFAULT_STORAGE}).")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD_PCT,
+        help=f"Median regression, in percent, that fails the comparison (default: {DEFAULT_THRESHOLD_PCT:g}).",
+    )
+    parser.add_argument("--output", type=Path, help="Also append the markdown report to this file (e.g. $GITHUB_STEP_SUMMARY).")
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Entry point; returns a process exit code."""
+    args = build_arg_parser().parse_args(argv)
+    current = json.loads(args.current.read_text(encoding="utf-8"))
+    tag = machine_tag(current["machine_info"])
+    rows = compare(current, load_baselines(args.storage / tag))
+    report = render_report(rows, tag=tag, threshold_pct=args.threshold)
+    print(report, end="")
+    if args.output is not None:
+        with args.output.open("a", encoding="utf-8") as handle:
+            handle.write(report)
+    return 1 if any(row.is_regression(args.threshold) for row in rows) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,281 @@
+"""Content-addressed cache for compiled charters.
+
+:func:`charter.compiler.compile_charter` rebuilds the compiled charter from
+scratch -- config-activated roots, DRG reference resolution, YAML asset
+indexing, template references and markdown rendering -- which takes seconds
+on a real doctrine tree. Its output is a pure function of a small set of
+inputs, so :func:`compile_charter_cached` keys it by one hash over all of
+them (see :func:`compile_inputs_manifest`):
+
+* the installed spec-kitty version and this cache's schema version;
+* mission, template set and the interview answers;
+* ``.kittify/config.yaml`` and the AUTHORED sections of ``charter.yaml``
+  (the derived ``catalog``/``metadata`` sections are what compilation
+  writes, so they would otherwise invalidate every entry they produce; the
+  one derived value compilation reads back, the active language set, is
+  keyed separately);
+* the content of every doctrine tree compilation reads: the built-in
+  doctrine package, the built-in packs, the project doctrine root and each
+  configured org pack root.
+
+File location (runtime state, gitignored via ``.kittify/runtime/``)::
+
+    {canonical_root}/.kittify/runtime/charter-compile/{inputs_hash}.json
+
+Entries live under the canonical (main-checkout) root, so worktrees of one
+repository share them: a charter with unchanged inputs is compiled once,
+not once per worktree. The cache is advisory in the same way as the dossier
+hash cache -- a missing, corrupt or version-mismatched entry is a miss and a
+write failure is logged and swallowed -- so the compiled charter is identical
+with or without it. Python code is not hashed; a code change is covered by
+the version component.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from collections.abc import Callable, Mapping
+from dataclasses import asdict
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from charter import compiler
+from charter._doctrine_paths import resolve_project_root
+from charter.catalog import resolve_doctrine_root
+from charter.compiler import CharterReference, CompiledCharter
+from charter.interview import CharterInterview
+from charter.language_scope import infer_repo_languages
+from kernel.atomic import atomic_write
+from kernel.paths import get_built_in_pack_root
+
+__all__ = [
+    "compile_charter_cached",
+    "doctrine_inputs",
+    "file_digest",
+    "hash_inputs",
+    "prune_oldest",
+    "spec_kitty_version",
+    "tree_digest",
+]
+
+logger = logging.getLogger(__name__)
+
+CHARTER_COMPILE_CACHE_DIR = "charter-compile"
+
+# Bump when the shape or meaning of a cache entry (or of the key) changes.
+CHARTER_COMPILE_CACHE_SCHEMA_VERSION = 1
+
+# Distinct input sets kept per repository; older entries are pruned on write.
+_MAX_ENTRIES = 16
+
+# ``charter.yaml`` sections written by ``write_compiled_charter``.
+_DERIVED_SECTIONS = frozenset({"catalog", "metadata"})
+
+_SKIPPED_DIRS = frozenset({"__pycache__", ".git"})
+_SKIPPED_SUFFIXES = (".py", ".pyc")
+
+_SafeLoader: type[yaml.SafeLoader] = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _sha256() -> Any:
+    return hashlib.sha256()  # noqa: TID251 - production raw SHA-256 owner (compile-cache content key, non-security)
+
+
+def spec_kitty_version() -> str:
+    try:
+        return version("spec-kitty-cli")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def file_digest(path: Path) -> str:
+    try:
+        data = path.read_bytes()
+    except OSError:
+        return "absent"
+    digest = _sha256()
+    digest.update(data)
+    return str(digest.hexdigest())
+
+
+def tree_digest(root: Path | None) -> str:
+    """Digest of every non-Python file under *root*, by relative path."""
+    if root is None or not root.is_dir():
+        return "absent"
+    digest = _sha256()
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(name for name in dirnames if name not in _SKIPPED_DIRS)
+        for name in sorted(filenames):
+            if name.endswith(_SKIPPED_SUFFIXES):
+                continue
+            path = Path(dirpath) / name
+            try:
+                data = path.read_bytes()
+            except OSError:
+                continue
+            digest.update(f"{path.relative_to(root).as_posix()}\0{len(data)}\0".encode())
+            digest.update(data)
+    return str(digest.hexdigest())
+
+
+def _authored_charter_digest(path: Path) -> str:
+    """Digest of ``charter.yaml`` without the sections compilation writes."""
+    try:
+        text = path.read_text(encoding="utf-8")
+    except OSError:
+        return "absent"
+    try:
+        document = yaml.load(text, Loader=_SafeLoader)  # noqa: S506 - safe loader (CSafeLoader/SafeLoader)
+    except yaml.YAMLError:
+        return file_digest(path)
+    if isinstance(document, dict):
+        document = {key: value for key, value in document.items() if key not in _DERIVED_SECTIONS}
+    digest = _sha256()
+    digest.update(json.dumps(document, sort_keys=True, default=str).encode("utf-8"))
+    return str(digest.hexdigest())
+
+
+def _org_roots(repo_root: Path) -> list[Path]:
+    from doctrine.drg.org_pack_config import resolve_existing_org_roots
+
+    try:
+        return resolve_existing_org_roots(repo_root)
+    except Exception as exc:  # noqa: BLE001 - an unreadable config fails compilation itself, not the key
+        logger.debug("Could not resolve org pack roots for the compile cache key: %s", exc)
+        return []
+
+
+def compile_inputs_manifest(
+    repo_root: Path,
+    *,
+    mission: str,
+    interview: CharterInterview,
+    template_set: str | None = None,
+) -> dict[str, Any]:
+    """Return every input :func:`charter.compiler.compile_charter` depends on.
+
+    Files and trees are reduced to digests; the result is JSON-serialisable
+    and stored next to each cache entry for diagnostics.
+    """
+    return {
+        "schema_version": CHARTER_COMPILE_CACHE_SCHEMA_VERSION,
+        "spec_kitty_version": spec_kitty_version(),
+        "mission": mission,
+        "template_set": template_set,
+        "interview": interview.to_dict(),
+        "active_languages": infer_repo_languages(repo_root, interview=interview),
+        "charter_yaml": _authored_charter_digest(repo_root / ".kittify" / "charter" / "charter.yaml"),
+        **doctrine_inputs(repo_root),
+    }
+
+
+def doctrine_inputs(repo_root: Path) -> dict[str, Any]:
+    """Digest ``config.yaml`` and every doctrine tree the DRG is merged from.
+
+    Shared with :mod:`charter.context_memo`, which keys rendered context by
+    the same DRG inputs.
+    """
+    return {
+        "config": file_digest(repo_root / ".kittify" / "config.yaml"),
+        "built_in_doctrine": tree_digest(resolve_doctrine_root()),
+        "built_in_packs": tree_digest(get_built_in_pack_root()),
+        "project_doctrine": tree_digest(resolve_project_root(repo_root)),
+        "org_packs": [tree_digest(root) for root in _org_roots(repo_root)],
+    }
+
+
+def hash_inputs(manifest: Mapping[str, Any]) -> str:
+    """Return the content address of *manifest* (any JSON-serialisable mapping)."""
+    digest = _sha256()
+    digest.update(json.dumps(manifest, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8"))
+    return f"sha256:{digest.hexdigest()}"
+
+
+def _cache_dir(repo_root: Path) -> Path:
+    from charter.resolution import resolve_canonical_repo_root
+
+    root: Path
+    try:
+        root = resolve_canonical_repo_root(repo_root)
+    except Exception:  # noqa: BLE001 - outside a git checkout the cache is per-directory
+        root = repo_root
+    return root / ".kittify" / "runtime" / CHARTER_COMPILE_CACHE_DIR
+
+
+def _entry_path(cache_dir: Path, inputs_hash: str) -> Path:
+    return cache_dir / f"{inputs_hash.removeprefix('sha256:')}.json"
+
+
+def _load_entry(path: Path, inputs_hash: str) -> CompiledCharter | None:
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+        if payload.get("schema_version") != CHARTER_COMPILE_CACHE_SCHEMA_VERSION or payload.get("inputs_hash") != inputs_hash:
+            return None
+        data = dict(payload["compiled"])
+        data["references"] = [CharterReference(**reference) for reference in data["references"]]
+        return CompiledCharter(**data)
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None
+
+
+def _store_entry(cache_dir: Path, inputs_hash: str, manifest: dict[str, Any], compiled: CompiledCharter) -> None:
+    payload = {
+        "schema_version": CHARTER_COMPILE_CACHE_SCHEMA_VERSION,
+        "inputs_hash": inputs_hash,
+        "inputs": manifest,
+        "compiled": asdict(compiled),
+    }
+    try:
+        atomic_write(_entry_path(cache_dir, inputs_hash), json.dumps(payload, sort_keys=True), mkdir=True)
+        prune_oldest(cache_dir, keep=_MAX_ENTRIES)
+    except OSError as exc:
+        logger.warning("Could not persist the compiled charter cache entry: %s", exc)
+
+
+def prune_oldest(directory: Path, *, keep: int) -> None:
+    """Delete all but the *keep* most recently written entries in *directory*."""
+    by_age = sorted(directory.glob("*.json"), key=lambda path: path.stat().st_mtime_ns, reverse=True)
+    for stale in by_age[keep:]:
+        stale.unlink(missing_ok=True)
+
+
+def compile_charter_cached(
+    *,
+    repo_root: Path,
+    mission: str,
+    interview: CharterInterview,
+    template_set: str | None = None,
+    doctrine_service_factory: Callable[[Path], Any],
+    pack_context_factory: Callable[[Path], Any],
+) -> CompiledCharter:
+    """Return the compiled charter for the current inputs, compiling on a miss.
+
+    The doctrine service and pack context are built through the factories
+    only when a compilation actually runs. Compilation goes through
+    ``charter.compiler.compile_charter`` looked up at call time, so patches
+    of that name apply here too.
+    """
+    manifest = compile_inputs_manifest(repo_root, mission=mission, interview=interview, template_set=template_set)
+    inputs_hash = hash_inputs(manifest)
+    cache_dir = _cache_dir(repo_root)
+    cached = _load_entry(_entry_path(cache_dir, inputs_hash), inputs_hash)
+    if cached is not None:
+        logger.debug("Compiled charter cache hit (%s)", inputs_hash)
+        return cached
+
+    compiled = compiler.compile_charter(
+        mission=mission,
+        interview=interview,
+        template_set=template_set,
+        repo_root=repo_root,
+        doctrine_service=doctrine_service_factory(repo_root),
+        pack_context=pack_context_factory(repo_root),
+    )
+    _store_entry(cache_dir, inputs_hash, manifest, compiled)
+    return compiled
@@ -31,6 +31,13 @@ from charter.action_doctrine_bundle import (
 from charter.bundle import CHARTER_MD, CHARTER_YAML
 from charter.charter_md_parsing import _extract_policy_summary as _extract_policy_summary
 from charter.context_contract import CONTEXT_SCHEMA_VERSION as CONTEXT_SCHEMA_VERSION
+from charter.context_memo import (
+    BRANCH_BOOTSTRAP,
+    BRANCH_COMPACT,
+    BRANCH_MISSING,
+    BRANCH_NON_BOOTSTRAP,
+    ContextMemo,
+)
 from charter.context_json import (
     _EMPTY_ORG_CHARTER as _EMPTY_ORG_CHARTER,
     _bundle_root_for_json as _bundle_root_for_json,
@@ -216,6 +223,26 @@ def build_charter_context(
     # MEDIUM-2: honour the scope kwarg by overriding repo_root when provided.
     if scope is not None:
         repo_root = scope.root
+    normalized = action.strip().lower()
+    state_bundle = _prepare_context_state(repo_root, normalized, depth)
+
+    # Everything below is a pure function of the memo key (see
+    # ``charter.context_memo``), so a hit skips it; only the first-load
+    # bookkeeping in ``replay`` runs on every call.
+    memo = ContextMemo.open(
+        repo_root,
+        action=normalized,
+        profile=profile,
+        effective_depth=state_bundle.effective_depth,
+        org_root=org_root,
+        mission_type=mission_type,
+        feature_dir=feature_dir,
+        suppress_project_resolver=suppress_project_resolver,
+    )
+    memoized = memo.replay(state_bundle, depth=depth, mark_loaded=mark_loaded)
+    if memoized is not None:
+        return memoized
+
     profile_record = _load_agent_profile(profile, repo_root) if profile else None
 
     # WP06 / FR-015 — surface a loud diagnostic when the consumer's
@@ -230,7 +257,6 @@ def build_charter_context(
     sync_result = ensure_charter_bundle_fresh(repo_root)
     canonical_root = sync_result.canonical_root if sync_result and sync_result.canonical_root else repo_root
 
-    normalized = action.strip().lower()
     # FR-005 (charter-pack-usage-journey WP03): the presence gate below is
     # authoritative on ``charter.yaml`` (``bundle.CHARTER_YAML``) -- a
     # charter.yaml-only project (charter.md deleted, SC-002) must still
@@ -283,8 +309,6 @@ def build_charter_context(
             return missing_pack_diagnostic + "\n\n" + text
         return text
 
-    state_bundle = _prepare_context_state(repo_root, normalized, depth)
-
     # WP11 (T060/B-3) — compute the bundle BEFORE the depth-tier branch so it
     # is delivered on EVERY load; the old order returned compact before it existed.
     # FR-001/FR-004 (rc3-charter-gate-predicate-inversion WP02, #3596): the
@@ -318,13 +342,16 @@ def build_charter_context(
     if normalized not in BOOTSTRAP_ACTIONS and not _action_node_declared(
         doctrine_bundle, normalized
     ):
-        return _non_bootstrap_context_result(
-            repo_root,
-            normalized,
-            depth,
-            profile_record,
-            suppress_project_resolver=suppress_project_resolver,
-            augment=_augment,
+        return memo.record(
+            BRANCH_NON_BOOTSTRAP,
+            _non_bootstrap_context_result(
+                repo_root,
+                normalized,
+                depth,
+                profile_record,
+                suppress_project_resolver=suppress_project_resolver,
+                augment=_augment,
+            ),
         )
 
     # From here the action WILL deliver grain (fast-path or a declared node),
@@ -332,31 +359,37 @@ def build_charter_context(
     # for bootstrap actions (this is a NEW dependency for a declared
     # non-fast-path action, since it now reaches the same rendering path).
     if not charter_yaml_path.exists() and not charter_path.exists():
-        return _missing_charter_context_result(normalized, state_bundle, augment=_augment)
+        return memo.record(BRANCH_MISSING, _missing_charter_context_result(normalized, state_bundle, augment=_augment))
 
     if state_bundle.effective_depth < _MIN_EFFECTIVE_DEPTH:
         # Steady-state load: deliver via the widened compact rail (T061/FR-010).
-        return _compact_bundle_context_result(
+        return memo.record(
+            BRANCH_COMPACT,
+            _compact_bundle_context_result(
+                repo_root,
+                normalized,
+                state_bundle,
+                profile_record,
+                doctrine_bundle,
+                suppress_project_resolver=suppress_project_resolver,
+                mark_loaded=mark_loaded,
+                augment=_augment,
+            ),
+        )
+
+    return memo.record(
+        BRANCH_BOOTSTRAP,
+        _bootstrap_context_result(
             repo_root,
             normalized,
+            charter_path,
+            canonical_root,
             state_bundle,
-            profile_record,
             doctrine_bundle,
-            suppress_project_resolver=suppress_project_resolver,
+            profile_record,
             mark_loaded=mark_loaded,
             augment=_augment,
-        )
-
-    return _bootstrap_context_result(
-        repo_root,
-        normalized,
-        charter_path,
-        canonical_root,
-        state_bundle,
-        doctrine_bundle,
-        profile_record,
-        mark_loaded=mark_loaded,
-        augment=_augment,
+        ),
     )
 
 
@@ -0,0 +1,232 @@
+"""On-disk memo of rendered charter context (``build_charter_context``).
+
+Every action prompt renders charter context, and each render re-parses the
+DRG, the doctrine repositories, the agent profiles and ``charter.yaml`` --
+seconds of YAML parsing to produce text that only changes when the charter
+or the doctrine does. :class:`ContextMemo` stores the rendered result keyed
+by:
+
+* the call parameters: action, agent profile, resolved mission type,
+  effective depth, org-root override and ``suppress_project_resolver``;
+* the compiled-charter hash: ``charter.yaml`` and ``charter.md`` under the
+  project and canonical roots;
+* the DRG hash: ``config.yaml`` and every doctrine tree the graph is merged
+  from (:func:`charter.compile_cache.doctrine_inputs`);
+* the spec-kitty version.
+
+Only first-load bookkeeping stays per call: ``context-state.json`` is still
+read to pick the effective depth, and a replayed result gets its
+``first_load``/``depth`` from it and is recorded via ``mark_loaded`` exactly
+as a fresh render would be.
+
+File location (runtime state, gitignored via ``.kittify/runtime/``)::
+
+    {repo_root}/.kittify/runtime/charter-context/{key}.json
+
+The memo is advisory in the same way as the compiled-charter cache: a
+missing, corrupt or version-mismatched entry is a miss and a write failure
+is logged and swallowed. Since every input is part of the key, an edited
+overlay is a different key, never a stale hit -- unlike a process-wide graph
+cache, which the action-gate ADR rules out for exactly that reason.
+
+:func:`warm_context_memo` fills the memo for a mission type ahead of time;
+``charter generate`` runs it in a detached process after compiling.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from charter.compile_cache import doctrine_inputs, file_digest, hash_inputs, prune_oldest, spec_kitty_version, tree_digest
+from charter.context_result_builders import CharterContextResult
+from charter.context_state import _mark_action_loaded
+from kernel.atomic import atomic_write
+
+if TYPE_CHECKING:
+    from charter.context_state import _ContextStateBundle
+
+__all__ = ["ContextMemo"]
+
+# ``warm_context_memo`` is invoked from a detached ``python -c`` process
+# spawned by ``charter generate``, which the static dead-code gate cannot
+# trace -- kept importable but not exported.
+
+logger = logging.getLogger(__name__)
+
+CHARTER_CONTEXT_MEMO_DIR = "charter-context"
+
+# Bump when the shape or meaning of a memo entry (or of the key) changes.
+CHARTER_CONTEXT_MEMO_SCHEMA_VERSION = 1
+
+# Rendered results kept per project; older entries are pruned on write.
+_MAX_ENTRIES = 256
+
+# The four result builders of ``build_charter_context``. They differ in how
+# ``first_load``/``depth`` are derived and whether the action is marked loaded.
+BRANCH_NON_BOOTSTRAP = "non_bootstrap"
+BRANCH_MISSING = "missing"
+BRANCH_COMPACT = "compact"
+BRANCH_BOOTSTRAP = "bootstrap"
+_BRANCHES = frozenset({BRANCH_NON_BOOTSTRAP, BRANCH_MISSING, BRANCH_COMPACT, BRANCH_BOOTSTRAP})
+_MARKING_BRANCHES = frozenset({BRANCH_COMPACT, BRANCH_BOOTSTRAP})
+
+# Effective depths a prompt render resolves to: steady state and first load.
+_WARM_DEPTHS = (1, 2)
+
+
+def _charter_digests(*roots: Path) -> list[str]:
+    digests: list[str] = []
+    for root in dict.fromkeys(roots):
+        charter_dir = root / ".kittify" / "charter"
+        digests.extend(file_digest(charter_dir / name) for name in ("charter.yaml", "charter.md"))
+    return digests
+
+
+def _canonical_root(repo_root: Path) -> Path:
+    from charter.resolution import resolve_canonical_repo_root
+
+    root: Path
+    try:
+        root = resolve_canonical_repo_root(repo_root)
+    except Exception:  # noqa: BLE001 - outside a git checkout the project root is canonical
+        root = repo_root
+    return root
+
+
+@dataclass(frozen=True)
+class ContextMemo:
+    """The memo slot for one ``build_charter_context`` call.
+
+    ``path`` is ``None`` when the key could not be computed; the slot then
+    never hits and never stores.
+    """
+
+    action: str
+    path: Path | None
+
+    @classmethod
+    def open(
+        cls,
+        repo_root: Path,
+        *,
+        action: str,
+        profile: str | None,
+        effective_depth: int,
+        org_root: Path | None,
+        mission_type: str | None,
+        feature_dir: Path | None,
+        suppress_project_resolver: bool,
+    ) -> ContextMemo:
+        """Return the slot keyed by these parameters and the current inputs."""
+        try:
+            from charter.mission_type_profiles import resolve_mission_type_key
+
+            key = {
+                "schema_version": CHARTER_CONTEXT_MEMO_SCHEMA_VERSION,
+                "spec_kitty_version": spec_kitty_version(),
+                "repo_root": str(repo_root),
+                "action": action,
+                "profile": profile,
+                "mission_type": resolve_mission_type_key(mission_type=mission_type, feature_dir=feature_dir),
+                "effective_depth": effective_depth,
+                "org_root": None if org_root is None else [str(org_root), tree_digest(org_root)],
+                "suppress_project_resolver": suppress_project_resolver,
+                "charter": _charter_digests(repo_root, _canonical_root(repo_root)),
+                "drg": hash_inputs(doctrine_inputs(repo_root)),
+            }
+        except Exception as exc:  # noqa: BLE001 - the memo must never break context rendering
+            logger.debug("Charter context memo disabled for %s: %s", action, exc)
+            return cls(action=action, path=None)
+        digest = hash_inputs(key).removeprefix("sha256:")
+        return cls(action=action, path=repo_root / ".kittify" / "runtime" / CHARTER_CONTEXT_MEMO_DIR / f"{digest}.json")
+
+    def replay(self, state_bundle: _ContextStateBundle, *, depth: int | None, mark_loaded: bool) -> CharterContextResult | None:
+        """Return the memoised result for this call, or ``None`` on a miss."""
+        entry = self._load()
+        if entry is None:
+            return None
+        branch = entry["branch"]
+        if branch == BRANCH_NON_BOOTSTRAP:
+            first_load, result_depth = False, depth if depth is not None else 1
+        else:
+            first_load, result_depth = state_bundle.first_load, state_bundle.effective_depth
+        if mark_loaded and first_load and branch in _MARKING_BRANCHES:
+            _mark_action_loaded(state_bundle.state, state_bundle.state_path, self.action)
+        return CharterContextResult(
+            action=self.action,
+            mode=entry["mode"],
+            first_load=first_load,
+            text=entry["text"],
+            references_count=entry["references_count"],
+            depth=result_depth,
+        )
+
+    def record(self, branch: str, result: CharterContextResult) -> CharterContextResult:
+        """Store *result* rendered by *branch* and return it unchanged."""
+        if self.path is None:
+            return result
+        payload = {
+            "schema_version": CHARTER_CONTEXT_MEMO_SCHEMA_VERSION,
+            "branch": branch,
+            "mode": result.mode,
+            "text": result.text,
+            "references_count": result.references_count,
+        }
+        try:
+            atomic_write(self.path, json.dumps(payload, sort_keys=True), mkdir=True)
+            prune_oldest(self.path.parent, keep=_MAX_ENTRIES)
+        except OSError as exc:
+            logger.warning("Could not persist the charter context memo entry: %s", exc)
+        return result
+
+    def _load(self) -> dict[str, Any] | None:
+        if self.path is None:
+            return None
+        try:
+            entry = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if (
+            not isinstance(entry, dict)
+            or entry.get("schema_version") != CHARTER_CONTEXT_MEMO_SCHEMA_VERSION
+            or entry.get("branch") not in _BRANCHES
+            or not isinstance(entry.get("mode"), str)
+            or not isinstance(entry.get("text"), str)
+            or not isinstance(entry.get("references_count"), int)
+        ):
+            return None
+        return entry
+
+
+def _declared_actions(repo_root: Path, mission_type: str) -> list[str]:
+    from charter._drg_helpers import load_validated_graph
+
+    prefix = f"action:{mission_type}/"
+    try:
+        urns = load_validated_graph(repo_root).node_urns()
+    except Exception as exc:  # noqa: BLE001 - warm the fast-path actions regardless
+        logger.debug("Could not load the DRG to list declared actions: %s", exc)
+        return []
+    return [urn.removeprefix(prefix) for urn in urns if urn.startswith(prefix)]
+
+
+def warm_context_memo(repo_root: Path, mission_type: str) -> None:
+    """Render and memoise every declared action of *mission_type*.
+
+    Covers the fast-path actions plus every ``action:<mission_type>/<step>``
+    DRG node, at both effective depths, for the profile-less render the
+    workflow prompts use. Nothing is marked loaded.
+    """
+    from charter.context import BOOTSTRAP_ACTIONS, build_charter_context
+
+    actions = sorted(set(BOOTSTRAP_ACTIONS) | set(_declared_actions(repo_root, mission_type)))
+    for action in actions:
+        for depth in _WARM_DEPTHS:
+            try:
+                build_charter_context(repo_root, action=action, mission_type=mission_type, depth=depth, mark_loaded=False)
+            except Exception as exc:  # noqa: BLE001 - one failing action must not stop the rest
+                logger.debug("Could not warm charter context for %s: %s", action, exc)
@@ -38,6 +38,8 @@ from pydantic import BaseModel, ValidationError
 from ruamel.yaml import YAML
 from ruamel.yaml.error import YAMLError
 
+from kernel.tracing import span
+
 from doctrine.artifact_kinds import ArtifactKind
 from doctrine.discovery_recursion import overlay_scan_is_recursive
 from doctrine.shared.scoping import applies_to_languages_match, normalize_languages
@@ -387,21 +389,24 @@ class BaseDoctrineRepository(ABC, Generic[T]):
     def _load(self) -> None:
         """Walk built-in + org + project dirs, parse, merge, warn on failure."""
         yaml_parser = YAML(typ="safe")
-        built_in = self._load_built_in_items(yaml_parser)
+        with span("doctrine.load", kind=self._kind, layer="builtin"):
+            built_in = self._load_built_in_items(yaml_parser)
         self._items = built_in.copy()
         # Tag all built-in items as 'builtin'
         self._provenance = dict.fromkeys(self._items, "builtin")
         # Org layer overrides built-in
-        self._apply_overlay_layer(
-            self._org_dirs, "org", yaml_parser=yaml_parser, built_in=built_in
-        )
+        with span("doctrine.load", kind=self._kind, layer="org"):
+            self._apply_overlay_layer(
+                self._org_dirs, "org", yaml_parser=yaml_parser, built_in=built_in
+            )
         # Project layer overrides built-in + org
-        self._apply_overlay_layer(
-            [self._project_dir] if self._project_dir else [],
-            "project",
-            yaml_parser=yaml_parser,
-            built_in=built_in,
-        )
+        with span("doctrine.load", kind=self._kind, layer="project"):
+            self._apply_overlay_layer(
+                [self._project_dir] if self._project_dir else [],
+                "project",
+                yaml_parser=yaml_parser,
+                built_in=built_in,
+            )
 
     def _merge(self, built_in: T, project_data: dict[str, Any]) -> T:
         """Merge project override into a built-in instance at field level."""
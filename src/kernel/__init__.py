@@ -42,6 +42,10 @@ glossary_runner
     ``clear_registry()`` (test-only). ``glossary`` registers
     the concrete ``GlossaryAwarePrimitiveRunner`` at import time; doctrine
     calls ``get_runner()`` without importing ``specify_cli``.
+tracing
+    Opt-in hot-path timing spans (``span()``/``traced()``), a no-op unless
+    ``SPEC_KITTY_TRACE`` or the root ``--trace`` option turns them on; the
+    recorded spans are written as one Chrome-trace JSON file per invocation.
 """
 
 from kernel.paths import (
@@ -0,0 +1,207 @@
+"""Opt-in hot-path tracing spans written as a Chrome trace.
+
+When a command such as ``agent tasks move-task`` or ``mission finalize`` is
+slow, the time is spread across git subprocesses, status-lock waits,
+event-log reads, reducer folds, YAML parsing and project-store writes. The
+choke points in those layers open named spans::
+
+    from kernel.tracing import span, traced
+
+    with span("status.lock.wait", mission=mission_slug):
+        lock.acquire()
+
+    @traced("status.reduce")
+    def reduce(...): ...
+
+Tracing is off unless ``SPEC_KITTY_TRACE`` is truthy or the root ``--trace``
+option is passed. While it is off, :func:`span` returns one shared no-op
+context manager and :func:`traced` wrappers cost a single global lookup, so
+the instrumentation stays in production code paths.
+
+When it is on, every closed span is recorded as a Chrome-trace ``"X"``
+(complete) event with the span's arguments, the thread id and, if the body
+raised, the exception type. At interpreter exit the events are written as
+one JSON document per invocation to ``SPEC_KITTY_TRACE_FILE`` when set,
+otherwise to ``<kittify home>/traces/trace-<stamp>-<pid>.json``. Load it in
+``chrome://tracing`` or https://ui.perfetto.dev. Nested spans nest by time on
+the same thread; spans from worker threads appear on their own track.
+
+The module imports only the standard library (plus :mod:`kernel` helpers,
+lazily, when the trace is written) so doctrine, charter and specify_cli can
+all instrument without an upward import.
+"""
+
+from __future__ import annotations
+
+import atexit
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from pathlib import Path
+from typing import Any, ParamSpec, TypeVar
+
+__all__ = ["enable", "install_if_requested", "span", "traced"]
+
+TRACE_ENV_VAR = "SPEC_KITTY_TRACE"
+TRACE_FILE_ENV_VAR = "SPEC_KITTY_TRACE_FILE"
+
+_TRUTHY = frozenset({"1", "true", "yes", "on"})
+_NOOP: AbstractContextManager[None] = nullcontext()
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+class _Recorder:
+    """Collects complete events for one process."""
+
+    def __init__(self, output: Path | None) -> None:
+        self.output = output
+        self.origin = time.perf_counter()
+        self.pid = os.getpid()
+        self.events: list[dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def add(self, name: str, started: float, finished: float, args: dict[str, Any]) -> None:
+        event = {
+            "name": name,
+            "cat": name.split(".", 1)[0],
+            "ph": "X",
+            "ts": round((started - self.origin) * 1_000_000, 1),
+            "dur": round((finished - started) * 1_000_000, 1),
+            "pid": self.pid,
+            "tid": threading.get_ident(),
+        }
+        if args:
+            event["args"] = args
+        with self._lock:
+            self.events.append(event)
+
+    def document(self) -> dict[str, Any]:
+        with self._lock:
+            events = list(self.events)
+        process_name = {"name": "process_name", "ph": "M", "pid": self.pid, "tid": 0, "args": {"name": " ".join(sys.argv) or "python"}}
+        return {"traceEvents": [process_name, *events], "displayTimeUnit": "ms"}
+
+
+_RECORDER: _Recorder | None = None
+
+
+def is_requested(environ: Mapping[str, str] | None = None) -> bool:
+    """Return True when ``SPEC_KITTY_TRACE`` is truthy."""
+    env = os.environ if environ is None else environ
+    return env.get(TRACE_ENV_VAR, "").strip().casefold() in _TRUTHY
+
+
+def is_enabled() -> bool:
+    """Return True while spans are being recorded."""
+    return _RECORDER is not None
+
+
+def enable(output: Path | None = None) -> None:
+    """Start recording spans; the trace is written at interpreter exit.
+
+    *output* overrides ``SPEC_KITTY_TRACE_FILE`` and the default location.
+    Calling it again while recording only updates a given *output*.
+    """
+    global _RECORDER
+    if _RECORDER is not None:
+        if output is not None:
+            _RECORDER.output = output
+        return
+    _RECORDER = _Recorder(output)
+    atexit.register(_write_at_exit)
+
+
+def install_if_requested() -> bool:
+    """Start recording when ``SPEC_KITTY_TRACE`` is truthy."""
+    if _RECORDER is None and is_requested():
+        enable()
+    return _RECORDER is not None
+
+
+@contextmanager
+def _recording_span(recorder: _Recorder, name: str, args: dict[str, Any]) -> Iterator[None]:
+    started = time.perf_counter()
+    try:
+        yield
+    except BaseException as exc:
+        args["error"] = type(exc).__name__
+        raise
+    finally:
+        recorder.add(name, started, time.perf_counter(), args)
+
+
+def span(name: str, **args: Any) -> AbstractContextManager[None]:
+    """Time the ``with`` body as span *name*; a no-op unless tracing is on.
+
+    The category shown by trace viewers is the part of *name* before the
+    first dot. Keyword arguments are recorded as the span's ``args`` and
+    must be JSON-serialisable (anything else is written with ``str()``).
+    """
+    recorder = _RECORDER
+    if recorder is None:
+        return _NOOP
+    return _recording_span(recorder, name, args)
+
+
+def traced(name: str) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Decorate a function so each call is recorded as span *name*."""
+
+    def decorate(func: Callable[P, R]) -> Callable[P, R]:
+        @functools.wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            recorder = _RECORDER
+            if recorder is None:
+                return func(*args, **kwargs)
+            with _recording_span(recorder, name, {}):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
+
+
+def _default_output(recorder: _Recorder) -> Path:
+    from kernel.clock import now_utc_compact_stamp
+    from kernel.paths import get_kittify_home
+
+    configured = os.environ.get(TRACE_FILE_ENV_VAR)
+    if configured:
+        return Path(configured)
+    return get_kittify_home() / "traces" / f"trace-{now_utc_compact_stamp()}-{recorder.pid}.json"
+
+
+def write_trace() -> Path | None:
+    """Write the recorded spans now and return the trace path.
+
+    Returns ``None`` when tracing is off. Safe to call more than once: each
+    call rewrites the file with everything recorded so far.
+    """
+    recorder = _RECORDER
+    if recorder is None:
+        return None
+    target = recorder.output or _default_output(recorder)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_text(json.dumps(recorder.document(), default=str) + "\n", encoding="utf-8")
+    return target
+
+
+def _write_at_exit() -> None:
+    # Silent on success: agents often parse a merged ``2>&1`` --json stream.
+    try:
+        write_trace()
+    except OSError as exc:
+        if sys.__stderr__ is not None:
+            sys.__stderr__.write(f"spec-kitty: could not write trace: {exc}\n")
+
+
+def reset() -> None:
+    """Stop recording and drop every span (test helper)."""
+    global _RECORDER
+    _RECORDER = None
@@ -34,6 +34,20 @@ from specify_cli.bootstrap.env_file import load_operator_env_file  # noqa: E402
 
 load_operator_env_file()
 
+# Opt-in startup profiler (``SPEC_KITTY_PROFILE_STARTUP=1``). Installed right
+# after the env loader so the variable may come from ``.kitty.env`` and every
+# import below is timed; stdlib-only, see the module docstring.
+from specify_cli.bootstrap.startup_profile import install_if_requested, instrument_dispatch, mark  # noqa: E402
+
+install_if_requested()
+
+# Opt-in hot-path tracing (``SPEC_KITTY_TRACE=1`` or the root ``--trace``
+# option): spans from the status, coordination, git, sync, event-journal and
+# doctrine layers are written as a Chrome trace at exit; see kernel.tracing.
+from kernel import tracing as _tracing  # noqa: E402
+
+_tracing.install_if_requested()
+
 import os  # noqa: E402
 import sys  # noqa: E402
 from pathlib import Path  # noqa: E402
@@ -93,6 +107,12 @@ def activate_mission(project_path: Path, mission_type: str, mission_display: str
         return f"{mission_display} (templates pending)"
 
 
+def trace_callback(value: bool) -> None:
+    """Start recording tracing spans for this invocation."""
+    if value:
+        _tracing.enable()
+
+
 def version_callback(value: bool) -> None:
     """Display version and exit."""
     if value:
@@ -113,6 +133,13 @@ def main_callback(
     version: bool = typer.Option(  # noqa: ARG001
         None, "--version", "-v", callback=version_callback, is_eager=True, help="Show version and exit"
     ),
+    trace: bool = typer.Option(  # noqa: ARG001
+        False,
+        "--trace",
+        callback=trace_callback,
+        is_eager=True,
+        help="Record hot-path timing spans and write a Chrome-trace JSON file at exit (same as SPEC_KITTY_TRACE=1).",
+    ),
 ) -> None:
     """Main callback for root CLI setup."""
     import sys
@@ -155,9 +182,25 @@ def _run_startup_project_gates(ctx: typer.Context) -> None:
         check_schema_version(project_root, invoked_subcommand=ctx.invoked_subcommand)
 
 
-def _build_app() -> typer.Typer:
-    from specify_cli.cli.commands import register_commands
+def _register_init(app: typer.Typer) -> None:
     from specify_cli.cli.commands.init import register_init_command
+
+    register_init_command(
+        app,
+        console=_get_console(),
+        show_banner=_get_show_banner(),
+        activate_mission=activate_mission,
+        ensure_executable_scripts=ensure_executable_scripts,
+    )
+
+
+def _build_app(*, lazy: bool = False) -> typer.Typer:
+    """Build the root CLI application.
+
+    ``lazy=True`` (the ``spec-kitty`` entry point) registers manifest-backed
+    placeholders that import a command's module only when it is resolved.
+    """
+    from specify_cli.cli.commands import _prepare_root_commands, register_commands
     from specify_cli.cli.helpers import BannerGroup
 
     app = typer.Typer(
@@ -172,14 +215,15 @@ def _build_app() -> typer.Typer:
         cls=BannerGroup,
     )
     app.callback()(main_callback)
-    register_init_command(
-        app,
-        console=_get_console(),
-        show_banner=_get_show_banner(),
-        activate_mission=activate_mission,
-        ensure_executable_scripts=ensure_executable_scripts,
-    )
-    register_commands(app)
+    if lazy:
+        from specify_cli.cli.commands._lazy import CommandSpec, register_lazy
+        from specify_cli.completion import load_command_manifest
+
+        init_spec = {"init": CommandSpec("specify_cli", "_register_init", registrar=True)}
+        register_lazy(app, init_spec, load_command_manifest(), saas_enabled=True, prepare=_prepare_root_commands)
+    else:
+        _register_init(app)
+    register_commands(app, lazy=lazy)
     return app
 
 
@@ -375,6 +419,8 @@ def _argv_requests_json_mode(argv: list[str]) -> bool:
 
 
 def main() -> None:
+    mark("main")
+
     # FR-130 / FR-131: Install the CLI logging bootstrap early — before the
     # Typer app runs — so that warnings.warn(...) calls (including
     # CharterCatalogMissWarning from charter._catalog_miss) are routed through
@@ -424,7 +470,12 @@ def main() -> None:
         _get_console().print(f"[red]{EventAdapter.get_missing_library_error()}[/red]")
         raise typer.Exit(1)
 
-    _get_app()()
+    from typer.core import TyperCommand
+
+    root_app = _build_app(lazy=True)
+    mark("app_built")
+    instrument_dispatch(TyperCommand)
+    root_app()
 
 
 __all__ = ["main", "app", "__version__"]
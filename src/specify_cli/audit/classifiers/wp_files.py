@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from specify_cli.frontmatter import FrontmatterError, FrontmatterManager
+from specify_cli.frontmatter import FrontmatterError, read_frontmatter_readonly
 from specify_cli.status import CanonicalStatusNotFoundError, get_wp_lane, has_event_log
 from specify_cli.status import StoreError
 
@@ -15,16 +15,12 @@ from ..shape_registry import check_unknown_keys
 # Terminal lanes that require evidence
 _TERMINAL_LANES = frozenset({"done", "approved"})
 
-# Use the canonical FrontmatterManager (same ruamel.yaml config as production)
-_fm_manager = FrontmatterManager()
-
-
 def classify_wp_files(mission_dir: Path) -> list[MissionFinding]:
     """Classify WP*.md frontmatter for legacy keys, unknown keys, and missing evidence.
 
     Globs ``mission_dir / "tasks" / "WP*.md"``, sorted by filename for
     determinism.  For each file:
-    - Parses YAML frontmatter via :class:`~specify_cli.frontmatter.FrontmatterManager`.
+    - Parses YAML frontmatter via :func:`~specify_cli.frontmatter.read_frontmatter_readonly`.
     - Skips files with absent or empty frontmatter (no finding — frontmatter is optional).
     - Emits ``UNKNOWN_SHAPE`` (info) for files whose frontmatter YAML cannot be parsed.
     - Detects legacy keys and unknown keys.
@@ -55,7 +51,8 @@ def classify_wp_files(mission_dir: Path) -> list[MissionFinding]:
         artifact_path = f"tasks/{filename}"
 
         try:
-            frontmatter, _ = _fm_manager.read(wp_path)
+            # Read-only scan: the canonical fast path (same fail-closed key rules).
+            frontmatter, _ = read_frontmatter_readonly(wp_path)
         except FrontmatterError:
             # Frontmatter absent or malformed YAML
             # Check if file starts with "---" to distinguish absent vs malformed
@@ -69,7 +66,7 @@ def classify_wp_files(mission_dir: Path) -> list[MissionFinding]:
                 # No frontmatter — skip silently (optional)
                 continue
 
-            # Has "---" but FrontmatterManager raised — malformed YAML
+            # Has "---" but the frontmatter reader raised — malformed YAML
             findings.append(
                 MissionFinding(
                     code="UNKNOWN_SHAPE",
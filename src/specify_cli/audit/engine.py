@@ -2,16 +2,20 @@
 
 This module is the integration point for the read-only mission-state audit.  It:
 
-1. Discovers mission directories under ``scan_root`` in lexicographic order.
-2. Dispatches the 7 per-artifact classifiers for each mission.
-3. Calls ``audit_repo()`` once and indexes ``IdentityState`` results by slug.
-4. Calls ``find_duplicate_prefixes()`` and ``find_ambiguous_selectors()`` for
-   repo-level findings.
-5. Sorts findings by ``(artifact_path, code)`` within each mission.
-6. Assembles ``RepoAuditReport`` with sorted missions and shape counters.
+1. Calls ``audit_repo()`` once and indexes ``IdentityState`` results by slug.
+   That one directory/``meta.json`` scan also supplies the mission list when
+   ``scan_root`` is the repository's own ``kitty-specs/``.
+2. Dispatches the 7 per-artifact classifiers for each mission, fanning out
+   across a process pool (one task per mission) for large trees.
+3. Calls ``find_duplicate_prefixes()`` (over the states from step 1) and
+   ``find_ambiguous_selectors()`` for repo-level findings.
+4. Sorts findings by ``(artifact_path, code)`` within each mission.
+5. Assembles ``RepoAuditReport`` with sorted missions and shape counters.
 
 Determinism contract (D4):
-- Missions processed in ``sorted(..., key=lambda p: p.name)`` order.
+- Missions processed in ``sorted(..., key=lambda p: p.name)`` order; pool
+  results are collected in submission order, so worker scheduling never
+  reaches the report.
 - Findings sorted by ``(artifact_path, code)`` before constructing ``MissionAuditResult``.
 - ``json.dumps(sort_keys=True, indent=2)`` — enforced by ``serializer.py``.
 - No timestamps, PIDs, or wall-clock values in output.
@@ -22,7 +26,9 @@ from __future__ import annotations
 
 from specify_cli.core.constants import KITTY_SPECS_DIR
 from specify_cli.core.utils import safe_is_dir
+import os
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -53,6 +59,10 @@ from .models import (
 
 _META_JSON = "meta.json"
 
+# Below this many missions per worker the pool's start-up cost outweighs the
+# classifier work it would spread out, so the scan runs inline.
+_PARALLEL_MIN_MISSIONS = 64
+
 
 # ---------------------------------------------------------------------------
 # Private: mission filter resolution
@@ -98,26 +108,8 @@ def _resolve_mission_filter(
 # ---------------------------------------------------------------------------
 
 
-def _scan_missions(
-    scan_root: Path,
-    allowed_dirs: frozenset[Path] | None,
-    identity_index: dict[str, Any],
-) -> list[MissionAuditResult]:
-    """Walk *scan_root* and classify each mission directory.
-
-    Args:
-        scan_root: Directory to walk (usually ``repo_root / KITTY_SPECS_DIR``).
-        allowed_dirs: When not None, only directories in this set are processed.
-            Pass ``frozenset()`` to produce an empty scan result.
-        identity_index: Mapping of ``{mission_slug: IdentityState}`` built from
-            ``audit_repo()``.  Used to call ``identity_state_to_findings()``
-            without re-reading ``meta.json`` for each mission.
-
-    Returns:
-        List of :class:`~specify_cli.audit.models.MissionAuditResult`, one per
-        directory, in lexicographic order of directory name.  Each result's
-        findings are sorted by ``(artifact_path, code)``.
-    """
+def _list_mission_dirs(scan_root: Path) -> list[Path]:
+    """Return the mission directories under *scan_root*, sorted by name."""
     try:
         if not safe_is_dir(scan_root):
             return []
@@ -134,8 +126,7 @@ def _scan_missions(
         # one fail-soft path instead of adding a second, differently-shaped one.
         return []
 
-    results: list[MissionAuditResult] = []
-
+    mission_dirs: list[Path] = []
     for candidate in candidates:
         try:
             is_mission_dir = safe_is_dir(candidate)
@@ -146,55 +137,98 @@ def _scan_missions(
             # for "not a directory" the way the bare `Path.is_dir()` this
             # replaces did on 3.14 (see `safe_is_dir`'s docstring).
             continue
-        if not is_mission_dir:
-            continue
+        if is_mission_dir:
+            mission_dirs.append(candidate)
+    return mission_dirs
 
-        if allowed_dirs is not None and candidate not in allowed_dirs:
-            continue
 
-        identity_state = identity_index.get(candidate.name)
+def _classify_mission_dir(
+    candidate: Path,
+    identity_state: IdentityState | None,
+) -> MissionAuditResult:
+    """Run every per-artifact classifier over one mission directory.
+
+    Module-level and free of shared state so it can run in a pool worker.
+    """
+    # Collect findings from all 7 classifiers in the documented order.
+    all_findings: list[MissionFinding] = []
+
+    # 1. meta.json
+    all_findings.extend(classify_meta_json(candidate))
 
-        # Collect findings from all 7 classifiers in the documented order.
-        all_findings: list[MissionFinding] = []
+    # 2. status.events.jsonl — returns (findings, has_corrupt_jsonl)
+    findings_events, has_corrupt = classify_status_events_jsonl(candidate)
+    all_findings.extend(findings_events)
 
-        # 1. meta.json
-        all_findings.extend(classify_meta_json(candidate))
+    # 3. status.json — skip drift check if events are corrupt
+    all_findings.extend(classify_status_json(candidate, skip_drift=has_corrupt))
 
-        # 2. status.events.jsonl — returns (findings, has_corrupt_jsonl)
-        findings_events, has_corrupt = classify_status_events_jsonl(candidate)
-        all_findings.extend(findings_events)
+    # 4. mission-events.jsonl
+    all_findings.extend(classify_mission_events_jsonl(candidate))
 
-        # 3. status.json — skip drift check if events are corrupt
-        all_findings.extend(classify_status_json(candidate, skip_drift=has_corrupt))
+    # 5. decisions/events.jsonl
+    all_findings.extend(classify_decisions_events_jsonl(candidate))
 
-        # 4. mission-events.jsonl
-        all_findings.extend(classify_mission_events_jsonl(candidate))
+    # 6. handoff/events.jsonl
+    all_findings.extend(classify_handoff_events_jsonl(candidate))
 
-        # 5. decisions/events.jsonl
-        all_findings.extend(classify_decisions_events_jsonl(candidate))
+    # 7. WP*.md frontmatter
+    all_findings.extend(classify_wp_files(candidate))
 
-        # 6. handoff/events.jsonl
-        all_findings.extend(classify_handoff_events_jsonl(candidate))
+    # 8. Identity-state adapter (only when identity data is available)
+    if identity_state is not None:
+        all_findings.extend(identity_state_to_findings(identity_state, candidate))
 
-        # 7. WP*.md frontmatter
-        all_findings.extend(classify_wp_files(candidate))
+    # Sort by (artifact_path, code) for determinism before constructing the result.
+    return MissionAuditResult(
+        mission_slug=candidate.name,
+        mission_dir=candidate,
+        findings=sorted(all_findings, key=lambda f: (f.artifact_path, f.code)),
+    )
 
-        # 8. Identity-state adapter (only when identity data is available)
-        if identity_state is not None:
-            all_findings.extend(identity_state_to_findings(identity_state, candidate))
 
-        # Sort by (artifact_path, code) for determinism before constructing the result.
-        sorted_findings = sorted(all_findings, key=lambda f: (f.artifact_path, f.code))
+def _scan_missions(
+    scan_root: Path,
+    allowed_dirs: frozenset[Path] | None,
+    identity_index: dict[str, Any],
+    *,
+    mission_dirs: list[Path] | None = None,
+    max_workers: int | None = None,
+) -> list[MissionAuditResult]:
+    """Classify each mission directory under *scan_root*.
 
-        results.append(
-            MissionAuditResult(
-                mission_slug=candidate.name,
-                mission_dir=candidate,
-                findings=sorted_findings,
-            )
-        )
+    Args:
+        scan_root: Directory to walk (usually ``repo_root / KITTY_SPECS_DIR``).
+        allowed_dirs: When not None, only directories in this set are processed.
+            Pass ``frozenset()`` to produce an empty scan result.
+        identity_index: Mapping of ``{mission_slug: IdentityState}`` built from
+            ``audit_repo()``.  Used to call ``identity_state_to_findings()``
+            without re-reading ``meta.json`` for each mission.
+        mission_dirs: The sorted mission directories of *scan_root* when the
+            caller already enumerated them; *scan_root* is walked otherwise.
+        max_workers: Pool size; defaults to ``os.cpu_count()``.  ``1`` (or
+            fewer than ``_PARALLEL_MIN_MISSIONS`` missions per worker) runs
+            inline without a pool.
+
+    Returns:
+        List of :class:`~specify_cli.audit.models.MissionAuditResult`, one per
+        directory, in lexicographic order of directory name.  Each result's
+        findings are sorted by ``(artifact_path, code)``.
+    """
+    if mission_dirs is None:
+        mission_dirs = _list_mission_dirs(scan_root)
+    if allowed_dirs is not None:
+        mission_dirs = [d for d in mission_dirs if d in allowed_dirs]
+    states = [identity_index.get(d.name) for d in mission_dirs]
+
+    workers = min(max_workers or os.cpu_count() or 1, len(mission_dirs) // _PARALLEL_MIN_MISSIONS or 1)
+    if workers <= 1:
+        return [_classify_mission_dir(d, state) for d, state in zip(mission_dirs, states, strict=True)]
 
-    return results
+    # ``map`` yields in submission order, which keeps the D4 mission order.
+    chunksize = max(1, len(mission_dirs) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_classify_mission_dir, mission_dirs, states, chunksize=chunksize))
 
 
 # ---------------------------------------------------------------------------
@@ -233,7 +267,7 @@ def _compute_repo_findings_by_slug(
         Dict mapping ``{mission_slug: [MissionFinding, ...]}`` for all
         missions that have any repo-level findings.
     """
-    prefix_groups = find_duplicate_prefixes(repo_root)
+    prefix_groups = find_duplicate_prefixes(repo_root, states=identity_states)
     selector_groups = find_ambiguous_selectors(identity_states)
     slug_to_dir = {r.mission_slug: r.mission_dir for r in mission_results}
 
@@ -427,8 +461,9 @@ def run_audit(options: AuditOptions) -> RepoAuditReport:
     """Run the full mission-state audit and return a ``RepoAuditReport``.
 
     This function is the sole public entry point for the audit engine.  It
-    is completely read-only: no files are written, no processes are spawned,
-    and no network calls are made.
+    is completely read-only: no files are written and no network calls are
+    made.  Large trees are classified in a process pool of up to
+    ``options.max_workers`` workers; the report is identical either way.
 
     Args:
         options: Engine configuration.  ``scan_root`` defaults to
@@ -455,8 +490,23 @@ def run_audit(options: AuditOptions) -> RepoAuditReport:
         options.mission_filter, options.repo_root, scan_root
     )
 
+    # Shared scan: when auditing the repository's own kitty-specs/, the
+    # directories audit_repo() just walked are exactly the missions to
+    # classify, so the tree is not enumerated a second time.
+    mission_dirs = (
+        [s.path for s in identity_states]
+        if scan_root == options.repo_root / KITTY_SPECS_DIR
+        else None
+    )
+
     # Per-mission classification
-    mission_results = _scan_missions(scan_root, allowed_dirs, identity_index)
+    mission_results = _scan_missions(
+        scan_root,
+        allowed_dirs,
+        identity_index,
+        mission_dirs=mission_dirs,
+        max_workers=options.max_workers,
+    )
 
     # Repo-level findings with explicit slug attribution
     attributed = _compute_repo_findings_by_slug(
@@ -195,9 +195,12 @@ class AuditOptions:
     (never hardcoded here — the engine resolves the default at call time).
     ``fail_on`` is ``None`` for "always exit 0"; set to ``Severity.ERROR``
     to fail on errors only, ``Severity.WARNING`` for errors+warnings, etc.
+    ``max_workers`` caps the per-mission process pool (``None`` for
+    ``os.cpu_count()``, ``1`` to classify inline).
     """
 
     repo_root: Path
     scan_root: Path | None = None
     mission_filter: str | None = None
     fail_on: Severity | None = None
+    max_workers: int | None = None
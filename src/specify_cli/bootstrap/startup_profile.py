@@ -0,0 +1,235 @@
+"""Opt-in startup profiler: ``SPEC_KITTY_PROFILE_STARTUP=1``.
+
+Agents invoke ``spec-kitty`` dozens of times per work package, so process
+startup is a cost paid on every step. With ``SPEC_KITTY_PROFILE_STARTUP=1``
+this module records, for one invocation:
+
+* every module imported after ``specify_cli`` starts loading, with self and
+  cumulative import time (the same split ``python -X importtime`` reports),
+  aggregated by subsystem;
+* named milestones: entry into ``main()``, the command tree being built, the
+  leaf command's callback starting (dispatch) and the first write to
+  stdout/stderr (time to first output).
+
+The report is one JSON document written at interpreter exit to
+``SPEC_KITTY_PROFILE_STARTUP_FILE`` when set, otherwise to stderr. All times
+are milliseconds since the profiler was installed, which happens right after
+the ``.kitty.env`` loader at the top of ``specify_cli/__init__.py`` so the
+variable may also be set there.
+
+Like the env loader this module imports only the standard library: it runs
+before the rest of the CLI is imported and must not pull any of it in.
+Imports made before installation (the env loader and :mod:`kernel`) are not
+in the report.
+"""
+
+from __future__ import annotations
+
+import atexit
+import importlib.abc
+import json
+import os
+import sys
+import time
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from types import ModuleType
+from typing import Any, TextIO
+
+PROFILE_ENV_VAR = "SPEC_KITTY_PROFILE_STARTUP"
+PROFILE_FILE_ENV_VAR = "SPEC_KITTY_PROFILE_STARTUP_FILE"
+REPORT_SCHEMA_VERSION = 1
+
+# First-party roots are split one level deeper than third-party ones so the
+# report separates e.g. ``specify_cli.sync`` from ``specify_cli.status``.
+_FIRST_PARTY_ROOTS = frozenset({"specify_cli", "charter", "doctrine", "kernel", "mission_runtime", "glossary", "runtime"})
+_STDLIB = "stdlib"
+_SLOWEST_MODULES = 25
+_TRUTHY = frozenset({"1", "true", "yes", "on"})
+
+
+@dataclass
+class _ImportRecord:
+    module: str
+    self_s: float
+    cumulative_s: float
+
+
+@dataclass
+class _Profile:
+    started: float
+    imports: list[_ImportRecord] = field(default_factory=list)
+    marks: dict[str, float] = field(default_factory=dict)
+    # Child-import time accumulated for each import currently executing.
+    stack: list[float] = field(default_factory=list)
+
+    def elapsed_ms(self, at: float) -> float:
+        return round((at - self.started) * 1000, 3)
+
+
+_PROFILE: _Profile | None = None
+
+__all__ = ["install_if_requested", "instrument_dispatch", "mark"]
+
+
+def subsystem_for(module: str) -> str:
+    """Return the reporting bucket for *module*."""
+    parts = module.split(".")
+    if parts[0] in _FIRST_PARTY_ROOTS:
+        return ".".join(parts[:2])
+    if parts[0] in sys.stdlib_module_names:
+        return _STDLIB
+    return parts[0]
+
+
+class _TimingLoader(importlib.abc.Loader):
+    """Delegate to the real loader, timing module creation and execution."""
+
+    def __init__(self, loader: Any, profile: _Profile) -> None:
+        self._loader = loader
+        self._profile = profile
+
+    def __getattr__(self, name: str) -> Any:
+        # get_data, get_resource_reader, is_package, get_source, ...
+        return getattr(self._loader, name)
+
+    def create_module(self, spec: Any) -> ModuleType | None:
+        create = getattr(self._loader, "create_module", None)
+        return create(spec) if create is not None else None
+
+    def exec_module(self, module: ModuleType) -> None:
+        profile = self._profile
+        profile.stack.append(0.0)
+        started = time.perf_counter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            cumulative = time.perf_counter() - started
+            children = profile.stack.pop()
+            if profile.stack:
+                profile.stack[-1] += cumulative
+            profile.imports.append(_ImportRecord(module.__name__, cumulative - children, cumulative))
+
+
+class _TimingFinder(importlib.abc.MetaPathFinder):
+    """Resolve specs through the other finders and wrap their loaders."""
+
+    def __init__(self, profile: _Profile) -> None:
+        self._profile = profile
+
+    def find_spec(self, fullname: str, path: Sequence[str] | None, target: ModuleType | None = None) -> Any:
+        for finder in sys.meta_path:
+            if finder is self:
+                continue
+            find_spec = getattr(finder, "find_spec", None)
+            if find_spec is None:
+                continue
+            spec = find_spec(fullname, path, target)
+            if spec is None:
+                continue
+            if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                spec.loader = _TimingLoader(spec.loader, self._profile)
+            return spec
+        return None
+
+
+class _FirstWriteStream:
+    """Proxy for stdout/stderr that marks the first non-empty write."""
+
+    def __init__(self, stream: TextIO) -> None:
+        self._stream = stream
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._stream, name)
+
+    def write(self, text: str) -> int:
+        if text:
+            mark("first_output", once=True)
+        return self._stream.write(text)
+
+
+def is_requested(environ: Mapping[str, str] | None = None) -> bool:
+    """Return True when ``SPEC_KITTY_PROFILE_STARTUP`` is truthy."""
+    env = os.environ if environ is None else environ
+    return env.get(PROFILE_ENV_VAR, "").strip().casefold() in _TRUTHY
+
+
+def install_if_requested() -> bool:
+    """Start profiling when ``SPEC_KITTY_PROFILE_STARTUP`` is truthy."""
+    global _PROFILE
+    if _PROFILE is not None or not is_requested():
+        return _PROFILE is not None
+    profile = _Profile(started=time.perf_counter())
+    _PROFILE = profile
+    sys.meta_path.insert(0, _TimingFinder(profile))
+    sys.stdout = _FirstWriteStream(sys.stdout)
+    sys.stderr = _FirstWriteStream(sys.stderr)
+    atexit.register(_emit_report)
+    return True
+
+
+def mark(name: str, *, once: bool = False) -> None:
+    """Record milestone *name*; a no-op unless profiling is active."""
+    profile = _PROFILE
+    if profile is None or (once and name in profile.marks):
+        return
+    profile.marks[name] = time.perf_counter()
+
+
+def instrument_dispatch(command_cls: type) -> None:
+    """Mark ``dispatch`` when a leaf command of class *command_cls* is invoked.
+
+    Takes the class as an argument so this module never imports Typer.
+    """
+    if _PROFILE is None:
+        return
+    invoke = command_cls.invoke  # type: ignore[attr-defined]
+
+    def timed_invoke(self: Any, ctx: Any) -> Any:
+        mark("dispatch", once=True)
+        return invoke(self, ctx)
+
+    command_cls.invoke = timed_invoke  # type: ignore[attr-defined]
+
+
+def build_report(profile: _Profile, *, finished: float, argv: Sequence[str]) -> dict[str, Any]:
+    """Aggregate *profile* into the structured startup report."""
+    by_subsystem: dict[str, dict[str, Any]] = {}
+    for record in profile.imports:
+        bucket = by_subsystem.setdefault(subsystem_for(record.module), {"modules": 0, "self_s": 0.0})
+        bucket["modules"] += 1
+        bucket["self_s"] += record.self_s
+    subsystems = [
+        {"subsystem": name, "modules": bucket["modules"], "self_ms": round(bucket["self_s"] * 1000, 3)}
+        for name, bucket in sorted(by_subsystem.items(), key=lambda item: -item[1]["self_s"])
+    ]
+    slowest = sorted(profile.imports, key=lambda record: record.self_s, reverse=True)[:_SLOWEST_MODULES]
+    return {
+        "schema_version": REPORT_SCHEMA_VERSION,
+        "argv": list(argv),
+        "python": ".".join(str(part) for part in sys.version_info[:3]),
+        "total_ms": profile.elapsed_ms(finished),
+        "marks_ms": {name: profile.elapsed_ms(at) for name, at in sorted(profile.marks.items(), key=lambda item: item[1])},
+        "imports": {
+            "count": len(profile.imports),
+            "total_ms": round(sum(record.self_s for record in profile.imports) * 1000, 3),
+            "by_subsystem": subsystems,
+            "slowest": [
+                {"module": record.module, "self_ms": round(record.self_s * 1000, 3), "cumulative_ms": round(record.cumulative_s * 1000, 3)} for record in slowest
+            ],
+        },
+    }
+
+
+def _emit_report() -> None:
+    profile = _PROFILE
+    if profile is None:
+        return
+    report = json.dumps(build_report(profile, finished=time.perf_counter(), argv=sys.argv), indent=1)
+    target = os.environ.get(PROFILE_FILE_ENV_VAR)
+    if target:
+        with open(target, "w", encoding="utf-8") as handle:
+            handle.write(report + "\n")
+        return
+    if sys.__stderr__ is not None:
+        sys.__stderr__.write(report + "\n")
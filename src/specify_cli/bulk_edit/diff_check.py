@@ -23,9 +23,11 @@ YAMLs, CLI command modules, test fixtures, user-facing docs, etc.).
 
 from __future__ import annotations
 
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field, replace
-from fnmatch import fnmatch
+from fnmatch import fnmatch, translate
 from pathlib import Path
 
 from specify_cli.bulk_edit.occurrence_map import OccurrenceMap, _is_narrow_structural_path
@@ -111,9 +113,17 @@ _PATH_RULES: list[tuple[str, list[str]]] = [
 ]
 
 
-_COMPILED_RULES: list[tuple[str, list[re.Pattern[str]]]] = [
-    (category, [re.compile(p) for p in patterns]) for category, patterns in _PATH_RULES
-]
+# The whole rule table as ONE ordered alternation, one named group per
+# category. ``.*?`` in front of each category's patterns turns ``match`` into
+# "does any pattern occur anywhere", and alternation order preserves
+# first-category-wins — a single regex pass instead of one search per pattern.
+_CATEGORY_REGEX: re.Pattern[str] = re.compile(
+    "|".join(
+        f"(?P<c{index}>.*?(?:{'|'.join(patterns)}))"
+        for index, (_category, patterns) in enumerate(_PATH_RULES)
+    ),
+    re.DOTALL,
+)
 
 
 def classify_path(path: str) -> str | None:
@@ -123,12 +133,10 @@ def classify_path(path: str) -> str | None:
     used for matching. Returns ``None`` when no pattern matches — such files
     are treated as *unclassified* and block review per FR-008.
     """
-    posix = Path(path).as_posix()
-    for category, patterns in _COMPILED_RULES:
-        for pattern in patterns:
-            if pattern.search(posix):
-                return category
-    return None
+    match = _CATEGORY_REGEX.match(Path(path).as_posix())
+    if match is None or match.lastgroup is None:
+        return None
+    return _PATH_RULES[int(match.lastgroup[1:])][0]
 
 
 # ---------------------------------------------------------------------------
@@ -275,19 +283,212 @@ def _field_path_pins_for(path: str, omap: OccurrenceMap) -> tuple[str, ...]:
 
 def _fnmatch_recursive(path: str, pattern: str) -> bool:
     """fnmatch with ``**`` expanded to match any number of path components."""
+    return re.fullmatch(_recursive_glob_regex(pattern), path) is not None
+
+
+def _recursive_glob_regex(pattern: str) -> str:
+    """Return the regex source :func:`_fnmatch_recursive` matches *pattern* with."""
     # Turn the pattern into a regex:
     #   ``**`` -> ``.*``
     #   ``*``  -> ``[^/]*``
     #   ``?``  -> ``[^/]``
     placeholder = "\x00DOUBLESTAR\x00"
-    regex = (
+    return (
         pattern.replace("**", placeholder)
         .replace(".", r"\.")
         .replace("*", "[^/]*")
         .replace("?", "[^/]")
         .replace(placeholder, ".*")
     )
-    return re.fullmatch(regex, path) is not None
+
+
+# ---------------------------------------------------------------------------
+# Compiled rule matcher
+# ---------------------------------------------------------------------------
+#
+# The helpers above scan the occurrence map linearly, one ``fnmatch`` per rule,
+# for every changed file. That is fine for a single :func:`assess_file` call
+# but a codemod diff of tens of thousands of files against hundreds of rules
+# turns review gating into tens of millions of glob calls. ``OccurrenceMatcher``
+# compiles the map once into hashed and regex indexes with the SAME
+# first-match-wins / all-matches semantics, and :func:`check_diff_compliance`
+# classifies through it.
+
+_GLOB_METACHARS = frozenset("*?[")
+
+
+def _first_alternative(parts: list[tuple[int, str]]) -> re.Pattern[str] | None:
+    """Compile ``(?P<g0>...)|(?P<g1>...)`` over *parts*, or ``None`` when empty.
+
+    Regex alternation is ordered, so under ``fullmatch`` the alternative that
+    matches is the lowest-indexed part that can match the whole subject --
+    exactly the first rule a linear scan would have stopped at.
+    """
+    if not parts:
+        return None
+    return re.compile("|".join(f"(?P<g{index}>{source})" for index, source in parts))
+
+
+def _alternative_index(regex: re.Pattern[str] | None, subject: str) -> int | None:
+    if regex is None:
+        return None
+    match = regex.fullmatch(subject)
+    if match is None or match.lastgroup is None:
+        return None
+    return int(match.lastgroup[1:])
+
+
+class _GlobIndex:
+    """Ordered glob rules with :func:`_glob_match` semantics, compiled once.
+
+    Literal rules (no ``*``/``?``/``[``) live in an exact-path hash. Every other
+    rule is folded into one alternation of its :func:`fnmatch.translate` form,
+    and ``**`` rules additionally into one alternation of their
+    :func:`_fnmatch_recursive` form. A rule set that does not compile as a
+    single regex (a stray ``(`` in a ``**`` pattern) falls back to the linear
+    scan, so behaviour never diverges from :func:`_glob_match`.
+    """
+
+    def __init__(self, patterns: list[str]) -> None:
+        self._patterns = patterns
+        self._exact: dict[str, list[int]] = {}
+        self._globs: list[int] = []
+        fnmatch_parts: list[tuple[int, str]] = []
+        recursive_parts: list[tuple[int, str]] = []
+        for index, pattern in enumerate(patterns):
+            if _GLOB_METACHARS.isdisjoint(pattern):
+                self._exact.setdefault(os.path.normcase(pattern), []).append(index)
+                continue
+            self._globs.append(index)
+            fnmatch_parts.append((index, translate(os.path.normcase(pattern))))
+            if "**" in pattern:
+                recursive_parts.append((index, _recursive_glob_regex(pattern)))
+        try:
+            self._fnmatch_regex = _first_alternative(fnmatch_parts)
+            self._recursive_regex = _first_alternative(recursive_parts)
+        except re.error:
+            self._fnmatch_regex = self._recursive_regex = None
+            self._globs = list(range(len(patterns)))
+            self._exact = {}
+            self._linear = True
+        else:
+            self._linear = False
+
+    def first(self, posix: str) -> int | None:
+        """Return the index of the first rule matching *posix*, if any."""
+        if self._linear:
+            return next((i for i in self._globs if _glob_match(posix, self._patterns[i])), None)
+        normcased = os.path.normcase(posix)
+        exact = self._exact.get(normcased)
+        hits = [
+            index
+            for index in (
+                exact[0] if exact else None,
+                _alternative_index(self._fnmatch_regex, normcased),
+                _alternative_index(self._recursive_regex, posix),
+            )
+            if index is not None
+        ]
+        return min(hits) if hits else None
+
+    def every(self, posix: str) -> list[int]:
+        """Return the indexes of ALL rules matching *posix*, in rule order."""
+        matched = list(self._exact.get(os.path.normcase(posix), ()))
+        if self._globs and (self._linear or self.first(posix) is not None):
+            matched.extend(i for i in self._globs if _glob_match(posix, self._patterns[i]))
+        return sorted(matched)
+
+
+class _DeclaredPathIndex:
+    """Ordered declared paths with :func:`_path_matches` semantics, compiled once.
+
+    Plain declarations match the path itself or any of its ancestor
+    directories, so they are looked up by hashing each ancestor prefix of the
+    candidate (``a``, ``a/b``, ...) instead of testing every declaration;
+    ``*``/``?`` declarations go through a :class:`_GlobIndex`.
+    """
+
+    def __init__(self, declared_paths: list[str]) -> None:
+        self._prefixes: dict[str, int] = {}
+        glob_indexes: list[int] = []
+        glob_patterns: list[str] = []
+        for index, declared in enumerate(declared_paths):
+            declared = declared.strip()
+            if not declared:
+                continue
+            normalized = Path(declared).as_posix().rstrip("/")
+            if "*" in normalized or "?" in normalized:
+                glob_indexes.append(index)
+                glob_patterns.append(normalized)
+            else:
+                self._prefixes.setdefault(normalized, index)
+        self._glob_indexes = glob_indexes
+        self._globs = _GlobIndex(glob_patterns)
+
+    def first(self, posix: str) -> int | None:
+        """Return the index of the first declaration covering *posix*, if any."""
+        hits: list[int] = []
+        if self._prefixes:
+            candidates = [posix] + [posix[:i] for i, char in enumerate(posix) if char == "/"]
+            hits.extend(index for index in map(self._prefixes.get, candidates) if index is not None)
+        glob_hit = self._globs.first(posix)
+        if glob_hit is not None:
+            hits.append(self._glob_indexes[glob_hit])
+        return min(hits) if hits else None
+
+
+class OccurrenceMatcher:
+    """An :class:`OccurrenceMap` compiled for bulk path classification.
+
+    Each lookup returns exactly what the corresponding linear helper
+    (:func:`_exception_for`, :func:`_move_for`, :func:`_structural_target_for`,
+    :func:`_field_path_pins_for`) returns for the same path; only the cost
+    changes. Build one per map with :meth:`compile` and reuse it across files.
+    """
+
+    def __init__(self, omap: OccurrenceMap) -> None:
+        self._exceptions = [
+            exception
+            for exception in omap.exceptions
+            if not exception.get("field_path") and exception.get("path", "")
+        ]
+        self._exception_index = _GlobIndex([exception["path"] for exception in self._exceptions])
+
+        self._moves: list[tuple[str, str]] = []
+        move_paths: list[str] = []
+        for move in omap.moves:
+            for source in move.sources:
+                self._moves.append(("move-source", move.reason or "declared move source"))
+                move_paths.append(source)
+            self._moves.append(("move-destination", move.reason or "declared move destination"))
+            move_paths.append(move.destination)
+        self._move_index = _DeclaredPathIndex(move_paths)
+
+        targets = [target for target in omap.structural_targets if _is_narrow_structural_path(target.path)]
+        self._target_reasons = [target.reason or "declared structural target" for target in targets]
+        self._target_index = _DeclaredPathIndex([target.path for target in targets])
+
+        self._pin_fields = [fpe.field_path for fpe in omap.field_path_exceptions]
+        self._pin_index = _GlobIndex([fpe.path for fpe in omap.field_path_exceptions])
+
+    @classmethod
+    def compile(cls, omap: OccurrenceMap) -> OccurrenceMatcher:
+        return cls(omap)
+
+    def exception_for(self, posix: str) -> dict[str, str] | None:
+        index = self._exception_index.first(posix)
+        return None if index is None else self._exceptions[index]
+
+    def move_for(self, posix: str) -> tuple[str, str] | None:
+        index = self._move_index.first(posix)
+        return None if index is None else self._moves[index]
+
+    def structural_target_for(self, posix: str) -> str | None:
+        index = self._target_index.first(posix)
+        return None if index is None else self._target_reasons[index]
+
+    def field_path_pins_for(self, posix: str) -> tuple[str, ...]:
+        return tuple(sorted({self._pin_fields[index] for index in self._pin_index.every(posix)}))
 
 
 # ---------------------------------------------------------------------------
@@ -407,6 +608,8 @@ def assess_file(
     path: str,
     omap: OccurrenceMap,
     feature_dir_rel: str | None = None,
+    *,
+    matcher: OccurrenceMatcher | None = None,
 ) -> FileAssessment:
     """Classify a single file and determine whether it violates the map.
 
@@ -419,9 +622,17 @@ def assess_file(
     computed below — they only ADD a :attr:`FileAssessment.field_path_pins`
     annotation naming the protected field(s), which
     :func:`check_diff_compliance` turns into a targeted warning.
+
+    *matcher* is *omap* pre-compiled by :meth:`OccurrenceMatcher.compile`;
+    pass one when assessing many files against the same map. The verdict is
+    identical either way.
     """
-    base = _classify_file(path, omap, feature_dir_rel)
-    pins = _field_path_pins_for(path, omap)
+    base = _classify_file(path, omap, feature_dir_rel, matcher)
+    pins = (
+        _field_path_pins_for(path, omap)
+        if matcher is None
+        else matcher.field_path_pins_for(Path(path).as_posix())
+    )
     if not pins:
         return base
     return replace(base, field_path_pins=pins)
@@ -431,10 +642,12 @@ def _classify_file(
     path: str,
     omap: OccurrenceMap,
     feature_dir_rel: str | None,
+    matcher: OccurrenceMatcher | None = None,
 ) -> FileAssessment:
     """The whole-file classification :func:`assess_file` pins fields onto."""
+    posix = Path(path).as_posix()
     # 1) Exceptions take precedence over path heuristics.
-    exception = _exception_for(path, omap)
+    exception = _exception_for(path, omap) if matcher is None else matcher.exception_for(posix)
     if exception is not None:
         action = exception.get("action")
         reason = exception.get("reason", "matched exception")
@@ -459,7 +672,7 @@ def _classify_file(
     # 2) Declared structural moves (IC-10, #1815). A move source/destination is
     #    a reviewer-approved relocation, so it is exempt from the
     #    do_not_change path heuristic.
-    move = _move_for(path, omap)
+    move = _move_for(path, omap) if matcher is None else matcher.move_for(posix)
     if move is not None:
         role, move_reason = move
         return FileAssessment(
@@ -476,7 +689,9 @@ def _classify_file(
     #    mission are a genuine structural code edit rather than a bulk
     #    find/replace occurrence — narrow by construction (one path/glob at
     #    a time), never a blanket "ignore all src/*.py".
-    structural_reason = _structural_target_for(path, omap)
+    structural_reason = (
+        _structural_target_for(path, omap) if matcher is None else matcher.structural_target_for(posix)
+    )
     if structural_reason is not None:
         return FileAssessment(
             path=path,
@@ -553,10 +768,43 @@ def _classify_file(
     )
 
 
+#: Below this many changed files a diff is assessed inline; a process pool's
+#: start-up cost outweighs the classification work.
+_PARALLEL_MIN_FILES = 5000
+
+
+def _assess_chunk(
+    paths: list[str],
+    omap: OccurrenceMap,
+    feature_dir_rel: str | None,
+) -> list[FileAssessment]:
+    """Assess *paths* against one freshly compiled matcher (pool worker entry)."""
+    matcher = OccurrenceMatcher.compile(omap)
+    return [assess_file(p, omap, feature_dir_rel, matcher=matcher) for p in paths]
+
+
+def _assess_all(
+    changed_files: list[str],
+    omap: OccurrenceMap,
+    feature_dir_rel: str | None,
+    max_workers: int | None,
+) -> list[FileAssessment]:
+    workers = min(max_workers or os.cpu_count() or 1, len(changed_files) // _PARALLEL_MIN_FILES or 1)
+    if workers <= 1:
+        return _assess_chunk(changed_files, omap, feature_dir_rel)
+    size = -(-len(changed_files) // workers)
+    chunks = [changed_files[start : start + size] for start in range(0, len(changed_files), size)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_assess_chunk, chunk, omap, feature_dir_rel) for chunk in chunks]
+        return [assessment for future in futures for assessment in future.result()]
+
+
 def check_diff_compliance(
     changed_files: list[str],
     omap: OccurrenceMap,
     feature_dir_rel: str | None = None,
+    *,
+    max_workers: int | None = None,
 ) -> DiffCheckResult:
     """Assess every changed file and aggregate the verdict.
 
@@ -565,8 +813,14 @@ def check_diff_compliance(
     ``feature_dir`` as a repo-root-relative POSIX path — see
     :func:`assess_file` for how it anchors the runtime-state exemption. The
     function is pure — no I/O — so it can be unit-tested directly.
+
+    The map is compiled once (:class:`OccurrenceMatcher`) for the whole diff.
+    Diffs of at least ``_PARALLEL_MIN_FILES`` files per worker are split into
+    contiguous chunks assessed across a process pool of up to *max_workers*
+    (default ``os.cpu_count()``; ``1`` forces inline); the assessments come
+    back in *changed_files* order, identical to an inline run.
     """
-    assessments = [assess_file(p, omap, feature_dir_rel) for p in changed_files]
+    assessments = _assess_all(changed_files, omap, feature_dir_rel, max_workers)
     violations = [a for a in assessments if a.violation]
     errors = [f"{a.path}: {a.reason}" for a in violations]
 
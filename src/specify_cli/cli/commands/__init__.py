@@ -9,6 +9,8 @@ import typer
 from typer.core import TyperGroup
 from typer.models import DefaultPlaceholder, TyperInfo
 
+from ._lazy import CommandSpec, register_eager, register_lazy
+
 
 class HelpOnEmptyTopLevelGroup(TyperGroup):
     """Render help with exit 0 for empty top-level command-group invocation."""
@@ -173,8 +175,92 @@ def _is_doctor_restart_daemon_fast_path(argv: list[str]) -> bool:
     return False
 
 
-def register_commands(app: typer.Typer) -> None:
-    """Attach all extracted commands to the root Typer application."""
+# Root command table, in registration order. Eager registration imports every
+# module below; lazy registration (``spec-kitty`` entry point) imports one.
+_ROOT_COMMANDS: dict[str, CommandSpec] = {
+    "accept": CommandSpec("specify_cli.cli.commands.accept", "accept"),
+    "agent": CommandSpec("specify_cli.cli.commands.agent", "app", group=True, lazy_factory="build_lazy_app"),
+    "archive": CommandSpec("specify_cli.cli.commands.archive", "app", group=True, help="Archive a terminal mission (operator-invoked only)."),
+    "config": CommandSpec("specify_cli.cli.commands.config_cmd", "config"),
+    "auth": CommandSpec("specify_cli.cli.commands.auth", "app", group=True, help="Authentication commands"),
+    "charter": CommandSpec("specify_cli.cli.commands.charter", "app", group=True),
+    "context": CommandSpec("specify_cli.cli.commands.context", "app", group=True),
+    "cutover-guard": CommandSpec(
+        "specify_cli.cli.commands.cutover_guard", "cutover_guard", help="Diff-scoped fail-closed cut-over gate (pre-merge required check)."
+    ),
+    "dashboard": CommandSpec("specify_cli.cli.commands.dashboard", "dashboard"),
+    "doctor": CommandSpec("specify_cli.cli.commands.doctor", "app", group=True, help="Project health diagnostics"),
+    "doctrine": CommandSpec("specify_cli.cli.commands.doctrine", "app", group=True, help="Manage org-layer doctrine packs"),
+    "docs": CommandSpec("specify_cli.cli.commands.docs", "app", group=True, help="Common Docs retrieval commands"),
+    "glossary": CommandSpec("specify_cli.cli.commands.glossary", "app", group=True, help="Glossary management commands"),
+    "implement": CommandSpec("specify_cli.cli.commands.implement", "implement"),
+    "intake": CommandSpec("specify_cli.cli.commands.intake", "intake"),
+    # write-side-seam-matrix-tracer-01KYP3MH WP05 / T022 (FR-013): bulk
+    # issue-matrix migration command, out-of-map registration (owned_files
+    # for WP05 does not list this file; a rationale-backed minimal edit is
+    # the only way to make `spec-kitty issue-matrix migrate` reachable).
+    "issue-matrix": CommandSpec(
+        "specify_cli.tasks.issue_matrix_migration", "app", group=True, help="Issue-matrix commands (structured issue-matrix.json)."
+    ),
+    "specify": CommandSpec("specify_cli.cli.commands.lifecycle", "specify"),
+    "plan": CommandSpec("specify_cli.cli.commands.lifecycle", "plan"),
+    "tasks": CommandSpec("specify_cli.cli.commands.lifecycle", "tasks"),
+    "lint": CommandSpec("specify_cli.cli.commands.lint", "lint_command"),
+    "materialize": CommandSpec("specify_cli.cli.commands.materialize", "materialize"),
+    "regen": CommandSpec("specify_cli.cli.commands.regen", "regen", help="Regenerate the committed generated agent-command + skill fixtures from source (#3447)."),
+    "merge": CommandSpec("specify_cli.cli.commands.merge", "merge"),
+    "merge-driver-event-log": CommandSpec("specify_cli.cli.commands.merge_driver", "merge_driver_event_log", hidden=True),
+    "merge-driver-meta": CommandSpec("specify_cli.cli.commands.merge_driver", "merge_driver_meta", hidden=True),
+    "merge-driver-traces": CommandSpec("specify_cli.cli.commands.merge_driver", "merge_driver_traces", hidden=True),
+    "merge-driver-acceptance-matrix": CommandSpec("specify_cli.cli.commands.merge_driver", "merge_driver_acceptance_matrix", hidden=True),
+    "merge-driver-issue-matrix": CommandSpec("specify_cli.cli.commands.merge_driver", "merge_driver_issue_matrix", hidden=True),
+    "merge-driver-review-cycle": CommandSpec("specify_cli.cli.commands.merge_driver", "merge_driver_review_cycle", hidden=True),
+    "migrate": CommandSpec("specify_cli.cli.commands.migrate_cmd", "app", group=True),
+    "mission": CommandSpec("specify_cli.cli.commands.mission", "app", group=True),
+    "next": CommandSpec("specify_cli.cli.commands.next_cmd", "next_step"),
+    "mission-type": CommandSpec("specify_cli.cli.commands.mission_type", "app", group=True),
+    "ops": CommandSpec("specify_cli.cli.commands.ops", "app", group=True),
+    "plugin": CommandSpec("specify_cli.cli.commands.plugin", "plugin_app", group=True, help="Plugin bundle commands"),
+    "orchestrator-api": CommandSpec("specify_cli.orchestrator_api", "app", group=True),
+    "reconcile": CommandSpec(
+        "specify_cli.cli.commands.reconcile", "reconcile", help="Reconcile a mission dossier against its recorded snapshot (exit 0=parity, non-zero=divergence)."
+    ),
+    "research": CommandSpec("specify_cli.cli.commands.research", "research"),
+    "review": CommandSpec("specify_cli.cli.commands.review", "review_mission"),
+    "safe-commit": CommandSpec("specify_cli.cli.commands.safe_commit_cmd", "safe_commit_command"),
+    "spec-commit": CommandSpec("specify_cli.cli.commands.spec_commit_cmd", "spec_commit_command"),
+    "session-start": CommandSpec(
+        "specify_cli.cli.commands.session_start", "session_start", help="Emit spec-kitty orientation for the Claude Code SessionStart hook."
+    ),
+    "session-stop": CommandSpec("specify_cli.cli.commands.session_stop", "session_stop", help="Emit the open-Ops reminder for the Claude Code Stop hook."),
+    "sync": CommandSpec("specify_cli.cli.commands.sync", "app", group=True, help="Synchronization commands"),
+    "tracker": CommandSpec("specify_cli.cli.commands.tracker", "app", group=True, help="Task tracker commands", saas_gated=True),
+    "issue-search": CommandSpec("specify_cli.cli.commands.tracker", "issue_search_command", help="Search tracker issues via the hosted read path", saas_gated=True),
+    "upgrade": CommandSpec("specify_cli.cli.commands.upgrade", "upgrade"),
+    "validate-encoding": CommandSpec("specify_cli.cli.commands.validate_encoding", "validate_encoding"),
+    "validate-tasks": CommandSpec("specify_cli.cli.commands.validate_tasks", "validate_tasks"),
+    "verify-setup": CommandSpec("specify_cli.cli.commands.verify", "verify_setup"),
+    "workflow": CommandSpec("specify_cli.cli.commands.workflow", "app", group=True, help="Manage mission workflow definitions"),
+    "profiles": CommandSpec("specify_cli.cli.commands.profiles_cmd", "app", group=True),
+    "dispatch": CommandSpec("specify_cli.cli.commands.dispatch", "dispatch", help="Dispatch a request to a governed Op (canonical surface)."),
+    "profile-invocation": CommandSpec("specify_cli.cli.commands.profile_invocation", "profile_invocation_app", group=True),
+    "invocations": CommandSpec("specify_cli.cli.commands.invocations_cmd", "app", group=True),
+    # WP05 (replaces WP09 single-command registration)
+    "retrospect": CommandSpec("specify_cli.cli.commands.retrospect", "app", group=True, help="Retrospective authoring and summary (create / backfill / summary)"),
+}
+
+
+def _prepare_root_commands(app: typer.Typer) -> None:
+    _enforce_top_level_empty_group_help(app)
+    _apply_short_help_options(app)
+
+
+def register_commands(app: typer.Typer, *, lazy: bool = False) -> None:
+    """Attach all extracted commands to the root Typer application.
+
+    With ``lazy=True`` each command is a placeholder built from the completion
+    manifest that imports its module only when resolved (see ``_lazy``).
+    """
     if _is_next_fast_path(sys.argv):
         from . import next_cmd as next_cmd_module
 
@@ -190,139 +276,17 @@ def register_commands(app: typer.Typer) -> None:
         _apply_short_help_options(app)
         return
 
-    from . import accept as accept_module
-    from . import agent as agent_module
-    from . import archive as archive_module
-    from . import auth as auth_module
-    from . import plugin as plugin_module
-    from . import charter as charter_module
-    from . import config_cmd as config_cmd_module
-    from . import context as context_module
-    from . import cutover_guard as cutover_guard_module
-    from . import dashboard as dashboard_module
-    from . import dispatch as dispatch_module
-    from . import docs as docs_module
-    from . import doctor as doctor_module
-    from . import doctrine as doctrine_module
-    from . import glossary as glossary_module
-    from . import implement as implement_module
-    from . import intake as intake_module
-    from . import invocations_cmd as invocations_cmd_module
-    from specify_cli.tasks import issue_matrix_migration as issue_matrix_module
-    from . import lifecycle as lifecycle_module
-    from . import lint as lint_module
-    from . import materialize as materialize_module
-    from . import merge as merge_module
-    from . import merge_driver as merge_driver_module
-    from . import migrate_cmd as migrate_module
-    from . import mission as mission_module
-    from . import mission_type as mission_type_module
-    from . import next_cmd as next_cmd_module
-    from . import ops as ops_module
-    from . import profiles_cmd as profiles_cmd_module
-    from . import profile_invocation as profile_invocation_module
-    from . import reconcile as reconcile_module
-    from . import regen as regen_module
-    from . import research as research_module
-    from . import review as review_module
-    from . import safe_commit_cmd as safe_commit_module
-    from . import spec_commit_cmd as spec_commit_module
-    from . import session_start as session_start_module
-    from . import session_stop as session_stop_module
-    from . import sync as sync_module
-    from . import upgrade as upgrade_module
-    from . import validate_encoding as validate_encoding_module
-    from . import validate_tasks as validate_tasks_module
-    from . import verify as verify_module
-    from . import workflow as workflow_module
-    from specify_cli import orchestrator_api as orchestrator_api_module
     from specify_cli.saas.rollout import is_saas_sync_enabled
 
-    if is_saas_sync_enabled():
-        from . import tracker as tracker_module
-    else:  # pragma: no cover - deterministic environment gate
-        tracker_module = None
-
-    app.command()(accept_module.accept)
-    app.add_typer(agent_module.app, name="agent")
-    app.add_typer(archive_module.app, name="archive", help="Archive a terminal mission (operator-invoked only).")
-    app.command()(config_cmd_module.config)
-    app.add_typer(auth_module.app, name="auth", help="Authentication commands")
-    app.add_typer(charter_module.app, name="charter")
-    app.add_typer(context_module.app, name="context")
-    app.command(name="cutover-guard", help="Diff-scoped fail-closed cut-over gate (pre-merge required check).")(
-        cutover_guard_module.cutover_guard
-    )
-    app.command()(dashboard_module.dashboard)
-    app.add_typer(doctor_module.app, name="doctor", help="Project health diagnostics")
-    app.add_typer(doctrine_module.app, name="doctrine", help="Manage org-layer doctrine packs")
-    app.add_typer(docs_module.app, name="docs", help="Common Docs retrieval commands")
-    app.add_typer(glossary_module.app, name="glossary", help="Glossary management commands")
-    app.command()(implement_module.implement)
-    app.command()(intake_module.intake)
-    # write-side-seam-matrix-tracer-01KYP3MH WP05 / T022 (FR-013): bulk
-    # issue-matrix migration command, out-of-map registration (owned_files
-    # for WP05 does not list this file; a rationale-backed minimal edit is
-    # the only way to make `spec-kitty issue-matrix migrate` reachable).
-    app.add_typer(issue_matrix_module.app, name="issue-matrix", help="Issue-matrix commands (structured issue-matrix.json).")
-    app.command()(lifecycle_module.specify)
-    app.command()(lifecycle_module.plan)
-    app.command()(lifecycle_module.tasks)
-    app.command(name="lint")(lint_module.lint_command)
-    app.command(name="materialize")(materialize_module.materialize)
-    app.command(
-        name="regen",
-        help="Regenerate the committed generated agent-command + skill fixtures from source (#3447).",
-    )(regen_module.regen)
-    app.command()(merge_module.merge)
-    app.command(name="merge-driver-event-log", hidden=True)(merge_driver_module.merge_driver_event_log)
-    app.command(name="merge-driver-meta", hidden=True)(merge_driver_module.merge_driver_meta)
-    app.command(name="merge-driver-traces", hidden=True)(merge_driver_module.merge_driver_traces)
-    app.command(name="merge-driver-acceptance-matrix", hidden=True)(
-        merge_driver_module.merge_driver_acceptance_matrix
-    )
-    app.command(name="merge-driver-issue-matrix", hidden=True)(
-        merge_driver_module.merge_driver_issue_matrix
-    )
-    app.command(name="merge-driver-review-cycle", hidden=True)(
-        merge_driver_module.merge_driver_review_cycle
-    )
-    app.add_typer(migrate_module.app, name="migrate")
-    app.add_typer(mission_module.app, name="mission")
-    app.command(name="next")(next_cmd_module.next_step)
-    app.add_typer(mission_type_module.app, name="mission-type")
-    app.add_typer(ops_module.app, name="ops")
-    app.add_typer(plugin_module.plugin_app, name="plugin", help="Plugin bundle commands")
-    app.add_typer(orchestrator_api_module.app, name="orchestrator-api")
-    app.command(name="reconcile", help="Reconcile a mission dossier against its recorded snapshot (exit 0=parity, non-zero=divergence).")(
-        reconcile_module.reconcile
-    )
-    app.command()(research_module.research)
-    app.command(name="review")(review_module.review_mission)
-    app.command(name="safe-commit")(safe_commit_module.safe_commit_command)
-    app.command(name="spec-commit")(spec_commit_module.spec_commit_command)
-    app.command(name="session-start", help="Emit spec-kitty orientation for the Claude Code SessionStart hook.")(session_start_module.session_start)
-    app.command(name="session-stop", help="Emit the open-Ops reminder for the Claude Code Stop hook.")(session_stop_module.session_stop)
-    app.add_typer(sync_module.app, name="sync", help="Synchronization commands")
-    if tracker_module is not None:
-        app.add_typer(tracker_module.app, name="tracker", help="Task tracker commands")
-        app.command(name="issue-search", help="Search tracker issues via the hosted read path")(tracker_module.issue_search_command)
-    app.command()(upgrade_module.upgrade)
-    app.command(name="validate-encoding")(validate_encoding_module.validate_encoding)
-    app.command(name="validate-tasks")(validate_tasks_module.validate_tasks)
-    app.command()(verify_module.verify_setup)
-    app.add_typer(workflow_module.app, name="workflow", help="Manage mission workflow definitions")
-    app.add_typer(profiles_cmd_module.app, name="profiles")
-    app.command(name="dispatch", help="Dispatch a request to a governed Op (canonical surface).")(dispatch_module.dispatch)
-    app.add_typer(profile_invocation_module.profile_invocation_app, name="profile-invocation")
-    app.add_typer(invocations_cmd_module.app, name="invocations")
-
-    from specify_cli.cli.commands.retrospect import app as retrospect_app  # WP05 (replaces WP09 single-command registration)
-
-    app.add_typer(retrospect_app, name="retrospect", help="Retrospective authoring and summary (create / backfill / summary)")
+    saas_enabled = is_saas_sync_enabled()
+    if lazy:
+        from specify_cli.completion import load_command_manifest
+
+        register_lazy(app, _ROOT_COMMANDS, load_command_manifest(), saas_enabled=saas_enabled, prepare=_prepare_root_commands)
+    else:
+        register_eager(app, _ROOT_COMMANDS, saas_enabled=saas_enabled)
     _sort_root_command_metadata(app)
-    _enforce_top_level_empty_group_help(app)
-    _apply_short_help_options(app)
+    _prepare_root_commands(app)
 
 
 __all__ = ["register_commands"]
@@ -0,0 +1,362 @@
+"""``doctor all`` -- run the independent read-only checks concurrently.
+
+Self-registering sibling (``register(app)``, the ``doctor.py`` auto-discovery
+seam ``_provenance_doctor.py`` introduced). A full CI health sweep used to be
+sixteen separate ``spec-kitty doctor <check>`` processes, each re-resolving the
+project root, re-loading the doctrine mission-type roster, and re-probing git.
+This runner resolves that shared, read-only context ONCE and then fans the
+checks out over a thread pool, merging their ``--json`` reports into one
+payload with a per-check wall time and an optional per-check time budget.
+
+**Reuse, not reimplementation.** Each check runs through its existing
+``@app.command`` shell with ``--json`` (``sparse-checkout`` has no JSON mode,
+so its text is kept verbatim), so its report and exit code are exactly what the
+standalone subcommand produces. Nothing here knows how any check works.
+
+**Isolation on threads.** Every check prints through the one shared ``console``
+and writes ``sys.stdout`` directly in places, so the runner swaps
+``sys.stdout``/``sys.stderr`` for :class:`_ThreadRoutedStream` for the duration
+of the fan-out: each worker thread's writes land in its own buffer and
+everything else passes through. ``_json_output_guard`` is reentrant across
+threads for the same reason (see ``_doctor_shared``).
+
+**Shared context.** ``SPECIFY_REPO_ROOT`` -- the authoritative override
+``locate_project_root`` honours first -- pins every check to the root resolved
+up front, and the process-wide doctrine/git caches (``MissionTypeRepository
+.default``, ``builtin_mission_type_ids``, ``get_git_version``) are warmed before
+the workers start so they are computed once instead of raced.
+
+Only read-only invocations are included: no ``--fix``, no ``--close-stale``,
+and ``restart-daemon`` (which mutates) is never run.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Annotated, Any, TextIO
+
+import typer
+from rich.table import Table
+from typer.main import get_command
+
+from specify_cli.core.paths import locate_project_root
+
+from ._doctor_shared import _NOT_IN_PROJECT_MESSAGE, _json_error, _json_output_guard, console
+
+__all__ = ["register"]
+
+logger = logging.getLogger(__name__)
+
+#: ``(check name, argv passed to the doctor group)`` in report order. Every
+#: entry is a read-only invocation of an existing subcommand.
+ALL_CHECKS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("command-files", ("command-files", "--json")),
+    ("skills", ("skills", "--json")),
+    ("tool-surfaces", ("tool-surfaces", "--json")),
+    ("state-roots", ("state-roots", "--json")),
+    ("workspaces", ("workspaces", "--json")),
+    ("identity", ("identity", "--json")),
+    ("topology", ("topology", "--json")),
+    ("sparse-checkout", ("sparse-checkout",)),
+    ("shim-registry", ("shim-registry", "--json")),
+    ("contracts", ("contracts", "--json")),
+    ("ops", ("ops", "--json")),
+    ("orphan-daemons", ("orphan-daemons", "--json")),
+    ("mission-state", ("mission-state", "--audit", "--json")),
+    ("doctrine", ("doctrine", "--json")),
+    ("coordination", ("coordination", "--json")),
+    ("cutover", ("cutover", "--json")),
+)
+
+_DEFAULT_JOBS = 8
+_REPO_ROOT_ENV = "SPECIFY_REPO_ROOT"
+
+
+@dataclass(frozen=True)
+class CheckRun:
+    """One check's outcome inside a ``doctor all`` sweep.
+
+    Attributes:
+        name: Subcommand name.
+        argv: Arguments the subcommand was invoked with.
+        exit_code: The subcommand's exit code (1 when it raised).
+        wall_time_s: Wall-clock seconds the check took on its worker.
+        over_budget: True when ``--budget`` was given and the check exceeded it.
+        report: Parsed ``--json`` payload, or None when the output is not JSON.
+        output: Raw captured output when it did not parse as JSON.
+        error: ``"<ExcType>: <message>"`` when the subcommand raised.
+    """
+
+    name: str
+    argv: tuple[str, ...]
+    exit_code: int
+    wall_time_s: float
+    over_budget: bool
+    report: Any = None
+    output: str | None = None
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.exit_code == 0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "argv": list(self.argv),
+            "ok": self.ok,
+            "exit_code": self.exit_code,
+            "wall_time_s": self.wall_time_s,
+            "over_budget": self.over_budget,
+            "report": self.report,
+            "output": self.output,
+            "error": self.error,
+        }
+
+
+class _ThreadRoutedStream(io.TextIOBase):
+    """A ``sys.stdout`` stand-in that routes writes to a per-thread buffer.
+
+    Threads that called :meth:`capture` write into their own ``StringIO``;
+    every other thread (the runner itself, unrelated background threads)
+    passes straight through to the wrapped stream.
+    """
+
+    def __init__(self, wrapped: TextIO) -> None:
+        super().__init__()
+        self._wrapped = wrapped
+        self._local = threading.local()
+
+    def _target(self) -> TextIO:
+        buffer: io.StringIO | None = getattr(self._local, "buffer", None)
+        return buffer if buffer is not None else self._wrapped
+
+    @contextmanager
+    def capture(self) -> Iterator[io.StringIO]:
+        buffer = io.StringIO()
+        self._local.buffer = buffer
+        try:
+            yield buffer
+        finally:
+            self._local.buffer = None
+
+    def write(self, text: str) -> int:
+        return self._target().write(text)
+
+    def flush(self) -> None:
+        self._target().flush()
+
+    def isatty(self) -> bool:
+        # Captured output is parsed, never shown on a terminal: no ANSI styling.
+        return getattr(self._local, "buffer", None) is None and self._wrapped.isatty()
+
+    @property
+    def encoding(self) -> str:  # type: ignore[override]
+        return getattr(self._wrapped, "encoding", None) or "utf-8"
+
+
+@contextmanager
+def _routed_std_streams() -> Iterator[tuple[_ThreadRoutedStream, _ThreadRoutedStream]]:
+    stdout, stderr = sys.stdout, sys.stderr
+    routed_out, routed_err = _ThreadRoutedStream(stdout), _ThreadRoutedStream(stderr)
+    sys.stdout, sys.stderr = routed_out, routed_err
+    try:
+        yield routed_out, routed_err
+    finally:
+        sys.stdout, sys.stderr = stdout, stderr
+
+
+@contextmanager
+def _shared_context(repo_root: Path) -> Iterator[None]:
+    """Pin the project root and warm the process-wide read-only caches once."""
+    from doctrine.missions.mission_type_repository import MissionTypeRepository, builtin_mission_type_ids
+    from specify_cli.core.vcs.detection import get_git_version
+
+    for warm in (MissionTypeRepository.default, builtin_mission_type_ids, get_git_version):
+        try:
+            warm()
+        except Exception:  # noqa: BLE001 — the owning check reports the failure itself
+            logger.debug("doctor all: cache warm-up %s failed", getattr(warm, "__name__", warm), exc_info=True)
+
+    previous = os.environ.get(_REPO_ROOT_ENV)
+    os.environ[_REPO_ROOT_ENV] = str(repo_root)
+    try:
+        yield
+    finally:
+        if previous is None:
+            os.environ.pop(_REPO_ROOT_ENV, None)
+        else:
+            os.environ[_REPO_ROOT_ENV] = previous
+
+
+def _invoke_check(group: Any, argv: tuple[str, ...]) -> tuple[int, str | None]:
+    """Run one subcommand in non-standalone mode; return (exit code, error).
+
+    *group* is the Typer-built command group (Typer vendors its own click, so
+    it is duck-typed rather than annotated with a click class).
+    """
+    try:
+        rv = group.main(args=list(argv), prog_name="doctor", standalone_mode=False)
+    except SystemExit as exc:
+        return (exc.code if isinstance(exc.code, int) else 1), None
+    except Exception as exc:  # noqa: BLE001 — one crashing check must not sink the sweep
+        return 1, f"{type(exc).__name__}: {exc}"
+    return (rv if isinstance(rv, int) else 0), None
+
+
+def _run_one(
+    group: Any,
+    name: str,
+    argv: tuple[str, ...],
+    streams: tuple[_ThreadRoutedStream, _ThreadRoutedStream],
+    budget: float | None,
+) -> CheckRun:
+    routed_out, routed_err = streams
+    started = time.perf_counter()
+    with routed_out.capture() as out, routed_err.capture():
+        exit_code, error = _invoke_check(group, argv)
+    wall_time = time.perf_counter() - started
+    captured = out.getvalue()
+    report: Any = None
+    output: str | None = None
+    try:
+        report = json.loads(captured)
+    except ValueError:
+        output = captured
+    return CheckRun(
+        name=name,
+        argv=argv,
+        exit_code=exit_code,
+        wall_time_s=round(wall_time, 3),
+        over_budget=budget is not None and wall_time > budget,
+        report=report,
+        output=output,
+        error=error,
+    )
+
+
+def run_all_checks(
+    app: typer.Typer,
+    repo_root: Path,
+    *,
+    budget: float | None = None,
+    jobs: int = _DEFAULT_JOBS,
+    checks: tuple[tuple[str, tuple[str, ...]], ...] | None = None,
+) -> list[CheckRun]:
+    """Run *checks* (default :data:`ALL_CHECKS`) concurrently against *repo_root*.
+
+    Results come back in input order regardless of completion order.
+    """
+    checks = ALL_CHECKS if checks is None else checks
+    group = get_command(app)
+    with (
+        _json_output_guard(True),
+        _shared_context(repo_root),
+        _routed_std_streams() as streams,
+        ThreadPoolExecutor(max_workers=max(1, min(jobs, len(checks)))) as pool,
+    ):
+        futures = [pool.submit(_run_one, group, name, argv, streams, budget) for name, argv in checks]
+        return [future.result() for future in futures]
+
+
+def _payload(repo_root: Path, runs: list[CheckRun], *, budget: float | None, jobs: int, wall_time: float) -> dict[str, Any]:
+    return {
+        "ok": all(run.ok for run in runs),
+        "repo_root": str(repo_root),
+        "jobs": jobs,
+        "budget_s": budget,
+        "wall_time_s": round(wall_time, 3),
+        "cumulative_check_time_s": round(sum(run.wall_time_s for run in runs), 3),
+        "failed": [run.name for run in runs if not run.ok],
+        "over_budget": [run.name for run in runs if run.over_budget],
+        "checks": [run.to_dict() for run in runs],
+    }
+
+
+def _print_summary(payload: dict[str, Any]) -> None:
+    table = Table(box=None, padding=(0, 2), show_edge=False)
+    table.add_column("Check", style="cyan")
+    table.add_column("Result")
+    table.add_column("Exit", justify="right")
+    table.add_column("Time (s)", justify="right")
+    for check in payload["checks"]:
+        result = "[green]ok[/green]" if check["ok"] else "[red]FAIL[/red]"
+        elapsed = f"{check['wall_time_s']:.2f}"
+        if check["over_budget"]:
+            elapsed = f"[yellow]{elapsed} over budget[/yellow]"
+        table.add_row(check["name"], result, str(check["exit_code"]), elapsed)
+    console.print(table)
+    console.print(
+        f"\n{len(payload['checks']) - len(payload['failed'])}/{len(payload['checks'])} checks passed "
+        f"in {payload['wall_time_s']:.2f}s wall ({payload['cumulative_check_time_s']:.2f}s of check time)."
+    )
+    if payload["over_budget"]:
+        console.print(f"[yellow]Over the {payload['budget_s']}s budget:[/yellow] {', '.join(payload['over_budget'])}")
+    if payload["failed"]:
+        console.print(f"[red]Failed:[/red] {', '.join(payload['failed'])} -- rerun `spec-kitty doctor <check>` for details.")
+
+
+def register(app: typer.Typer) -> None:
+    """Register the ``all`` subcommand onto *app* (doctor.py auto-discovery seam)."""
+
+    @app.command(name="all")
+    def all_checks(
+        json_output: Annotated[
+            bool,
+            typer.Option("--json", help="Machine-readable JSON output"),
+        ] = False,
+        budget: Annotated[
+            float | None,
+            typer.Option("--budget", help="Per-check time slice in seconds; slower checks are marked over budget"),
+        ] = None,
+        jobs: Annotated[
+            int,
+            typer.Option("--jobs", help="Maximum number of checks run at once"),
+        ] = _DEFAULT_JOBS,
+    ) -> None:
+        """Run every read-only doctor check concurrently and merge the reports.
+
+        Resolves the project once, runs each check's --json form on a worker
+        thread, and reports per-check exit code and wall time. Never mutates
+        state: no --fix paths run.
+
+        Exit codes:
+          0  Every check passed.
+          1  At least one check failed (or not in a project).
+
+        Examples:
+            spec-kitty doctor all
+            spec-kitty doctor all --json --budget 5
+        """
+        if budget is not None and budget < 0:
+            raise typer.BadParameter("--budget must be non-negative")
+        if jobs < 1:
+            raise typer.BadParameter("--jobs must be at least 1")
+
+        repo_root = locate_project_root()
+        if repo_root is None:
+            if json_output:
+                console.print_json(json.dumps(_json_error("not_in_project", _NOT_IN_PROJECT_MESSAGE), indent=2))
+            else:
+                console.print(f"[red]Error:[/red] {_NOT_IN_PROJECT_MESSAGE}")
+            raise typer.Exit(1)
+
+        started = time.perf_counter()
+        runs = run_all_checks(app, repo_root, budget=budget, jobs=jobs)
+        payload = _payload(repo_root, runs, budget=budget, jobs=jobs, wall_time=time.perf_counter() - started)
+        if json_output:
+            console.print_json(json.dumps(payload, indent=2))
+        else:
+            _print_summary(payload)
+        raise typer.Exit(0 if payload["ok"] else 1)
@@ -23,6 +23,7 @@ from __future__ import annotations
 
 import logging
 import os
+import threading
 import warnings
 from collections.abc import Generator
 from contextlib import contextmanager
@@ -79,21 +80,49 @@ def _is_interactive_environment() -> bool:
     return all(not is_truthy(os.environ.get(var)) for var in _CI_ENV_VARS)
 
 
+class _JsonGuardState:
+    """Process-wide depth counter behind :func:`_json_output_guard`.
+
+    ``doctor all`` runs several ``--json`` checks on worker threads at once, and
+    each enters the guard. Logging's disable level and the warnings filter list
+    are process globals, so only the outermost entry saves/suppresses them and
+    only the last exit restores them -- otherwise an early-finishing check would
+    restore the level a slower sibling still depends on (or re-disable logging
+    after everyone is done).
+    """
+
+    lock = threading.Lock()
+    depth = 0
+    previous_disable = logging.NOTSET
+    warnings_ctx: warnings.catch_warnings[None] | None = None
+
+
 @contextmanager
 def _json_output_guard(enabled: bool) -> Generator[None, None, None]:
-    """Keep ``--json`` stdout/stderr machine-clean."""
+    """Keep ``--json`` stdout/stderr machine-clean (reentrant across threads)."""
     if not enabled:
         yield
         return
 
-    previous_disable = logging.root.manager.disable
-    with warnings.catch_warnings():
-        warnings.simplefilter("ignore")
-        logging.disable(logging.CRITICAL)
-        try:
-            yield
-        finally:
-            logging.disable(previous_disable)
+    state = _JsonGuardState
+    with state.lock:
+        if state.depth == 0:
+            state.previous_disable = logging.root.manager.disable
+            state.warnings_ctx = warnings.catch_warnings()
+            state.warnings_ctx.__enter__()
+            warnings.simplefilter("ignore")
+            logging.disable(logging.CRITICAL)
+        state.depth += 1
+    try:
+        yield
+    finally:
+        with state.lock:
+            state.depth -= 1
+            if state.depth == 0:
+                logging.disable(state.previous_disable)
+                if state.warnings_ctx is not None:
+                    state.warnings_ctx.__exit__(None, None, None)
+                    state.warnings_ctx = None
 
 
 def _json_error(code: str, message: str) -> dict[str, object]:
@@ -0,0 +1,138 @@
+"""Manifest-driven lazy command registration.
+
+Registering the full command tree imports every command module, which
+dominates CLI startup even though one invocation runs exactly one command.
+In lazy mode each command is registered as a :class:`LazyCommand`
+placeholder carrying only the name, help, hidden and deprecated flags
+recorded in ``_completion_manifest.json``. Listing commands (root ``--help``)
+reads the placeholders; resolving one for invocation, ``--help`` or shell
+completion imports its module and hands over to the real command.
+
+A command table (name → :class:`CommandSpec`) is the single source for both
+modes: eager registration walks it in order, lazy registration walks the
+manifest and looks each name up in it. ``tests/specify_cli/cli/commands/
+test_lazy_registration.py`` keeps the table, the manifest and the real tree
+in sync.
+"""
+
+from __future__ import annotations
+
+import importlib
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+import typer
+from typer.core import TyperCommand
+
+
+@dataclass(frozen=True)
+class CommandSpec:
+    """Where a command lives and how it is attached to its parent app.
+
+    ``attribute`` names a command callback (``group=False``), a Typer sub-app
+    (``group=True``) or, with ``registrar=True``, a ``register(app)`` function
+    that attaches the command itself. ``lazy_factory`` optionally names a
+    module-level function returning a sub-app whose own children are lazily
+    registered.
+    """
+
+    module: str
+    attribute: str
+    group: bool = False
+    help: str | None = None
+    hidden: bool = False
+    saas_gated: bool = False
+    lazy_factory: str | None = None
+    registrar: bool = False
+
+    def load(self, *, lazy: bool = False) -> Any:
+        """Import the owning module and return the callback or sub-app."""
+        module = importlib.import_module(self.module)
+        if lazy and self.lazy_factory is not None:
+            return getattr(module, self.lazy_factory)()
+        return getattr(module, self.attribute)
+
+    def register(self, app: typer.Typer, name: str, *, lazy: bool = False) -> None:
+        """Attach the real command or sub-app to *app* under *name*."""
+        target = self.load(lazy=lazy)
+        if self.registrar:
+            target(app)
+            return
+        kwargs: dict[str, Any] = {}
+        if self.help is not None:
+            kwargs["help"] = self.help
+        if self.hidden:
+            kwargs["hidden"] = True
+        if self.group:
+            app.add_typer(target, name=name, **kwargs)
+        else:
+            app.command(name=name, **kwargs)(target)
+
+
+class LazyCommand(TyperCommand):
+    """Placeholder that builds the real command the first time it is resolved.
+
+    Click creates a subcommand's context through ``make_context`` and then
+    invokes ``sub_ctx.command``, so delegating ``make_context`` is enough for
+    invocation, ``--help`` and shell completion to run against the real
+    command. The placeholder's callback is the loader.
+    """
+
+    _resolved: Any = None
+
+    def resolve(self) -> Any:
+        """Return the real click command, importing its module on first use."""
+        if self._resolved is None:
+            assert self.callback is not None
+            self._resolved = self.callback()
+        return self._resolved
+
+    def make_context(self, info_name: str | None, args: list[str], parent: Any = None, **extra: Any) -> Any:
+        return self.resolve().make_context(info_name, args, parent=parent, **extra)
+
+
+def register_eager(app: typer.Typer, specs: Mapping[str, CommandSpec], *, saas_enabled: bool) -> None:
+    """Import and register every command in *specs*, in table order."""
+    for name, spec in specs.items():
+        if spec.saas_gated and not saas_enabled:
+            continue
+        spec.register(app, name)
+
+
+def register_lazy(
+    app: typer.Typer,
+    specs: Mapping[str, CommandSpec],
+    manifest_node: Mapping[str, Any],
+    *,
+    saas_enabled: bool,
+    prepare: Callable[[typer.Typer], None],
+) -> None:
+    """Register a :class:`LazyCommand` for every manifest child that has a spec.
+
+    *prepare* is applied to the single-command app each placeholder builds
+    when it resolves, so the real command carries the same settings eager
+    registration would have given it.
+    """
+    for name, node in manifest_node.get("commands", {}).items():
+        spec = specs.get(name)
+        if spec is None or (spec.saas_gated and not saas_enabled):
+            continue
+        app.command(
+            name=name,
+            cls=LazyCommand,
+            help=node.get("help") or "",
+            hidden=bool(node.get("hidden", False)),
+            deprecated=bool(node.get("deprecated", False)),
+            add_help_option=False,
+        )(_loader(name, spec, prepare))
+
+
+def _loader(name: str, spec: CommandSpec, prepare: Callable[[typer.Typer], None]) -> Callable[[], Any]:
+    def load() -> Any:
+        holder = typer.Typer()
+        spec.register(holder, name, lazy=True)
+        prepare(holder)
+        return typer.main.get_group(holder).commands[name]
+
+    return load
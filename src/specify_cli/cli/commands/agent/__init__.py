@@ -1,45 +1,47 @@
-"""Agent command namespace for AI agents to execute spec-kitty mission actions programmatically."""
+"""Agent command namespace for AI agents to execute spec-kitty mission actions programmatically.
 
-import typer
-from typing_extensions import Annotated
+``app`` is built on first access with every sub-app imported; the
+``spec-kitty`` entry point uses :func:`build_lazy_app` instead, which imports
+only the sub-app an invocation resolves.
+"""
 
-from specify_cli.cli.commands import profiles_cmd
-from specify_cli.cli.commands.agent_retrospect import app as retrospect_app
-from specify_cli.cli.commands.decision import decision_app
+from typing import Any
 
-from . import config, context, mission, release, status, tasks, tests, workflow
-from .issue_verdict import issue_verdict_command
-from .tracer_append import tracer_append
+import typer
+from typing_extensions import Annotated
 
-app = typer.Typer(
-    name="agent",
-    help="Commands for AI agents to execute spec-kitty mission actions programmatically",
-    no_args_is_help=True
-)
+from specify_cli.cli.commands._lazy import CommandSpec, register_eager, register_lazy
 
 # Register sub-apps for each command module.
 # `mission` and `action` are the canonical command namespaces.
-app.add_typer(config.app, name="config")
-app.add_typer(mission.app, name="mission", help="Mission lifecycle commands for AI agents")
-app.add_typer(tasks.app, name="tasks")
-app.add_typer(context.app, name="context")
-app.add_typer(release.app, name="release")
-app.add_typer(workflow.app, name="action", help="Mission action commands that display prompts and instructions for agents")
-app.add_typer(status.app, name="status")
-app.add_typer(tests.app, name="tests")
-app.add_typer(decision_app, name="decision")
-app.add_typer(retrospect_app, name="retrospect", help="Retrospective synthesis commands")
-app.command(name="tracer-append")(tracer_append)
-app.add_typer(
-    profiles_cmd.app,
-    name="profile",
-    help="Compatibility alias for listing agent profiles",
-    hidden=True,
-)
-app.command(name="issue-verdict")(issue_verdict_command)
-
-
-@app.command(name="check-prerequisites", hidden=True)
+_AGENT_COMMANDS: dict[str, CommandSpec] = {
+    "config": CommandSpec("specify_cli.cli.commands.agent.config", "app", group=True),
+    "mission": CommandSpec("specify_cli.cli.commands.agent.mission", "app", group=True, help="Mission lifecycle commands for AI agents"),
+    "tasks": CommandSpec("specify_cli.cli.commands.agent.tasks", "app", group=True),
+    "context": CommandSpec("specify_cli.cli.commands.agent.context", "app", group=True),
+    "release": CommandSpec("specify_cli.cli.commands.agent.release", "app", group=True),
+    "action": CommandSpec(
+        "specify_cli.cli.commands.agent.workflow", "app", group=True, help="Mission action commands that display prompts and instructions for agents"
+    ),
+    "status": CommandSpec("specify_cli.cli.commands.agent.status", "app", group=True),
+    "tests": CommandSpec("specify_cli.cli.commands.agent.tests", "app", group=True),
+    "decision": CommandSpec("specify_cli.cli.commands.decision", "decision_app", group=True),
+    "retrospect": CommandSpec("specify_cli.cli.commands.agent_retrospect", "app", group=True, help="Retrospective synthesis commands"),
+    "tracer-append": CommandSpec("specify_cli.cli.commands.agent.tracer_append", "tracer_append"),
+    "profile": CommandSpec("specify_cli.cli.commands.profiles_cmd", "app", group=True, help="Compatibility alias for listing agent profiles", hidden=True),
+    "issue-verdict": CommandSpec("specify_cli.cli.commands.agent.issue_verdict", "issue_verdict_command"),
+    "check-prerequisites": CommandSpec("specify_cli.cli.commands.agent", "check_prerequisites_alias", hidden=True),
+}
+
+
+def _new_app() -> typer.Typer:
+    return typer.Typer(
+        name="agent",
+        help="Commands for AI agents to execute spec-kitty mission actions programmatically",
+        no_args_is_help=True,
+    )
+
+
 def check_prerequisites_alias(
     mission_slug: Annotated[
         str | None,
@@ -54,7 +56,9 @@ def check_prerequisites_alias(
     ] = False,
 ) -> None:
     """Deprecated compatibility alias forwarding to agent mission check-prerequisites."""
-    mission.check_prerequisites(
+    from .mission import check_prerequisites
+
+    check_prerequisites(
         feature=mission_slug,
         json_output=json_output,
         paths_only=paths_only,
@@ -63,4 +67,31 @@ def check_prerequisites_alias(
     )
 
 
-__all__ = ["app"]
+def build_lazy_app() -> typer.Typer:
+    """Return an agent app whose sub-apps import on first resolution."""
+    from specify_cli.cli.commands import _apply_short_help_options
+    from specify_cli.completion import load_command_manifest
+
+    lazy_app = _new_app()
+    register_lazy(
+        lazy_app,
+        _AGENT_COMMANDS,
+        load_command_manifest()["commands"]["agent"],
+        saas_enabled=True,
+        prepare=_apply_short_help_options,
+    )
+    return lazy_app
+
+
+def __getattr__(name: str) -> Any:
+    # ``app`` is built on first access so importing a submodule of this
+    # package does not import all of its siblings.
+    if name == "app":
+        eager_app = _new_app()
+        register_eager(eager_app, _AGENT_COMMANDS, saas_enabled=True)
+        globals()["app"] = eager_app
+        return eager_app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = ["app", "build_lazy_app", "check_prerequisites_alias"]
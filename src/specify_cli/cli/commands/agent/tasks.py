@@ -459,6 +459,9 @@ from specify_cli.cli.commands.agent.tasks_move_task import (
     _mt_pre_review_gate_skip_reason as _mt_pre_review_gate_skip_reason,
     _mt_pre_review_gate_with_override_scope as _mt_pre_review_gate_with_override_scope,
     _mt_pre_review_scope_override as _mt_pre_review_scope_override,
+    # The review.pre_review_shards knob (head-run sharding) joins the family
+    # surface like every other native move-task def.
+    _mt_pre_review_shards as _mt_pre_review_shards,
     _mt_release_review_lock as _mt_release_review_lock,
     _mt_resolve_gate_baseline as _mt_resolve_gate_baseline,
     # #2816/IC-04 (runtime-state-corpus-cutover, WP05): the ownership-read reroute
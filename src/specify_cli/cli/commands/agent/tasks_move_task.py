@@ -63,6 +63,7 @@ import logging
 import traceback
 import warnings
 from collections.abc import Callable, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field, replace
 from kernel.clock import format_stamp, now_utc
 from pathlib import Path
@@ -906,6 +907,7 @@ _PRE_REVIEW_CONFIG_KEY_BLOCK = "fail_on_pre_review_regression"
 _PRE_REVIEW_CONFIG_KEY_TEST_COMMAND = "pre_review_test_command"
 _PRE_REVIEW_CONFIG_KEY_TEST_COMMAND_REPLACEMENT = "test_command"
 _PRE_REVIEW_FRONTMATTER_KEY = "pre_review_test_scope"
+_PRE_REVIEW_CONFIG_KEY_SHARDS = "pre_review_shards"
 
 #: T043 (FR-011): the legacy ``review.pre_review_test_command`` key is aliased to
 #: the ``ScopeSource`` single test-command authority (``review.test_command``).
@@ -977,6 +979,18 @@ def _mt_pre_review_block_enabled(main_repo_root: Path) -> bool:
     return bool(_mt_review_config_section(main_repo_root).get(_PRE_REVIEW_CONFIG_KEY_BLOCK, False))
 
 
+def _mt_pre_review_shards(main_repo_root: Path) -> int:
+    """How many worker processes the gate's head run may shard into — ``review.pre_review_shards``.
+
+    Anything but a positive integer (absent, malformed, zero) degrades to ``1``,
+    the incumbent single-process run: a bad value must never break a transition.
+    """
+    value = _mt_review_config_section(main_repo_root).get(_PRE_REVIEW_CONFIG_KEY_SHARDS, 1)
+    if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+        return 1
+    return value
+
+
 def _mt_pre_review_gate_env_disable_reason() -> str | None:
     """#2573 FR-002: the first honored disable env var, or ``None`` if none set.
 
@@ -1098,6 +1112,7 @@ def _mt_pre_review_gate_with_override_scope(
     repo_root: Path,
     baseline: BaselineTestResult | None,
     progress_callback: Callable[[float], None] | None = None,
+    shards: int = 1,
 ) -> pre_review_gate.GateVerdict:
     """Compose a verdict for an EXPLICIT override scope (FR-004).
 
@@ -1133,6 +1148,7 @@ def _mt_pre_review_gate_with_override_scope(
         repo_root=repo_root,
         baseline=baseline,
         progress_callback=progress_callback,
+        shards=shards,
     )
 
 
@@ -1415,6 +1431,7 @@ def _mt_build_transition_gate_context(st: _MoveTaskState, inputs: _TransitionGat
         force=st.force,
         from_lane=st.old_lane,
         to_lane=st.target_lane,
+        shards=_mt_pre_review_shards(st.main_repo_root),
     )
 
 
@@ -1463,19 +1480,45 @@ def _mt_dispatch_one_gate(
     )
 
 
+# Upper bound on gate handlers dispatched at once for one transition.
+_MT_GATE_DISPATCH_WORKERS = 4
+
+
 def _mt_dispatch_transition_gates(
     bindings: Sequence[GateBinding],
     ctx: TransitionGateContext,
     *,
     handler_lookup: Callable[[str], GateHandler] = get_gate_handler,
 ) -> list[pre_review_gate.GateVerdict]:
-    """Dispatch each active binding in the resolver's stable order (FR-004/008).
+    """Dispatch each active binding; verdicts come back in the resolver's stable order (FR-004/008).
 
     ``get_gate_handler(b.handler).run(ctx)`` per binding (never a bare
-    ``GATE_REGISTRY[name]``); order is the stable sort the resolver already
-    applied, so aggregation precedence is deterministic (NFR-001).
+    ``GATE_REGISTRY[name]``). Independent handlers run concurrently (up to
+    :data:`_MT_GATE_DISPATCH_WORKERS` at a time), but the returned list is
+    always in binding order — the stable sort the resolver already applied —
+    so aggregation precedence stays deterministic (NFR-001) regardless of
+    which handler finishes first.
+
+    A ``Ctrl-C`` reaches only this (main) thread: it terminates every scoped
+    run still in flight (:func:`pre_review_gate.cancel_scoped_runs`) and turns
+    each binding that had not finished into the terminal ``CANCELLED`` verdict,
+    exactly as the sequential fail-open would have (T041/C-003).
     """
-    return [_mt_dispatch_one_gate(binding, ctx, handler_lookup) for binding in bindings]
+    if len(bindings) <= 1:
+        return [_mt_dispatch_one_gate(binding, ctx, handler_lookup) for binding in bindings]
+    with ThreadPoolExecutor(max_workers=min(len(bindings), _MT_GATE_DISPATCH_WORKERS), thread_name_prefix="spec-kitty-gate") as pool:
+        futures = [pool.submit(_mt_dispatch_one_gate, binding, ctx, handler_lookup) for binding in bindings]
+        try:
+            return [future.result() for future in futures]
+        except KeyboardInterrupt:
+            finished = [future.done() for future in futures]
+            for future in futures:
+                future.cancel()
+            pre_review_gate.cancel_scoped_runs()
+            return [
+                future.result() if done else _mt_cancelled_verdict()
+                for future, done in zip(futures, finished, strict=True)
+            ]
 
 
 _PRE_REVIEW_GATE_RUNNING_NOTICE = (
@@ -1519,6 +1562,7 @@ def _mt_collect_transition_gate_verdicts(
                     override_targets,
                     repo_root=inputs.gate_repo_root,
                     baseline=_mt_resolve_gate_baseline(st),
+                    shards=_mt_pre_review_shards(st.main_repo_root),
                 ),
                 changed_files=inputs.changed_files,
             )
@@ -201,7 +201,11 @@ def _st_resolve_dirs(st: _StatusState) -> None:
         raise typer.Exit(1)
 
 
-def _st_runtime_row(feature_dir: Path, wp_id: str | None) -> dict[str, Any]:
+def _st_runtime_row(
+    feature_dir: Path,
+    wp_id: str | None,
+    snapshot: StatusSnapshot | None = None,
+) -> dict[str, Any]:
     """Return the WP's runtime-identity row fields through the ONE canonical reader.
 
     Routes the snapshot read through
@@ -215,11 +219,14 @@ def _st_runtime_row(feature_dir: Path, wp_id: str | None) -> dict[str, Any]:
     DISTINCT resolved-binding actuals (empty when unrecorded). The board's authored
     ``agent_profile`` row field stays separate and feeds the HiC marker — the two
     are never conflated (C-008).
+
+    ``snapshot`` is the board's one reduction of ``feature_dir``'s event log
+    (annotations included); without it each row reads and reduces the log.
     """
     from specify_cli.status import reconstruct_wp_view
 
     if wp_id:
-        resolved = reconstruct_wp_view(feature_dir, wp_id).resolved
+        resolved = reconstruct_wp_view(feature_dir, wp_id, snapshot=snapshot).resolved
         return {
             "lane": resolved.lane or "",
             "agent": resolved.agent or "",
@@ -301,12 +308,18 @@ def _st_load_work_packages(st: _StatusState) -> None:
     for the pure ``build_status_view`` readiness map.
     """
     from specify_cli.cli.commands.agent import tasks as _tasks
+    # The log is read once: its transitions feed the lane snapshot, and the
+    # full stream (annotations included) reduces once into the runtime
+    # snapshot every row below reconstructs from, instead of once per WP.
+    runtime_snapshot: StatusSnapshot | None = None
     try:
-        from specify_cli.status import read_events as _st_read_events
+        from specify_cli.status import read_event_stream as _st_read_event_stream
         from specify_cli.status import reduce as _st_reduce
 
-        st.events = _st_read_events(st.feature_dir)
+        stream = _st_read_event_stream(st.feature_dir)
+        st.events = stream.transitions
         st.snapshot = _st_reduce(st.events) if st.events else None
+        runtime_snapshot = _st_reduce(stream.transitions, stream.annotations)
     except Exception:
         st.events = []
 
@@ -332,7 +345,7 @@ def _st_load_work_packages(st: _StatusState) -> None:
         # reconstruction reader (SC-007). The authored ``agent_profile`` stays
         # frontmatter-canonical (design intent for the HiC marker) and DISTINCT
         # from ``resolved_agent_profile`` (what actually ran) — C-008.
-        _st_row = _st_runtime_row(st.feature_dir, wp_id)
+        _st_row = _st_runtime_row(st.feature_dir, wp_id, runtime_snapshot)
         lane = resolve_lane_alias(str(_st_row["lane"] or Lane.GENESIS))
         st.work_packages.append(
             {
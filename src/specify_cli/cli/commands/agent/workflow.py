@@ -1012,17 +1012,24 @@ def _read_op_started_event(invocation_id: str, repo_root: Path) -> OpStartedEven
         parse_op_event,
         validate_invocation_id,
     )
+    from specify_cli.invocation.trail_store import read_compacted_events
     from specify_cli.invocation.writer import InvocationWriter
 
     validate_invocation_id(invocation_id)
     try:
         path = InvocationWriter(repo_root).invocation_path(invocation_id)
-        if not path.exists():
-            raise ValueError(f"Op record not found for invocation_id={invocation_id!r}")
-        lines = path.read_text(encoding="utf-8").splitlines()
-        if not lines:
-            raise ValueError(f"Op record is empty for invocation_id={invocation_id!r}")
-        event = parse_op_event(json.loads(lines[0]))
+        if path.exists():
+            lines = path.read_text(encoding="utf-8").splitlines()
+            if not lines:
+                raise ValueError(f"Op record is empty for invocation_id={invocation_id!r}")
+            first = json.loads(lines[0])
+        else:
+            # A closed Op may have been compacted into a segment since dispatch.
+            compacted = read_compacted_events(path.parent, invocation_id)
+            if compacted is None:
+                raise ValueError(f"Op record not found for invocation_id={invocation_id!r}")
+            first = compacted[0]
+        event = parse_op_event(first)
         if not isinstance(event, OpStartedEvent):
             raise ValueError(
                 f"First Op record is not a started event for invocation_id={invocation_id!r}"
@@ -1,13 +1,17 @@
 """``spec-kitty charter generate`` command + git-auto-track helpers (WP06 split)."""
 from __future__ import annotations
 
+import contextlib
 import json
+import os
 import subprocess
+import sys
 from pathlib import Path
 from typing import Any
 
 import typer
 
+from specify_cli.core.env import is_truthy
 from specify_cli.task_utils import TaskCliError
 
 from specify_cli.cli.commands.charter._app import charter_app, console
@@ -206,6 +210,34 @@ def _finalize_sync_result(sync_result: Any) -> tuple[list[str], list[str]]:
     return list(sync_result.warnings), list(sync_result.files_written)
 
 
+CONTEXT_WARMUP_OPT_OUT_ENV_VAR = "SPEC_KITTY_NO_CONTEXT_WARMUP"
+
+
+def _start_context_memo_warmup(repo_root: Path, mission_type: str) -> None:
+    """Pre-render charter context for *mission_type* in a detached process.
+
+    Fills the :mod:`charter.context_memo` store so the first action prompts
+    after a (re)compile are memo hits. Fire-and-forget like the upgrade
+    check: never blocks the command and never raises.
+    """
+    if is_truthy(os.environ.get(CONTEXT_WARMUP_OPT_OUT_ENV_VAR)):
+        return
+    with contextlib.suppress(OSError):
+        subprocess.Popen(
+            [
+                sys.executable,
+                "-c",
+                "import sys; from pathlib import Path; from charter.context_memo import warm_context_memo; "
+                "warm_context_memo(Path(sys.argv[1]), sys.argv[2])",
+                str(repo_root),
+                mission_type,
+            ],
+            start_new_session=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+
+
 def _load_interview_for_generate(
     *,
     repo_root: Path,
@@ -271,8 +303,8 @@ def generate(
       gitignore updates, or staging. Update the symlink target directly or
       replace it with a regular runtime charter.
     """
+    from charter.compile_cache import compile_charter_cached
     from charter.compiler import (
-        compile_charter,
         provision_mission_type_activations,
         write_compiled_charter,
     )
@@ -350,14 +382,15 @@ def generate(
         # default. `interview_data` still flows through for the interview
         # record (`_user_profile_reference`) and non-doctrine answers
         # (testing/quality/deployment prose); it is no longer read for
-        # activation selection.
-        compiled = compile_charter(
+        # activation selection. Both are only built when the inputs hash
+        # misses the compiled-charter cache.
+        compiled = compile_charter_cached(
+            repo_root=repo_root,
             mission=resolved_mission,
             interview=interview_data,
             template_set=template_set,
-            repo_root=repo_root,
-            doctrine_service=_build_doctrine_service_with_org_layer(repo_root),
-            pack_context=PackContext.from_config(repo_root),
+            doctrine_service_factory=_build_doctrine_service_with_org_layer,
+            pack_context_factory=PackContext.from_config,
         )
         bundle_result = write_compiled_charter(
             charter_dir,
@@ -401,6 +434,7 @@ def generate(
             Path(".gitignore"),
         ]
         _stage_charter_files(repo_root, commit_input_files)
+        _start_context_memo_warmup(repo_root, compiled.mission)
 
         if json_output:
             local_support_files = [
@@ -185,7 +185,8 @@ def _compile_bundle_after_merge(repo_root: Path, *, pack_name: str) -> list[str]
     Raises :class:`_ApplyCompileGitWorktreeError` when *repo_root* is not
     inside a git working tree.
     """
-    from charter.compiler import compile_charter, write_compiled_charter  # noqa: PLC0415
+    from charter.compile_cache import compile_charter_cached  # noqa: PLC0415
+    from charter.compiler import write_compiled_charter  # noqa: PLC0415
     from charter.pack_context import PackContext  # noqa: PLC0415
 
     from specify_cli.cli.commands.charter._common import _interview_path  # noqa: PLC0415
@@ -193,6 +194,7 @@ def _compile_bundle_after_merge(repo_root: Path, *, pack_name: str) -> list[str]
         _build_doctrine_service_with_org_layer,
         _is_inside_git_worktree,
         _load_interview_for_generate,
+        _start_context_memo_warmup,
     )
 
     if not _is_inside_git_worktree(repo_root):
@@ -212,15 +214,16 @@ def _compile_bundle_after_merge(repo_root: Path, *, pack_name: str) -> list[str]
         resolved_mission_type=None,
         profile=pack_name,
     )
-    compiled = compile_charter(
+    compiled = compile_charter_cached(
+        repo_root=repo_root,
         mission=resolved_mission,
         interview=interview_data,
-        repo_root=repo_root,
-        doctrine_service=_build_doctrine_service_with_org_layer(repo_root),
-        pack_context=PackContext.from_config(repo_root),
+        doctrine_service_factory=_build_doctrine_service_with_org_layer,
+        pack_context_factory=PackContext.from_config,
     )
     charter_dir = repo_root / ".kittify" / "charter"
     bundle_result = write_compiled_charter(charter_dir, compiled, repo_root=repo_root)
+    _start_context_memo_warmup(repo_root, compiled.mission)
     return list(bundle_result.files_written)
 
 
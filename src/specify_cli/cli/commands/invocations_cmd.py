@@ -15,9 +15,17 @@ append-only index at ``kitty-ops/ops-index.jsonl``:
 - Each line: ``{invocation_id, profile_id, started_at}``
 - Written by ``InvocationWriter.write_started()`` immediately after the
   per-invocation file is created.
+- ``InvocationWriter.write_completed()`` appends a ``completed`` line
+  carrying the action and completion fields, so an invocation closed on
+  this machine is resolved from the index alone.
 - ``_iter_records()`` reads the index *in reverse* (O(1) seek-to-end per
-  block) to find the N most-recent matching entries, then opens only those
-  individual files to determine ``open`` vs ``closed`` status.
+  block) to find the N most-recent matching entries, then opens only the
+  individual files of entries the index cannot close.
+
+``spec-kitty invocations compact`` rolls closed invocations into
+self-describing segment files under ``kitty-ops/segments/`` (see
+``specify_cli.invocation.trail_store``); records whose loose file is gone are
+resolved from segment headers without reading their events.
 
 Sort is by ``started_at`` from the index content (not filesystem mtime) to
 guarantee correct temporal ordering.
@@ -39,6 +47,13 @@ from rich.table import Table
 
 from specify_cli.invocation.errors import LegacyRecordError
 from specify_cli.invocation.record import OpCompletedEvent, OpStartedEvent, parse_op_event
+from specify_cli.invocation.trail_store import (
+    DEFAULT_MIN_AGE_HOURS,
+    SEGMENTS_DIR,
+    SegmentEntry,
+    compact_invocations,
+    read_segment_index,
+)
 from specify_cli.invocation.writer import EVENTS_DIR, INDEX_PATH
 from specify_cli.task_utils import find_repo_root
 
@@ -232,8 +247,13 @@ def _iter_records_from_index(
 ) -> Iterator[dict]:  # type: ignore[type-arg]
     """Yield invocation records using the index for O(N) scanning instead of O(N*disk).
 
-    For each matching index entry (newest first) open only the per-invocation
-    file to determine ``open`` / ``closed`` status.
+    Each started entry (newest first) is resolved in this order:
+
+    1. a ``completed`` index line seen earlier in the reverse scan closes it
+       with no file access;
+    2. otherwise the per-invocation file decides ``open`` / ``closed``;
+    3. a record whose file is gone is looked up in the segment headers
+       (loaded once, on first need) and skipped if it is not there either.
 
     Args:
         events_dir: ``kitty-ops/``
@@ -243,33 +263,61 @@ def _iter_records_from_index(
     """
     count = 0
     seen: set[str] = set()  # de-duplicate (index may have repeated entries on edge cases)
+    completions: dict[str, dict] = {}  # type: ignore[type-arg]
+    segments: dict[str, SegmentEntry] | None = None
     for entry in _iter_index_reverse(index_path):
         if count >= limit:
             break
         inv_id = entry.get("invocation_id", "")
+        if entry.get("event") == "completed":
+            # Appended after its started line, so the reverse scan meets it first.
+            if inv_id:
+                completions.setdefault(inv_id, entry)
+            continue
         if not inv_id or inv_id in seen:
             continue
         seen.add(inv_id)
         if profile_filter and entry.get("profile_id") != profile_filter:
             continue
-        # Determine open / closed by checking the per-invocation file.
-        inv_file = events_dir / f"{inv_id}.jsonl"
         record: dict = dict(entry)  # type: ignore[type-arg]
-        if not _apply_completion_status(record, inv_file, inv_id, legacy_ids):
-            continue  # legacy line → warn-and-skip (see _warn_legacy)
-        # Also read full started record to get 'action' field (not stored in index).
-        started_raw = _read_first_line(inv_file)
-        if started_raw is None:
-            continue  # stale/dangling index row; canonical per-op file is gone/unreadable
-        started = _parse_started(started_raw, legacy_ids)
-        if started is None:
-            continue  # legacy line → warn-and-skip (see _warn_legacy)
-        record.setdefault("action", started.action)
-        record.setdefault("event", started.event)
+        completion = completions.get(inv_id)
+        inv_file = events_dir / f"{inv_id}.jsonl"
+        if completion is not None and completion.get("action"):
+            _apply_indexed_completion(record, completion)
+        elif inv_file.exists():
+            if not _apply_completion_status(record, inv_file, inv_id, legacy_ids):
+                continue  # legacy line → warn-and-skip (see _warn_legacy)
+            # Also read full started record to get 'action' field (not stored in index).
+            started_raw = _read_first_line(inv_file)
+            if started_raw is None:
+                continue  # unreadable per-op file
+            started = _parse_started(started_raw, legacy_ids)
+            if started is None:
+                continue  # legacy line → warn-and-skip (see _warn_legacy)
+            record.setdefault("action", started.action)
+            record.setdefault("event", started.event)
+        else:
+            if segments is None:
+                segments = read_segment_index(events_dir)
+            compacted = segments.get(inv_id)
+            if compacted is None:
+                continue  # stale/dangling index row; canonical per-op file is gone
+            record = {**record, **compacted.to_record()}
         yield record
         count += 1
 
 
+def _apply_indexed_completion(record: dict, completion: dict) -> None:  # type: ignore[type-arg]
+    """Close *record* from a ``completed`` index line (same keys as the file path)."""
+    record["completed_at"] = completion.get("completed_at")
+    record["outcome"] = completion.get("outcome")
+    record["closed_by"] = completion.get("closed_by")
+    record["evidence_ref"] = completion.get("evidence_ref")
+    record["status"] = "closed"
+    record.setdefault("action", completion.get("action"))
+    record.setdefault("event", "started")
+
+
 def _apply_completion_status(
     record: dict,  # type: ignore[type-arg]
     inv_file: Path,
@@ -333,6 +381,16 @@ def _iter_records_from_dir(
             continue  # legacy line → warn-and-skip (see _warn_legacy)
         raw_records.append(record)
 
+    # Compacted invocations are closed by construction; their headers carry
+    # everything a listing shows, so segment bodies are never read here.
+    loose_ids = {record.get("invocation_id") for record in raw_records}
+    for inv_id, compacted in read_segment_index(events_dir).items():
+        if inv_id in loose_ids:
+            continue  # interrupted compaction left both copies
+        if profile_filter and compacted.profile_id != profile_filter:
+            continue
+        raw_records.append(compacted.to_record())
+
     raw_records.sort(key=lambda r: r.get("started_at", ""), reverse=True)
 
     count = 0
@@ -430,3 +488,50 @@ def list_invocations(
             (r.get("started_at") or "?")[:19],
         )
     console.print(table)
+
+
+@app.command("compact")
+def compact_invocations_cmd(
+    older_than: float = typer.Option(
+        DEFAULT_MIN_AGE_HOURS,
+        "--older-than",
+        help="Only compact invocations closed at least this many hours ago",
+    ),
+    dry_run: bool = typer.Option(False, "--dry-run", help="Report what would be compacted without writing"),
+    json_output: bool = typer.Option(False, "--json", help="Emit the compaction report as JSON"),
+) -> None:
+    """Roll closed invocation records into segment files under kitty-ops/segments/.
+
+    Open invocations and invocations closed less than ``--older-than`` hours
+    ago stay as loose ``kitty-ops/<ULID>.jsonl`` files. Segments and the
+    removed loose files are left uncommitted for the operator to review and
+    commit.
+    """
+    from kernel.clock import now_utc
+
+    if older_than < 0:
+        raise typer.BadParameter("--older-than must be >= 0")
+    repo_root = _get_repo_root()
+    report = compact_invocations(
+        repo_root / EVENTS_DIR,
+        now=now_utc(),
+        min_age_hours=older_than,
+        dry_run=dry_run,
+    )
+    if json_output:
+        typer.echo(json.dumps(report.to_dict(), indent=2))
+        return
+
+    verb = "Would compact" if dry_run else "Compacted"
+    console.print(
+        f"{verb} {report.compacted} closed invocation(s)"
+        + (f" into {len(report.segments)} segment(s)" if report.segments else "")
+        + f"; kept {report.skipped_open} open and {report.skipped_recent} recently closed."
+    )
+    for name in report.segments:
+        console.print(f"  [dim]{SEGMENTS_DIR}/{name}[/dim]")
+    if report.skipped_unreadable:
+        _console_err.print(
+            f"[yellow]Warning:[/yellow] left {len(report.skipped_unreadable)} unreadable or legacy record(s) loose. "
+            "Run 'spec-kitty upgrade' to migrate kitty-ops records."
+        )
@@ -45,6 +45,7 @@ from specify_cli.retrospective import (
     emit_capture_failed,
     emit_skipped as _emit_retro_skipped,
     generate_retrospective,
+    generate_retrospectives,
     resolve_policy,
     write_gen_record,
     RecordExistsError,
@@ -52,7 +53,7 @@ from specify_cli.retrospective import (
 )
 from specify_cli.retrospective.reader import read_gen_record
 from specify_cli.retrospective.writer import resolve_existing_record_path
-from specify_cli.retrospective.schema import GenActor, GenProvenance, ProvenanceKind
+from specify_cli.retrospective.schema import GenActor, GenProvenance, GenRetrospectiveRecord, ProvenanceKind
 from specify_cli.retrospective.summary import (
     classify_mission_record,
     iter_mission_instance_dirs,
@@ -635,6 +636,15 @@ def backfill_cmd(  # noqa: C901
         bool,
         typer.Option("--json", help="Emit a single aggregate JSON object at the end"),
     ] = False,
+    jobs: Annotated[
+        int,
+        typer.Option(
+            "--jobs",
+            "-j",
+            min=0,
+            help="Generate records in parallel across N worker processes (0 = CPU count, 1 = serial)",
+        ),
+    ] = 0,
 ) -> None:
     """Author retrospective records for historical missions in bulk."""
     # Parse window
@@ -701,6 +711,34 @@ def backfill_cmd(  # noqa: C901
         else:
             work_candidates.append(c)
 
+    # Pre-generate records for every candidate that will be authored. Each
+    # mission is independent, so generation fans out across a process pool;
+    # writing, emitting, and reporting stay sequential below so output order
+    # and event-log appends are unchanged.
+    pregenerated: dict[str, GenRetrospectiveRecord | Exception] = {}
+    if not dry_run:
+        to_generate = [
+            str(c["mission_slug"])
+            for c in work_candidates
+            if not _canonical_record_path(repo_root, str(c["mission_slug"]), str(c["mission_id"])).exists()
+        ]
+        if to_generate:
+            try:
+                batch_policy, batch_source_map = resolve_policy(repo_root)
+            except Exception:  # noqa: BLE001 — surfaced per-mission by the serial path
+                pass
+            else:
+                outcomes = generate_retrospectives(
+                    to_generate,
+                    batch_policy,
+                    repo_root,
+                    max_workers=jobs or None,
+                    provenance_kind="backfill",
+                    actor=_gen_actor(),
+                    policy_source=batch_source_map,
+                )
+                pregenerated = dict(zip(to_generate, outcomes, strict=True))
+
     # Process each work candidate
     def _process_candidate(c: dict[str, object]) -> None:
         mid = str(c["mission_id"])
@@ -724,15 +762,21 @@ def backfill_cmd(  # noqa: C901
 
         # Generate and write
         try:
-            policy, source_map = resolve_policy(repo_root)
-            record = generate_retrospective(
-                mslug,
-                policy,
-                repo_root,
-                provenance_kind="backfill",
-                actor=_gen_actor(),
-                policy_source=source_map,
-            )
+            outcome = pregenerated.get(mslug)
+            if isinstance(outcome, Exception):
+                raise outcome
+            if outcome is None:
+                policy, source_map = resolve_policy(repo_root)
+                record = generate_retrospective(
+                    mslug,
+                    policy,
+                    repo_root,
+                    provenance_kind="backfill",
+                    actor=_gen_actor(),
+                    policy_source=source_map,
+                )
+            else:
+                record = outcome
             import dataclasses
             record = dataclasses.replace(
                 record,
@@ -28,8 +28,6 @@ import re
 from dataclasses import dataclass
 from typing import Literal, Protocol
 
-import httpx
-
 # ---------------------------------------------------------------------------
 # Constants
 # ---------------------------------------------------------------------------
@@ -202,6 +200,10 @@ class PyPIProvider:
         Returns:
             A :class:`LatestVersionResult` describing the outcome.  Never raises.
         """
+        # Imported here: ``specify_cli.distribution`` imports this module on
+        # every CLI start, and only the upgrade nag ever makes the request.
+        import httpx  # noqa: PLC0415
+
         user_agent = _compat_user_agent()
         url = _PYPI_URL_TEMPLATE.format(package=package)
 
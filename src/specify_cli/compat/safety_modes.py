@@ -132,6 +132,8 @@ _ORCHESTRATOR_API_UNSAFE_SUBCOMMANDS: frozenset[str] = frozenset(
         "append-history",
         "accept-mission",
         "merge-mission",
+        # Dispatches every verb above from one long-lived process.
+        "serve",
     }
 )
 
@@ -192,6 +194,7 @@ def register_mode_predicates() -> None:
     register_safety(("doctor", "mission-state"), predicate=_mission_state_predicate)  # mode-aware
     register_safety(("doctor", "shim-registry"), predicate=None)  # read-only
     register_safety(("doctor", "sparse-checkout"), predicate=_sparse_checkout_predicate)  # mode-aware
+    register_safety(("doctor", "all"), predicate=None)  # read-only (runs only the read-only check forms)
     # Orchestrator API — JSON parser/read-only paths safe; state transitions unsafe.
     register_safety(("orchestrator-api",), predicate=_orchestrator_api_predicate)
 
@@ -113,7 +113,12 @@ def _manifest_path() -> Path:
     return Path(__file__).with_name(_MANIFEST_FILENAME)
 
 
-def _load_manifest() -> dict[str, Any]:
+def load_command_manifest() -> dict[str, Any]:
+    """Return the parsed command manifest (names, help, hidden/deprecated flags).
+
+    Read once per process; shared by shell completion and the lazy command
+    registration in ``specify_cli.cli.commands``.
+    """
     global _MANIFEST_CACHE
     if _MANIFEST_CACHE is None:
         import json
@@ -131,7 +136,7 @@ def run_completion(env: Mapping[str, str] | None = None) -> int:
     from typer.completion import shell_complete
 
     completion_init()
-    command = _build_command_tree(_load_manifest(), saas_enabled=_saas_enabled(active_env))
+    command = _build_command_tree(load_command_manifest(), saas_enabled=_saas_enabled(active_env))
     return shell_complete(command, {}, PROG_NAME, COMPLETE_VAR, instruction)
 
 
@@ -241,6 +246,7 @@ def _main(argv: list[str]) -> int:
 
 
 __all__ = [
+    "load_command_manifest",
     "maybe_run_completion",
 ]
 
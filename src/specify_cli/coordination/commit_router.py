@@ -9,6 +9,12 @@ Extracted from ``cli/commands/agent/mission.py`` to provide a single canonical
    artifacts there before committing.
 3. Otherwise commits directly to the primary checkout (flattened / unprotected).
 
+With ``SPEC_KITTY_PLUMBING_COMMITS`` set, step 2 commits through
+``plumbing_commit`` instead of ``safe_commit`` (blobs + ``mktree`` +
+``commit-tree`` + compare-and-swap ``update-ref``): no index staging or refresh
+in the coordination worktree, and no worktree materialised at all when none
+exists yet.
+
 This module owns the extraction described in WP02 / IC-02. The three formerly
 open-coded inline commit tails in ``mission.py`` (gap-analysis, generator-config,
 finalize-tasks) are folded into this entry point (T027 / #2056).
@@ -24,6 +30,7 @@ not at read time.
 from __future__ import annotations
 
 import logging
+import os
 import shutil
 import subprocess
 from dataclasses import dataclass, replace
@@ -40,7 +47,8 @@ from mission_runtime import (
     routes_through_coordination,
 )
 from specify_cli.coordination.coherence import is_coord_residue_churn
-from specify_cli.git import safe_commit
+from specify_cli.core.env import is_truthy
+from specify_cli.git import plumbing_commit, safe_commit
 
 
 class PrimaryKindReachedCoordStagingError(RuntimeError):
@@ -89,6 +97,13 @@ _ANALYSIS_REPORT_FILENAME: Final = "analysis-report.md"
 _STATUS_NO_OP_WRONG_SURFACE: Final = "no_op_wrong_surface"
 _STATUS_ERROR: Final = "error"
 
+#: Opt-in switch for plumbing coordination commits: a coordination-partition
+#: commit is built with ``plumbing_commit`` (no index staging, no stash, no
+#: index refresh) instead of ``safe_commit``, and an unmaterialised coordination
+#: worktree is left unmaterialised — the commit lands on the coordination ref
+#: straight from the primary checkout.
+PLUMBING_COMMIT_ENV: Final = "SPEC_KITTY_PLUMBING_COMMITS"
+
 
 @dataclass(frozen=True)
 class CommitRouterResult:
@@ -296,7 +311,16 @@ def _commit_partition_group(
             ),
         )
 
-    if use_coord:
+    use_plumbing = use_coord and is_truthy(os.environ.get(PLUMBING_COMMIT_ENV))
+    worktree_free_paths = (
+        _worktree_free_coord_paths(repo_root, mission_slug, files, kind=kind) if use_plumbing else None
+    )
+    if worktree_free_paths is not None:
+        # Worktree-free: the coordination worktree was never materialised, so
+        # the primary checkout is still the read authority (the create-window)
+        # and the artifacts are committed onto the coordination ref from there.
+        worktree_root, commit_paths = repo_root, worktree_free_paths
+    elif use_coord:
         worktree_root, commit_paths = _materialise_coord_worktree(
             repo_root,
             mission_slug,
@@ -305,6 +329,10 @@ def _commit_partition_group(
             kind=kind,
             primary_paths_created_this_invocation=primary_paths_created_this_invocation,
         )
+        # A resolution fallback to the primary checkout keeps the historical
+        # safe_commit path (and its HEAD assertion) rather than plumbing the
+        # unfiltered primary files onto the coordination ref.
+        use_plumbing = use_plumbing and worktree_root != repo_root
     else:
         # Flattened or unprotected primary: commit directly.
         worktree_root, commit_paths = repo_root, files
@@ -327,13 +355,22 @@ def _commit_partition_group(
         )
 
     try:
-        commit_result = safe_commit(
-            repo_root=repo_root,
-            worktree_root=worktree_root,
-            target=placement,
-            message=message,
-            paths=commit_paths,
-        )
+        if use_plumbing:
+            commit_result = plumbing_commit(
+                repo_root=repo_root,
+                source_root=worktree_root,
+                target=placement,
+                message=message,
+                paths=commit_paths,
+            )
+        else:
+            commit_result = safe_commit(
+                repo_root=repo_root,
+                worktree_root=worktree_root,
+                target=placement,
+                message=message,
+                paths=commit_paths,
+            )
     except subprocess.CalledProcessError as exc:
         stderr = getattr(exc, "stderr", "") or ""
         if "nothing to commit" in stderr or "nothing added to commit" in stderr:
@@ -367,7 +404,13 @@ def _commit_partition_group(
     # status-only coord write produces — no behaviour change for status writes;
     # the planning case is gone.
     if use_coord and target_branch:
-        _try_advance_ref(repo_root, target_branch, worktree_root, mission_slug=mission_slug)
+        _try_advance_ref(
+            repo_root,
+            target_branch,
+            worktree_root,
+            mission_slug=mission_slug,
+            head=commit_hash if use_plumbing else None,
+        )
 
     return CommitRouterResult(
         status=_STATUS_COMMITTED,
@@ -669,6 +712,47 @@ def _materialise_coord_worktree(
     return coord_wt, tuple(coord_paths)
 
 
+def _worktree_free_coord_paths(
+    repo_root: Path,
+    mission_slug: str,
+    files: tuple[Path, ...],
+    *,
+    kind: MissionArtifactKind,
+) -> tuple[Path, ...] | None:
+    """Return the primary-checkout paths to plumb onto the coordination ref.
+
+    ``None`` when the worktree-free path does not apply and the caller must go
+    through :func:`_materialise_coord_worktree`: the coordination worktree is
+    already materialised (it is then the authoritative surface for the files
+    it carries) or its identity cannot be resolved. Otherwise the same files
+    :func:`_stage_artifacts_in_coord_worktree` would copy are committed from
+    where they are, with no copy and no residue cleanup — the primary checkout
+    stays the read authority until something materialises the worktree.
+
+    The DECISION 8 guard applies here exactly as at the staging boundary.
+    """
+    if is_primary_artifact_kind(kind):
+        raise PrimaryKindReachedCoordStagingError(
+            f"PRIMARY-partition kind {kind!r} reached coordination staging for "
+            f"mission {mission_slug!r}; planning artifacts must commit directly to "
+            f"the primary target branch and never transit the coordination worktree."
+        )
+
+    from specify_cli.coordination.surface_resolver import is_under_worktrees_segment
+    from specify_cli.coordination.workspace import CoordinationWorkspace
+
+    mid8 = _resolve_mid8(repo_root, mission_slug)
+    if mid8 is None or CoordinationWorkspace.is_present(repo_root, mission_slug, mid8):
+        return None
+    commit_paths: list[Path] = []
+    for src in files:
+        rel = src.relative_to(repo_root)
+        if _skips_coord_staging(src, rel) or is_under_worktrees_segment(rel):
+            continue
+        commit_paths.append(src)
+    return tuple(commit_paths)
+
+
 def _resolve_mid8(repo_root: Path, mission_slug: str) -> str | None:
     """Load meta.json and derive mid8 for worktree resolution."""
     try:
@@ -693,6 +777,46 @@ def _resolve_mid8(repo_root: Path, mission_slug: str) -> str | None:
         return None
 
 
+def _skips_coord_staging(src: Path, rel: Path) -> bool:
+    """Return True for an artifact that is never carried onto the coordination ref.
+
+    Shared by the worktree copy (:func:`_stage_artifacts_in_coord_worktree`) and
+    the worktree-free plumbing path (:func:`_worktree_free_coord_paths`) so both
+    skip exactly the same files.
+    """
+    # WP13 (IC-07c): single-source through the canonical file→kind classifier
+    # instead of a locally-duplicated ``{"status.events.jsonl", "status.json"}``
+    # literal. Narrow ON PURPOSE (STATUS_STATE only, not the full
+    # ``is_coord_residue_churn`` union): ``acceptance-matrix.json`` /
+    # ``issue-matrix.md`` (``ACCEPTANCE_MATRIX`` / ``ISSUE_MATRIX``) STAY COORD
+    # and must continue to be staged below — only the status log/snapshot are
+    # authored directly in the coord worktree and must never be copied from a
+    # stale primary.
+    if kind_for_mission_file(rel) is MissionArtifactKind.STATUS_STATE:
+        return True
+    # FR-003 (coord-commit-integrity): ``analysis-report.md`` was re-homed
+    # COORD→PRIMARY — it lands on the primary ``target_branch`` and is NEVER
+    # a second copy on the coordination worktree. Skip its copy2 staging path
+    # (mirroring the STATUS_STATE skip above) so a coord commit that
+    # happens to sweep it makes no coord residue. ``acceptance-matrix.json`` /
+    # ``issue-matrix.md`` STAY COORD and continue to be staged below.
+    #
+    # NOTE (coord-commit-integrity SURFACE A #2, DEFERRED): the operator asked
+    # to generalise this to a by-construction
+    # ``is_primary_artifact_kind(kind_for_mission_file(src))`` skip. That is
+    # UNSAFE as specified: this helper legitimately stages OTHER PRIMARY-kind
+    # planning artifacts (``tasks.md`` / ``lanes.json``) into the coord worktree
+    # for a combined commit — a pinned contract
+    # (``test_finalize_coord_staging.py`` / ``test_finalize_clobber_e2e.py``).
+    # There is no partition-derived distinction between ``analysis-report.md``
+    # (must-skip, re-homed) and ``tasks.md`` (must-stage), so a blanket
+    # primary-kind skip regresses those tests. Closing the "next re-home
+    # silently regresses" class requires first retiring the tasks.md/lanes.json
+    # → coord staging (a separate finalize-flow change); until then this stays
+    # the narrow, behaviour-correct analysis-report skip.
+    return src.name == _ANALYSIS_REPORT_FILENAME
+
+
 def _stage_artifacts_in_coord_worktree(
     files: list[Path],
     coord_worktree: Path,
@@ -721,37 +845,7 @@ def _stage_artifacts_in_coord_worktree(
 
     for src in files:
         rel = src.relative_to(repo_root)
-        # WP13 (IC-07c): single-source through the canonical file→kind classifier
-        # instead of a locally-duplicated ``{"status.events.jsonl", "status.json"}``
-        # literal. Narrow ON PURPOSE (STATUS_STATE only, not the full
-        # ``is_coord_residue_churn`` union): ``acceptance-matrix.json`` /
-        # ``issue-matrix.md`` (``ACCEPTANCE_MATRIX`` / ``ISSUE_MATRIX``) STAY COORD
-        # and must continue to be staged below — only the status log/snapshot are
-        # authored directly in the coord worktree and must never be copied from a
-        # stale primary.
-        if kind_for_mission_file(rel) is MissionArtifactKind.STATUS_STATE:
-            continue
-        # FR-003 (coord-commit-integrity): ``analysis-report.md`` was re-homed
-        # COORD→PRIMARY — it lands on the primary ``target_branch`` and is NEVER
-        # a second copy on the coordination worktree. Skip its copy2 staging path
-        # (mirroring the STATUS_STATE skip above) so a coord commit that
-        # happens to sweep it makes no coord residue. ``acceptance-matrix.json`` /
-        # ``issue-matrix.md`` STAY COORD and continue to be staged below.
-        #
-        # NOTE (coord-commit-integrity SURFACE A #2, DEFERRED): the operator asked
-        # to generalise this to a by-construction
-        # ``is_primary_artifact_kind(kind_for_mission_file(src))`` skip. That is
-        # UNSAFE as specified: this helper legitimately stages OTHER PRIMARY-kind
-        # planning artifacts (``tasks.md`` / ``lanes.json``) into the coord worktree
-        # for a combined commit — a pinned contract
-        # (``test_finalize_coord_staging.py`` / ``test_finalize_clobber_e2e.py``).
-        # There is no partition-derived distinction between ``analysis-report.md``
-        # (must-skip, re-homed) and ``tasks.md`` (must-stage), so a blanket
-        # primary-kind skip regresses those tests. Closing the "next re-home
-        # silently regresses" class requires first retiring the tasks.md/lanes.json
-        # → coord staging (a separate finalize-flow change); until then this stays
-        # the narrow, behaviour-correct analysis-report skip.
-        if src.name == _ANALYSIS_REPORT_FILENAME:
+        if _skips_coord_staging(src, rel):
             continue
         if is_under_worktrees_segment(rel):
             try:
@@ -937,11 +1031,14 @@ def _any_path_absent(paths: tuple[Path, ...]) -> bool:
 
 
 def _is_empty_changeset_error(exc: RuntimeError) -> bool:
-    # Match ONLY the genuine empty-changeset signal safe_commit now raises with a
-    # distinct message. A generic "safe_commit: git commit failed …" (a rejecting
-    # pre-commit hook, a lock error, etc.) must fall through to a real error,
-    # never be silently reported as "unchanged".
-    return "safe_commit: nothing to commit" in str(exc)
+    # Match ONLY the genuine empty-changeset signal safe_commit / plumbing_commit
+    # raise with a distinct message. A generic "safe_commit: git commit failed …"
+    # (a rejecting pre-commit hook, a lock error, etc.) must fall through to a
+    # real error, never be silently reported as "unchanged".
+    return any(
+        signal in str(exc)
+        for signal in ("safe_commit: nothing to commit", "plumbing_commit: nothing to commit")
+    )
 
 
 def _try_advance_ref(
@@ -950,11 +1047,14 @@ def _try_advance_ref(
     coord_worktree: Path,
     *,
     mission_slug: str | None = None,
+    head: str | None = None,
 ) -> None:
     """Best-effort fast-forward of *primary_branch* to the coord HEAD (#1878).
 
     ``advance_branch_ref`` advances the ref to a *SHA* (it does not accept a
-    worktree path), so resolve the coordination worktree's HEAD here first.
+    worktree path), so resolve the coordination worktree's HEAD here first —
+    unless the caller already knows it (``head``: a plumbing commit, which may
+    not have run in the coordination worktree at all).
     Toolchain-generated churn (coordination status residue, spec-kitty's own
     bookkeeping) on the primary checkout is legitimate after a coord-branch
     write, so exclude it from the dirty gate via the single canonical churn
@@ -967,13 +1067,14 @@ def _try_advance_ref(
         from specify_cli.coordination.coherence import is_toolchain_generated_churn
         from specify_cli.git.ref_advance import advance_branch_ref
 
-        head = subprocess.run(
-            ["git", "rev-parse", "HEAD"],
-            cwd=str(coord_worktree),
-            capture_output=True,
-            text=True,
-            check=True,
-        ).stdout.strip()
+        if head is None:
+            head = subprocess.run(
+                ["git", "rev-parse", "HEAD"],
+                cwd=str(coord_worktree),
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout.strip()
 
         advance_branch_ref(
             repo_root,
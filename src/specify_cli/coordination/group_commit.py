@@ -0,0 +1,101 @@
+"""Group-commit helpers for :class:`BookkeepingTransaction`.
+
+In the default mode every bookkeeping transaction holds the feature status
+lock across ``append → materialize → safe_commit``, so N agents finishing at
+the same moment pay N serial git commits. In group-commit mode (opt-in via
+``acquire(group_commit=True)`` or ``SPEC_KITTY_GROUP_COMMIT=1``) a transaction
+appends under the status lock, releases it, and then queues on a per-feature
+*commit* lock. Whoever holds the commit lock commits the status files as they
+stand, which carries every event appended while the previous commit was in
+flight. A transaction that reaches the commit lock and finds its events
+already on the destination ref takes a receipt for that commit instead of
+making a new one.
+
+Each caller still gets its own receipt, pinned to the commit that carries its
+events and verified by reading the committed event log back. When a commit
+fails, a caller removes only its own event lines from the log (other writers
+may have appended after it, so the default surgical truncate no longer
+applies) and re-materialises ``status.json``.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+from pathlib import Path
+
+from kernel.atomic import atomic_write
+from specify_cli.core.env import is_truthy
+
+#: Environment switch that turns group commit on for every transaction whose
+#: caller did not choose explicitly.
+GROUP_COMMIT_ENV = "SPEC_KITTY_GROUP_COMMIT"
+
+
+def group_commit_enabled(requested: bool | None) -> bool:
+    """Resolve the group-commit mode: an explicit choice wins over the env."""
+    if requested is not None:
+        return requested
+    return is_truthy(os.environ.get(GROUP_COMMIT_ENV))
+
+
+def committed_event_ids(worktree_root: Path, rev: str, events_path: Path) -> tuple[str, frozenset[str]] | None:
+    """Return ``(sha, event_ids)`` for the event log committed at ``rev``.
+
+    ``None`` when ``rev`` does not resolve or the log is not in its tree.
+    Unparseable lines are skipped: this is a membership probe, not a reader.
+    """
+    resolved = subprocess.run(
+        ["git", "-C", str(worktree_root), "rev-parse", "--verify", "--quiet", f"{rev}^{{commit}}"],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    sha = resolved.stdout.strip()
+    if resolved.returncode != 0 or not sha:
+        return None
+    relpath = events_path.relative_to(worktree_root).as_posix()
+    shown = subprocess.run(
+        ["git", "-C", str(worktree_root), "show", f"{sha}:{relpath}"],
+        capture_output=True,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+        check=False,
+    )
+    if shown.returncode != 0:
+        return None
+    event_ids: set[str] = set()
+    for line in shown.stdout.splitlines():
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(record, dict) and isinstance(record.get("event_id"), str):
+            event_ids.add(record["event_id"])
+    return sha, frozenset(event_ids)
+
+
+def remove_event_lines(events_path: Path, event_ids: set[str]) -> bytes:
+    """Drop the lines carrying ``event_ids`` from the log; return what remains.
+
+    The caller must hold the feature status lock. Lines are matched by parsed
+    ``event_id`` so other writers' lines, blank lines, and byte layout are
+    preserved exactly.
+    """
+    if not events_path.exists():
+        return b""
+    kept: list[bytes] = []
+    for line in events_path.read_bytes().splitlines(keepends=True):
+        try:
+            record = json.loads(line)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            kept.append(line)
+            continue
+        if isinstance(record, dict) and record.get("event_id") in event_ids:
+            continue
+        kept.append(line)
+    remaining = b"".join(kept)
+    atomic_write(events_path, remaining)
+    return remaining
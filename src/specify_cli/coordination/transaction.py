@@ -24,6 +24,7 @@ import subprocess
 from collections.abc import Callable
 from contextlib import AbstractContextManager
 from kernel.clock import now_utc
+from kernel.tracing import traced
 from pathlib import Path
 from types import TracebackType
 
@@ -45,9 +46,15 @@ from specify_cli.coordination.types import (
     Refused,
 )
 from specify_cli.coordination.workspace import CoordinationWorkspace
+from specify_cli.coordination.group_commit import (
+    committed_event_ids,
+    group_commit_enabled,
+    remove_event_lines,
+)
 from mission_runtime import CommitTarget
 from specify_cli.core.commit_guard import GuardCapability
 from specify_cli.git.commit_helpers import (
+    CommitResult,
     SafeCommitPathPolicyError,
     SafeCommitRecoveryFailed,
     safe_commit,
@@ -55,7 +62,9 @@ from specify_cli.git.commit_helpers import (
 from specify_cli.status import reducer as _reducer
 from specify_cli.status.locking import (
     FeatureStatusLockTimeoutError,
+    feature_commit_lock,
     feature_status_lock,
+    feature_status_lock_depth,
 )
 from specify_cli.status.models import InnerStateChanged, StatusEvent
 
@@ -228,10 +237,18 @@ class BookkeepingTransaction(AbstractContextManager["BookkeepingTransaction"]):
         self._explicit_commit_receipt: CommitReceipt | None = None
         self._capability: GuardCapability = GuardCapability.STANDARD
         self._legacy_mode = False
+        # Group-commit mode (see ``coordination.group_commit``): commit()
+        # releases the status lock early, so rollback after that point must
+        # re-acquire it and remove only this transaction's event lines.
+        self._group_commit = False
+        self._lock_path: Path | None = None
+        self._lock_timeout = 30.0
+        self._lock_released = False
 
     # ---- acquire ----
 
     @classmethod
+    @traced("coordination.transaction.acquire")
     def acquire(
         cls,
         *,
@@ -244,6 +261,7 @@ class BookkeepingTransaction(AbstractContextManager["BookkeepingTransaction"]):
         timeout: float = 30.0,
         capability: GuardCapability = GuardCapability.STANDARD,
         commit_to_primary_target: bool = False,
+        group_commit: bool | None = None,
     ) -> BookkeepingTransaction:
         """Construct, lock, and run the pre-flight policy gate.
 
@@ -270,6 +288,11 @@ class BookkeepingTransaction(AbstractContextManager["BookkeepingTransaction"]):
         every other caller keeps the default, so no status/coord write path
         changes behaviour.
 
+        ``group_commit`` opts into coalescing this transaction's commit with
+        concurrent ones (``None`` defers to ``SPEC_KITTY_GROUP_COMMIT``; see
+        :mod:`specify_cli.coordination.group_commit`). It only takes effect
+        when this transaction holds the outermost status lock.
+
         On a lock-acquire timeout, raises :class:`BookkeepingLockTimeout`.
 
         On a missing coordination worktree, raises
@@ -289,12 +312,12 @@ class BookkeepingTransaction(AbstractContextManager["BookkeepingTransaction"]):
             repo_root, mission_slug, timeout=timeout,
         )
         try:
-            lock_cm.__enter__()
+            lock_path = lock_cm.__enter__()
         except FeatureStatusLockTimeoutError as exc:
             raise BookkeepingLockTimeout(str(exc)) from exc
 
         try:
-            return cls._acquire_locked(
+            txn = cls._acquire_locked(
                 repo_root=repo_root,
                 mission_id=mission_id,
                 mission_slug=mission_slug,
@@ -309,6 +332,10 @@ class BookkeepingTransaction(AbstractContextManager["BookkeepingTransaction"]):
         except Exception:
             lock_cm.__exit__(None, None, None)
             raise
+        txn._lock_path = lock_path
+        txn._lock_timeout = timeout
+        txn._group_commit = group_commit_enabled(group_commit) and feature_status_lock_depth(lock_path) == 1
+        return txn
 
     @classmethod
     def _acquire_locked(
@@ -589,6 +616,7 @@ class BookkeepingTransaction(AbstractContextManager["BookkeepingTransaction"]):
         """Append one ``event`` to ``status.events.jsonl`` + re-materialise."""
         return self.append_events([event])[0]
 
+    @traced("coordination.transaction.append_events")
     def append_events(
         self,
         events: list[StatusEvent | InnerStateChanged],
@@ -605,6 +633,10 @@ class BookkeepingTransaction(AbstractContextManager["BookkeepingTransaction"]):
         """
         if not events:
             return []
+        if self._lock_released:
+            raise BookkeepingError(
+                "append_events() after a group commit released the status lock"
+            )
         unit_ids = [event.event_id for event in events]
         duplicate_ids = {
             event_id
@@ -791,6 +823,7 @@ class BookkeepingTransaction(AbstractContextManager["BookkeepingTransaction"]):
             return receipt
         return self.commit(message)
 
+    @traced("coordination.transaction.commit")
     def commit(self, message: str) -> CommitReceipt:
         """Commit all staged paths via :func:`safe_commit`.
 
@@ -815,9 +848,16 @@ class BookkeepingTransaction(AbstractContextManager["BookkeepingTransaction"]):
             raise BookkeepingCommitFailed(
                 "commit() called with no events or artifacts to commit"
             )
+        if self._group_commit:
+            return self._group_commit_or_join(message)
 
+        result = self._safe_commit(message)
+        return self._record_receipt(message, result.sha)
+
+    def _safe_commit(self, message: str) -> CommitResult:
+        """Run :func:`safe_commit` on the staged paths; roll back on failure."""
         try:
-            result = safe_commit(
+            return safe_commit(
                 repo_root=self.repo_root,
                 worktree_root=self.worktree_root,
                 target=CommitTarget(ref=self.destination_ref),
@@ -842,8 +882,55 @@ class BookkeepingTransaction(AbstractContextManager["BookkeepingTransaction"]):
                 f"safe_commit failed on {self.destination_ref!r}: {exc}"
             ) from exc
 
+    def _group_commit_or_join(self, message: str) -> CommitReceipt:
+        """Group-commit mode: commit for the group, or join a commit already made.
+
+        Releases the status lock so other transactions can append while this
+        one waits on the commit lock. Under the commit lock, a pure-status
+        transaction whose events already landed on ``destination_ref`` takes
+        that commit; otherwise it re-takes the status lock and commits the
+        status files as they stand, carrying every event appended since the
+        last commit. The receipt is verified by reading the committed event
+        log back.
+        """
+        assert self._lock_path is not None  # noqa: S101 — set by acquire()
+        own_ids = set(self._event_ids)
+        status_only = all(
+            path in (self._events_path, self._snapshot_path)
+            for path in self._staged_paths
+        )
+        self._release_lock()
+        try:
+            with feature_commit_lock(self._lock_path, timeout=self._lock_timeout):
+                committed = (
+                    committed_event_ids(self.worktree_root, self.destination_ref, self._events_path)
+                    if status_only and own_ids
+                    else None
+                )
+                if committed is not None and own_ids <= committed[1]:
+                    sha = committed[0]
+                else:
+                    with feature_status_lock(
+                        self.repo_root, self.mission_slug, timeout=self._lock_timeout,
+                    ):
+                        sha = self._safe_commit(message).sha
+        except FeatureStatusLockTimeoutError as exc:
+            self._rollback()
+            raise BookkeepingLockTimeout(str(exc)) from exc
+
+        if own_ids:
+            readback = committed_event_ids(self.worktree_root, sha, self._events_path)
+            if readback is None or not own_ids <= readback[1]:
+                self._rollback()
+                raise BookkeepingCommitFailed(
+                    f"group commit {sha} on {self.destination_ref!r} does not "
+                    f"carry events {sorted(own_ids - (readback[1] if readback else frozenset()))}"
+                )
+        return self._record_receipt(message, sha)
+
+    def _record_receipt(self, message: str, sha: str) -> CommitReceipt:
         receipt = CommitReceipt(
-            commit_sha=result.sha,
+            commit_sha=sha,
             committed_at=now_utc(),
             destination_ref=self.destination_ref,
             worktree_root=self.worktree_root,
@@ -918,6 +1005,7 @@ class BookkeepingTransaction(AbstractContextManager["BookkeepingTransaction"]):
 
     # ---- private ----
 
+    @traced("coordination.transaction.rollback")
     def _rollback(self) -> None:
         """Surgical rollback: truncate event log; restore artifacts.
 
@@ -928,6 +1016,9 @@ class BookkeepingTransaction(AbstractContextManager["BookkeepingTransaction"]):
         guarded so a failing restore on one path still attempts the
         others.
         """
+        if self._lock_released:
+            self._rollback_after_release()
+            return
         # 1. Surgical truncate of status.events.jsonl (FR-010). This
         # restores the file byte-for-byte to the pre-emit state because
         # the file is append-only.
@@ -972,6 +1063,35 @@ class BookkeepingTransaction(AbstractContextManager["BookkeepingTransaction"]):
                     exc,
                 )
 
+        self._restore_artifact_snapshots()
+
+    def _rollback_after_release(self) -> None:
+        """Group-commit rollback once the status lock was released.
+
+        Other transactions may have appended after this one, so the log is
+        not truncated: this transaction's own lines are removed by event id
+        and ``status.json`` is re-materialised from what remains.
+        """
+        try:
+            with feature_status_lock(
+                self.repo_root, self.mission_slug, timeout=self._lock_timeout,
+            ):
+                remaining = remove_event_lines(self._events_path, set(self._event_ids))
+                if not remaining.strip() and not self._pre_emit_events_existed:
+                    self._events_path.unlink(missing_ok=True)
+                    if not self._pre_emit_snapshot_existed:
+                        self._snapshot_path.unlink(missing_ok=True)
+                elif self._event_ids:
+                    _reducer.materialize(self.feature_dir)
+                self._restore_artifact_snapshots()
+        except Exception as exc:  # noqa: BLE001 — rollback is tolerant by contract
+            logger.error(
+                "BookkeepingTransaction group rollback of %s failed: %s",
+                self._events_path,
+                exc,
+            )
+
+    def _restore_artifact_snapshots(self) -> None:
         # 3. Snapshot-restore each tracked write_artifact path AND every enrolled
         # subprocess byproduct (C3), through the single compensator (TAO-3). The
         # confined fd-relative write/unlink is injected so restore stays inside the
@@ -991,6 +1111,7 @@ class BookkeepingTransaction(AbstractContextManager["BookkeepingTransaction"]):
             ),
         )
 
+    @traced("coordination.transaction.outbound")
     def _run_deferred_outbound(self) -> None:
         """Run deferred outbound side effects. Individual failures log only."""
         for side_effect in self._deferred:
@@ -1003,7 +1124,10 @@ class BookkeepingTransaction(AbstractContextManager["BookkeepingTransaction"]):
                 )
 
     def _release_lock(self) -> None:
-        """Release the feature status lock. Idempotent within one __exit__."""
+        """Release the feature status lock. Idempotent (group commit releases early)."""
+        if self._lock_released:
+            return
+        self._lock_released = True
         try:
             self._lock_cm.__exit__(None, None, None)
         except Exception as exc:  # noqa: BLE001 — defensive
@@ -13,6 +13,7 @@ from pathlib import Path
 
 from specify_cli.status import Lane
 from specify_cli.status import resolve_lane_alias
+from specify_cli.status import read_mission_wp_metadata
 from specify_cli.status import read_wp_frontmatter
 
 
@@ -137,26 +138,27 @@ def build_dependency_graph(feature_dir: Path) -> dict[str, list[str]]:
     if not tasks_dir.exists():
         return graph
 
-    # Find all WP markdown files
-    for wp_file in sorted(tasks_dir.glob("WP*.md")):
+    # One frontmatter parse per WP and one event-log reduction for the mission.
+    # Files whose name carries no WP ID were never parsed here, so only an
+    # unreadable file WITH an ID is fatal.
+    mission = read_mission_wp_metadata(tasks_dir.parent, strict=False)
+    for wp_file, exc in mission.unreadable:
+        if extract_wp_id_from_filename(wp_file.name):
+            raise exc
+
+    for wp_file, meta, _body in mission.work_packages:
         # Extract WP ID from filename (e.g., WP01-title.md → WP01)
         filename_wp_id = extract_wp_id_from_filename(wp_file.name)
         if not filename_wp_id:
             continue
 
-        # Parse frontmatter to get canonical work_package_id
-        meta, _ = read_wp_frontmatter(wp_file)
-        frontmatter_wp_id = meta.work_package_id
-
         # Verify filename matches frontmatter (catch misnamed files)
+        frontmatter_wp_id = meta.work_package_id
         if frontmatter_wp_id and frontmatter_wp_id != filename_wp_id:
             raise ValueError(f"WP ID mismatch: filename {filename_wp_id} vs frontmatter {frontmatter_wp_id} in {wp_file}")
 
         wp_id = frontmatter_wp_id or filename_wp_id
-
-        # Parse dependencies from frontmatter
-        dependencies = parse_wp_dependencies(wp_file)
-        graph[wp_id] = dependencies
+        graph[wp_id] = meta.dependencies
 
     return graph
 
@@ -176,7 +178,7 @@ def extract_wp_id_from_filename(filename: str) -> str | None:
         >>> extract_wp_id_from_filename("invalid.md")
         None
     """
-    match = re.match(r"^(WP\d{2})", filename)
+    match = re.match(r"^(WP\d{2,})", filename)
     return match.group(1) if match else None
 
 
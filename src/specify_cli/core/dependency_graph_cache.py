@@ -0,0 +1,330 @@
+"""Persisted dependency graph and incremental readiness for orchestrator polling.
+
+External orchestrators poll ``orchestrator-api list-ready`` / ``mission-state``
+in a loop, and each call used to parse every WP file's frontmatter, reduce the
+whole ``status.events.jsonl`` and re-evaluate every WP's readiness. This module
+keeps one JSON artifact per mission so a poll only pays for what changed:
+
+* The dependency graph is stored with the stat signature ``(size, mtime_ns,
+  inode)`` of every ``tasks/*.md`` file. While the signatures match the graph
+  is reused without opening a single WP file.
+* The reduced lane of every WP is stored with the byte offset of the event log
+  it covers. A poll parses only the lines appended since, folds them into the
+  stored lanes and re-evaluates readiness for the WPs whose lane changed and
+  their direct dependents; every other verdict is carried over.
+
+File location (runtime state, gitignored via ``.kittify/runtime/``)::
+
+    {repo_root}/.kittify/runtime/dependency-graph/{mission_slug}.json
+
+The cache is advisory in the same way as the dossier hash cache: a missing,
+corrupt or version-mismatched file is treated as empty and a write failure is
+logged and swallowed, so results are always identical with or without it.
+Anything the incremental fold cannot prove equivalent to a full
+``reduce(read_events(...))`` -- a rewritten or truncated log, an appended
+event that sorts before the stored high-water mark, or a same-timestamp
+transition that rollback precedence might override -- falls back to the full
+reduction.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from kernel.atomic import atomic_write
+from specify_cli.core.dependency_graph import build_dependency_graph, dependency_readiness_for_wp
+from specify_cli.core.paths import assert_safe_path_segment
+from specify_cli.status import EVENTS_FILENAME, Lane, StatusEvent, read_events_from_text, reduce, wp_state_for
+
+logger = logging.getLogger(__name__)
+
+DEPENDENCY_GRAPH_CACHE_DIR = "dependency-graph"
+
+# Bump when the shape or meaning of the persisted artifact changes.
+DEPENDENCY_GRAPH_CACHE_SCHEMA_VERSION = 1
+
+# Racy-mtime guard (see ``dossier.hash_cache``): a WP file modified this close
+# to the scan may be rewritten again inside the same mtime tick with the same
+# size, so a graph built from it is persisted without a reusable signature.
+_RACY_WINDOW_NS = 2_000_000_000
+
+_Signature = tuple[int, int, int]
+
+
+@dataclass(frozen=True)
+class MissionReadiness:
+    """Dependency graph, per-WP lanes and the ready set for one mission.
+
+    ``ready`` lists the not-yet-started WPs whose dependencies are all
+    ``approved``/``done``, in graph order. ``graph_source`` and
+    ``lanes_source`` record how each half was obtained (``"cache"``,
+    ``"incremental"`` or ``"rebuilt"``) for diagnostics and tests.
+    """
+
+    graph: dict[str, list[str]]
+    lanes: dict[str, str]
+    ready: tuple[str, ...]
+    graph_source: str
+    lanes_source: str
+
+
+def dependency_graph_cache_path(repo_root: Path, mission_slug: str) -> Path:
+    """Return the persisted dependency-graph artifact path for *mission_slug*."""
+    safe_slug = assert_safe_path_segment(mission_slug)
+    return repo_root / ".kittify" / "runtime" / DEPENDENCY_GRAPH_CACHE_DIR / f"{safe_slug}.json"
+
+
+def _wp_file_signatures(planning_dir: Path) -> tuple[dict[str, _Signature], bool]:
+    """Stat every ``tasks/*.md`` file; return the signatures and whether any is racy."""
+    tasks_dir = planning_dir if planning_dir.name == "tasks" else planning_dir / "tasks"
+    signatures: dict[str, _Signature] = {}
+    racy_after = time.time_ns() - _RACY_WINDOW_NS
+    racy = False
+    try:
+        entries = list(os.scandir(tasks_dir))
+    except OSError:
+        return signatures, racy
+    for entry in entries:
+        if not entry.name.endswith(".md"):
+            continue
+        try:
+            st = entry.stat()
+        except OSError:
+            continue
+        signatures[entry.name] = (st.st_size, st.st_mtime_ns, st.st_ino)
+        racy = racy or st.st_mtime_ns >= racy_after
+    return signatures, racy
+
+
+def _load_cache(cache_path: Path) -> dict[str, Any]:
+    try:
+        data = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("schema_version") != DEPENDENCY_GRAPH_CACHE_SCHEMA_VERSION:
+        return {}
+    return data
+
+
+def _save_cache(cache_path: Path, data: dict[str, Any]) -> None:
+    try:
+        atomic_write(cache_path, json.dumps(data, sort_keys=True), mkdir=True)
+    except OSError as exc:
+        logger.debug("Could not persist dependency graph cache %s: %s", cache_path, exc)
+
+
+def _cached_graph(
+    planning_dir: Path,
+    cached: Mapping[str, Any],
+) -> tuple[dict[str, list[str]], dict[str, Any], str]:
+    """Return ``(graph, graph_record, source)``, rebuilding only on a signature change."""
+    signatures, racy = _wp_file_signatures(planning_dir)
+    record = cached.get("graph")
+    encoded = {name: list(sig) for name, sig in signatures.items()}
+    if isinstance(record, dict) and record.get("signatures") == encoded and isinstance(record.get("edges"), dict):
+        return {wp_id: list(deps) for wp_id, deps in record["edges"].items()}, record, "cache"
+
+    graph = build_dependency_graph(planning_dir)
+    # A racy scan is persisted without signatures, so the next poll rebuilds.
+    return graph, {"signatures": None if racy else encoded, "edges": graph}, "rebuilt"
+
+
+def _read_complete_lines(events_path: Path, offset: int) -> tuple[str, int, int] | None:
+    """Return ``(text, end_offset, inode)`` of the complete lines from *offset* on.
+
+    ``None`` when the log does not exist. A torn final line (no newline yet)
+    is left for the next poll.
+    """
+    try:
+        with events_path.open("rb") as handle:
+            inode = os.fstat(handle.fileno()).st_ino
+            handle.seek(offset)
+            data = handle.read()
+    except FileNotFoundError:
+        return None
+    complete = data[: data.rfind(b"\n") + 1]
+    return complete.decode("utf-8"), offset + len(complete), inode
+
+
+def _full_lanes(status_dir: Path) -> tuple[dict[str, Any], dict[str, str]]:
+    """Reduce the whole log; return ``(log_record, lanes)``."""
+    read = _read_complete_lines(status_dir / EVENTS_FILENAME, 0)
+    if read is None:
+        return {"offset": 0, "inode": None, "tail": "", "hwm": None, "wp_at": {}}, {}
+    text, end, inode = read
+    snapshot = reduce(read_events_from_text(status_dir, text))
+    lanes = {wp_id: str(state.get("lane", Lane.PLANNED)) for wp_id, state in snapshot.work_packages.items()}
+    wp_at = {wp_id: state.get("last_transition_at") for wp_id, state in snapshot.work_packages.items()}
+    last_line = text.rstrip("\n").rsplit("\n", 1)[-1] if text else ""
+    hwm = [snapshot.materialized_at, snapshot.last_event_id] if snapshot.last_event_id else None
+    return {"offset": end, "inode": inode, "tail": last_line, "hwm": hwm, "wp_at": wp_at}, lanes
+
+
+def _tail_intact(events_path: Path, record: Mapping[str, Any]) -> bool:
+    """Return True when the bytes the record ends on are still in place."""
+    tail = str(record.get("tail", "")).encode("utf-8") + b"\n"
+    offset = int(record.get("offset", 0))
+    if offset == 0:
+        return True
+    if offset < len(tail):
+        return False
+    try:
+        with events_path.open("rb") as handle:
+            handle.seek(offset - len(tail))
+            return handle.read(len(tail)) == tail
+    except OSError:
+        return False
+
+
+def _incremental_lanes(
+    status_dir: Path,
+    cached: Mapping[str, Any],
+) -> tuple[dict[str, Any], dict[str, str], set[str]] | None:
+    """Fold the events appended since the cached offset into the cached lanes.
+
+    Returns ``(log_record, lanes, changed_wp_ids)`` or ``None`` when only a
+    full reduction is provably correct.
+    """
+    record = cached.get("log")
+    lanes_record = cached.get("lanes")
+    if not isinstance(record, dict) or not isinstance(lanes_record, dict):
+        return None
+    events_path = status_dir / EVENTS_FILENAME
+    try:
+        st = events_path.stat()
+    except FileNotFoundError:
+        return None if record.get("offset") else (dict(record), dict(lanes_record), set())
+    offset = int(record.get("offset", 0))
+    if st.st_size < offset or (offset and st.st_ino != record.get("inode")) or not _tail_intact(events_path, record):
+        return None
+
+    read = _read_complete_lines(events_path, offset)
+    if read is None:
+        return None
+    text, end, inode = read
+    if end == offset:
+        return dict(record), dict(lanes_record), set()
+
+    new_events: list[StatusEvent] = read_events_from_text(status_dir, text)
+    hwm = record.get("hwm")
+    wp_at: dict[str, Any] = dict(record.get("wp_at") or {})
+    lanes = dict(lanes_record)
+    changed: set[str] = set()
+    for event in sorted(new_events, key=lambda e: (e.at, e.event_id)):
+        key = [event.at, event.event_id]
+        if hwm is not None and key <= hwm:
+            return None  # sorts into the already-folded prefix (or repeats an event)
+        if wp_at.get(event.wp_id) == event.at:
+            return None  # same-timestamp pair: rollback precedence needs the full fold
+        hwm = key
+        wp_at[event.wp_id] = event.at
+        lane = str(event.to_lane)
+        if lanes.get(event.wp_id) != lane:
+            lanes[event.wp_id] = lane
+            changed.add(event.wp_id)
+    last_line = text.rstrip("\n").rsplit("\n", 1)[-1]
+    return {"offset": end, "inode": inode, "tail": last_line, "hwm": hwm, "wp_at": wp_at}, lanes, changed
+
+
+def _ready_verdicts(
+    graph: Mapping[str, list[str]],
+    lanes: Mapping[str, str],
+    wp_ids: set[str] | None = None,
+) -> dict[str, bool]:
+    """Evaluate readiness for *wp_ids* (every WP in *graph* when ``None``)."""
+    dep_lanes = {wp_id: wp_state_for(lane).lane for wp_id, lane in lanes.items()}
+    verdicts: dict[str, bool] = {}
+    for wp_id in graph if wp_ids is None else wp_ids & graph.keys():
+        if wp_state_for(lanes.get(wp_id, Lane.PLANNED)).progress_bucket() != "not_started":
+            verdicts[wp_id] = False
+            continue
+        verdicts[wp_id] = dependency_readiness_for_wp(wp_id, graph[wp_id], dep_lanes).satisfied
+    return verdicts
+
+
+def load_dependency_graph(planning_dir: Path, *, cache_path: Path) -> dict[str, list[str]]:
+    """Return :func:`build_dependency_graph` for *planning_dir*, reusing the persisted graph."""
+    cached = _load_cache(cache_path)
+    graph, graph_record, source = _cached_graph(planning_dir, cached)
+    if source != "cache":
+        # The folded lanes stay valid; the ready verdicts were computed for the
+        # old graph, so they are dropped and re-derived on the next readiness poll.
+        kept = {key: value for key, value in cached.items() if key not in {"graph", "ready"}}
+        _save_cache(
+            cache_path,
+            {**kept, "schema_version": DEPENDENCY_GRAPH_CACHE_SCHEMA_VERSION, "graph": graph_record},
+        )
+    return graph
+
+
+def load_mission_readiness(planning_dir: Path, status_dir: Path, *, cache_path: Path) -> MissionReadiness:
+    """Return the mission's dependency graph, lanes and ready set, incrementally.
+
+    Args:
+        planning_dir: Directory holding ``tasks/`` (the PRIMARY planning surface).
+        status_dir: Directory holding ``status.events.jsonl`` (the coord-aware
+            STATUS surface); may equal *planning_dir*.
+        cache_path: Persisted artifact, usually :func:`dependency_graph_cache_path`.
+
+    Raises whatever :func:`build_dependency_graph` or the event-log reader
+    raise for corrupt input, exactly as the uncached computation would.
+    """
+    cached = _load_cache(cache_path)
+    graph, graph_record, graph_source = _cached_graph(planning_dir, cached)
+
+    folded = _incremental_lanes(status_dir, cached)
+    if folded is None:
+        log_record, lanes = _full_lanes(status_dir)
+        changed: set[str] | None = None
+        lanes_source = "rebuilt"
+    else:
+        log_record, lanes, changed = folded
+        lanes_source = "incremental" if changed or log_record != cached.get("log") else "cache"
+
+    cached_ready = cached.get("ready")
+    if graph_source == "cache" and changed is not None and isinstance(cached_ready, dict):
+        # Only a lane change can move a verdict: the WP itself (it may have
+        # started) and every WP that depends on it.
+        affected = set(changed)
+        for wp_id, deps in graph.items():
+            if changed.intersection(deps):
+                affected.add(wp_id)
+        verdicts = {wp_id: bool(cached_ready.get(wp_id, False)) for wp_id in graph}
+        verdicts.update(_ready_verdicts(graph, lanes, affected))
+    else:
+        verdicts = _ready_verdicts(graph, lanes)
+
+    if graph_source != "cache" or lanes_source != "cache":
+        _save_cache(
+            cache_path,
+            {
+                "schema_version": DEPENDENCY_GRAPH_CACHE_SCHEMA_VERSION,
+                "graph": graph_record,
+                "log": log_record,
+                "lanes": lanes,
+                "ready": verdicts,
+            },
+        )
+
+    return MissionReadiness(
+        graph=graph,
+        lanes=lanes,
+        ready=tuple(wp_id for wp_id in graph if verdicts.get(wp_id)),
+        graph_source=graph_source,
+        lanes_source=lanes_source,
+    )
+
+
+__all__ = [
+    "MissionReadiness",
+    "dependency_graph_cache_path",
+    "load_dependency_graph",
+    "load_mission_readiness",
+]
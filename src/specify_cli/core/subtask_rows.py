@@ -303,11 +303,11 @@ def authored_subtask_roster(feature_dir: Path, wp_id: str) -> list[str]:
     wp_file = _locate_wp_file(feature_dir, wp_id)
     # Lazy imports: ``core`` must not import ``status`` at module scope
     # (``status.emit`` imports THIS module — a top-level edge would cycle).
-    from specify_cli.frontmatter import FrontmatterManager
+    from specify_cli.frontmatter import read_frontmatter_readonly
     from specify_cli.status import WPMetadata
 
     try:
-        frontmatter, _body = FrontmatterManager().read(wp_file)
+        frontmatter, _body = read_frontmatter_readonly(wp_file)
         if "subtasks" not in frontmatter:
             raise SubtaskRosterResolutionError(
                 f"Cannot resolve subtask roster for {wp_id}: subtasks key is missing"
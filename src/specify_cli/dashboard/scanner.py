@@ -12,6 +12,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from specify_cli.status import IndexedMission, StatusSnapshot, WPMetadata
     from specify_cli.status.wp_view import WPView
 
 from specify_cli.dashboard.charter_path import resolve_project_charter_presence
@@ -611,7 +612,11 @@ def resolve_active_feature(
     return None
 
 
-def _count_wps_by_lane(tasks_dir: Path, status_dir: Path | None = None) -> dict[str, int]:
+def _count_wps_by_lane(
+    tasks_dir: Path,
+    status_dir: Path | None = None,
+    event_lanes: dict[str, Lane] | None = None,
+) -> dict[str, int]:
     """Count work packages by lane from the canonical event log.
 
     Raises ``CanonicalStatusNotFoundError`` when the event log is absent.
@@ -622,6 +627,9 @@ def _count_wps_by_lane(tasks_dir: Path, status_dir: Path | None = None) -> dict[
     coordination topology it differs from the planning surface that holds
     ``tasks/`` (#2430). ``None`` derives it from ``tasks_dir`` as before.
 
+    ``event_lanes`` supplies already-reduced lanes (the repo status index);
+    ``None`` reduces the event log here.
+
     Lane-to-column mapping is driven by :meth:`WPState.display_category`
     via :data:`_KANBAN_COLUMN_MAP`.
     """
@@ -630,12 +638,13 @@ def _count_wps_by_lane(tasks_dir: Path, status_dir: Path | None = None) -> dict[
     if not tasks_dir.exists():
         return counts
 
-    # Default: the event log lives beside tasks/ (single-surface layouts).
-    feature_dir = status_dir if status_dir is not None else tasks_dir.parent
+    if event_lanes is None:
+        # Default: the event log lives beside tasks/ (single-surface layouts).
+        feature_dir = status_dir if status_dir is not None else tasks_dir.parent
 
-    from specify_cli.status import get_all_wp_lanes
+        from specify_cli.status import get_all_wp_lanes
 
-    event_lanes = get_all_wp_lanes(feature_dir)
+        event_lanes = get_all_wp_lanes(feature_dir)
 
     for wp_file in tasks_dir.glob("WP*.md"):
         stem = wp_file.stem
@@ -764,21 +773,36 @@ def _resolve_checkout_root(feature_dir: Path) -> Path | None:
     return None
 
 
-def _build_event_log_kanban_stats(feature_dir: Path, tasks_dir: Path) -> dict[str, Any]:
+def _build_event_log_kanban_stats(
+    feature_dir: Path,
+    tasks_dir: Path,
+    indexed: IndexedMission | None = None,
+) -> dict[str, Any]:
     """Count WP lanes: ``tasks_dir`` lists the WPs (planning surface),
-    ``feature_dir`` holds the canonical event log (status surface, #2430)."""
+    ``feature_dir`` holds the canonical event log (status surface, #2430).
+
+    ``indexed`` is the mission's up-to-date repo status index row; when given,
+    lanes and weighted progress come from it instead of reducing the log.
+    """
     from specify_cli.status import CanonicalStatusNotFoundError
     from specify_cli.status import StoreError
 
     kanban_stats: dict[str, Any] = {"total": 0, "planned": 0, "doing": 0, "for_review": 0, "approved": 0, "done": 0}
     try:
-        lane_counts = _count_wps_by_lane(tasks_dir, status_dir=feature_dir)
+        lane_counts = _count_wps_by_lane(
+            tasks_dir,
+            status_dir=feature_dir,
+            event_lanes=indexed.wp_lanes if indexed is not None else None,
+        )
         for lane, count in lane_counts.items():
             kanban_stats[lane] = count
             kanban_stats["total"] += count
 
         try:
-            weighted = read_only_weighted_percentage(feature_dir)
+            if indexed is not None:
+                weighted: float | None = round(indexed.weighted_percentage, 1)
+            else:
+                weighted = read_only_weighted_percentage(feature_dir)
             if weighted is not None:
                 kanban_stats["weighted_percentage"] = weighted
         except Exception:
@@ -807,13 +831,15 @@ def _build_kanban_stats(
     planning_dir: Path,
     artifacts: dict[str, dict[str, Any]],
     status_dir: Path | None = None,
+    indexed: IndexedMission | None = None,
 ) -> dict[str, Any]:
     """Build kanban lane counts.
 
     ``planning_dir`` supplies the WP task files (planning surface);
     ``status_dir`` supplies the canonical event log — under coordination
     topology the two live on different surfaces (#2430). ``None`` keeps the
-    single-surface behavior for legacy call sites.
+    single-surface behavior for legacy call sites. ``indexed`` is forwarded to
+    :func:`_build_event_log_kanban_stats`.
     """
     kanban_stats: dict[str, Any] = {"total": 0, "planned": 0, "doing": 0, "for_review": 0, "approved": 0, "done": 0}
     if not artifacts["kanban"]:
@@ -822,7 +848,7 @@ def _build_kanban_stats(
     tasks_dir = planning_dir / "tasks"
     if is_legacy_format(planning_dir):
         return _build_legacy_kanban_stats(tasks_dir)
-    return _build_event_log_kanban_stats(status_dir or planning_dir, tasks_dir)
+    return _build_event_log_kanban_stats(status_dir or planning_dir, tasks_dir, indexed)
 
 
 def scan_all_features(project_dir: Path) -> list[dict[str, Any]]:
@@ -830,6 +856,18 @@ def scan_all_features(project_dir: Path) -> list[dict[str, Any]]:
     features: list[dict[str, Any]] = []
     feature_paths = gather_feature_paths(project_dir)
 
+    # One incremental refresh of the repo status index serves every mission's
+    # lanes and progress; missions it cannot answer (no log, unreadable log,
+    # unusable index) fall back to reducing their own event log below. The
+    # index lives under the gitignored ``.kittify/derived/``, so an
+    # uninitialised directory is scanned without one rather than seeded.
+    from specify_cli.status import refresh_repo_status_index
+    from specify_cli.status import repo_status_index_key
+
+    status_index: dict[str, IndexedMission] = {}
+    if (project_dir / ".kittify").is_dir():
+        status_index = refresh_repo_status_index(project_dir, feature_paths.values(), prune=True) or {}
+
     for feature_id, feature_dir in feature_paths.items():
         # Planning artifacts read primary-first (#2430); the scanned dir stays
         # the live-status surface (gather is coord-first by construction).
@@ -850,7 +888,12 @@ def scan_all_features(project_dir: Path) -> list[dict[str, Any]]:
         friendly_name, meta_data = _read_dashboard_feature_meta(meta_dir)
         artifacts = get_feature_artifacts(planning_dir, project_dir)
         workflow = get_workflow_status(artifacts)
-        kanban_stats = _build_kanban_stats(planning_dir, artifacts, status_dir=feature_dir)
+        kanban_stats = _build_kanban_stats(
+            planning_dir,
+            artifacts,
+            status_dir=feature_dir,
+            indexed=status_index.get(repo_status_index_key(project_dir, feature_dir)),
+        )
 
         worktree = _resolve_feature_worktree_info(project_dir, feature_dir)
         display_name = format_feature_display_name(feature_id, friendly_name)
@@ -893,11 +936,30 @@ def _resolve_wp_title(content: str, wp_meta: Any, prompt_file: Path) -> str:
     return prompt_file.stem
 
 
+def _resolve_event_log_dir(candidate: Path, status_dir: Path | None) -> Path | None:
+    """Return the surface carrying the live event log for WPs under *candidate*.
+
+    *candidate* is the directory holding ``tasks/``. The status surface (coord
+    worktree) wins when present, else *candidate*, else its parent (#2430). The
+    answer is the same for every WP of a mission, so a scan resolves it once.
+    """
+    from specify_cli.status import has_event_log
+
+    if status_dir is not None and has_event_log(status_dir):
+        return status_dir
+    if has_event_log(candidate):
+        return candidate
+    if has_event_log(candidate.parent):
+        return candidate.parent
+    return None
+
+
 def _resolve_wp_lane_and_dir(
     prompt_file: Path,
     canonical_wp_id: str,
     default_lane: str,
     status_dir: Path | None,
+    snapshot: StatusSnapshot | None = None,
 ) -> tuple[Any, Path]:
     """Resolve ``(lane, event_log_dir)``.
 
@@ -906,25 +968,18 @@ def _resolve_wp_lane_and_dir(
     when present, else the WP's feature dir (#2430) -- and is what the
     reconstruction reader reads resolved runtime state from. A legacy feature
     falls back to ``default_lane`` and the (log-less) feature dir; a non-legacy
-    feature with no canonical log raises the finalize hint.
+    feature with no canonical log raises the finalize hint. ``snapshot`` is the
+    already-reduced log of that surface when the caller has one.
     """
     from specify_cli.status import (
         CanonicalStatusNotFoundError,
-        has_event_log,
         reconstruct_wp_view,
     )
 
     candidate = prompt_file.parent.parent
-    if status_dir is not None and has_event_log(status_dir):
-        event_log_dir = status_dir
-    elif has_event_log(candidate):
-        event_log_dir = candidate
-    elif has_event_log(candidate.parent):
-        event_log_dir = candidate.parent
-    else:
-        event_log_dir = None
+    event_log_dir = _resolve_event_log_dir(candidate, status_dir)
     if event_log_dir is not None:
-        lane = reconstruct_wp_view(event_log_dir, canonical_wp_id).resolved.lane
+        lane = reconstruct_wp_view(event_log_dir, canonical_wp_id, snapshot=snapshot).resolved.lane
         return lane or default_lane, event_log_dir
     feature_candidate = candidate if candidate.name != "tasks" else candidate.parent
     if is_legacy_format(feature_candidate):
@@ -937,16 +992,22 @@ def _resolve_wp_lane_and_dir(
     )
 
 
-def _wp_runtime_view(event_log_dir: Path, canonical_wp_id: str, wp_meta: Any) -> WPView:
+def _wp_runtime_view(
+    event_log_dir: Path,
+    canonical_wp_id: str,
+    wp_meta: Any,
+    snapshot: StatusSnapshot | None = None,
+) -> WPView:
     """Reconstruct the WP view through the ONE canonical reader (T044 / SC-007).
 
     ``metadata`` is threaded so the authored group is sourced from the (possibly
     planning-surface) prompt file already parsed here -- the reader does not
-    re-read it -- while resolved runtime state comes from ``event_log_dir``.
+    re-read it -- while resolved runtime state comes from ``event_log_dir``
+    (or its already-reduced ``snapshot``).
     """
     from specify_cli.status import reconstruct_wp_view
 
-    return reconstruct_wp_view(event_log_dir, canonical_wp_id, metadata=wp_meta)
+    return reconstruct_wp_view(event_log_dir, canonical_wp_id, metadata=wp_meta, snapshot=snapshot)
 
 
 def _wp_identity_fields(view: WPView) -> dict[str, str]:
@@ -993,6 +1054,9 @@ def _process_wp_file(
     project_dir: Path,
     default_lane: str,
     status_dir: Path | None = None,
+    *,
+    parsed: tuple[WPMetadata, str] | None = None,
+    snapshot: StatusSnapshot | None = None,
 ) -> dict[str, Any] | None:
     """Process a single WP file and return task data or None on error.
 
@@ -1000,6 +1064,10 @@ def _process_wp_file(
     is reconstructed through the ONE canonical ``reconstruct_wp_view`` reader
     (T044/T045); the presentation fields (``title`` / ``prompt_markdown`` /
     ``prompt_path``) stay consumer-side -- the reader never produces them.
+
+    A mission scan passes the frontmatter it already ``parsed`` in bulk and the
+    ``snapshot`` it reduced once for the mission's event-log surface; without
+    them this WP's file and log are read on their own.
     """
     content, error = read_file_resilient(prompt_file, auto_fix=True)
 
@@ -1023,15 +1091,18 @@ def _process_wp_file(
 
     from specify_cli.status import read_wp_frontmatter
 
-    try:
-        wp_meta, prompt_body = read_wp_frontmatter(prompt_file)
-    except Exception:
-        return None
+    if parsed is not None:
+        wp_meta, prompt_body = parsed
+    else:
+        try:
+            wp_meta, prompt_body = read_wp_frontmatter(prompt_file)
+        except Exception:
+            return None
 
     canonical_wp_id = _canonical_wp_id(prompt_file.stem)
-    lane, event_log_dir = _resolve_wp_lane_and_dir(prompt_file, canonical_wp_id, default_lane, status_dir)
+    lane, event_log_dir = _resolve_wp_lane_and_dir(prompt_file, canonical_wp_id, default_lane, status_dir, snapshot)
 
-    view = _wp_runtime_view(event_log_dir, canonical_wp_id, wp_meta)
+    view = _wp_runtime_view(event_log_dir, canonical_wp_id, wp_meta, snapshot)
     identity = _wp_identity_fields(view)
     subtasks_done, subtasks_total = _wp_subtask_progress(view)
 
@@ -1096,7 +1167,22 @@ def scan_feature_kanban(project_dir: Path, feature_id: str) -> dict[str, list[di
         return lanes
 
     # New format: scan flat tasks/ directory, lane from event log
-    from specify_cli.status import CanonicalStatusNotFoundError
+    from specify_cli.status import CanonicalStatusNotFoundError, read_mission_wp_metadata
+
+    # Parse every WP and reduce the mission's event log ONCE, instead of once
+    # per WP file. A file the bulk read could not parse is retried on its own
+    # (after ``read_file_resilient`` has had the chance to repair its encoding).
+    parsed: dict[Path, tuple[WPMetadata, str]] = {}
+    snapshot: StatusSnapshot | None = None
+    event_log_dir = _resolve_event_log_dir(planning_dir, status_dir)
+    if event_log_dir is not None:
+        try:
+            mission = read_mission_wp_metadata(planning_dir, event_log_dir=event_log_dir, strict=False)
+        except Exception as exc:  # noqa: BLE001 — fall back to the per-file reads below
+            logger.debug("Bulk WP read failed for %s: %s", feature_dir.name, exc)
+        else:
+            parsed = {path: (meta, body) for path, meta, body in mission.work_packages}
+            snapshot = mission.snapshot
 
     for prompt_file in tasks_dir.glob("WP*.md"):
         try:
@@ -1105,6 +1191,8 @@ def scan_feature_kanban(project_dir: Path, feature_id: str) -> dict[str, list[di
                 project_dir,
                 "planned",
                 status_dir=status_dir,
+                parsed=parsed.get(prompt_file),
+                snapshot=snapshot,
             )
             if task_data is not None:
                 raw_lane = task_data.get("lane", "planned")
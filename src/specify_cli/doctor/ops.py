@@ -8,6 +8,7 @@ from kernel.clock import datetime, UTC, parse_iso
 from pathlib import Path
 
 from specify_cli.invocation.errors import AlreadyClosedError
+from specify_cli.invocation.trail_store import read_indexed_completions
 from specify_cli.invocation.writer import EVENTS_DIR
 
 _NON_OP_JSONL = {
@@ -36,10 +37,21 @@ def _has_completed_event(path: Path) -> bool:
 
 
 def list_orphan_ops(repo_root: Path) -> list[Path]:
+    """Return loose Op records that carry no ``completed`` event.
+
+    Records compacted into ``kitty-ops/segments/`` are closed by construction
+    and never listed; loose records whose close is already recorded in
+    ``ops-index.jsonl`` are skipped without opening their file.
+    """
     ops_dir = repo_root / EVENTS_DIR
     if not ops_dir.exists():
         return []
-    return [path for path in sorted(ops_dir.glob("*.jsonl")) if path.name not in _NON_OP_JSONL and not _has_completed_event(path)]
+    closed = read_indexed_completions(ops_dir)
+    return [
+        path
+        for path in sorted(ops_dir.glob("*.jsonl"))
+        if path.name not in _NON_OP_JSONL and path.stem not in closed and not _has_completed_event(path)
+    ]
 
 
 @dataclass
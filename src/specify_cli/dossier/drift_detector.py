@@ -10,6 +10,8 @@ Key Functions:
 - save_baseline() / load_baseline(): Persistence to JSON file
 - accept_baseline(): Validate baseline key matches current context
 - detect_drift(): Compare current snapshot hash vs cached baseline
+- detect_drift_without_reindex(): Same comparison from the stat-keyed hash
+  cache, answering "no change" without reading artifact contents
 - emit_drift_if_detected(): Detect drift and emit event
 - capture_baseline(): Capture new baseline when accepted
 
@@ -27,6 +29,7 @@ from pathlib import Path
 from kernel.clock import datetime, now_utc, parse_iso
 from specify_cli.core.paths import assert_safe_path_segment
 from specify_cli.dossier.events import emit_parity_drift_detected
+from specify_cli.dossier.hash_cache import cached_parity_hash
 from specify_cli.dossier.models import MissionDossierSnapshot
 from specify_cli.identity.project import ProjectIdentity
 
@@ -323,6 +326,72 @@ def detect_drift(
             - (False, None): No drift or no baseline to compare
             - (True, drift_info): Drift detected with details
     """
+    return _compare_to_baseline(
+        mission_slug=mission_slug,
+        current_hash=current_snapshot.parity_hash_sha256,
+        repo_root=repo_root,
+        project_identity=project_identity,
+        target_branch=target_branch,
+        mission_type=mission_type,
+        manifest_version=manifest_version,
+    )
+
+
+def detect_drift_without_reindex(
+    mission_slug: str,
+    feature_dir: Path,
+    repo_root: Path,
+    project_identity: ProjectIdentity,
+    target_branch: str,
+    mission_type: str,
+    manifest_version: str,
+) -> tuple[bool, dict | None] | None:
+    """Detect drift from the dossier hash cache, without touching file contents.
+
+    When the feature directory's stat fingerprint still matches the one
+    recorded by the last cached :meth:`Indexer.index_feature` run, the parity
+    hash recorded alongside it is compared against the baseline exactly as
+    :func:`detect_drift` would compare a freshly computed snapshot.
+
+    Args:
+        mission_slug: Feature identifier
+        feature_dir: Feature directory holding the dossier hash cache
+        repo_root: Repository root path
+        project_identity: ProjectIdentity with project_uuid and node_id
+        target_branch: Target branch (e.g., "main", "2.x")
+        mission_type: Mission type (e.g., "software-dev")
+        manifest_version: Manifest schema version (e.g., "1")
+
+    Returns:
+        The same ``(has_drift, drift_info)`` tuple as :func:`detect_drift`, or
+        ``None`` when the cache cannot vouch for the current tree (no cache,
+        or any artifact added/removed/modified) and a re-index is required.
+    """
+    current_hash = cached_parity_hash(feature_dir, mission_slug)
+    if current_hash is None:
+        return None
+    return _compare_to_baseline(
+        mission_slug=mission_slug,
+        current_hash=current_hash,
+        repo_root=repo_root,
+        project_identity=project_identity,
+        target_branch=target_branch,
+        mission_type=mission_type,
+        manifest_version=manifest_version,
+    )
+
+
+def _compare_to_baseline(
+    *,
+    mission_slug: str,
+    current_hash: str,
+    repo_root: Path,
+    project_identity: ProjectIdentity,
+    target_branch: str,
+    mission_type: str,
+    manifest_version: str,
+) -> tuple[bool, dict | None]:
+    """Compare *current_hash* against the accepted baseline for this context."""
     # Compute current baseline key
     current_key = compute_baseline_key(
         mission_slug=mission_slug,
@@ -345,7 +414,6 @@ def detect_drift(
         return False, None
 
     # Compare parity hashes
-    current_hash = current_snapshot.parity_hash_sha256
     baseline_hash = stored_baseline.parity_hash_sha256
 
     if current_hash == baseline_hash:
@@ -355,21 +423,14 @@ def detect_drift(
     # Drift detected
     logger.warning(f"Parity drift detected for {mission_slug}: {baseline_hash[:8]}... -> {current_hash[:8]}...")
 
-    # Compute severity based on completeness status changes
-    severity = "warning"
-    if current_snapshot.completeness_status != "unknown":  # noqa: SIM102
-        # Check if completeness changed
-        if stored_baseline.parity_hash_sha256 != current_snapshot.parity_hash_sha256:
-            # Could check stored completeness, but we don't have it here
-            # Default to warning for any drift
-            severity = "warning"
-
     drift_info = {
         "local_parity_hash": current_hash,
         "baseline_parity_hash": baseline_hash,
         "missing_in_local": [],  # TODO: compute from artifact summaries
         "missing_in_baseline": [],  # TODO: compute from artifact summaries
-        "severity": severity,
+        # Any parity drift is reported as a warning; completeness changes are
+        # not recoverable from the baseline record.
+        "severity": "warning",
     }
 
     return True, drift_info
@@ -0,0 +1,239 @@
+"""Persistent per-feature content-hash cache for incremental dossier indexing.
+
+Re-indexing a feature directory on every sync tick re-reads and re-hashes
+every artifact, which for missions with hundreds of research/contract files
+repeats megabytes of SHA-256 work for content that has not changed. This
+module records, per artifact, the ``(size, mtime_ns, inode)`` stat signature
+the content hash was computed under, so :class:`~specify_cli.dossier.indexer.Indexer`
+only rehashes files whose signature moved.
+
+The cache also stores a stat-only *scan fingerprint* of the whole feature
+directory together with the parity hash computed from that scan. When the
+fingerprint still matches, :func:`cached_parity_hash` answers "nothing
+changed" without opening a single artifact — the basis for the no-change
+fast path in :mod:`specify_cli.dossier.drift_detector`.
+
+File location (next to the dossier snapshot):
+    ``{feature_dir}/.kittify/dossiers/{mission_slug}/hash-cache.json``
+
+The cache is advisory: a missing, corrupt, or version-mismatched file is
+treated as empty, and any write failure is logged and swallowed, so the
+indexer's results are always identical with or without it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from kernel.atomic import atomic_write
+from specify_cli.core.paths import assert_safe_path_segment
+
+logger = logging.getLogger(__name__)
+
+HASH_CACHE_FILENAME = "hash-cache.json"
+
+# Bump when the meaning of a cached content hash changes (e.g. the WP static
+# projection field set in ``hasher.WP_STATIC_PROJECTION_FIELDS``), so stale
+# entries computed under the old definition are discarded wholesale.
+HASH_CACHE_SCHEMA_VERSION = 1
+
+# Racy-mtime guard (same idea as git's racy-index handling): a file modified
+# within this window of the scan may be rewritten again inside the same mtime
+# tick with an identical size, so its hash is never trusted from the cache.
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+@dataclass(frozen=True)
+class FileSignature:
+    """Stat-only identity of an artifact's content: ``(size, mtime_ns, inode)``."""
+
+    size: int
+    mtime_ns: int
+    inode: int
+
+    @classmethod
+    def from_stat(cls, st: os.stat_result) -> FileSignature:
+        return cls(size=st.st_size, mtime_ns=st.st_mtime_ns, inode=st.st_ino)
+
+
+@dataclass(frozen=True)
+class CachedHash:
+    """A previously computed ``(content_hash, error_reason)`` and its signature."""
+
+    signature: FileSignature
+    content_hash: str | None
+    error_reason: str | None
+
+
+def hash_cache_path(feature_dir: Path, mission_slug: str) -> Path:
+    """Return the cache file path for *mission_slug* under *feature_dir*."""
+    # FR-001: validate mission_slug before joining into a FS path (traversal guard).
+    _safe_slug = assert_safe_path_segment(mission_slug)
+    return feature_dir / ".kittify" / "dossiers" / _safe_slug / HASH_CACHE_FILENAME
+
+
+def compute_scan_fingerprint(signatures: dict[str, FileSignature]) -> str:
+    """Hash the sorted ``(relative_path, size, mtime_ns, inode)`` tuples of a scan.
+
+    Any artifact add, remove, rename, or in-place rewrite moves the
+    fingerprint; no file content is read.
+    """
+    lines = "\n".join(f"{path}\t{sig.size}\t{sig.mtime_ns}\t{sig.inode}" for path, sig in sorted(signatures.items()))
+    return hashlib.sha256(lines.encode("utf-8")).hexdigest()  # noqa: TID251 - stat fingerprint, not a content hash
+
+
+def scan_signatures(feature_dir: Path) -> dict[str, FileSignature]:
+    """Stat every indexable file under *feature_dir* (skipping hidden parts).
+
+    Mirrors :meth:`Indexer._scan_directory` so the fingerprint covers exactly
+    the artifact set the indexer would hash.
+    """
+    signatures: dict[str, FileSignature] = {}
+    for item in feature_dir.rglob("*"):
+        rel_parts = item.relative_to(feature_dir).parts
+        if any(part.startswith(".") for part in rel_parts):
+            continue
+        try:
+            st = item.stat()
+        except OSError:
+            continue
+        if item.is_file():
+            signatures[str(Path(*rel_parts))] = FileSignature.from_stat(st)
+    return signatures
+
+
+class DossierHashCache:
+    """Per-feature cache of artifact content hashes keyed by stat signature.
+
+    Typical use (see :meth:`Indexer.index_feature`)::
+
+        cache = DossierHashCache.load(feature_dir, mission_slug)
+        hit = cache.lookup(rel_path, signature)
+        ...
+        cache.store(rel_path, signature, content_hash, error_reason)
+        cache.finalize_scan(parity_hash)
+        cache.save()
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._entries: dict[str, CachedHash] = {}
+        self._seen: dict[str, FileSignature] = {}
+        self.scan_fingerprint: str | None = None
+        self.parity_hash_sha256: str | None = None
+        self.hits = 0
+        self.misses = 0
+        self._racy = False
+        self._scan_started_ns = time.time_ns()
+
+    @classmethod
+    def load(cls, feature_dir: Path, mission_slug: str) -> DossierHashCache:
+        """Load the cache for a feature, returning an empty one on any problem."""
+        cache = cls(hash_cache_path(feature_dir, mission_slug))
+        try:
+            data = json.loads(cache.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return cache
+        except (OSError, ValueError) as exc:
+            logger.debug("Ignoring unreadable dossier hash cache %s: %s", cache.path, exc)
+            return cache
+        if not isinstance(data, dict) or data.get("schema_version") != HASH_CACHE_SCHEMA_VERSION:
+            return cache
+        try:
+            for rel_path, raw in (data.get("entries") or {}).items():
+                cache._entries[rel_path] = CachedHash(
+                    signature=FileSignature(
+                        size=int(raw["size"]),
+                        mtime_ns=int(raw["mtime_ns"]),
+                        inode=int(raw["inode"]),
+                    ),
+                    content_hash=raw.get("content_hash"),
+                    error_reason=raw.get("error_reason"),
+                )
+        except (AttributeError, KeyError, TypeError, ValueError) as exc:
+            logger.debug("Discarding malformed dossier hash cache %s: %s", cache.path, exc)
+            cache._entries = {}
+            return cache
+        cache.scan_fingerprint = data.get("scan_fingerprint")
+        cache.parity_hash_sha256 = data.get("parity_hash_sha256")
+        return cache
+
+    def lookup(self, rel_path: str, signature: FileSignature) -> CachedHash | None:
+        """Return the cached hash for *rel_path* iff its signature is unchanged."""
+        self._seen[rel_path] = signature
+        entry = self._entries.get(rel_path)
+        if entry is not None and entry.signature == signature:
+            self.hits += 1
+            return entry
+        self.misses += 1
+        return None
+
+    def store(
+        self,
+        rel_path: str,
+        signature: FileSignature,
+        content_hash: str | None,
+        error_reason: str | None,
+    ) -> None:
+        """Record a freshly computed hash; racy or unreadable results are not cached."""
+        self._seen[rel_path] = signature
+        racy = self._scan_started_ns - signature.mtime_ns < _RACY_WINDOW_NS
+        self._racy = self._racy or racy
+        if racy or error_reason == "unreadable":
+            self._entries.pop(rel_path, None)
+            return
+        self._entries[rel_path] = CachedHash(signature, content_hash, error_reason)
+
+    def finalize_scan(self, parity_hash_sha256: str) -> None:
+        """Drop entries for vanished files and record the scan fingerprint.
+
+        A scan that saw a racily-modified file records no fingerprint, so the
+        next :func:`cached_parity_hash` call falls back to a real re-index.
+        """
+        self._entries = {path: entry for path, entry in self._entries.items() if path in self._seen}
+        self.scan_fingerprint = None if self._racy else compute_scan_fingerprint(self._seen)
+        self.parity_hash_sha256 = parity_hash_sha256
+
+    def save(self) -> None:
+        """Persist the cache atomically; failures are logged, never raised."""
+        payload = {
+            "schema_version": HASH_CACHE_SCHEMA_VERSION,
+            "scan_fingerprint": self.scan_fingerprint,
+            "parity_hash_sha256": self.parity_hash_sha256,
+            "entries": {
+                rel_path: {
+                    "size": entry.signature.size,
+                    "mtime_ns": entry.signature.mtime_ns,
+                    "inode": entry.signature.inode,
+                    "content_hash": entry.content_hash,
+                    "error_reason": entry.error_reason,
+                }
+                for rel_path, entry in sorted(self._entries.items())
+            },
+        }
+        try:
+            atomic_write(self.path, json.dumps(payload, indent=2, sort_keys=True), mkdir=True)
+        except OSError as exc:
+            logger.warning("Failed to persist dossier hash cache %s: %s", self.path, exc)
+
+
+def cached_parity_hash(feature_dir: Path, mission_slug: str) -> str | None:
+    """Return the last indexed parity hash iff the feature directory is unchanged.
+
+    Compares a stat-only fingerprint of *feature_dir* against the one recorded
+    at the last cached index run. Returns ``None`` when there is no cache or
+    anything moved, in which case the caller must re-index. Never reads
+    artifact contents.
+    """
+    cache = DossierHashCache.load(feature_dir, mission_slug)
+    if cache.scan_fingerprint is None or cache.parity_hash_sha256 is None:
+        return None
+    if compute_scan_fingerprint(scan_signatures(feature_dir)) != cache.scan_fingerprint:
+        return None
+    return cache.parity_hash_sha256
@@ -10,6 +10,8 @@ Key concepts:
 - Missing artifact detection comparing filesystem against manifest requirements
 - Graceful error handling: permission errors, UTF-8 decode failures, deleted files
 - MissionDossier builder: aggregates all artifacts (present + missing + unreadable)
+- Optional incremental mode: a persistent stat-keyed hash cache
+  (:mod:`specify_cli.dossier.hash_cache`) so only changed files are rehashed
 
 See: kitty-specs/042-local-mission-dossier-authority-parity-export/tasks/WP03-indexing.md
 """
@@ -23,6 +25,7 @@ from collections.abc import Iterator
 
 from kernel.clock import now_utc
 from charter.missions import ExpectedArtifactManifest
+from specify_cli.dossier.hash_cache import DossierHashCache, FileSignature
 from specify_cli.dossier.hasher import hash_file_with_validation, hash_wp_static_projection
 from specify_cli.dossier.manifest import ManifestRegistry
 from specify_cli.dossier.models import ArtifactRef, MissionDossier
@@ -87,7 +90,13 @@ class Indexer:
         errors: List of errors encountered during scanning
     """
 
-    def __init__(self, manifest_registry: ManifestRegistry, repo_root: Path | None = None):
+    def __init__(
+        self,
+        manifest_registry: ManifestRegistry,
+        repo_root: Path | None = None,
+        *,
+        use_hash_cache: bool = False,
+    ):
         """Initialize Indexer with manifest registry.
 
         Args:
@@ -100,9 +109,17 @@ class Indexer:
                 and defaults to ``None`` -- the pre-fold behavior (no org
                 lookup, built-in manifest tree only) for every caller that
                 does not supply it.
+            use_hash_cache: When True, reuse content hashes from the feature's
+                persistent :class:`DossierHashCache` for files whose
+                ``(size, mtime_ns, inode)`` signature is unchanged, and persist
+                the refreshed cache (plus the scan's parity hash) after
+                indexing. Results are identical either way; only the amount of
+                SHA-256 work differs.
         """
         self.manifest_registry = manifest_registry
         self._repo_root = repo_root
+        self._use_hash_cache = use_hash_cache
+        self._hash_cache: DossierHashCache | None = None
         self.artifacts: list[ArtifactRef] = []
         self.errors: list[dict] = []
 
@@ -122,6 +139,8 @@ class Indexer:
         """
         self.artifacts = []
         self.errors = []
+        mission_slug = self._extract_mission_slug(feature_dir)
+        self._hash_cache = DossierHashCache.load(feature_dir, mission_slug) if self._use_hash_cache else None
 
         # Recursively scan feature directory
         for file_path in self._scan_directory(feature_dir):
@@ -136,7 +155,7 @@ class Indexer:
         dossier = MissionDossier(
             mission_type=mission_type,
             mission_run_id=str(uuid.uuid4()),
-            mission_slug=self._extract_mission_slug(feature_dir),
+            mission_slug=mission_slug,
             feature_dir=str(feature_dir),
             artifacts=self.artifacts,
             manifest=manifest.model_dump() if manifest else None,
@@ -149,8 +168,47 @@ class Indexer:
         # Update timestamp
         dossier.dossier_updated_at = now_utc()
 
+        if self._hash_cache is not None:
+            from specify_cli.dossier.snapshot import compute_parity_hash_from_dossier
+
+            self._hash_cache.finalize_scan(compute_parity_hash_from_dossier(dossier))
+            self._hash_cache.save()
+            logger.debug(
+                "Dossier hash cache for %s: %d hit(s), %d rehashed",
+                mission_slug,
+                self._hash_cache.hits,
+                self._hash_cache.misses,
+            )
+            self._hash_cache = None
+
         return dossier
 
+    def _hash_artifact(self, file_path: Path, relative_path: str) -> tuple[str | None, str | None, int]:
+        """Return ``(content_hash, error_reason, size_bytes)`` for one artifact.
+
+        WP artifacts hash their normalized static projection (FR-002, C-004);
+        everything else hashes raw bytes. With the hash cache enabled, a file
+        whose stat signature is unchanged is answered from the cache without
+        reading its content.
+
+        Raises:
+            OSError: If the file cannot be stat'ed (deleted mid-scan, permissions).
+        """
+        signature = FileSignature.from_stat(file_path.stat())
+        if self._hash_cache is not None:
+            cached = self._hash_cache.lookup(relative_path, signature)
+            if cached is not None:
+                return cached.content_hash, cached.error_reason, signature.size
+
+        if _is_wp_artifact(file_path):
+            file_hash, error_reason = _hash_wp_projection(file_path)
+        else:
+            file_hash, error_reason = hash_file_with_validation(file_path)
+
+        if self._hash_cache is not None:
+            self._hash_cache.store(relative_path, signature, file_hash, error_reason)
+        return file_hash, error_reason, signature.size
+
     def _scan_directory(self, directory: Path) -> Iterator[Path]:
         """Recursively yield all files in directory (skip hidden/git).
 
@@ -193,20 +251,10 @@ class Indexer:
             artifact_class = "output"
 
         try:
-            # Try to read and hash. WP artifacts hash their normalized static
-            # projection (FR-002, C-004); everything else hashes raw bytes.
-            if _is_wp_artifact(file_path):
-                file_hash, error_reason = _hash_wp_projection(file_path)
-            else:
-                file_hash, error_reason = hash_file_with_validation(file_path)
+            file_hash, error_reason, size_bytes = self._hash_artifact(file_path, relative_path)
 
             if error_reason:
                 # UTF-8 validation failed or I/O error
-                try:
-                    size_bytes = file_path.stat().st_size
-                except OSError:
-                    size_bytes = 0
-
                 logger.warning(f"Artifact unreadable {relative_path}: {error_reason}")
                 return ArtifactRef(
                     artifact_key=artifact_key,
@@ -225,7 +273,7 @@ class Indexer:
                 artifact_class=artifact_class,
                 relative_path=relative_path,
                 content_hash_sha256=file_hash,
-                size_bytes=file_path.stat().st_size,
+                size_bytes=size_bytes,
                 required_status=self._get_required_status(artifact_key, manifest),
                 is_present=True,
                 error_reason=None,
@@ -17,6 +17,7 @@ from pathlib import Path
 from typing import Any, Protocol, cast
 
 from kernel.clock import now_utc_iso
+from kernel.tracing import span, traced
 from specify_cli.paths import get_runtime_root
 from specify_cli.sync.layout_generation import (
     LayoutDestination,
@@ -160,6 +161,7 @@ class EventJournal:
             inserted=False,
         )
 
+    @traced("event_journal.append")
     def append(
         self,
         event: Event,
@@ -172,7 +174,8 @@ class EventJournal:
         existing = self._existing_assignment(event.event_id)
         if existing is not None:
             return existing
-        decision = _active_coalesce_strategy(self, event)
+        with span("event_journal.coalesce", event_type=event.event_type):
+            decision = _active_coalesce_strategy(self, event)
         if not decision.store_as_new:
             # A strategy that suppresses the incoming identity must leave a prior
             # row. Return that row's assignment when it reused the same id, or a
@@ -228,6 +231,7 @@ class EventJournal:
         """Compatibility grouping seam; the store already owns the transaction."""
         yield self
 
+    @traced("event_journal.read_all")
     def read_all(self) -> list[Event]:
         rows = self._unit.execute(
             "SELECT payload_json FROM journal_entries WHERE project_uuid = ? ORDER BY capture_sequence, entry_id",
@@ -242,6 +246,7 @@ class EventJournal:
         ).fetchone()
         return None if row is None else _event_from_document(str(row[0]))
 
+    @traced("event_journal.read_by_ids")
     def read_by_ids(self, event_ids: Sequence[str]) -> list[Event]:
         if not event_ids:
             return []
@@ -342,6 +347,7 @@ class EventJournal:
 
         self._authority.execute_write(self._authority.issue_write_permit(), write)
 
+    @traced("event_journal.purge")
     def purge_events(
         self,
         event_ids: Sequence[str],
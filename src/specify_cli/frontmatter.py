@@ -9,10 +9,14 @@ LLMs and scripts should NEVER manually edit YAML frontmatter.
 
 from __future__ import annotations
 
+import copy
+import os
 import re
+import threading
 from pathlib import Path
 from typing import Any
 
+import yaml
 from ruamel.yaml import YAML
 from ruamel.yaml.comments import CommentedMap
 from ruamel.yaml.constructor import DuplicateKeyError
@@ -97,6 +101,9 @@ class FrontmatterManager:
     def read(self, file_path: Path) -> tuple[dict[str, Any], str]:
         """Read frontmatter and body from a markdown file.
 
+        Round-trip parse (comments and key order preserved) for callers that
+        write the file back; read-only callers use :func:`read_frontmatter_readonly`.
+
         Args:
             file_path: Path to markdown file
 
@@ -110,23 +117,9 @@ class FrontmatterManager:
             raise FrontmatterError(f"File not found: {file_path}")
 
         content = file_path.read_text(encoding="utf-8-sig")
-
-        if not content.startswith("---"):
-            raise FrontmatterError(f"File has no frontmatter: {file_path}")
-
-        # Find closing ---
-        lines = content.split("\n")
-        closing_idx = -1
-        for i, line in enumerate(lines[1:], start=1):
-            if line.strip() == "---":
-                closing_idx = i
-                break
-
-        if closing_idx == -1:
-            raise FrontmatterError(f"Malformed frontmatter (no closing ---): {file_path}")
+        frontmatter_text, body = _split_frontmatter(file_path, content)
 
         # Parse frontmatter
-        frontmatter_text = "\n".join(lines[1:closing_idx])
         try:
             frontmatter = self.yaml.load(frontmatter_text)
             if frontmatter is None:
@@ -139,24 +132,10 @@ class FrontmatterManager:
         except Exception as e:
             raise FrontmatterError(f"Invalid YAML in {file_path}: {e}") from e
 
-        # Frontmatter must be a mapping. A YAML list/scalar (structurally-malformed
-        # doc) would otherwise blow up the key access below with a TypeError that
-        # escapes this method's documented FrontmatterError-only contract and
-        # aborts callers mid-scan (#2883 item 4).
-        if not isinstance(frontmatter, dict):
-            raise FrontmatterError(f"Frontmatter is not a mapping in {file_path}: parsed as {type(frontmatter).__name__}")
-
-        # Ensure dependencies field exists for WP files only (backward compatibility with pre-0.11.0)
-        if file_path.name.startswith("WP") and "dependencies" not in frontmatter:
-            frontmatter["dependencies"] = []
-
-        # Get body (everything after closing ---)
-        body = "\n".join(lines[closing_idx + 1 :])
-
-        return frontmatter, body
+        return _finish_frontmatter(file_path, frontmatter), body
 
     @staticmethod
-    def _format_duplicate_key_error(file_path: Path, content: str, error: DuplicateKeyError) -> str:
+    def _format_duplicate_key_error(file_path: Path, content: str, error: Exception) -> str:
         """Build a legible duplicate-key message naming every offending key.
 
         Consumes WP03's raw-text detector
@@ -230,7 +209,7 @@ class FrontmatterManager:
         Returns:
             Field value or default
         """
-        frontmatter, _ = self.read(file_path)
+        frontmatter, _ = read_frontmatter_readonly(file_path)
         return frontmatter.get(field, default)
 
     def _normalize_frontmatter(self, frontmatter: dict[str, Any]) -> CommentedMap:
@@ -355,6 +334,182 @@ WP_RUNTIME_FIELDS: frozenset[str] = frozenset(
     field for field in FrontmatterManager.WP_FIELD_ORDER if field in _RUNTIME_FIELD_NAMES
 )
 
+def _split_frontmatter(file_path: Path, content: str) -> tuple[str, str]:
+    """Split *content* into ``(frontmatter_text, body)`` at the ``---`` fences."""
+    if not content.startswith("---"):
+        raise FrontmatterError(f"File has no frontmatter: {file_path}")
+
+    # Find closing ---
+    lines = content.split("\n")
+    closing_idx = -1
+    for i, line in enumerate(lines[1:], start=1):
+        if line.strip() == "---":
+            closing_idx = i
+            break
+
+    if closing_idx == -1:
+        raise FrontmatterError(f"Malformed frontmatter (no closing ---): {file_path}")
+
+    # Body is everything after the closing ---
+    return "\n".join(lines[1:closing_idx]), "\n".join(lines[closing_idx + 1 :])
+
+
+def _finish_frontmatter(file_path: Path, frontmatter: Any) -> Any:
+    """Apply the post-parse checks shared by the round-trip and read-only paths."""
+    # Frontmatter must be a mapping. A YAML list/scalar (structurally-malformed
+    # doc) would otherwise blow up the key access below with a TypeError that
+    # escapes the documented FrontmatterError-only contract and aborts callers
+    # mid-scan (#2883 item 4).
+    if not isinstance(frontmatter, dict):
+        raise FrontmatterError(f"Frontmatter is not a mapping in {file_path}: parsed as {type(frontmatter).__name__}")
+
+    # Ensure dependencies field exists for WP files only (backward compatibility with pre-0.11.0)
+    if file_path.name.startswith("WP") and "dependencies" not in frontmatter:
+        frontmatter["dependencies"] = []
+    return frontmatter
+
+
+# ---------------------------------------------------------------------------
+# Read-only fast path
+# ---------------------------------------------------------------------------
+#
+# Round-trip ruamel (comment-preserving CommentedMap construction) is only
+# worth its cost when the document is written back. Read-only consumers parse
+# through libyaml's C safe loader instead, with two adjustments so both paths
+# agree on every value: implicit scalars resolve under the YAML 1.2 core schema
+# ruamel uses (``yes``/``on`` stay strings, no sexagesimal numbers), and a
+# duplicate key anywhere in the document still fails closed (WP09, FR-007).
+
+_SafeLoader: type[yaml.SafeLoader] = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+_MERGE_TAG = "tag:yaml.org,2002:merge"
+
+
+class _DuplicateFrontmatterKey(yaml.constructor.ConstructorError):
+    """A mapping in read-only frontmatter repeats a key."""
+
+
+class _ReadOnlyLoader(_SafeLoader):  # type: ignore[misc,valid-type]
+    """Safe loader resolving plain scalars like ruamel's YAML 1.2 round-trip loader."""
+
+    yaml_implicit_resolvers: dict[str | None, list[tuple[str, re.Pattern[str]]]] = {}
+
+    def construct_mapping(self, node: yaml.MappingNode, deep: bool = False) -> dict[Any, Any]:
+        seen: set[Any] = set()
+        for key_node, _value_node in node.value:
+            if key_node.tag == _MERGE_TAG:
+                continue
+            key = self.construct_object(key_node, deep=True)
+            try:
+                duplicate = key in seen
+            except TypeError:
+                continue  # unhashable key: the base constructor raises its own error
+            if duplicate:
+                raise _DuplicateFrontmatterKey(
+                    "while constructing a mapping",
+                    node.start_mark,
+                    f"found duplicate key {key!r}",
+                    key_node.start_mark,
+                )
+            seen.add(key)
+        mapping: dict[Any, Any] = super().construct_mapping(node, deep=deep)
+        return mapping
+
+    def construct_yaml_int(self, node: yaml.ScalarNode) -> int:
+        # YAML 1.2: a leading zero is decimal; octal needs the ``0o`` prefix.
+        value = str(self.construct_scalar(node)).replace("_", "")
+        sign = -1 if value.startswith("-") else 1
+        digits = value.lstrip("+-")
+        for prefix, base in (("0b", 2), ("0o", 8), ("0x", 16)):
+            if digits.startswith(prefix):
+                return sign * int(digits[2:], base)
+        return sign * int(digits)
+
+
+for _tag, _pattern, _first in (
+    ("tag:yaml.org,2002:bool", r"^(?:true|True|TRUE|false|False|FALSE)$", "tTfF"),
+    (
+        "tag:yaml.org,2002:float",
+        r"^(?:[-+]?(?:[0-9][0-9_]*)\.[0-9_]*(?:[eE][-+]?[0-9]+)?"
+        r"|[-+]?(?:[0-9][0-9_]*)(?:[eE][-+]?[0-9]+)"
+        r"|[-+]?\.[0-9_]+(?:[eE][-+][0-9]+)?"
+        r"|[-+]?\.(?:inf|Inf|INF)"
+        r"|\.(?:nan|NaN|NAN))$",
+        "-+0123456789.",
+    ),
+    (
+        "tag:yaml.org,2002:int",
+        r"^(?:[-+]?0b[0-1_]+|[-+]?0o[0-7_]+|[-+]?[0-9][0-9_]*|[-+]?0x[0-9a-fA-F_]+)$",
+        "-+0123456789",
+    ),
+    ("tag:yaml.org,2002:merge", r"^(?:<<)$", "<"),
+    ("tag:yaml.org,2002:null", r"^(?:~|null|Null|NULL|)$", ["~", "n", "N", ""]),
+    (
+        "tag:yaml.org,2002:timestamp",
+        r"^(?:[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9]"
+        r"|[0-9][0-9][0-9][0-9]-[0-9][0-9]?-[0-9][0-9]?"
+        r"(?:[Tt]|[ \t]+)[0-9][0-9]?"
+        r":[0-9][0-9]:[0-9][0-9](?:\.[0-9]*)?"
+        r"(?:[ \t]*(?:Z|[-+][0-9][0-9]?(?::[0-9][0-9])?))?)$",
+        "0123456789",
+    ),
+):
+    _ReadOnlyLoader.add_implicit_resolver(_tag, re.compile(_pattern), list(_first))
+_ReadOnlyLoader.add_constructor("tag:yaml.org,2002:int", _ReadOnlyLoader.construct_yaml_int)
+
+# Parsed read-only frontmatter per file, keyed on the stat identity it was
+# parsed from; a rewrite changes ``mtime_ns``/``size`` and misses the cache.
+_READONLY_CACHE_MAX = 4096
+_readonly_cache: dict[Path, tuple[tuple[int, int], dict[str, Any], str]] = {}
+_readonly_cache_lock = threading.Lock()
+
+
+def read_frontmatter_readonly(file_path: Path) -> tuple[dict[str, Any], str]:
+    """Read frontmatter and body for a caller that will NOT write the file back.
+
+    Same contract as :meth:`FrontmatterManager.read` (including the fail-closed
+    duplicate-key check and the ``dependencies`` default for WP files), but
+    parsed with the C-accelerated safe loader and memoised per process on
+    ``(path, mtime_ns, size)``. The returned mapping is a plain ``dict`` owned
+    by the caller; it carries no comments, so read-modify-write callers must
+    use :func:`read_frontmatter` instead.
+
+    Raises:
+        FrontmatterError: If the file is missing, has no frontmatter, or is malformed
+    """
+    try:
+        with file_path.open("rb") as handle:
+            stat = os.fstat(handle.fileno())
+            raw = handle.read()
+    except FileNotFoundError as e:
+        raise FrontmatterError(f"File not found: {file_path}") from e
+
+    key = (stat.st_mtime_ns, stat.st_size)
+    with _readonly_cache_lock:
+        cached = _readonly_cache.get(file_path)
+    if cached is not None and cached[0] == key:
+        return copy.deepcopy(cached[1]), cached[2]
+
+    # Universal newlines, as ``Path.read_text`` applies on the round-trip path.
+    content = raw.decode("utf-8-sig").replace("\r\n", "\n").replace("\r", "\n")
+    frontmatter_text, body = _split_frontmatter(file_path, content)
+    try:
+        frontmatter = yaml.load(frontmatter_text, Loader=_ReadOnlyLoader)  # noqa: S506 — safe loader subclass
+        if frontmatter is None:
+            frontmatter = {}
+    except _DuplicateFrontmatterKey as e:
+        raise FrontmatterError(FrontmatterManager._format_duplicate_key_error(file_path, content, e)) from e
+    except Exception as e:
+        raise FrontmatterError(f"Invalid YAML in {file_path}: {e}") from e
+    frontmatter = _finish_frontmatter(file_path, frontmatter)
+
+    with _readonly_cache_lock:
+        if len(_readonly_cache) >= _READONLY_CACHE_MAX:
+            _readonly_cache.clear()
+        _readonly_cache[file_path] = (key, frontmatter, body)
+    return copy.deepcopy(frontmatter), body
+
+
 # Global instance for convenience
 _manager = FrontmatterManager()
 
@@ -416,6 +571,7 @@ __all__ = [
     "FrontmatterError",
     "FrontmatterManager",
     "read_frontmatter",
+    "read_frontmatter_readonly",
     "write_frontmatter",
     "update_fields",
     "get_field",
@@ -4,6 +4,7 @@ from .commit_helpers import (
     ProtectedBranchCommitError,
     SafeCommitPathPolicyError,
     assert_not_protected_branch,
+    plumbing_commit,
     safe_commit,
 )
 
@@ -11,5 +12,6 @@ __all__ = [
     "ProtectedBranchCommitError",
     "SafeCommitPathPolicyError",
     "assert_not_protected_branch",
+    "plumbing_commit",
     "safe_commit",
 ]
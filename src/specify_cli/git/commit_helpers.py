@@ -70,6 +70,7 @@ from __future__ import annotations
 from specify_cli.core.constants import KITTY_SPECS_DIR, WORKTREES_DIR
 import contextlib
 import logging
+import os
 import subprocess
 import uuid
 from collections.abc import Sequence
@@ -81,6 +82,7 @@ from mission_runtime import CommitTarget
 from kernel.paths import to_posix
 from specify_cli.core.commit_guard import GuardCapability, GuardVerdict, ProtectionState
 from kernel.clock import now_utc_iso
+from kernel.tracing import span, traced
 from specify_cli.core.commit_guard import evaluate as evaluate_commit_guard
 from kernel.git_topology import (
     GitTopologyError,
@@ -88,6 +90,7 @@ from kernel.git_topology import (
     git_toplevel,
 )
 from specify_cli.git.protection_policy import ProtectionPolicy
+from specify_cli.git.ref_advance import RefSwapConflictError, TreeEntryUpdate, swap_branch_ref
 
 logger = logging.getLogger(__name__)
 
@@ -454,6 +457,7 @@ class CommitResult:
 # ---------------------------------------------------------------------------
 
 
+@traced("git.run")
 def _run_git_text(repo_path: Path, args: list[str]) -> str | None:
     result = subprocess.run(
         ["git", *args],
@@ -530,6 +534,7 @@ def assert_not_protected_branch(repo_path: Path, *, operation: str = "commit") -
             )
 
 
+@traced("git.staging_check")
 def assert_staging_area_matches_expected(
     repo_path: Path,
     expected_paths: Sequence[str],
@@ -694,6 +699,7 @@ def _find_stash_ref(repo_path: Path, stash_message: str) -> str | None:
     return None
 
 
+@traced("git.stage")
 def _stage_requested_files(repo_path: Path, normalized_files: list[str]) -> bool:
     """Stage each requested file via ``git add --force``. Returns False on failure."""
     for file_path in normalized_files:
@@ -835,6 +841,7 @@ def _commit_output_is_empty_changeset(output: str) -> bool:
     return any(marker in low for marker in _EMPTY_CHANGESET_MARKERS)
 
 
+@traced("git.staged_tree_check")
 def _staged_tree_is_empty(repo_path: Path) -> bool:
     """True iff the index matches HEAD, i.e. there is genuinely nothing staged.
 
@@ -867,6 +874,7 @@ def _staged_tree_is_empty(repo_path: Path) -> bool:
     return result.returncode == 0
 
 
+@traced("git.commit")
 def _run_commit_capture_sha(repo_path: Path, commit_message: str) -> tuple[str | None, str, str]:
     """Run ``git commit``.
 
@@ -941,6 +949,70 @@ def _get_current_build_id(repo_root: Path) -> str:
         return str(uuid.uuid4())
 
 
+def _assert_destination_allowed(
+    repo_root: Path,
+    worktree_root: Path,
+    target: CommitTarget,
+    capability: GuardCapability,
+    message: str,
+) -> None:
+    """Raise :class:`ProtectedBranchRefused` unless ``capability`` may write ``target``.
+
+    Both roots are checked (the worktree may be on a different branch when run
+    from inside a lane worktree); each resolves its own ProtectionPolicy so the
+    correct config is read for each root. The decision itself is
+    ``commit_guard.evaluate`` alone (C-GUARD-1).
+    """
+    _policy_repo = ProtectionPolicy.resolve(repo_root)
+    _policy_wt = ProtectionPolicy.resolve(worktree_root)
+    is_protected = (
+        _policy_repo.is_protected(target.ref)
+        or _policy_wt.is_protected(target.ref)
+    )
+    guard_verdict: GuardVerdict = evaluate_commit_guard(
+        target,
+        ProtectionState(is_protected=is_protected),
+        capability,
+    )
+    if not guard_verdict.allowed:
+        raise ProtectedBranchRefused(
+            destination_ref=target.ref,
+            worktree_root=worktree_root,
+            commit_message=message,
+        )
+
+
+def _emit_local_commit_frame(
+    repo_root: Path, worktree_root: Path, paths: tuple[Path, ...], sha: str
+) -> None:
+    """Emit a LocalCommit frame for any paths under kitty-specs/ (FR-010–FR-017).
+
+    This is fire-and-forget: failures are logged and swallowed so a notification
+    failure never aborts a successful commit.
+    """
+    mission_specs_files = [
+        str(Path(p).relative_to(worktree_root)) if Path(p).is_absolute() else str(p)
+        for p in paths
+        if KITTY_SPECS_DIR in Path(p).parts
+    ]
+    if not mission_specs_files:
+        return
+    try:
+        from specify_cli.sync.local_commit import emit_local_commit  # noqa: PLC0415
+
+        emit_local_commit(
+            repo_root=repo_root,
+            git_hash=sha,
+            mission_id=_derive_mission_id(mission_specs_files),
+            build_id=_get_current_build_id(repo_root),
+            changed_files=mission_specs_files,
+            committed_at=now_utc_iso(),
+        )
+    except Exception:  # noqa: BLE001
+        logger.warning("emit_local_commit failed after commit %s; commit succeeded", sha, exc_info=True)
+
+
+@traced("git.safe_commit")
 def safe_commit(  # noqa: C901 -- sequential validation gates; splitting harms readability
     *,
     repo_root: Path,
@@ -1107,27 +1179,7 @@ def safe_commit(  # noqa: C901 -- sequential validation gates; splitting harms r
     #    (WP01 / T002): the policy is resolved at this boundary (FR-007) and the
     #    hatch + set membership are decided together.  ``evaluate`` itself never
     #    reads the environment — agent privilege stays capability-asserted (FR-008).
-    #
-    #    Both repo_root and worktree_root are checked (the worktree may be on a
-    #    different branch when run from inside a lane worktree).  Each resolves
-    #    its own ProtectionPolicy so the correct config is read for each root.
-    _policy_repo = ProtectionPolicy.resolve(repo_root)
-    _policy_wt = ProtectionPolicy.resolve(worktree_root)
-    is_protected = (
-        _policy_repo.is_protected(destination_ref)
-        or _policy_wt.is_protected(destination_ref)
-    )
-    guard_verdict: GuardVerdict = evaluate_commit_guard(
-        target,
-        ProtectionState(is_protected=is_protected),
-        capability,
-    )
-    if not guard_verdict.allowed:
-        raise ProtectedBranchRefused(
-            destination_ref=destination_ref,
-            worktree_root=worktree_root,
-            commit_message=message,
-        )
+    _assert_destination_allowed(repo_root, worktree_root, target, capability, message)
 
     # 7-9. Stage + backstop + commit, with prior-staging preservation.
     stash_message = f"spec-kitty-safe-commit:{uuid.uuid4()}"
@@ -1142,15 +1194,16 @@ def safe_commit(  # noqa: C901 -- sequential validation gates; splitting harms r
         )
     _unstage_requested_files(worktree_root, normalized_files)
 
-    stash_result = subprocess.run(
-        ["git", "stash", "push", "--staged", "--quiet", "-m", stash_message],
-        cwd=worktree_root,
-        capture_output=True,
-        text=True,
-        encoding="utf-8",
-        errors="replace",
-        check=False,
-    )
+    with span("git.stash", op="push"):
+        stash_result = subprocess.run(
+            ["git", "stash", "push", "--staged", "--quiet", "-m", stash_message],
+            cwd=worktree_root,
+            capture_output=True,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+            check=False,
+        )
     created_stash = stash_result.returncode == 0 and _find_stash_ref(worktree_root, stash_message) is not None
 
     backstop_error: SafeCommitBackstopError | None = None
@@ -1228,15 +1281,16 @@ def safe_commit(  # noqa: C901 -- sequential validation gates; splitting harms r
         if created_stash:
             stash_ref = _find_stash_ref(worktree_root, stash_message)
             if stash_ref is not None:
-                pop_result = subprocess.run(
-                    ["git", "stash", "pop", "--index", "--quiet", stash_ref],
-                    cwd=worktree_root,
-                    capture_output=True,
-                    text=True,
-                    encoding="utf-8",
-                    errors="replace",
-                    check=False,
-                )
+                with span("git.stash", op="pop"):
+                    pop_result = subprocess.run(
+                        ["git", "stash", "pop", "--index", "--quiet", stash_ref],
+                        cwd=worktree_root,
+                        capture_output=True,
+                        text=True,
+                        encoding="utf-8",
+                        errors="replace",
+                        check=False,
+                    )
                 if pop_result.returncode != 0:
                     orphan_stash_ref = _find_stash_ref(worktree_root, stash_message) or stash_ref
                     detail = (pop_result.stderr or pop_result.stdout).strip()
@@ -1280,31 +1334,184 @@ def safe_commit(  # noqa: C901 -- sequential validation gates; splitting harms r
 
     assert new_sha is not None  # type narrow: commit_created => new_sha set
 
-    # Emit a LocalCommit frame for any paths under kitty-specs/ (FR-010–FR-017).
-    # This is fire-and-forget: failures are logged and swallowed so a notification
-    # failure never aborts a successful commit.
-    mission_specs_files = [
-        str(Path(p).relative_to(worktree_root)) if Path(p).is_absolute() else str(p)
-        for p in paths
-        if KITTY_SPECS_DIR in Path(p).parts
-    ]
-    if mission_specs_files:
-        try:
-            from specify_cli.sync.local_commit import emit_local_commit  # noqa: PLC0415
-
-            emit_local_commit(
-                repo_root=repo_root,
-                git_hash=new_sha,
-                mission_id=_derive_mission_id(mission_specs_files),
-                build_id=_get_current_build_id(repo_root),
-                changed_files=mission_specs_files,
-                committed_at=now_utc_iso(),
-            )
-        except Exception:  # noqa: BLE001
-            logger.warning("emit_local_commit failed after safe_commit; commit succeeded", exc_info=True)
+    _emit_local_commit_frame(repo_root, worktree_root, paths, new_sha)
 
     return CommitResult(
         sha=new_sha,
         destination_ref=destination_ref,
         worktree_root=worktree_root,
     )
+
+
+# ---------------------------------------------------------------------------
+# Worktree-free commit via git plumbing
+# ---------------------------------------------------------------------------
+
+# How many times plumbing_commit rebuilds on a moved tip before giving up. Each
+# retry re-reads the tip and re-folds the same blobs onto it, so a loss only
+# means another writer committed in between.
+_PLUMBING_CAS_ATTEMPTS = 3
+
+_TREE_MODE = "040000"
+
+
+@traced("git.plumbing")
+def _git_plumbing(cwd: Path, args: list[str], *, input_text: str | None = None) -> str:
+    """Run a plumbing command and return its stdout; raise ``RuntimeError`` on failure."""
+    result = subprocess.run(
+        ["git", *args],
+        cwd=cwd,
+        input=input_text,
+        capture_output=True,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+        check=False,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"plumbing_commit: git {args[0]} failed in {cwd}: {(result.stderr or result.stdout).strip()}")
+    return result.stdout
+
+
+def _hash_blobs(source_root: Path, relpaths: list[str]) -> tuple[TreeEntryUpdate, ...]:
+    """Write each file as a blob (``hash-object -w``) and pair it with its mode."""
+    shas = _git_plumbing(
+        source_root, ["hash-object", "-w", "--stdin-paths"], input_text="\n".join(relpaths) + "\n"
+    ).split()
+    return tuple(
+        TreeEntryUpdate(
+            path=relpath,
+            mode="100755" if os.stat(source_root / relpath).st_mode & 0o111 else "100644",
+            blob_sha=sha,
+        )
+        for relpath, sha in zip(relpaths, shas, strict=True)
+    )
+
+
+def _fold_tree(repo_root: Path, base_tree: str | None, changes: dict[str, Any]) -> str:
+    """Return the tree id of ``base_tree`` with ``changes`` applied (``mktree``).
+
+    ``changes`` maps a name to a :class:`TreeEntryUpdate` (a blob) or to a nested
+    dict (a subdirectory). Only the directories on a changed path are listed and
+    rewritten; every other subtree is reused by id.
+    """
+    rows: dict[str, str] = {}
+    if base_tree is not None:
+        for record in _git_plumbing(repo_root, ["ls-tree", "-z", base_tree]).split("\0"):
+            if record:
+                meta, name = record.split("\t", 1)
+                rows[name] = meta
+    for name, change in changes.items():
+        if isinstance(change, TreeEntryUpdate):
+            rows[name] = f"{change.mode} blob {change.blob_sha}"
+            continue
+        existing = rows.get(name, "").split()
+        child_base = existing[2] if len(existing) == 3 and existing[1] == "tree" else None
+        rows[name] = f"{_TREE_MODE} tree {_fold_tree(repo_root, child_base, change)}"
+    payload = "".join(f"{meta}\t{name}\0" for name, meta in rows.items())
+    return _git_plumbing(repo_root, ["mktree", "-z"], input_text=payload).strip()
+
+
+def _fold_updates(repo_root: Path, base_tree: str, updates: tuple[TreeEntryUpdate, ...]) -> str:
+    changes: dict[str, Any] = {}
+    for update in updates:
+        *dirs, name = update.path.split("/")
+        node = changes
+        for directory in dirs:
+            node = node.setdefault(directory, {})
+        node[name] = update
+    return _fold_tree(repo_root, base_tree, changes)
+
+
+@traced("git.plumbing_commit")
+def plumbing_commit(
+    *,
+    repo_root: Path,
+    source_root: Path,
+    target: CommitTarget,
+    message: str,
+    paths: tuple[Path, ...],
+    capability: GuardCapability = GuardCapability.STANDARD,
+) -> CommitResult:
+    """Commit ``paths`` onto ``target.ref`` without staging them in any index.
+
+    The worktree-free sibling of :func:`safe_commit`. Each file under
+    ``source_root`` is written as a blob (``hash-object -w``), the tip's tree is
+    rewritten along the changed directories only (``ls-tree`` + ``mktree``),
+    the commit is created with ``commit-tree`` and the branch is moved with a
+    compare-and-swap ``update-ref`` (:func:`~specify_cli.git.ref_advance.swap_branch_ref`).
+    No index is read, refreshed, or stashed, and ``source_root`` does not have
+    to have ``target.ref`` checked out, so the cost does not grow with the size
+    of the tree. A checkout that does have the branch has just the changed
+    entries resynced.
+
+    The same gates as :func:`safe_commit` run first: short ref shape,
+    non-empty ``paths``, the ``.worktrees/`` path policy, an existing
+    destination, and the ``commit_guard.evaluate`` protection decision.
+    Commit hooks do not run (``commit-tree`` is plumbing); the in-process
+    guard is the authority, exactly as for ``safe_commit``.
+
+    Returns:
+        :class:`CommitResult` whose ``worktree_root`` is ``source_root``.
+
+    Raises:
+        SafeCommitDestinationRefShape, SafeCommitEmptyChangeset,
+        SafeCommitPathPolicyError, SafeCommitDestinationNotFound,
+        ProtectedBranchRefused: as for :func:`safe_commit`. A path outside
+            ``source_root`` is a :class:`SafeCommitPathPolicyError`.
+        RefAdvanceDirtyWorktreeError: a checkout of ``target.ref`` holds local
+            changes on a committed path.
+        RuntimeError: the content already matches the tip (message starts
+            ``plumbing_commit: nothing to commit``), a plumbing command failed,
+            or the tip kept moving for every retry.
+    """
+    destination_ref = target.ref
+    if destination_ref.startswith("refs/heads/"):
+        raise SafeCommitDestinationRefShape(destination_ref=destination_ref)
+    if not paths:
+        raise SafeCommitEmptyChangeset(destination_ref=destination_ref)
+
+    resolved_source = source_root.resolve()
+    relpaths: list[str] = []
+    for path in paths:
+        try:
+            relpath = to_posix((path if path.is_absolute() else source_root / path).resolve().relative_to(resolved_source))
+        except ValueError:
+            raise SafeCommitPathPolicyError(offending_path=str(path), worktree_root=source_root) from None
+        if Path(relpath).parts[0] == WORKTREES_DIR:
+            raise SafeCommitPathPolicyError(offending_path=relpath, worktree_root=source_root)
+        relpaths.append(relpath)
+
+    if not _destination_ref_exists(repo_root, destination_ref):
+        raise SafeCommitDestinationNotFound(destination_ref=destination_ref, worktree_root=source_root)
+    _assert_destination_allowed(repo_root, source_root, target, capability, message)
+
+    updates = _hash_blobs(source_root, list(dict.fromkeys(relpaths)))
+    subject = message.splitlines()[0] if message else ""
+    for _attempt in range(_PLUMBING_CAS_ATTEMPTS):
+        parent = _git_plumbing(repo_root, ["rev-parse", "--verify", f"refs/heads/{destination_ref}^{{commit}}"]).strip()
+        base_tree = _git_plumbing(repo_root, ["rev-parse", f"{parent}^{{tree}}"]).strip()
+        tree = _fold_updates(repo_root, base_tree, updates)
+        if tree == base_tree:
+            raise RuntimeError(
+                f"plumbing_commit: nothing to commit for destination_ref={destination_ref!r} (empty changeset)"
+            )
+        new_sha = _git_plumbing(repo_root, ["commit-tree", tree, "-p", parent, "-F", "-"], input_text=message).strip()
+        try:
+            swap_branch_ref(
+                repo_root,
+                destination_ref,
+                new_sha,
+                expected_current_sha=parent,
+                updates=updates,
+                reflog_message=f"commit: {subject}",
+            )
+        except RefSwapConflictError:
+            logger.debug("plumbing_commit: %s moved under %s; rebuilding", destination_ref, new_sha)
+            continue
+        _emit_local_commit_frame(repo_root, source_root, tuple(Path(relpath) for relpath in relpaths), new_sha)
+        return CommitResult(sha=new_sha, destination_ref=destination_ref, worktree_root=source_root)
+
+    raise RuntimeError(
+        f"plumbing_commit: {destination_ref!r} kept moving; gave up after {_PLUMBING_CAS_ATTEMPTS} attempts"
+    )
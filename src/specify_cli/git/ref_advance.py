@@ -13,7 +13,10 @@ pipeline to advance a branch ref. **Invariant: no worktree may be left
 checked out behind a ref this function advanced.** An architectural ratchet
 (``tests/architectural/test_merge_pipeline_ratchets.py``) enforces that no
 raw ``update-ref`` subprocess invocation exists in ``src/specify_cli``
-outside this module (AC-B3).
+outside this module (AC-B3). :func:`swap_branch_ref` is its compare-and-swap
+sibling for commits built with plumbing on the current tip (the coordination
+bookkeeping path in ``commit_helpers.plumbing_commit``): it keeps the same
+invariant but resyncs checkouts per changed path.
 
 Locking: the three merge-pipeline call sites (``lanes/merge.py`` Stage-1
 lane→mission advances and ``cli/commands/merge.py`` mission-number baking)
@@ -70,6 +73,20 @@ class RefAdvanceNonFastForwardError(RefAdvanceError):
         )
 
 
+class RefSwapConflictError(RefAdvanceError):
+    """A compare-and-swap advance lost: the branch moved after it was read."""
+
+    error_code = "REF_SWAP_CONFLICT"
+
+    def __init__(self, *, branch: str, expected_sha: str, new_sha: str) -> None:
+        self.branch = branch
+        self.expected_sha = expected_sha
+        self.new_sha = new_sha
+        super().__init__(
+            f"Branch {branch!r} no longer points at {expected_sha[:12]}; refusing to swap it to {new_sha[:12]}. Rebuild the commit on the current tip."
+        )
+
+
 @dataclass
 class _WorktreeEntry:
     """One ``git worktree list --porcelain`` block."""
@@ -80,6 +97,15 @@ class _WorktreeEntry:
     lines: list[str] = field(default_factory=list)
 
 
+@dataclass(frozen=True)
+class TreeEntryUpdate:
+    """One blob a plumbing-built commit wrote at ``path`` (repo-relative POSIX)."""
+
+    path: str
+    mode: str
+    blob_sha: str
+
+
 class RefAdvanceDirtyWorktreeError(RuntimeError):
     """A worktree with the advanced branch checked out holds local state.
 
@@ -122,6 +148,7 @@ def _run_git(
     args: list[str],
     *,
     env: dict[str, str] | None = None,
+    input_text: str | None = None,
 ) -> subprocess.CompletedProcess[str]:
     return subprocess.run(
         ["git", *args],
@@ -130,6 +157,7 @@ def _run_git(
         text=True,
         check=False,
         env=env,
+        input=input_text,
     )
 
 
@@ -424,3 +452,112 @@ def restore_branch_ref(
         raise RefRestoreError(
             f"Failed to restore {branch!r} from {expected_current_sha[:12]} to {restored_sha[:12]}: {result.stderr.strip() or result.stdout.strip()}"
         )
+
+
+def _changed_path_conflicts(
+    worktree: Path,
+    old_sha: str,
+    updates: tuple[TreeEntryUpdate, ...],
+    env: dict[str, str] | None,
+) -> list[str]:
+    """Return the changed paths whose checkout state a per-path resync would lose.
+
+    Only the paths in ``updates`` are inspected: the index entries via
+    ``ls-files --stage`` and the files via ``hash-object``, so neither a
+    status scan nor an index refresh runs. A path is safe when its index entry
+    and its file each hold either the blob at ``old_sha`` (or are absent where
+    ``old_sha`` has no such path) or the blob being committed.
+    """
+    paths = [update.path for update in updates]
+    old = _run_git(worktree, ["ls-tree", "-r", "-z", old_sha, "--", *paths], env=env)
+    staged = _run_git(worktree, ["ls-files", "--stage", "-z", "--", *paths], env=env)
+    if old.returncode != 0 or staged.returncode != 0:
+        raise RefAdvanceError(f"Could not inspect {paths} in the worktree at {worktree}: {(old.stderr or staged.stderr).strip()}")
+    old_blobs = {record.split("\t", 1)[1]: record.split()[2] for record in old.stdout.split("\0") if record}
+    index_blobs = {record.split("\t", 1)[1]: record.split()[1] for record in staged.stdout.split("\0") if record}
+
+    present = [path for path in paths if (worktree / path).is_file()]
+    file_blobs: dict[str, str] = {}
+    if present:
+        hashed = _run_git(worktree, ["hash-object", "--stdin-paths"], env=env, input_text="\n".join(present) + "\n")
+        if hashed.returncode != 0:
+            raise RefAdvanceError(f"Could not hash {present} in the worktree at {worktree}: {hashed.stderr.strip()}")
+        file_blobs = dict(zip(present, hashed.stdout.split(), strict=True))
+
+    conflicts: list[str] = []
+    for update in updates:
+        accepted = {update.blob_sha, old_blobs.get(update.path)}
+        if index_blobs.get(update.path) not in accepted:
+            conflicts.append(f"M  {update.path} (staged changes would be overwritten)")
+        elif file_blobs.get(update.path) not in accepted:
+            conflicts.append(f" M {update.path} (local changes would be overwritten)")
+    return conflicts
+
+
+def swap_branch_ref(
+    repo_root: Path,
+    branch: str,
+    new_sha: str,
+    *,
+    expected_current_sha: str,
+    updates: tuple[TreeEntryUpdate, ...],
+    reflog_message: str | None = None,
+    env: dict[str, str] | None = None,
+) -> None:
+    """Compare-and-swap ``refs/heads/<branch>`` to a commit built on its tip.
+
+    The counterpart of :func:`advance_branch_ref` for a commit assembled with
+    git plumbing directly on top of ``expected_current_sha``, where the caller
+    knows exactly which paths changed (``updates``). The same invariant holds
+    -- no worktree is left checked out behind the ref -- but a checkout that
+    has ``branch`` is resynced per path instead of by ``reset --hard``: only
+    the changed index entries are rewritten and only those files are checked
+    out, so no full checkout or index refresh runs however large the tree is.
+
+    Refusal is atomic, as in :func:`advance_branch_ref`: every checkout is
+    checked before the ref moves, and a changed path carrying local or staged
+    content that is neither the old nor the new blob refuses the swap.
+
+    Raises:
+        RefSwapConflictError: the ref no longer points at
+            ``expected_current_sha`` (another writer won); nothing was mutated.
+        RefAdvanceDirtyWorktreeError: a checkout holds local state on a
+            changed path; nothing was mutated.
+        RefAdvanceError: ``update-ref`` or a per-path resync failed.
+    """
+    ref = f"refs/heads/{branch}"
+    checkouts = [entry.path for entry in _list_worktrees(repo_root, env) if not entry.detached and entry.branch == ref]
+    for worktree in checkouts:
+        conflicts = _changed_path_conflicts(worktree, expected_current_sha, updates, env)
+        if conflicts:
+            raise RefAdvanceDirtyWorktreeError(
+                worktree_path=worktree.resolve(),
+                branch=branch,
+                old_sha=expected_current_sha,
+                new_sha=new_sha,
+                dirty_entries=conflicts,
+            )
+
+    args = ["update-ref"]
+    if reflog_message:
+        args += ["-m", reflog_message]
+    result = _run_git(repo_root, [*args, ref, new_sha, expected_current_sha], env=env)
+    if result.returncode != 0:
+        current = _run_git(repo_root, ["rev-parse", "--verify", "--quiet", ref], env=env).stdout.strip()
+        if current != expected_current_sha:
+            raise RefSwapConflictError(branch=branch, expected_sha=expected_current_sha, new_sha=new_sha)
+        raise RefAdvanceError(f"Failed to update {branch} ref: {result.stderr.strip() or result.stdout.strip()}")
+
+    index_info = "".join(f"{update.mode} {update.blob_sha}\t{update.path}\n" for update in updates)
+    paths = [update.path for update in updates]
+    for worktree in checkouts:
+        patched = _run_git(worktree, ["update-index", "--index-info"], env=env, input_text=index_info)
+        written = patched if patched.returncode != 0 else _run_git(worktree, ["checkout-index", "-f", "-u", "--", *paths], env=env)
+        if written.returncode != 0:
+            raise RefAdvanceError(
+                f"Advanced {branch} ({expected_current_sha[:12]} -> {new_sha[:12]}) but "
+                f"failed to resync {paths} in the checked-out worktree at {worktree}: "
+                f"{written.stderr.strip() or written.stdout.strip()}. "
+                f"The worktree is behind its own HEAD (#1826); repair with "
+                f"`git -C {worktree} reset --hard` once the cause is fixed."
+            )
@@ -34,6 +34,7 @@ from kernel.clock import now_utc_iso
 from specify_cli.git import safe_commit
 from specify_cli.invocation.empty_charter import resolve_generic_fallback
 from specify_cli.invocation.errors import (
+    AlreadyClosedError,
     InvalidModeForEvidenceError,
     InvocationError,
     UndeterminedModeForEvidenceError,
@@ -44,6 +45,7 @@ from specify_cli.invocation.record import OpCompletedEvent, OpStartedEvent, prom
 from specify_cli.invocation.registry import ProfileRegistry
 from specify_cli.invocation.router import ActionRouter, RouterDecision  # WP02: router implemented
 from specify_cli.invocation.task_class_map import task_type_for_verb
+from specify_cli.invocation.trail_store import find_compacted
 from specify_cli.invocation.writer import InvocationWriter, normalise_ref
 
 logger = logging.getLogger(__name__)
@@ -565,6 +567,8 @@ class ProfileInvocationExecutor:
         """
         path = self._writer.invocation_path(invocation_id)
         if not path.exists():
+            if find_compacted(path.parent, invocation_id) is not None:
+                raise AlreadyClosedError(invocation_id)
             raise InvocationError(f"Invocation record not found: {invocation_id}")
         first_line = path.read_text(encoding="utf-8").splitlines()[0]
         first = _json_mod.loads(first_line)
@@ -0,0 +1,380 @@
+"""Compacted, self-describing segment store for the invocation audit trail.
+
+Every invocation starts as a loose ``kitty-ops/<ULID>.jsonl`` file written by
+:class:`~specify_cli.invocation.writer.InvocationWriter`; that stays the only
+write path for live invocations, so appends cost exactly what they always did.
+Long-lived projects accumulate tens of thousands of those files, and every
+reader that needs open/closed status or the action had to open each one.
+
+Compaction rolls *closed* invocations into segment files under
+``kitty-ops/segments/``. A segment is self-describing: its first line is a
+header carrying one index entry per invocation — profile, action, status and
+completion fields, plus the byte span of that invocation's events — followed
+by the original event lines verbatim. Readers answer list/status questions
+from headers alone and seek to a span only when they need the full events.
+
+Segments are named ``<first ULID>-<last ULID>.jsonl`` after the invocations
+they hold, so two clones compacting the same closed records produce the same
+file instead of a merge conflict. If a record does appear in two segments,
+the first segment in name order wins.
+
+The machine-local ``ops-index.jsonl`` additionally carries one ``completed``
+line per close (see ``InvocationWriter.write_completed``), which lets readers
+skip the per-file read for invocations closed on this machine even before
+they are compacted.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from kernel.clock import UTC, datetime, parse_iso
+from specify_cli.invocation.errors import LegacyRecordError
+from specify_cli.invocation.record import (
+    OpCompletedEvent,
+    OpStartedEvent,
+    parse_op_event,
+    validate_invocation_id,
+)
+
+logger = logging.getLogger(__name__)
+
+SEGMENTS_DIRNAME = "segments"
+SEGMENTS_DIR = f"kitty-ops/{SEGMENTS_DIRNAME}"
+SEGMENT_KIND = "kitty-ops-segment"
+SEGMENT_VERSION = 1
+
+#: Closed invocations younger than this stay loose so late correlation links
+#: (artifact/commit links appended after completion) still find their file.
+DEFAULT_MIN_AGE_HOURS = 24.0
+#: Invocations per segment file; bounds the header a reader parses per file.
+DEFAULT_SEGMENT_SIZE = 1000
+
+_INDEX_FILENAME = "ops-index.jsonl"
+
+
+@dataclass(frozen=True)
+class SegmentEntry:
+    """Header index entry for one compacted invocation."""
+
+    invocation_id: str
+    profile_id: str
+    action: str
+    started_at: str
+    completed_at: str
+    outcome: str
+    closed_by: str
+    evidence_ref: str | None
+    segment: str
+    offset: int
+    length: int
+
+    def to_header(self) -> dict[str, Any]:
+        """Return the header form (the segment name is implied by the file)."""
+        return {
+            "invocation_id": self.invocation_id,
+            "profile_id": self.profile_id,
+            "action": self.action,
+            "started_at": self.started_at,
+            "status": "closed",
+            "completed_at": self.completed_at,
+            "outcome": self.outcome,
+            "closed_by": self.closed_by,
+            "evidence_ref": self.evidence_ref,
+            "offset": self.offset,
+            "length": self.length,
+        }
+
+    def to_record(self) -> dict[str, Any]:
+        """Return the ``invocations list`` record shape for this invocation."""
+        return {
+            "invocation_id": self.invocation_id,
+            "profile_id": self.profile_id,
+            "started_at": self.started_at,
+            "completed_at": self.completed_at,
+            "outcome": self.outcome,
+            "closed_by": self.closed_by,
+            "evidence_ref": self.evidence_ref,
+            "status": "closed",
+            "action": self.action,
+            "event": "started",
+        }
+
+
+@dataclass
+class CompactionReport:
+    """Result of one ``compact_invocations`` run."""
+
+    compacted: int = 0
+    segments: list[str] = field(default_factory=list)
+    skipped_open: int = 0
+    skipped_recent: int = 0
+    skipped_unreadable: list[str] = field(default_factory=list)
+    dry_run: bool = False
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "compacted": self.compacted,
+            "segments": list(self.segments),
+            "skipped_open": self.skipped_open,
+            "skipped_recent": self.skipped_recent,
+            "skipped_unreadable": list(self.skipped_unreadable),
+            "dry_run": self.dry_run,
+        }
+
+
+@dataclass(frozen=True)
+class _Candidate:
+    started: OpStartedEvent
+    completed: OpCompletedEvent
+    body: bytes
+
+
+def _segment_paths(events_dir: Path) -> list[Path]:
+    segments_dir = events_dir / SEGMENTS_DIRNAME
+    if not segments_dir.is_dir():
+        return []
+    return sorted(path for path in segments_dir.glob("*.jsonl") if not path.is_symlink())
+
+
+def _read_header(path: Path) -> tuple[dict[str, Any], int] | None:
+    """Return ``(header, body_offset)`` for one segment, or ``None`` if unreadable."""
+    try:
+        with path.open("rb") as handle:
+            first = handle.readline()
+            body_offset = handle.tell()
+        header = json.loads(first)
+    except (OSError, json.JSONDecodeError):
+        logger.warning("Skipping unreadable invocation segment %s", path)
+        return None
+    if not isinstance(header, dict) or header.get("kind") != SEGMENT_KIND:
+        logger.warning("Skipping %s: not an invocation segment", path)
+        return None
+    if header.get("version") != SEGMENT_VERSION:
+        logger.warning("Skipping %s: unsupported segment version %r", path, header.get("version"))
+        return None
+    return header, body_offset
+
+
+def read_segment_index(events_dir: Path) -> dict[str, SegmentEntry]:
+    """Return every compacted invocation keyed by ID, reading segment headers only."""
+    index: dict[str, SegmentEntry] = {}
+    for path in _segment_paths(events_dir):
+        parsed = _read_header(path)
+        if parsed is None:
+            continue
+        header, body_offset = parsed
+        for raw in header.get("invocations", []):
+            try:
+                entry = SegmentEntry(
+                    invocation_id=str(raw["invocation_id"]),
+                    profile_id=str(raw["profile_id"]),
+                    action=str(raw["action"]),
+                    started_at=str(raw["started_at"]),
+                    completed_at=str(raw["completed_at"]),
+                    outcome=str(raw["outcome"]),
+                    closed_by=str(raw["closed_by"]),
+                    evidence_ref=raw.get("evidence_ref"),
+                    segment=path.name,
+                    offset=body_offset + int(raw["offset"]),
+                    length=int(raw["length"]),
+                )
+            except (KeyError, TypeError, ValueError):
+                logger.warning("Skipping malformed entry in invocation segment %s", path)
+                continue
+            index.setdefault(entry.invocation_id, entry)
+    return index
+
+
+def find_compacted(events_dir: Path, invocation_id: str) -> SegmentEntry | None:
+    """Return the segment entry for *invocation_id*, or ``None`` if not compacted."""
+    return read_segment_index(events_dir).get(invocation_id)
+
+
+def read_compacted_events(events_dir: Path, invocation_id: str) -> list[dict[str, Any]] | None:
+    """Return the event lines of one compacted invocation, in their original order.
+
+    Only the invocation's own byte span is read. Returns ``None`` when the
+    invocation is not compacted or its span is unreadable.
+    """
+    entry = find_compacted(events_dir, invocation_id)
+    if entry is None:
+        return None
+    try:
+        with (events_dir / SEGMENTS_DIRNAME / entry.segment).open("rb") as handle:
+            handle.seek(entry.offset)
+            body = handle.read(entry.length)
+        events = [json.loads(line) for line in body.splitlines() if line.strip()]
+    except (OSError, json.JSONDecodeError):
+        return None
+    if not events or events[0].get("invocation_id") != invocation_id:
+        return None
+    return events
+
+
+def read_indexed_completions(events_dir: Path) -> dict[str, dict[str, Any]]:
+    """Return the ``completed`` lines of ``ops-index.jsonl`` keyed by invocation ID.
+
+    Started lines are skipped without being decoded. A missing index yields an
+    empty mapping — callers then fall back to the per-invocation files.
+    """
+    completions: dict[str, dict[str, Any]] = {}
+    try:
+        with (events_dir / _INDEX_FILENAME).open("rb") as handle:
+            for line in handle:
+                if b'"completed"' not in line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if isinstance(entry, dict) and entry.get("event") == "completed":
+                    completions.setdefault(str(entry.get("invocation_id", "")), entry)
+    except OSError:
+        return {}
+    return completions
+
+
+def _age_hours(timestamp: str, now: datetime) -> float | None:
+    try:
+        moment = parse_iso(timestamp)
+    except ValueError:
+        return None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=UTC)
+    return (now - moment).total_seconds() / 3600.0
+
+
+def _load_candidate(path: Path) -> _Candidate | None:
+    """Parse one loose op file; ``None`` for open records, raises on unreadable ones."""
+    lines = [line for line in path.read_bytes().splitlines() if line.strip()]
+    if not lines:
+        raise ValueError("empty record")
+    events = [json.loads(line) for line in lines]
+    started = parse_op_event(events[0])
+    if not isinstance(started, OpStartedEvent) or started.invocation_id != path.stem:
+        raise ValueError("first line is not this invocation's started event")
+    raw_completed = next(
+        (event for event in events if isinstance(event, dict) and event.get("event") == "completed" and event.get("invocation_id") == path.stem),
+        None,
+    )
+    if raw_completed is None:
+        return None
+    completed = parse_op_event(raw_completed)
+    if not isinstance(completed, OpCompletedEvent):
+        raise ValueError("completed line is not a completed event")
+    return _Candidate(started=started, completed=completed, body=b"".join(line + b"\n" for line in lines))
+
+
+def _write_segment(segments_dir: Path, chunk: list[_Candidate]) -> str:
+    """Atomically write one segment for *chunk* and return its file name."""
+    entries: list[dict[str, Any]] = []
+    offset = 0
+    for candidate in chunk:
+        entry = SegmentEntry(
+            invocation_id=candidate.started.invocation_id,
+            profile_id=candidate.started.profile_id,
+            action=candidate.started.action,
+            started_at=candidate.started.started_at,
+            completed_at=candidate.completed.completed_at,
+            outcome=candidate.completed.outcome,
+            closed_by=candidate.completed.closed_by,
+            evidence_ref=candidate.completed.evidence_ref,
+            segment="",
+            offset=offset,
+            length=len(candidate.body),
+        )
+        entries.append(entry.to_header())
+        offset += len(candidate.body)
+    header = {
+        "kind": SEGMENT_KIND,
+        "version": SEGMENT_VERSION,
+        "count": len(chunk),
+        "invocations": entries,
+    }
+    name = f"{chunk[0].started.invocation_id}-{chunk[-1].started.invocation_id}.jsonl"
+    target = segments_dir / name
+    tmp = segments_dir / f".{name}.tmp"
+    with tmp.open("wb") as handle:
+        handle.write(json.dumps(header, sort_keys=True).encode("utf-8") + b"\n")
+        for candidate in chunk:
+            handle.write(candidate.body)
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(tmp, target)
+    return name
+
+
+def _chunks(candidates: list[_Candidate], size: int) -> Iterable[list[_Candidate]]:
+    for start in range(0, len(candidates), size):
+        yield candidates[start : start + size]
+
+
+def compact_invocations(
+    events_dir: Path,
+    *,
+    now: datetime,
+    min_age_hours: float = DEFAULT_MIN_AGE_HOURS,
+    segment_size: int = DEFAULT_SEGMENT_SIZE,
+    dry_run: bool = False,
+) -> CompactionReport:
+    """Roll closed invocations older than *min_age_hours* into segment files.
+
+    Only loose files whose name is a ULID are considered; open invocations,
+    invocations closed less than *min_age_hours* ago, and records that are not
+    v2-parseable (run ``spec-kitty upgrade`` first) stay loose. Each segment is
+    written to a temporary file and renamed into place before the loose files
+    it absorbs are removed, so an interrupted run leaves at worst a duplicate
+    that the next run (and every reader) resolves.
+    """
+    if segment_size < 1:
+        raise ValueError(f"segment_size must be >= 1, got {segment_size}")
+    report = CompactionReport(dry_run=dry_run)
+    if not events_dir.is_dir():
+        return report
+
+    already = read_segment_index(events_dir)
+    candidates: list[_Candidate] = []
+    absorbed: list[Path] = []
+    for path in sorted(events_dir.glob("*.jsonl")):
+        try:
+            validate_invocation_id(path.stem)
+        except ValueError:
+            continue  # ops-index, lifecycle, propagation-errors, ...
+        if path.is_symlink():
+            report.skipped_unreadable.append(path.stem)
+            continue
+        try:
+            candidate = _load_candidate(path)
+        except (OSError, ValueError, LegacyRecordError):
+            report.skipped_unreadable.append(path.stem)
+            continue
+        if candidate is None:
+            report.skipped_open += 1
+            continue
+        age = _age_hours(candidate.completed.completed_at, now)
+        if age is None or age < min_age_hours:
+            report.skipped_recent += 1
+            continue
+        report.compacted += 1
+        absorbed.append(path)
+        if path.stem not in already:
+            candidates.append(candidate)
+
+    if dry_run or not absorbed:
+        return report
+
+    if candidates:
+        segments_dir = events_dir / SEGMENTS_DIRNAME
+        segments_dir.mkdir(parents=True, exist_ok=True)
+        for chunk in _chunks(candidates, segment_size):
+            report.segments.append(_write_segment(segments_dir, chunk))
+    for path in absorbed:
+        path.unlink(missing_ok=True)
+    return report
@@ -17,6 +17,7 @@ from specify_cli.invocation.record import (
     OpStartedEvent,
     validate_invocation_id,
 )
+from specify_cli.invocation.trail_store import find_compacted
 
 if TYPE_CHECKING:
     from glossary.chokepoint import GlossaryObservationBundle
@@ -165,6 +166,31 @@ class InvocationWriter:
         except OSError:
             pass  # index is a performance aid; silently degrade
 
+    def _append_completion_to_index(self, record: OpCompletedEvent, action: str) -> None:
+        """Append the ``completed`` line for *record* to the invocation index.
+
+        Carries the started event's ``action`` alongside the completion fields
+        so ``invocations list`` and ``doctor ops`` can resolve a closed
+        invocation from the index without opening its file. Same best-effort
+        contract as :meth:`_append_to_index`.
+        """
+        index_path = self._dir / "ops-index.jsonl"
+        try:
+            entry = json.dumps(
+                {
+                    "event": "completed",
+                    "invocation_id": record.invocation_id,
+                    "action": action,
+                    "completed_at": record.completed_at,
+                    "outcome": record.outcome,
+                    "closed_by": record.closed_by,
+                    "evidence_ref": record.evidence_ref,
+                }
+            )
+            self._append_line_no_follow(index_path, entry + "\n")
+        except OSError:
+            pass  # index is a performance aid; silently degrade
+
     def write_started(self, record: OpStartedEvent) -> Path:
         """Write the ``started`` event. Returns the JSONL file path.
 
@@ -195,11 +221,16 @@ class InvocationWriter:
     def write_completed(self, record: OpCompletedEvent) -> Path:
         """Append the ``completed`` event to an existing invocation file.
 
-        Raises ``AlreadyClosedError`` if a completed event already exists (idempotent guard).
+        Also appends a ``completed`` line to ``kitty-ops/ops-index.jsonl``.
+
+        Raises ``AlreadyClosedError`` if a completed event already exists (idempotent
+        guard), including when the invocation was already compacted into a segment.
         Raises ``InvocationError`` if the invocation file is not found.
         Raises ``InvocationWriteError`` on filesystem failure.
         """
         path = self.invocation_path(record.invocation_id)
+        if not path.exists() and find_compacted(self._dir, record.invocation_id) is not None:
+            raise AlreadyClosedError(record.invocation_id)
         try:
             with self._validated_append_handle(path, record.invocation_id) as handle:
                 handle.seek(0)
@@ -211,10 +242,12 @@ class InvocationWriter:
                 if any(entry.get("event") == "completed" for entry in existing):
                     raise AlreadyClosedError(record.invocation_id)
                 handle.write(record.to_jsonl_line() + "\n")
+                action = str(existing[0].get("action") or "")
         except (AlreadyClosedError, InvocationError, InvocationWriteError):
             raise
         except OSError as e:
             raise InvocationWriteError(f"Failed to append completed event: {e}") from e
+        self._append_completion_to_index(record, action)
         return path
 
     def append_correlation_link(
@@ -10,6 +10,13 @@ blocker to prevent overlapping file conflicts.
 Strategy note (FR-006, FR-007):
 - Lane→mission always uses merge commits (no-ff) regardless of strategy.
 - Mission→target honors the ``strategy`` parameter (default: SQUASH).
+
+Concurrent consolidation (``merge.parallel_lanes``):
+:func:`consolidate_disjoint_lanes` prepares every lane's merge concurrently
+(staleness + ``git merge-tree`` probes, no worktrees) and then chains the
+results into the mission branch with in-object-database merges and a single
+ref advance. It only applies when lanes are provably disjoint; otherwise it
+returns ``None`` and the caller runs the serial per-lane path.
 """
 
 from __future__ import annotations
@@ -18,12 +25,15 @@ from mission_runtime import MissionArtifactKind, placement_seam
 import os
 import subprocess
 import sys
-from collections.abc import Iterator
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import ExitStack, contextmanager
 from dataclasses import dataclass, field
+from fnmatch import fnmatchcase
 from pathlib import Path
 
 from specify_cli.coordination.coherence import is_toolchain_generated_churn
+from specify_cli.core.vcs.git import git_diff_names_checked, git_merge_base
 from specify_cli.git.ref_advance import advance_branch_ref
 from specify_cli.lanes._git import branch_exists as _shared_branch_exists
 from specify_cli.lanes.branch_naming import lane_branch_name, worktree_path as _worktree_path
@@ -350,6 +360,247 @@ def integrate_mission_into_target(
     )
 
 
+# ---------------------------------------------------------------------------
+# Concurrent consolidation of disjoint lanes
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class _PreparedLaneMerge:
+    """A lane whose merge into the mission tip was proven clean in isolation."""
+
+    lane_id: str
+    branch: str
+    lane_tip: str
+    changed_files: frozenset[str]
+
+
+def _glob_literal_prefix(pattern: str) -> str:
+    """Return the part of a write-scope glob before its first wildcard."""
+    for index, char in enumerate(pattern):
+        if char in "*?[":
+            return pattern[:index]
+    return pattern
+
+
+def _write_scopes_disjoint(lanes: Sequence[ExecutionLane]) -> bool:
+    """True when the manifest proves no two lanes can write the same path.
+
+    Conservative: two globs are treated as overlapping whenever one literal
+    prefix is a prefix of the other, and a lane with no declared
+    ``write_scope`` proves nothing.
+    """
+    prefixes: list[tuple[str, list[str]]] = []
+    for lane in lanes:
+        if not lane.write_scope:
+            return False
+        prefixes.append((lane.lane_id, [_glob_literal_prefix(p) for p in lane.write_scope]))
+    for index, (_lane_id, mine) in enumerate(prefixes):
+        for _other_id, theirs in prefixes[index + 1 :]:
+            for a in mine:
+                for b in theirs:
+                    if a.startswith(b) or b.startswith(a):
+                        return False
+    return True
+
+
+def _touches_merge_driver_path(paths: frozenset[str]) -> bool:
+    """True when any path is routed to a custom merge driver (C-006).
+
+    Driver-managed artifacts must reconcile through the driver, which only the
+    worktree-based serial merge activates, so such lanes never take the fast path.
+    """
+    return any(fnmatchcase(path, spec.pattern) for path in paths for spec in _MERGE_DRIVERS)
+
+
+def _fast_forward_disabled(repo_root: Path) -> bool:
+    """True when ``merge.ff`` would change how the serial ``git merge`` behaves."""
+    result = subprocess.run(
+        ["git", "config", "--get", "merge.ff"],
+        cwd=str(repo_root), capture_output=True, text=True, env=_make_merge_env(),
+    )
+    return result.returncode == 0 and result.stdout.strip().lower() in ("false", "only")
+
+
+def _is_ancestor(repo_root: Path, ancestor: str, descendant: str, env: dict[str, str]) -> bool:
+    result = subprocess.run(
+        ["git", "merge-base", "--is-ancestor", ancestor, descendant],
+        cwd=str(repo_root), capture_output=True, env=env,
+    )
+    return result.returncode == 0
+
+
+def _merge_tree(repo_root: Path, ours: str, theirs: str, env: dict[str, str]) -> str | None:
+    """Return the merged tree SHA of two commits, or ``None`` on any conflict.
+
+    ``git merge-tree --write-tree`` (git >= 2.38) performs the same ``ort``
+    merge ``git merge`` would, entirely in the object database.
+    """
+    result = subprocess.run(
+        ["git", "merge-tree", "--write-tree", "--no-messages", ours, theirs],
+        cwd=str(repo_root), capture_output=True, text=True, env=env,
+    )
+    if result.returncode != 0:
+        return None
+    lines = result.stdout.splitlines()
+    return lines[0].strip() if lines else None
+
+
+def _commit_tree(
+    repo_root: Path, tree: str, parents: Sequence[str], message: str, env: dict[str, str]
+) -> str | None:
+    argv = ["git", "commit-tree", tree]
+    for parent in parents:
+        argv.extend(["-p", parent])
+    result = subprocess.run(
+        [*argv, "-m", message],
+        cwd=str(repo_root), capture_output=True, text=True, env=env,
+    )
+    return result.stdout.strip() if result.returncode == 0 else None
+
+
+def _prepare_lane_merge(
+    repo_root: Path,
+    mission_slug: str,
+    lane: ExecutionLane,
+    lanes_manifest: LanesManifest,
+    mission_tip: str,
+) -> _PreparedLaneMerge | None:
+    """Probe one lane against the current mission tip (read-only, thread-safe).
+
+    Returns ``None`` whenever the serial path must handle the lane: missing
+    branch, stale lane (the serial path owns auto-rebase), or a conflicting
+    merge.
+    """
+    env = _make_merge_env()
+    mission_branch = lanes_manifest.mission_branch
+    branch = lane_branch_name(
+        mission_slug,
+        lane.lane_id,
+        planning_base_branch=lanes_manifest.target_branch,
+    )
+    lane_tip = _rev_parse(repo_root, branch)
+    if lane_tip is None:
+        return None
+    if check_lane_staleness(lane, branch, mission_branch, repo_root).is_stale:
+        return None
+    merge_base = git_merge_base(repo_root, mission_tip, lane_tip)
+    if merge_base is None:
+        return None
+    changed = git_diff_names_checked(repo_root, merge_base, lane_tip)
+    if changed is None:
+        return None
+    if _merge_tree(repo_root, mission_tip, lane_tip, env) is None:
+        return None
+    return _PreparedLaneMerge(
+        lane_id=lane.lane_id,
+        branch=branch,
+        lane_tip=lane_tip,
+        changed_files=frozenset(changed),
+    )
+
+
+def consolidate_disjoint_lanes(
+    repo_root: Path,
+    mission_slug: str,
+    lane_ids: Sequence[str],
+    lanes_manifest: LanesManifest | None = None,
+    *,
+    max_workers: int | None = None,
+) -> list[LaneMergeResult] | None:
+    """Consolidate several disjoint lanes into the mission branch at once.
+
+    Fast path for :func:`consolidate_lane_into_mission`. Every lane is first
+    prepared concurrently against the current mission tip (staleness check,
+    changed-file set, ``git merge-tree`` conflict probe). When the manifest
+    write scopes AND the actual changed-file sets are pairwise disjoint, the
+    merges are chained in ``lane_ids`` order with ``merge-tree`` +
+    ``commit-tree`` -- producing the same commits the serial path creates
+    (fast-forward when possible, otherwise a two-parent merge commit with the
+    same message) -- and the mission branch is advanced once.
+
+    All-or-nothing: returns ``None`` without touching any ref whenever a
+    precondition fails or a conflict appears, so the caller can fall back to
+    the serial per-lane path unchanged.
+
+    Args:
+        repo_root: Repository root.
+        mission_slug: Feature slug.
+        lane_ids: Lanes to consolidate, in merge order.
+        lanes_manifest: Pre-loaded manifest (loaded from disk if None).
+        max_workers: Thread pool size for the prepare phase.
+
+    Returns:
+        One successful LaneMergeResult per lane, or ``None`` to fall back.
+    """
+    lanes_manifest = _resolve_lane_manifest(repo_root, mission_slug, lanes_manifest)
+    if lanes_manifest is None or len(lane_ids) < 2:
+        return None
+    by_id = {lane.lane_id: lane for lane in lanes_manifest.lanes}
+    lanes = [by_id[lane_id] for lane_id in lane_ids if lane_id in by_id]
+    if len(lanes) != len(lane_ids) or not _write_scopes_disjoint(lanes):
+        return None
+    if _fast_forward_disabled(repo_root):
+        return None
+
+    mission_branch = lanes_manifest.mission_branch
+    mission_tip = _rev_parse(repo_root, mission_branch)
+    if mission_tip is None:
+        return None
+
+    with ThreadPoolExecutor(max_workers=max_workers or min(len(lanes), 8)) as pool:
+        prepared = list(
+            pool.map(
+                lambda lane: _prepare_lane_merge(repo_root, mission_slug, lane, lanes_manifest, mission_tip),
+                lanes,
+            )
+        )
+
+    claimed: set[str] = set()
+    ready: list[_PreparedLaneMerge] = []
+    for item in prepared:
+        if item is None or item.changed_files & claimed or _touches_merge_driver_path(item.changed_files):
+            return None
+        claimed |= item.changed_files
+        ready.append(item)
+
+    env = _make_merge_env()
+    head = mission_tip
+    for item in ready:
+        if _is_ancestor(repo_root, item.lane_tip, head, env):
+            continue  # "Already up to date" on the serial path
+        if _is_ancestor(repo_root, head, item.lane_tip, env):
+            head = item.lane_tip  # serial ``git merge`` fast-forwards here
+            continue
+        tree = _merge_tree(repo_root, head, item.lane_tip, env)
+        if tree is None:
+            return None
+        commit = _commit_tree(
+            repo_root, tree, [head, item.lane_tip], f"Merge {item.branch} into {mission_branch}", env
+        )
+        if commit is None:
+            return None
+        head = commit
+
+    if head != mission_tip:
+        try:
+            advance_branch_ref(
+                repo_root,
+                mission_branch,
+                head,
+                env=env,
+                is_residue=is_toolchain_generated_churn,
+            )
+        except RuntimeError:
+            # Atomic refusal: nothing moved; the serial path surfaces the error.
+            return None
+
+    return [
+        LaneMergeResult(success=True, lane_id=item.lane_id, merged_into=mission_branch)
+        for item in ready
+    ]
+
+
 # ---------------------------------------------------------------------------
 # Git helpers
 # ---------------------------------------------------------------------------
@@ -1,7 +1,8 @@
 """Merge configuration types and loader.
 
 Provides MergeStrategy enum, MergeConfig dataclass, and load_merge_config()
-for reading the ``merge.strategy`` key from ``.kittify/config.yaml``.
+for reading the ``merge.strategy`` and ``merge.parallel_lanes`` keys from
+``.kittify/config.yaml``.
 
 Resolution order (FR-005, FR-008):
   CLI --strategy flag > .kittify/config.yaml merge.strategy > default (SQUASH)
@@ -30,6 +31,9 @@ class MergeConfig:
     """Project-level merge configuration read from .kittify/config.yaml."""
 
     strategy: MergeStrategy | None = None
+    # Opt-in: consolidate provably disjoint lanes concurrently (see
+    # lanes.merge.consolidate_disjoint_lanes); falls back to serial otherwise.
+    parallel_lanes: bool = False
 
 
 class ConfigError(ValueError):
@@ -69,9 +73,11 @@ def load_merge_config(repo_root: Path) -> MergeConfig:
     if not isinstance(merge_section, dict):
         return MergeConfig()
 
+    parallel_lanes = merge_section.get("parallel_lanes") is True
+
     raw_strategy = merge_section.get("strategy")
     if raw_strategy is None:
-        return MergeConfig()
+        return MergeConfig(parallel_lanes=parallel_lanes)
 
     allowed = {s.value for s in MergeStrategy}
     if str(raw_strategy) not in allowed:
@@ -81,4 +87,4 @@ def load_merge_config(repo_root: Path) -> MergeConfig:
             "No silent fallback — fix the config before merging."
         )
 
-    return MergeConfig(strategy=MergeStrategy(str(raw_strategy)))
+    return MergeConfig(strategy=MergeStrategy(str(raw_strategy)), parallel_lanes=parallel_lanes)
@@ -23,6 +23,7 @@ from __future__ import annotations
 
 import subprocess
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING, Final
@@ -31,7 +32,7 @@ import typer
 
 if TYPE_CHECKING:
     from specify_cli.lanes.merge import MissionMergeResult
-    from specify_cli.lanes.models import LanesManifest
+    from specify_cli.lanes.models import ExecutionLane, LanesManifest
     from specify_cli.migration.runtime_state_cutover import CutoverResult
 
 from specify_cli.cli.console import console
@@ -73,7 +74,7 @@ from specify_cli.merge.bookkeeping_projection import (
     _target_bookkeeping_status_paths,
     _target_branch_still_at_baseline,
 )
-from specify_cli.merge.config import MergeStrategy
+from specify_cli.merge.config import MergeStrategy, load_merge_config
 from specify_cli.merge.done_bookkeeping import (
     _assert_merged_wps_done_on_target,
     _record_merged_wps_done_for_merge,
@@ -414,13 +415,85 @@ def _phase_gates_and_state(run: _MergeRunState) -> None:
 
 
 def _phase_merge_lanes(run: _MergeRunState) -> None:
-    """Merge each lane branch into the mission branch (skipping integrated lanes)."""
+    """Merge each lane branch into the mission branch (skipping integrated lanes).
+
+    With ``merge.parallel_lanes: true`` the integration probes run
+    concurrently and provably disjoint lanes are consolidated in one batch
+    (``consolidate_disjoint_lanes``); any conflict or unmet precondition falls
+    back to the serial per-lane path.
+    """
+    from specify_cli.lanes.compute import is_planning_lane
+    from specify_cli.lanes.merge import consolidate_disjoint_lanes
+
+    lanes_manifest = run.lanes_manifest
+    candidates = [
+        lane
+        for lane in lanes_manifest.lanes
+        if not (run.planning_artifact_only and is_planning_lane(lane))
+    ]
+    if not load_merge_config(run.main_repo).parallel_lanes or len(candidates) < 2:
+        _merge_lanes_serially(run, lanes_manifest.lanes)
+        return
+
+    with ThreadPoolExecutor(max_workers=min(len(candidates), 8)) as pool:
+        integrated = list(pool.map(lambda lane: _lane_is_integrated(run, lane), candidates))
+
+    pending: list[ExecutionLane] = []
+    for lane in lanes_manifest.lanes:
+        if run.planning_artifact_only and is_planning_lane(lane):
+            console.print(
+                f"  [green]✓[/green] {lane.lane_id} already on {lanes_manifest.target_branch}"
+            )
+    for lane, already in zip(candidates, integrated, strict=True):
+        if already:
+            console.print(
+                f"  [dim]Skipping {lane.lane_id} (already integrated into "
+                f"{lanes_manifest.mission_branch})[/dim]"
+            )
+        else:
+            pending.append(lane)
+
+    if len(pending) > 1:
+        console.print(f"  [dim]Checking and merging {len(pending)} lanes concurrently...[/dim]")
+        batch = consolidate_disjoint_lanes(
+            run.main_repo, run.mission_slug, [lane.lane_id for lane in pending], lanes_manifest
+        )
+        if batch is not None:
+            run.any_lane_had_unintegrated_code = True
+            for lane_result in batch:
+                console.print(f"  [green]✓[/green] {lane_result.lane_id} → {lanes_manifest.mission_branch}")
+            return
+        console.print("  [dim]Lanes are not provably disjoint; merging serially[/dim]")
+
+    _merge_lanes_serially(run, pending)
+
+
+def _lane_is_integrated(run: _MergeRunState, lane: ExecutionLane) -> bool:
+    """FR-037: True only when the lane branch is fully integrated (real tree state).
+
+    Never decided on the ``done`` proxy; the planning lane is never "integrated".
+    """
     from specify_cli.lanes.branch_naming import lane_branch_name
     from specify_cli.lanes.compute import is_planning_lane
+
+    lanes_manifest = run.lanes_manifest
+    _lane_branch = lane_branch_name(
+        run.mission_slug,
+        lane.lane_id,
+        planning_base_branch=lanes_manifest.target_branch,
+    )
+    return not is_planning_lane(lane) and _lane_already_integrated(
+        run.main_repo, _lane_branch, lanes_manifest.mission_branch
+    )
+
+
+def _merge_lanes_serially(run: _MergeRunState, lanes: list[ExecutionLane]) -> None:
+    """Consolidate ``lanes`` one at a time (checkout, merge, verify per lane)."""
+    from specify_cli.lanes.compute import is_planning_lane
     from specify_cli.lanes.merge import consolidate_lane_into_mission
 
     lanes_manifest = run.lanes_manifest
-    for lane in lanes_manifest.lanes:
+    for lane in lanes:
         if run.planning_artifact_only and is_planning_lane(lane):
             console.print(
                 f"  [green]✓[/green] {lane.lane_id} already on {lanes_manifest.target_branch}"
@@ -429,14 +502,7 @@ def _phase_merge_lanes(run: _MergeRunState) -> None:
 
         # FR-037: skip ONLY when the lane branch is already fully integrated into
         # the mission branch (real tree state), never on the ``done`` proxy.
-        _lane_branch = lane_branch_name(
-            run.mission_slug,
-            lane.lane_id,
-            planning_base_branch=lanes_manifest.target_branch,
-        )
-        if not is_planning_lane(lane) and _lane_already_integrated(
-            run.main_repo, _lane_branch, lanes_manifest.mission_branch
-        ):
+        if _lane_is_integrated(run, lane):
             console.print(
                 f"  [dim]Skipping {lane.lane_id} (already integrated into "
                 f"{lanes_manifest.mission_branch})[/dim]"
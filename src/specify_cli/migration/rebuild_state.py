@@ -222,7 +222,7 @@ def _read_frontmatter_lanes(feature_dir: Path) -> dict[str, str]:
         return {}
     lanes: dict[str, str] = {}
     try:
-        from specify_cli.frontmatter import read_frontmatter
+        from specify_cli.frontmatter import read_frontmatter_readonly
     except ImportError:
         return {}
     import re
@@ -233,7 +233,7 @@ def _read_frontmatter_lanes(feature_dir: Path) -> dict[str, str]:
             continue
         wp_code = m.group(1)
         try:
-            fm, _ = read_frontmatter(wp_file)
+            fm, _ = read_frontmatter_readonly(wp_file)
             raw_lane = fm.get("lane") or "planned"
             lanes[wp_code] = _resolve_alias(str(raw_lane))
         except Exception as exc:
@@ -248,7 +248,7 @@ def _read_wp_frontmatter_full(feature_dir: Path) -> dict[str, dict[str, Any]]:
         return {}
     result: dict[str, dict[str, Any]] = {}
     try:
-        from specify_cli.frontmatter import read_frontmatter
+        from specify_cli.frontmatter import read_frontmatter_readonly
     except ImportError:
         return {}
     import re
@@ -259,7 +259,7 @@ def _read_wp_frontmatter_full(feature_dir: Path) -> dict[str, dict[str, Any]]:
             continue
         wp_code = m.group(1)
         try:
-            fm, _ = read_frontmatter(wp_file)
+            fm, _ = read_frontmatter_readonly(wp_file)
             result[wp_code] = dict(fm)
         except Exception as exc:
             logger.debug("Cannot read frontmatter for %s: %s", wp_file.name, exc)
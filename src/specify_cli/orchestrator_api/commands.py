@@ -23,6 +23,10 @@ Error codes used:
   PREFLIGHT_FAILED            -- preflight checks failed (for merge-mission)
   CONTRACT_VERSION_MISMATCH   -- provider version is below MIN_PROVIDER_VERSION
   UNSUPPORTED_STRATEGY        -- merge strategy not implemented
+
+``serve`` is the one command that does not print a single envelope: it keeps
+the process alive and answers JSON-RPC requests whose results are these same
+envelopes (see :mod:`specify_cli.orchestrator_api.server`).
 """
 
 from __future__ import annotations
@@ -708,7 +712,7 @@ def mission_state(
 
     from specify_cli.status import reduce
     from specify_cli.status import read_events
-    from specify_cli.core.dependency_graph import build_dependency_graph
+    from specify_cli.core.dependency_graph_cache import dependency_graph_cache_path, load_dependency_graph
 
     # STATUS reads stay on the coord-aware dir; PRIMARY reads (dep graph from WP
     # frontmatter, tasks/ enumeration) come from the primary surface (#2118).
@@ -716,7 +720,10 @@ def mission_state(
 
     # Query endpoint: reduce from event log without rewriting status.json.
     snapshot = reduce(read_events(mission_dir))
-    dep_graph = build_dependency_graph(planning_dir)
+    # The persisted graph is reused until a WP file's stat signature moves.
+    dep_graph = load_dependency_graph(
+        planning_dir, cache_path=dependency_graph_cache_path(main_repo_root, planning_dir.name)
+    )
 
     # Build the full WP set from task files + dep graph + snapshot
     # so that untouched WPs (no events yet) still appear as "planned"
@@ -768,42 +775,29 @@ def list_ready(
     main_repo_root = _get_main_repo_root()
     mission_dir = _resolve_mission_dir_or_fail("list-ready", main_repo_root, mission)
 
-    from specify_cli.status import reduce
-    from specify_cli.status import read_events
-    from specify_cli.core.dependency_graph import build_dependency_graph, dependency_readiness_for_wp
+    from specify_cli.core.dependency_graph_cache import dependency_graph_cache_path, load_mission_readiness
 
     # Query endpoint: reduce from event log without rewriting status.json.
     # STATUS read off the coord-aware dir; the dependency graph (WP frontmatter,
     # PRIMARY-partition) off the primary surface (#2118 — an empty dep graph here
     # is exactly what stalls the orchestrator under coordination topology).
-    snapshot = reduce(read_events(mission_dir))
-    dep_graph = build_dependency_graph(_planning_read_dir(main_repo_root, mission))
-    wp_states = snapshot.work_packages
-    wp_lanes = {
-        dep_id: wp_state_for(state.get("lane", Lane.PLANNED)).lane
-        for dep_id, state in wp_states.items()
-    }
-
-    ready_wps = []
-    for wp_id, deps in dep_graph.items():
-        wp_snapshot = wp_states.get(wp_id, {})
-        lane = wp_snapshot.get("lane", Lane.PLANNED)
-        state = wp_state_for(lane)
-        if state.progress_bucket() != "not_started":
-            continue
-
-        readiness = dependency_readiness_for_wp(wp_id, deps, wp_lanes)
-
-        ready_wps.append(
-            {
-                "wp_id": wp_id,
-                "lane": lane,
-                "dependencies_satisfied": readiness.satisfied,
-            }
-        )
-
-    # Filter to only truly ready ones
-    ready_wps = [wp for wp in ready_wps if wp["dependencies_satisfied"]]
+    # Polling fast path: the persisted graph is reused while the WP files are
+    # unchanged, only events appended since the last poll are folded, and only
+    # WPs whose lane changed (and their dependents) are re-evaluated.
+    planning_dir = _planning_read_dir(main_repo_root, mission)
+    readiness = load_mission_readiness(
+        planning_dir,
+        mission_dir,
+        cache_path=dependency_graph_cache_path(main_repo_root, planning_dir.name),
+    )
+    ready_wps = [
+        {
+            "wp_id": wp_id,
+            "lane": readiness.lanes.get(wp_id, Lane.PLANNED),
+            "dependencies_satisfied": True,
+        }
+        for wp_id in readiness.ready
+    ]
 
     data = {
         **_mission_identity_payload(mission_dir),
@@ -1739,4 +1733,36 @@ def merge_mission(
     _emit(envelope)
 
 
+# ── Command 10: serve ──────────────────────────────────────────────────────
+
+
+@app.command(name="serve")
+def serve(
+    socket_path: Path = typer.Option(
+        None,
+        "--socket",
+        help="Listen on this Unix domain socket instead of stdin/stdout",
+    ),
+    watch_interval: float = typer.Option(
+        0.5,
+        "--watch-interval",
+        help="Seconds between event-log checks for watched missions",
+    ),
+) -> None:
+    """Serve every command as newline-delimited JSON-RPC from one warm process.
+
+    Each request's ``result`` is the envelope the matching subcommand prints.
+    Contract >= 1.4.0.
+    """
+    import sys
+
+    from .server import OrchestratorServer
+
+    server = OrchestratorServer(typer.main.get_group(app), watch_interval=watch_interval)
+    if socket_path is None:
+        server.serve_stdio(sys.stdin, sys.stdout)
+    else:
+        server.serve_unix_socket(socket_path)
+
+
 __all__ = ["app"]
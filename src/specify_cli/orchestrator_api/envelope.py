@@ -25,7 +25,10 @@ from kernel.clock import now_utc_iso
 # so an external orchestrator can resume a for_review WP. Purely additive.
 # 1.3.0: ``transition`` accepts structured ``--review-result-json`` so normal
 # in_review exits satisfy host guards without using the recovery-only force flag.
-CONTRACT_VERSION = "1.3.0"
+# 1.4.0: added ``serve`` -- one warm process answering newline-delimited JSON-RPC
+# whose results are these same envelopes, plus ``watch`` lane-change pushes.
+# Purely additive.
+CONTRACT_VERSION = "1.4.0"
 MIN_PROVIDER_VERSION = "0.1.0"
 
 # Banned flags: enforced by parse_and_validate_policy() below (a policy whose
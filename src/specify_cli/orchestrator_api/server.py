@@ -0,0 +1,371 @@
+"""Long-lived JSON-RPC server mode for the orchestrator API (``orchestrator-api serve``).
+
+Every one-shot ``orchestrator-api`` call pays for interpreter startup, Typer
+registration and repo resolution before it does any work. ``serve`` keeps one
+process warm and answers newline-delimited JSON-RPC 2.0 over stdio (the
+default) or a Unix domain socket (``--socket PATH``).
+
+Protocol:
+
+* One JSON value per line in each direction. A request is
+  ``{"jsonrpc": "2.0", "id": 1, "method": "list-ready", "params": {"mission": "042-x"}}``;
+  a JSON array of requests is a batch and is answered with an array.
+* ``method`` is any ``orchestrator-api`` subcommand name. ``params`` maps
+  option names (``wp``, ``review_ref`` or ``review-ref``) to values: ``true``
+  passes a flag, ``false``/``null`` omits the option, objects and arrays are
+  JSON-encoded (so ``policy`` may be sent as an object).
+* ``result`` is the same canonical envelope the subcommand prints
+  (``make_envelope`` / ``CONTRACT_VERSION``), including failure envelopes.
+  JSON-RPC ``error`` is reserved for protocol faults: unparseable input, an
+  invalid request, an unknown method or non-object params.
+* ``watch`` (``{"mission": slug}``) answers with the mission's current lanes
+  and then pushes ``lane-changed`` notifications on the same stream whenever
+  an appended status event moves a WP's lane; ``unwatch`` stops them.
+
+Warm state is limited to caches that validate themselves against the files
+they were built from -- the read-only frontmatter cache (mtime/size), the
+persisted dependency graph (WP file stat signatures) and the folded lane
+state (event-log byte offset) -- so edits made by other processes are picked
+up by the next call without restarting the server.
+
+Command dispatch captures the subcommand's stdout, which is process-global,
+so requests are executed one at a time under a single lock. Each connection
+writes its responses and notifications under its own lock.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+import logging
+import os
+import socketserver
+import threading
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TextIO
+
+import typer
+from typer.core import TyperGroup
+
+from specify_cli.status import EVENTS_FILENAME, Lane
+
+from .envelope import make_envelope
+
+if TYPE_CHECKING:
+    from specify_cli.core.dependency_graph_cache import MissionReadiness
+
+logger = logging.getLogger(__name__)
+
+JSONRPC_VERSION = "2.0"
+
+# JSON-RPC 2.0 reserved error codes.
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+
+LANE_CHANGED_NOTIFICATION = "lane-changed"
+
+# Methods served by the server itself rather than by a subcommand.
+_WATCH_METHOD = "watch"
+_UNWATCH_METHOD = "unwatch"
+# Subcommands that cannot be dispatched over the protocol.
+_UNSERVED_COMMANDS = frozenset({"serve"})
+
+
+class _Connection:
+    """One client stream; serialises writes from request and watch threads."""
+
+    def __init__(self, writer: TextIO) -> None:
+        self._writer = writer
+        self._lock = threading.Lock()
+        self.closed = False
+
+    def send(self, message: dict[str, Any] | list[dict[str, Any]]) -> None:
+        """Write *message* as one JSON line; a broken stream closes the connection."""
+        line = json.dumps(message) + "\n"
+        with self._lock:
+            if self.closed:
+                return
+            try:
+                self._writer.write(line)
+                self._writer.flush()
+            except (OSError, ValueError):
+                self.closed = True
+
+
+@dataclass
+class _Subscription:
+    """A connection's ``watch`` on one mission."""
+
+    connection: _Connection
+    mission: str
+    main_repo_root: Path
+    mission_dir: Path
+    planning_dir: Path
+    lanes: dict[str, str]
+    signature: tuple[int, int, int] | None
+
+
+def _events_signature(mission_dir: Path) -> tuple[int, int, int] | None:
+    """Return ``(size, mtime_ns, inode)`` of the mission's event log, or None if absent."""
+    try:
+        stat = (mission_dir / EVENTS_FILENAME).stat()
+    except OSError:
+        return None
+    return (stat.st_size, stat.st_mtime_ns, stat.st_ino)
+
+
+def _params_to_args(params: dict[str, Any]) -> list[str]:
+    """Translate a JSON-RPC params object into subcommand CLI arguments."""
+    args: list[str] = []
+    for name, value in params.items():
+        option = "--" + name.replace("_", "-")
+        if value is None or value is False:
+            continue
+        if value is True:
+            args.append(option)
+        elif isinstance(value, (dict, list)):
+            args.extend([option, json.dumps(value)])
+        else:
+            args.extend([option, str(value)])
+    return args
+
+
+def _rpc_error(request_id: Any, code: int, message: str) -> dict[str, Any]:
+    return {"jsonrpc": JSONRPC_VERSION, "id": request_id, "error": {"code": code, "message": message}}
+
+
+class OrchestratorServer:
+    """Dispatch JSON-RPC requests to the orchestrator-api subcommands in-process."""
+
+    def __init__(self, group: TyperGroup, *, watch_interval: float = 0.5) -> None:
+        self._group = group
+        self._watch_interval = watch_interval
+        self._dispatch_lock = threading.Lock()
+        self._subscriptions: list[_Subscription] = []
+
+    # ── Request handling ──────────────────────────────────────────────────
+
+    def handle_line(self, line: str, connection: _Connection) -> dict[str, Any] | list[dict[str, Any]] | None:
+        """Handle one input line; return the response to send, or None for none."""
+        try:
+            payload = json.loads(line)
+        except json.JSONDecodeError as exc:
+            return _rpc_error(None, PARSE_ERROR, f"Parse error: {exc.msg}")
+        if isinstance(payload, list):
+            if not payload:
+                return _rpc_error(None, INVALID_REQUEST, "Invalid request: empty batch")
+            responses = [self._handle_request(request, connection) for request in payload]
+            batch = [response for response in responses if response is not None]
+            return batch or None
+        return self._handle_request(payload, connection)
+
+    def _handle_request(self, request: Any, connection: _Connection) -> dict[str, Any] | None:
+        if not isinstance(request, dict) or request.get("jsonrpc") != JSONRPC_VERSION:
+            return _rpc_error(None, INVALID_REQUEST, "Invalid request")
+        is_notification = "id" not in request
+        request_id = request.get("id")
+        method = request.get("method")
+        params = request.get("params", {})
+        if not isinstance(method, str) or not isinstance(request_id, (str, int, type(None))):
+            return _rpc_error(request_id, INVALID_REQUEST, "Invalid request")
+        if not isinstance(params, dict):
+            return _rpc_error(request_id, INVALID_PARAMS, "Invalid params: expected an object")
+
+        if method == _WATCH_METHOD:
+            envelope = self._run_captured(lambda: self._watch(params, connection))
+        elif method == _UNWATCH_METHOD:
+            envelope = self._run_captured(lambda: self._unwatch(params, connection))
+        elif method in self._group.commands and method not in _UNSERVED_COMMANDS:
+            args = [method, *_params_to_args(params)]
+            envelope = self._run_captured(lambda: self._group.main(args=args, prog_name="orchestrator-api"))
+        else:
+            return None if is_notification else _rpc_error(request_id, METHOD_NOT_FOUND, f"Method not found: {method}")
+
+        if is_notification:
+            return None
+        if envelope is None:
+            return _rpc_error(request_id, INTERNAL_ERROR, f"Internal error: {method} produced no envelope")
+        return {"jsonrpc": JSONRPC_VERSION, "id": request_id, "result": envelope}
+
+    def _run_captured(self, fn: Callable[[], object]) -> dict[str, Any] | None:
+        """Run *fn* with stdout captured and return the envelope it printed."""
+        buffer = io.StringIO()
+        with self._dispatch_lock, contextlib.redirect_stdout(buffer):
+            try:
+                fn()
+            except (SystemExit, typer.Exit):
+                pass
+            except Exception:  # noqa: BLE001 — one failing request must not stop the server
+                logger.exception("orchestrator-api serve: request failed")
+        for line in reversed(buffer.getvalue().splitlines()):
+            try:
+                envelope = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(envelope, dict):
+                return envelope
+        return None
+
+    # ── watch / unwatch ───────────────────────────────────────────────────
+
+    def _watch(self, params: dict[str, Any], connection: _Connection) -> None:
+        from . import commands
+
+        mission = str(params.get("mission") or "")
+        if not mission:
+            commands._fail(_WATCH_METHOD, "USAGE_ERROR", "Missing parameter 'mission'")
+        main_repo_root = commands._get_main_repo_root()
+        mission_dir = commands._resolve_mission_dir_or_fail(_WATCH_METHOD, main_repo_root, mission)
+        planning_dir = commands._planning_read_dir(main_repo_root, mission)
+        signature = _events_signature(mission_dir)
+        readiness = self._readiness(main_repo_root, mission_dir, planning_dir)
+
+        self._subscriptions = [sub for sub in self._subscriptions if not (sub.connection is connection and sub.mission == mission)]
+        self._subscriptions.append(
+            _Subscription(
+                connection=connection,
+                mission=mission,
+                main_repo_root=main_repo_root,
+                mission_dir=mission_dir,
+                planning_dir=planning_dir,
+                lanes=dict(readiness.lanes),
+                signature=signature,
+            )
+        )
+        data = {
+            **commands._mission_identity_payload(mission_dir),
+            "lanes": dict(sorted(readiness.lanes.items())),
+            "ready_work_packages": _ready_payload(readiness),
+        }
+        commands._emit(make_envelope(command=_WATCH_METHOD, success=True, data=data))
+
+    def _unwatch(self, params: dict[str, Any], connection: _Connection) -> None:
+        from . import commands
+
+        mission = params.get("mission")
+        before = len(self._subscriptions)
+        self._subscriptions = [sub for sub in self._subscriptions if not (sub.connection is connection and (mission is None or sub.mission == mission))]
+        data = {"mission_slug": mission, "removed": before - len(self._subscriptions)}
+        commands._emit(make_envelope(command=_UNWATCH_METHOD, success=True, data=data))
+
+    @staticmethod
+    def _readiness(main_repo_root: Path, mission_dir: Path, planning_dir: Path) -> MissionReadiness:
+        from specify_cli.core.dependency_graph_cache import dependency_graph_cache_path, load_mission_readiness
+
+        return load_mission_readiness(
+            planning_dir,
+            mission_dir,
+            cache_path=dependency_graph_cache_path(main_repo_root, planning_dir.name),
+        )
+
+    def poll_watches(self) -> None:
+        """Push ``lane-changed`` notifications for every watched mission whose lanes moved.
+
+        The event log's stat signature is checked first, so a quiet mission
+        costs one ``stat`` per poll.
+        """
+        from . import commands
+
+        with self._dispatch_lock:
+            self._subscriptions = [sub for sub in self._subscriptions if not sub.connection.closed]
+            for sub in self._subscriptions:
+                signature = _events_signature(sub.mission_dir)
+                if signature == sub.signature:
+                    continue
+                sub.signature = signature
+                try:
+                    readiness = self._readiness(sub.main_repo_root, sub.mission_dir, sub.planning_dir)
+                except Exception:  # noqa: BLE001 — a broken mission must not stop other watches
+                    logger.exception("orchestrator-api serve: watch on %s failed", sub.mission)
+                    continue
+                changes = [
+                    {"wp_id": wp_id, "from_lane": sub.lanes.get(wp_id), "to_lane": lane}
+                    for wp_id, lane in sorted(readiness.lanes.items())
+                    if sub.lanes.get(wp_id) != lane
+                ]
+                sub.lanes = dict(readiness.lanes)
+                if not changes:
+                    continue
+                data = {
+                    **commands._mission_identity_payload(sub.mission_dir),
+                    "changes": changes,
+                    "ready_work_packages": _ready_payload(readiness),
+                }
+                sub.connection.send(
+                    {
+                        "jsonrpc": JSONRPC_VERSION,
+                        "method": LANE_CHANGED_NOTIFICATION,
+                        "params": make_envelope(command=LANE_CHANGED_NOTIFICATION, success=True, data=data),
+                    }
+                )
+
+    def _watch_loop(self, stop: threading.Event) -> None:
+        while not stop.wait(self._watch_interval):
+            self.poll_watches()
+
+    @contextlib.contextmanager
+    def _watching(self) -> Iterator[None]:
+        stop = threading.Event()
+        thread = threading.Thread(target=self._watch_loop, args=(stop,), name="orchestrator-api-watch", daemon=True)
+        thread.start()
+        try:
+            yield
+        finally:
+            stop.set()
+            thread.join(timeout=self._watch_interval * 2)
+
+    # ── Transports ────────────────────────────────────────────────────────
+
+    def serve_connection(self, reader: TextIO, writer: TextIO) -> None:
+        """Answer requests read from *reader* until EOF, writing to *writer*."""
+        connection = _Connection(writer)
+        try:
+            for line in reader:
+                if not line.strip():
+                    continue
+                response = self.handle_line(line, connection)
+                if response is not None:
+                    connection.send(response)
+                if connection.closed:
+                    break
+        finally:
+            connection.closed = True
+
+    def serve_stdio(self, reader: TextIO, writer: TextIO) -> None:
+        """Serve one client over *reader*/*writer* (stdin/stdout) until EOF."""
+        with self._watching():
+            self.serve_connection(reader, writer)
+
+    def serve_unix_socket(self, socket_path: Path) -> None:
+        """Serve clients on a Unix domain socket until interrupted."""
+        server = self
+
+        class _Handler(socketserver.BaseRequestHandler):
+            def handle(self) -> None:
+                with self.request.makefile("r", encoding="utf-8") as reader, self.request.makefile("w", encoding="utf-8") as writer:
+                    server.serve_connection(reader, writer)
+
+        with contextlib.suppress(FileNotFoundError):
+            socket_path.unlink()
+        with socketserver.ThreadingUnixStreamServer(str(socket_path), _Handler) as unix_server:
+            unix_server.daemon_threads = True
+            try:
+                with self._watching(), contextlib.suppress(KeyboardInterrupt):
+                    unix_server.serve_forever()
+            finally:
+                with contextlib.suppress(OSError):
+                    os.unlink(socket_path)
+
+
+def _ready_payload(readiness: MissionReadiness) -> list[dict[str, Any]]:
+    """Return ``ready_work_packages`` in the ``list-ready`` payload shape."""
+    return [{"wp_id": wp_id, "lane": readiness.lanes.get(wp_id, Lane.PLANNED), "dependencies_satisfied": True} for wp_id in readiness.ready]
+
+
+__all__ = ["OrchestratorServer"]
@@ -10,6 +10,7 @@ Public API:
     reader          — read_record(): YAML parse + schema validation + pending guard
     policy          — RetrospectivePolicy resolver (FR-001, FR-002, FR-003, FR-004, FR-015, FR-024)
     generator       — generate_retrospective(): pure-Python deterministic generator (WP02)
+                      generate_retrospectives(): process-pool batch variant (backfill)
     lifecycle_events — Three canonical lifecycle event types + emit helpers (WP03)
     summary         — classify_mission_record(): per-mission state classifier (WP03 T017)
     deprecation     — warn_env_var_deprecated(): one-per-process deprecation for legacy env vars (WP06)
@@ -26,7 +27,7 @@ from specify_cli.retrospective.config import (
     ModeResolutionError as ModeResolutionError,  # noqa: F401
     is_retrospective_enabled as is_retrospective_enabled,  # noqa: F401
 )
-from specify_cli.retrospective.generator import GENERATOR_VERSION, generate_retrospective
+from specify_cli.retrospective.generator import GENERATOR_VERSION, generate_retrospective, generate_retrospectives
 from specify_cli.retrospective.lifecycle_events import (
     Actor as RetrospectiveActor,
     RetrospectiveCaptured,
@@ -100,6 +101,7 @@ __all__ = [
     "GenActor",
     # generator (WP02)
     "generate_retrospective",
+    "generate_retrospectives",
     "GENERATOR_VERSION",
     # lifecycle events (WP03 T015)
     "RetrospectiveCaptured",
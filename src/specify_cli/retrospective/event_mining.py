@@ -0,0 +1,155 @@
+"""Single-pass, pluggable event-mining engine for retrospective generation.
+
+The generator's event-log heuristics (rejection cycles, lane friction, done
+WPs, --force overrides, self-review fallbacks, arbiter overrides,
+implementation cycles) are all "per-WP tallies of events matching a
+predicate". Rather than each heuristic re-walking the mission's event list,
+every heuristic is declared as a :class:`WpEventDetector` and an
+:class:`EventMiningEngine` feeds each event to every registered detector in
+ONE pass over ``status.events.jsonl`` (streamed line by line, never
+materialised as a list).
+
+Each tally keeps the count plus the first/last matching ``event_id`` (the
+``first..last`` evidence range) and the first matching event's payload, which
+is everything the findings builders need, so the generator never rescans the
+log after mining.
+
+Determinism: tallies are accumulated in file (append) order, exactly as the
+former per-detector loops did, so the resulting ``GenRetrospectiveRecord`` is
+byte-identical.
+
+This module imports nothing from ``specify_cli.status`` — predicates that need
+status vocabulary are supplied by the generator (see the cycle-breaker note
+in ``generator.py``).
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+EventPredicate = Callable[[dict[str, Any]], bool]
+WpKeyFn = Callable[[dict[str, Any]], str]
+
+
+def top_level_wp_id(event: dict[str, Any]) -> str:
+    """Return the event's top-level ``wp_id`` (``""`` when absent)."""
+    return str(event.get("wp_id", "") or "")
+
+
+@dataclass(frozen=True)
+class WpEventDetector:
+    """A named per-WP tally of events matching ``predicate``.
+
+    Attributes:
+        name: Unique key the tally is stored under in :class:`EventMiningResult`.
+        predicate: Returns True for events this detector counts.
+        wp_key: Extracts the WP id an event is attributed to; events that map
+            to ``""`` are ignored.
+    """
+
+    name: str
+    predicate: EventPredicate
+    wp_key: WpKeyFn = top_level_wp_id
+
+
+@dataclass
+class WpEventTally:
+    """Count and evidence anchors for one (detector, WP) pair."""
+
+    count: int = 0
+    first_event_id: str = ""
+    last_event_id: str = ""
+    first_payload: Any = None
+
+    def observe(self, event: dict[str, Any]) -> None:
+        event_id = str(event.get("event_id", ""))
+        if self.count == 0:
+            self.first_event_id = event_id
+            self.first_payload = event.get("payload", {})
+        self.last_event_id = event_id
+        self.count += 1
+
+    @property
+    def range_str(self) -> str:
+        """``first..last`` for multiple matches, the single id for one match."""
+        if self.count > 1:
+            return f"{self.first_event_id}..{self.last_event_id}"
+        return self.first_event_id if self.count else ""
+
+
+@dataclass
+class EventMiningResult:
+    """Per-detector, per-WP tallies produced by one :meth:`EventMiningEngine.run`."""
+
+    event_count: int = 0
+    tallies: dict[str, dict[str, WpEventTally]] = field(default_factory=dict)
+
+    def counts(self, detector_name: str) -> dict[str, int]:
+        """Return ``{wp_id: count}`` for a detector (insertion = first-seen order)."""
+        return {wp_id: tally.count for wp_id, tally in self.tallies.get(detector_name, {}).items()}
+
+    def tally(self, detector_name: str, wp_id: str) -> WpEventTally:
+        """Return the tally for ``(detector, wp_id)``; an empty tally when unseen."""
+        return self.tallies.get(detector_name, {}).get(wp_id) or WpEventTally()
+
+
+class EventMiningEngine:
+    """Feed a stream of status events through every registered detector once."""
+
+    def __init__(self, detectors: Iterable[WpEventDetector] = ()) -> None:
+        self._detectors: list[WpEventDetector] = []
+        for detector in detectors:
+            self.register(detector)
+
+    def register(self, detector: WpEventDetector) -> None:
+        """Add a detector; names must be unique within one engine."""
+        if any(existing.name == detector.name for existing in self._detectors):
+            raise ValueError(f"Duplicate event detector name: {detector.name!r}")
+        self._detectors.append(detector)
+
+    def run(self, events: Iterable[dict[str, Any]]) -> EventMiningResult:
+        """Consume *events* once and return every detector's tallies."""
+        result = EventMiningResult(tallies={detector.name: {} for detector in self._detectors})
+        slots = [(detector, result.tallies[detector.name]) for detector in self._detectors]
+        count = 0
+        for event in events:
+            count += 1
+            for detector, per_wp in slots:
+                if not detector.predicate(event):
+                    continue
+                wp_id = detector.wp_key(event)
+                if not wp_id:
+                    continue
+                tally = per_wp.get(wp_id)
+                if tally is None:
+                    tally = per_wp[wp_id] = WpEventTally()
+                tally.observe(event)
+        result.event_count = count
+        return result
+
+
+def iter_status_event_dicts(events_path: Path) -> Iterator[dict[str, Any]]:
+    """Stream event dicts from a ``status.events.jsonl`` file in append order.
+
+    Blank, undecodable, and non-object lines are skipped, matching the
+    generator's tolerant read contract. A missing file yields nothing.
+    """
+    try:
+        handle = events_path.open(encoding="utf-8")
+    except FileNotFoundError:
+        return
+    with handle:
+        for line in handle:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                event = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(event, dict):
+                yield event
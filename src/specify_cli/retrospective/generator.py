@@ -11,6 +11,11 @@ Design decision:
 - Pure-Python; no subprocess calls.
 - Missing optional artifacts are recorded as gaps entries, NOT exceptions.
 - Generation MUST NOT mutate doctrine / DRG / glossary. Proposals are data only.
+- status.events.jsonl is streamed ONCE through a fused detector engine
+  (event_mining.EventMiningEngine); every event heuristic is a registered
+  WpEventDetector rather than its own pass over the log.
+- generate_retrospectives() fans generation for many missions out across a
+  process pool; results come back in input order.
 - findings_status values in persisted records: ONLY "has_findings" or "ran_no_findings".
   "missing" and "failed" are event-payload-only states per data-model invariants.
 """
@@ -24,13 +29,21 @@ from specify_cli.core.paths import read_target_branch_from_meta
 from kernel.clock import now_utc_iso
 from specify_cli.lanes.branch_naming import resolve_mid8
 import contextlib
-import json
 import logging
+import os
 import re
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from specify_cli.mission_metadata import load_meta_or_empty
+from specify_cli.retrospective.event_mining import (
+    EventMiningEngine,
+    EventMiningResult,
+    WpEventDetector,
+    iter_status_event_dicts,
+)
 from specify_cli.retrospective.schema import (
     FindingsStatus,
     GenActor,
@@ -189,24 +202,13 @@ def _read_optional_text(path: Path) -> str | None:
     return None
 
 
-def _load_events(feature_dir: Path) -> list[dict[str, Any]]:
-    """Load all status events from status.events.jsonl.
+def _mine_events(feature_dir: Path) -> EventMiningResult:
+    """Stream status.events.jsonl once through every event detector.
 
-    Returns a list of event dicts sorted by natural file order (append order).
+    Events are consumed in natural file order (append order) and never held
+    in memory as a list.
     """
-    events_path = feature_dir / "status.events.jsonl"
-    if not events_path.exists():
-        return []
-    events: list[dict[str, Any]] = []
-    for line in events_path.read_text(encoding="utf-8").splitlines():
-        line = line.strip()
-        if not line:
-            continue
-        try:
-            events.append(json.loads(line))
-        except json.JSONDecodeError:
-            continue
-    return events
+    return _default_event_engine().run(iter_status_event_dicts(feature_dir / "status.events.jsonl"))
 
 
 def _load_wp_files(feature_dir: Path) -> list[tuple[str, str]]:
@@ -376,44 +378,32 @@ def _is_lane_friction_event(event: dict[str, Any]) -> bool:
     return _is_backward_lane_event(event) and not _is_review_rejection_event(event)
 
 
-def _detect_rejection_cycles(events: list[dict[str, Any]]) -> dict[str, int]:
+def _is_rejection_range_event(event: dict[str, Any]) -> bool:
+    """Evidence-range anchor for rejection findings: any move back out of review."""
+    return event.get("from_lane") in ("for_review", "in_review") and event.get("to_lane") in (
+        "planned",
+        "in_progress",
+        "claimed",
+    )
+
+
+def _is_done_event(event: dict[str, Any]) -> bool:
+    return event.get("to_lane", "") in ("done", "approved")
+
+
+def _detect_rejection_cycles(events: Iterable[dict[str, Any]]) -> dict[str, int]:
     """Return a mapping of wp_id -> rejection_cycle_count.
 
     A rejection cycle is a documented reviewer-feedback transition out of
     in_review. Earlier for_review rewinds and force moves are lane friction, not
     review rejections.
     """
-    rejection_counts: dict[str, int] = {}
-    for event in events:
-        wp_id = event.get("wp_id", "")
-        if not wp_id:
-            continue
-        if _is_review_rejection_event(event):
-            rejection_counts[wp_id] = rejection_counts.get(wp_id, 0) + 1
-    return rejection_counts
+    return EventMiningEngine([_REJECTION_CYCLES]).run(events).counts(_REJECTION_CYCLES.name)
 
 
-def _detect_lane_friction(events: list[dict[str, Any]]) -> dict[str, int]:
+def _detect_lane_friction(events: Iterable[dict[str, Any]]) -> dict[str, int]:
     """Return backward lane moves that are not documented reviewer rejections."""
-    friction_counts: dict[str, int] = {}
-    for event in events:
-        wp_id = event.get("wp_id", "")
-        if not wp_id:
-            continue
-        if _is_lane_friction_event(event):
-            friction_counts[wp_id] = friction_counts.get(wp_id, 0) + 1
-    return friction_counts
-
-
-def _detect_done_wps(events: list[dict[str, Any]]) -> set[str]:
-    """Return wp_ids that reached 'done' or 'approved' state."""
-    done_wps: set[str] = set()
-    for event in events:
-        to_lane = event.get("to_lane", "")
-        wp_id = event.get("wp_id", "")
-        if wp_id and to_lane in ("done", "approved"):
-            done_wps.add(wp_id)
-    return done_wps
+    return EventMiningEngine([_LANE_FRICTION]).run(events).counts(_LANE_FRICTION.name)
 
 
 # ---------------------------------------------------------------------------
@@ -455,16 +445,9 @@ def _is_force_override_event(event: dict[str, Any]) -> bool:
     return event.get("from_lane") != event.get("to_lane")
 
 
-def _detect_force_overrides(events: list[dict[str, Any]]) -> dict[str, int]:
+def _detect_force_overrides(events: Iterable[dict[str, Any]]) -> dict[str, int]:
     """Count operator-driven --force transitions per WP."""
-    counts: dict[str, int] = {}
-    for event in events:
-        wp_id = event.get("wp_id", "")
-        if not wp_id:
-            continue
-        if _is_force_override_event(event):
-            counts[wp_id] = counts.get(wp_id, 0) + 1
-    return counts
+    return EventMiningEngine([_FORCE_OVERRIDES]).run(events).counts(_FORCE_OVERRIDES.name)
 
 
 def _event_wp_id(event: dict[str, Any]) -> str:
@@ -486,17 +469,6 @@ def _is_reviewer_self_approval_event(event: dict[str, Any]) -> bool:
     return bool(event.get("event_type") == REVIEWER_SELF_APPROVAL)
 
 
-def _detect_reviewer_self_approvals(events: list[dict[str, Any]]) -> dict[str, int]:
-    counts: dict[str, int] = {}
-    for event in events:
-        if not _is_reviewer_self_approval_event(event):
-            continue
-        wp_id = _event_wp_id(event)
-        if wp_id:
-            counts[wp_id] = counts.get(wp_id, 0) + 1
-    return counts
-
-
 def _event_note(event: dict[str, Any]) -> str:
     """Return the human-readable note/reason text from an event, lower-cased."""
     parts: list[str] = []
@@ -520,40 +492,71 @@ def _is_arbiter_event(event: dict[str, Any]) -> bool:
     return any(marker in note for marker in _ARBITER_MARKERS)
 
 
-def _detect_arbiter_overrides(events: list[dict[str, Any]]) -> dict[str, int]:
+def _detect_arbiter_overrides(events: Iterable[dict[str, Any]]) -> dict[str, int]:
     """Count arbiter-override events per WP."""
-    counts: dict[str, int] = {}
-    for event in events:
-        wp_id = event.get("wp_id", "")
-        if not wp_id:
-            continue
-        if _is_arbiter_event(event):
-            counts[wp_id] = counts.get(wp_id, 0) + 1
-    return counts
+    return EventMiningEngine([_ARBITER_OVERRIDES]).run(events).counts(_ARBITER_OVERRIDES.name)
+
+
+def _is_implementation_cycle_event(event: dict[str, Any]) -> bool:
+    """True for a non-bootstrap planned/claimed → in_progress transition."""
+    from specify_cli.status import Lane as _Lane  # cycle-breaker; see module note
+
+    actor = str(event.get("actor", "")).lower()
+    if actor in _BOOTSTRAP_ACTORS:
+        return False
+    return event.get("from_lane", "") in (_Lane.PLANNED, _Lane.CLAIMED) and event.get("to_lane", "") == _Lane.IN_PROGRESS
+
+
+def _implementation_cycles(mined: EventMiningResult) -> dict[str, int]:
+    # Only WPs with MORE THAN ONE cycle are interesting (the first cycle is normal).
+    return {wp: n for wp, n in mined.counts(_IMPLEMENTATION_CYCLES.name).items() if n > 1}
 
 
-def _detect_implementation_cycles(events: list[dict[str, Any]]) -> dict[str, int]:
+def _detect_implementation_cycles(events: Iterable[dict[str, Any]]) -> dict[str, int]:
     """Count distinct planned→in_progress (or claimed→in_progress) cycles per WP.
 
     A WP that needs >1 implementation cycle indicates rework that didn't
     surface as a documented review rejection.  Bootstrap and synthetic
     transitions are excluded.
     """
-    from specify_cli.status import Lane as _Lane  # cycle-breaker; see module note
-    counts: dict[str, int] = {}
-    for event in events:
-        wp_id = event.get("wp_id", "")
-        if not wp_id:
-            continue
-        actor = str(event.get("actor", "")).lower()
-        if actor in _BOOTSTRAP_ACTORS:
-            continue
-        from_lane = event.get("from_lane", "")
-        to_lane = event.get("to_lane", "")
-        if from_lane in (_Lane.PLANNED, _Lane.CLAIMED) and to_lane == _Lane.IN_PROGRESS:
-            counts[wp_id] = counts.get(wp_id, 0) + 1
-    # Only WPs with MORE THAN ONE cycle are interesting (the first cycle is normal).
-    return {wp: n for wp, n in counts.items() if n > 1}
+    return _implementation_cycles(EventMiningEngine([_IMPLEMENTATION_CYCLES]).run(events))
+
+
+# ---------------------------------------------------------------------------
+# Fused event-mining detectors
+# ---------------------------------------------------------------------------
+# Every event heuristic is registered here and fed by ONE streamed pass over
+# status.events.jsonl (see event_mining.py). Count detectors key on the
+# top-level ``wp_id``; the ``*_RANGE`` companions reproduce the evidence-range
+# lookups, which historically keyed on ``_event_wp_id`` (payload fallback).
+
+_REJECTION_CYCLES = WpEventDetector("rejection_cycles", _is_review_rejection_event)
+_REJECTION_RANGE = WpEventDetector("rejection_range", _is_rejection_range_event)
+_LANE_FRICTION = WpEventDetector("lane_friction", _is_lane_friction_event)
+_DONE_WPS = WpEventDetector("done_wps", _is_done_event)
+_FORCE_OVERRIDES = WpEventDetector("force_overrides", _is_force_override_event)
+_FORCE_OVERRIDES_RANGE = WpEventDetector("force_overrides_range", _is_force_override_event, _event_wp_id)
+_SELF_APPROVALS = WpEventDetector("reviewer_self_approvals", _is_reviewer_self_approval_event, _event_wp_id)
+_ARBITER_OVERRIDES = WpEventDetector("arbiter_overrides", _is_arbiter_event)
+_ARBITER_OVERRIDES_RANGE = WpEventDetector("arbiter_overrides_range", _is_arbiter_event, _event_wp_id)
+_IMPLEMENTATION_CYCLES = WpEventDetector("implementation_cycles", _is_implementation_cycle_event)
+
+_DEFAULT_EVENT_DETECTORS: tuple[WpEventDetector, ...] = (
+    _REJECTION_CYCLES,
+    _REJECTION_RANGE,
+    _LANE_FRICTION,
+    _DONE_WPS,
+    _FORCE_OVERRIDES,
+    _FORCE_OVERRIDES_RANGE,
+    _SELF_APPROVALS,
+    _ARBITER_OVERRIDES,
+    _ARBITER_OVERRIDES_RANGE,
+    _IMPLEMENTATION_CYCLES,
+)
+
+
+def _default_event_engine() -> EventMiningEngine:
+    return EventMiningEngine(_DEFAULT_EVENT_DETECTORS)
 
 
 def _collect_fr_references(wp_files: list[tuple[str, str]]) -> dict[str, set[str]]:
@@ -587,39 +590,29 @@ def _classify_risk(suggested_action: str) -> tuple[str, bool]:
     return "structural", False
 
 
-def _event_id_range_for(
-    events: list[dict[str, Any]],
-    wp_id: str,
-    predicate: Any,
-) -> str:
-    """Return ``first..last`` (or single id) for events matching ``predicate`` on a WP."""
-    ids = [
-        str(ev.get("event_id", ""))
-        for ev in events
-        if _event_wp_id(ev) == wp_id and predicate(ev)
-    ]
-    if len(ids) > 1:
-        return f"{ids[0]}..{ids[-1]}"
-    return ids[0] if ids else ""
-
-
 def _build_event_mining_findings(
     *,
-    events: list[dict[str, Any]],
+    events: Iterable[dict[str, Any]] = (),
     events_rel: str,
     finding_id_counters: dict[str, list[int]],
     ev_reg: _EvidenceRegistry,
+    mined: EventMiningResult | None = None,
 ) -> tuple[list[GenFinding], list[GenFinding]]:
     """Build T039 / FR-010 (F-04) findings — force, arbiter, implementation cycles.
 
+    Reads the fused detector tallies in ``mined``; when omitted, ``events`` is
+    mined here in one pass.
+
     Returns ``(not_helpful_additions, gaps_additions)``.
     """
+    if mined is None:
+        mined = _default_event_engine().run(events)
     not_helpful: list[GenFinding] = []
     gaps: list[GenFinding] = []
 
     # Force overrides → not_helpful
-    for wp_id, count in sorted(_detect_force_overrides(events).items()):
-        range_str = _event_id_range_for(events, wp_id, _is_force_override_event)
+    for wp_id, count in sorted(mined.counts(_FORCE_OVERRIDES.name).items()):
+        range_str = mined.tally(_FORCE_OVERRIDES_RANGE.name, wp_id).range_str
         ev_id = ev_reg.add_event_range(events_rel, range_str or "force_override", f"force_override_{wp_id}")
         not_helpful.append(
             GenFinding(
@@ -636,15 +629,11 @@ def _build_event_mining_findings(
         )
 
     # Self-review fallback → not_helpful
-    for wp_id, count in sorted(_detect_reviewer_self_approvals(events).items()):
-        range_str = _event_id_range_for(events, wp_id, _is_reviewer_self_approval_event)
+    for wp_id, count in sorted(mined.counts(_SELF_APPROVALS.name).items()):
+        tally = mined.tally(_SELF_APPROVALS.name, wp_id)
+        range_str = tally.range_str
         ev_id = ev_reg.add_event_range(events_rel, range_str or "reviewer_self_approval", f"reviewer_self_approval_{wp_id}")
-        matching_payloads = [
-            ev.get("payload", {})
-            for ev in events
-            if _event_wp_id(ev) == wp_id and _is_reviewer_self_approval_event(ev)
-        ]
-        first_payload = matching_payloads[0] if matching_payloads and isinstance(matching_payloads[0], dict) else {}
+        first_payload = tally.first_payload if isinstance(tally.first_payload, dict) else {}
         intended = str(first_payload.get("intended_reviewer") or "unknown")
         actor = str(first_payload.get("implementing_actor") or "unknown")
         reason = str(first_payload.get("failure_reason") or "reviewer_failed")
@@ -663,8 +652,8 @@ def _build_event_mining_findings(
         )
 
     # Arbiter overrides → gaps
-    for wp_id, count in sorted(_detect_arbiter_overrides(events).items()):
-        range_str = _event_id_range_for(events, wp_id, _is_arbiter_event)
+    for wp_id, count in sorted(mined.counts(_ARBITER_OVERRIDES.name).items()):
+        range_str = mined.tally(_ARBITER_OVERRIDES_RANGE.name, wp_id).range_str
         ev_id = ev_reg.add_event_range(events_rel, range_str or "arbiter", f"arbiter_{wp_id}")
         gaps.append(
             GenFinding(
@@ -681,7 +670,7 @@ def _build_event_mining_findings(
         )
 
     # Multi-cycle implementations → not_helpful
-    for wp_id, count in sorted(_detect_implementation_cycles(events).items()):
+    for wp_id, count in sorted(_implementation_cycles(mined).items()):
         ev_id = ev_reg.add_event_range(events_rel, "implementation_cycles", f"impl_cycles_{wp_id}")
         not_helpful.append(
             GenFinding(
@@ -702,27 +691,16 @@ def _build_event_mining_findings(
 
 def _build_lane_friction_findings(
     *,
-    events: list[dict[str, Any]],
-    lane_friction_counts: dict[str, int],
+    mined: EventMiningResult,
     events_rel: str,
     finding_id_counters: dict[str, list[int]],
     ev_reg: _EvidenceRegistry,
 ) -> list[GenFinding]:
     findings: list[GenFinding] = []
+    lane_friction_counts = mined.counts(_LANE_FRICTION.name)
     for wp_id in sorted(lane_friction_counts):
         count = lane_friction_counts[wp_id]
-        friction_event_ids = [
-            str(ev.get("event_id", ""))
-            for ev in events
-            if ev.get("wp_id") == wp_id
-            and _is_lane_friction_event(ev)
-        ]
-        if len(friction_event_ids) > 1:
-            range_str = f"{friction_event_ids[0]}..{friction_event_ids[-1]}"
-        elif friction_event_ids:
-            range_str = friction_event_ids[0]
-        else:
-            range_str = ""
+        range_str = mined.tally(_LANE_FRICTION.name, wp_id).range_str
         ev_id = ev_reg.add_event_range(events_rel, range_str or "lane_friction", f"lane_friction_{wp_id}")
         findings.append(
             GenFinding(
@@ -964,7 +942,7 @@ def _build_ingestor_findings(
 
 def _build_findings(
     *,
-    events: list[dict[str, Any]],
+    mined: EventMiningResult,
     spec_text: str,
     research_text: str | None,
     data_model_text: str | None,
@@ -993,9 +971,9 @@ def _build_findings(
     gaps: list[GenFinding] = []
     proposals: list[GenProposal] = []
 
-    rejection_counts = _detect_rejection_cycles(events)
-    lane_friction_counts = _detect_lane_friction(events)
-    done_wps = _detect_done_wps(events)
+    rejection_counts = mined.counts(_REJECTION_CYCLES.name)
+    lane_friction_counts = mined.counts(_LANE_FRICTION.name)
+    done_wps = set(mined.counts(_DONE_WPS.name))
 
     # --- Helped: WPs completed without rejection cycles.
     # Notable by contrast when rejection/friction exists; always notable when
@@ -1015,7 +993,7 @@ def _build_findings(
             wp_file_name = f"{wp_id}.md"
             if wp_file_name in wp_evidence_ids:
                 ev_refs = [wp_evidence_ids[wp_file_name]]
-            elif events:
+            elif mined.event_count:
                 ev_refs = [ev_reg.add_file(events_rel)]
             else:
                 ev_refs = []
@@ -1034,18 +1012,7 @@ def _build_findings(
     # --- Not-helpful: WPs with ≥1 rejection cycle
     for wp_id in sorted(rejection_counts.keys()):
         count = rejection_counts[wp_id]
-        rejection_event_ids = [
-            str(ev.get("event_id", ""))
-            for ev in events
-            if ev.get("wp_id") == wp_id
-            and ev.get("from_lane") in ("for_review", "in_review")
-            and ev.get("to_lane") in ("planned", "in_progress", "claimed")
-        ]
-        range_str = (
-            f"{rejection_event_ids[0]}..{rejection_event_ids[-1]}"
-            if len(rejection_event_ids) > 1
-            else (rejection_event_ids[0] if rejection_event_ids else "")
-        )
+        range_str = mined.tally(_REJECTION_RANGE.name, wp_id).range_str
         ev_id = ev_reg.add_event_range(events_rel, range_str or "rejection", f"rejection_{wp_id}")
         not_helpful.append(
             GenFinding(
@@ -1059,8 +1026,7 @@ def _build_findings(
 
     not_helpful.extend(
         _build_lane_friction_findings(
-            events=events,
-            lane_friction_counts=lane_friction_counts,
+            mined=mined,
             events_rel=events_rel,
             finding_id_counters=finding_id_counters,
             ev_reg=ev_reg,
@@ -1069,7 +1035,7 @@ def _build_findings(
 
     # --- T039 / FR-010 (F-04): force-override, arbiter, and impl-cycle findings
     _new_not_helpful, _new_gaps = _build_event_mining_findings(
-        events=events,
+        mined=mined,
         events_rel=events_rel,
         finding_id_counters=finding_id_counters,
         ev_reg=ev_reg,
@@ -1252,7 +1218,7 @@ def generate_retrospective(
     traces = _load_traces(repo_root, feature_dir)
 
     wp_files = _load_wp_files(feature_dir)
-    events = _load_events(feature_dir)
+    mined = _mine_events(feature_dir)
 
     # ------------------------------------------------------------------
     # Step 3: Build evidence_refs via registry (stable, sorted order)
@@ -1281,7 +1247,7 @@ def generate_retrospective(
         wp_rel = f"kitty-specs/{feature_dir.name}/tasks/{wp_name}"
         wp_evidence_ids[wp_name] = ev_reg.add_file(wp_rel)
 
-    if events:
+    if mined.event_count:
         ev_reg.add_file(events_rel)
 
     # ------------------------------------------------------------------
@@ -1289,7 +1255,7 @@ def generate_retrospective(
     # generate_proposals from policy gates whether proposals are populated.
     # ------------------------------------------------------------------
     helped, not_helpful, gaps, proposals = _build_findings(
-        events=events,
+        mined=mined,
         spec_text=spec_text,
         research_text=research_text,
         data_model_text=data_model_text,
@@ -1371,3 +1337,63 @@ def generate_retrospective(
     validate_record(record)
 
     return record
+
+
+def generate_retrospectives(
+    mission_handles: Sequence[str],
+    policy: RetrospectivePolicy,
+    repo_root: Path,
+    *,
+    max_workers: int | None = None,
+    provenance_kind: ProvenanceKind = "runtime_post_completion",
+    invoked_at: str | None = None,
+    actor: GenActor | None = None,
+    policy_source: dict[str, str] | None = None,
+) -> list[GenRetrospectiveRecord | Exception]:
+    """Generate retrospective records for many missions, in parallel.
+
+    Each mission is independent and read-only, so generation fans out across
+    a process pool (the work is CPU-bound parsing). Results are returned in
+    the order of ``mission_handles``; a mission whose generation raised
+    yields the exception in its slot instead of aborting the batch. Each
+    record is identical to what :func:`generate_retrospective` returns for
+    the same inputs.
+
+    Args:
+        mission_handles: Mission slugs, mission_ids, or directory names.
+        policy:          Resolved RetrospectivePolicy shared by every mission.
+        repo_root:       Absolute path to the project root.
+        max_workers:     Pool size; defaults to ``os.cpu_count()``. ``1`` (or a
+                         single mission) runs inline without a pool.
+        provenance_kind, invoked_at, actor, policy_source:
+                         Forwarded to :func:`generate_retrospective`.
+
+    Returns:
+        One ``GenRetrospectiveRecord`` or ``Exception`` per mission handle.
+    """
+    kwargs: dict[str, Any] = {
+        "provenance_kind": provenance_kind,
+        "invoked_at": invoked_at,
+        "actor": actor,
+        "policy_source": policy_source,
+    }
+    workers = min(max_workers or os.cpu_count() or 1, len(mission_handles))
+    if workers <= 1:
+        results: list[GenRetrospectiveRecord | Exception] = []
+        for handle in mission_handles:
+            try:
+                results.append(generate_retrospective(handle, policy, repo_root, **kwargs))
+            except Exception as exc:  # noqa: BLE001 — per-mission failure is data
+                results.append(exc)
+        return results
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(generate_retrospective, handle, policy, repo_root, **kwargs)
+            for handle in mission_handles
+        ]
+        outcomes: list[GenRetrospectiveRecord | Exception] = []
+        for future in futures:
+            exc = future.exception()
+            outcomes.append(exc if isinstance(exc, Exception) else future.result())
+        return outcomes
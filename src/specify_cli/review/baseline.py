@@ -11,6 +11,8 @@ Design decisions:
 - Baseline capture is opt-in via ``review.test_command`` in ``.kittify/config.yaml``.
 - Supported output formats are parser-specific; JUnit XML is supported today.
 - Artifact format: structured JSON with test name, status, one-line error for failures only.
+- Runs are shared across WPs and lanes through a commit-keyed cache in the
+  runtime root (:mod:`specify_cli.review.baseline_cache`).
 """
 from __future__ import annotations
 
@@ -22,10 +24,10 @@ import time
 import xml.etree.ElementTree as ET
 from collections.abc import Iterator, Sequence
 from contextlib import contextmanager
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from kernel.clock import now_utc_stamp
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from specify_cli.configured_command import ConfiguredCommandUnsupported, run_configured_command_template
 from specify_cli.review.scope_source import (
@@ -35,6 +37,9 @@ from specify_cli.review.scope_source import (
     scope_source_identity,
 )
 
+if TYPE_CHECKING:
+    from specify_cli.review.baseline_cache import BaselineCacheKey
+
 logger = logging.getLogger(__name__)
 
 # Wall-clock bound for a single scoped/full test run. Shared with the
@@ -234,9 +239,10 @@ def _resolve_base_commit(repo_root: Path, base_branch: str) -> str | None:
 
 @contextmanager
 def _baseline_worktree(repo_root: Path, base_branch: str) -> Iterator[Path | None]:
-    """Own a detached baseline worktree on ``base_branch`` for the block's lifetime.
+    """Own a private, detached baseline worktree on ``base_branch`` for the block's lifetime.
 
-    Adds ``.../baseline-worktree`` under a private ``TemporaryDirectory`` on
+    The fallback behind :func:`_capture_worktree` when the warm worktree is
+    busy or unavailable. Adds ``.../baseline-worktree`` under a private ``TemporaryDirectory`` on
     ``base_branch`` (detached), yields its path, and ALWAYS removes it on exit
     (``git worktree remove --force``). On an add failure the sentinel value
     ``None`` is yielded instead of raising, so the caller emits its own
@@ -275,6 +281,44 @@ def _baseline_worktree(repo_root: Path, base_branch: str) -> Iterator[Path | Non
                 logger.warning("Could not remove temporary worktree: %s", exc)
 
 
+@contextmanager
+def _capture_worktree(repo_root: Path, base_branch: str, base_commit: str) -> Iterator[Path | None]:
+    """The tree a baseline run executes in: the warm one, else a private one.
+
+    Prefers this repository's reusable baseline worktree
+    (:func:`~specify_cli.review.baseline_cache.warm_baseline_worktree`),
+    re-pointed at ``base_commit``; while another capture holds it, or if it
+    cannot be prepared, falls back to a throwaway :func:`_baseline_worktree`.
+    """
+    from specify_cli.review.baseline_cache import warm_baseline_worktree
+
+    with warm_baseline_worktree(repo_root, base_commit) as warm:
+        if warm is not None:
+            yield warm
+            return
+    with _baseline_worktree(repo_root, base_branch) as private:
+        yield private
+
+
+def _reuse_cached(
+    key: BaselineCacheKey,
+    *,
+    wp_id: str,
+    base_branch: str,
+    artifact_path: Path,
+) -> BaselineTestResult | None:
+    """A shared-cache hit re-labelled for ``wp_id`` and saved as its artifact."""
+    from specify_cli.review.baseline_cache import lookup
+
+    cached = lookup(key)
+    if cached is None:
+        return None
+    logger.info("Reusing cached baseline for %s at %s (captured for %s).", wp_id, key.base_commit[:12], cached.wp_id)
+    result = replace(cached, wp_id=wp_id, base_branch=base_branch)
+    result.save(artifact_path)
+    return result
+
+
 def capture_baseline(
     worktree_path: Path,
     base_branch: str,
@@ -284,16 +328,19 @@ def capture_baseline(
     wp_slug: str,
     test_command: str | None = None,
     scope_source: ScopeSource | None = None,
+    scope_targets: Sequence[str] = (),
 ) -> BaselineTestResult | None:
     """Capture baseline test results at implement time.
 
-    Creates a temporary git worktree on the base branch, runs the test
-    suite, parses JUnit XML output, and saves the result to
+    Runs the test suite in the baseline worktree at the base commit, parses
+    its output, and saves the result to
     ``feature_dir/tasks/{wp_slug}/baseline-tests.json``.
 
     Returns the BaselineTestResult on success, or a sentinel result
     (``failed=-1``) if the test suite cannot be run.  Returns the cached
-    result if the artifact already exists.
+    result if the artifact already exists, and reuses a run another WP (in
+    any lane) already made for the same base commit, source and command
+    (:mod:`specify_cli.review.baseline_cache`).
 
     Args:
         worktree_path: Path to the execution worktree (used to find repo root).
@@ -313,6 +360,10 @@ def capture_baseline(
             :func:`_capture_baseline_via_scope_source`). ``None`` (the
             default) preserves this function's exact prior, config-driven
             behaviour.
+        scope_targets: Optional test targets appended to the
+            ``scope_source`` command, as the head run appends its scope.
+            Empty (the default) runs the whole suite, which also answers any
+            narrower scope from the shared cache later.
     """
     artifact_dir = feature_dir / "tasks" / wp_slug
     artifact_path = artifact_dir / "baseline-tests.json"
@@ -336,6 +387,7 @@ def capture_baseline(
             base_branch=base_branch,
             wp_id=wp_id,
             artifact_path=artifact_path,
+            scope_targets=scope_targets,
         )
 
     return _capture_baseline_via_config(
@@ -363,6 +415,8 @@ def _capture_baseline_via_config(
     between this path and :func:`_capture_baseline_via_scope_source`
     (keeps both at or under the project's complexity ceiling).
     """
+    from specify_cli.review.baseline_cache import CONFIG_SOURCE, BaselineCacheKey, store
+
     # Determine test command
     if test_command is None:
         test_command, output_format = _get_test_command(repo_root)
@@ -386,11 +440,16 @@ def _capture_baseline_via_config(
     if base_commit is None:
         return _make_sentinel(wp_id, base_branch, "")
 
-    with _baseline_worktree(repo_root, base_branch) as tmp_worktree:
+    cache_key = BaselineCacheKey.build(repo_root, base_commit=base_commit, source=CONFIG_SOURCE, command=[test_command])
+    reused = _reuse_cached(cache_key, wp_id=wp_id, base_branch=base_branch, artifact_path=artifact_path)
+    if reused is not None:
+        return reused
+
+    with tempfile.TemporaryDirectory() as output_dir, _capture_worktree(repo_root, base_branch, base_commit) as tmp_worktree:
         if tmp_worktree is None:
             return _make_sentinel(wp_id, base_branch, base_commit)
-        # JUnit output lives beside the worktree (same private temp dir).
-        junit_xml_path = tmp_worktree.parent / "junit.xml"
+        # JUnit output lives outside the (possibly shared) worktree.
+        junit_xml_path = Path(output_dir) / "junit.xml"
 
         try:
             run_result = run_configured_command_template(
@@ -438,6 +497,7 @@ def _capture_baseline_via_config(
         failures=tuple(failures),
     )
     result.save(artifact_path)
+    store(cache_key, result)
     return result
 
 
@@ -545,6 +605,7 @@ def _capture_baseline_via_scope_source(
     base_branch: str,
     wp_id: str,
     artifact_path: Path,
+    scope_targets: Sequence[str] = (),
 ) -> BaselineTestResult | None:
     """FR-011: baseline capture via the injected ``ScopeSource`` — the SAME
     ``test_command()``/``parse_results()`` authority the pre-review head run
@@ -565,6 +626,8 @@ def _capture_baseline_via_scope_source(
     parses an absolute path in its own tempdir, so this reordering is a
     no-op for it — its behaviour is unaffected either way.
     """
+    from specify_cli.review.baseline_cache import BaselineCacheKey, store
+
     command = scope_source.test_command()
     if not command:
         logger.info(
@@ -576,10 +639,17 @@ def _capture_baseline_via_scope_source(
     if base_commit is None:
         return _make_sentinel(wp_id, base_branch, "")
 
-    with _baseline_worktree(repo_root, base_branch) as tmp_worktree:
+    cache_key = BaselineCacheKey.build(
+        repo_root, base_commit=base_commit, source=type(scope_source).__name__, command=command, targets=scope_targets,
+    )
+    reused = _reuse_cached(cache_key, wp_id=wp_id, base_branch=base_branch, artifact_path=artifact_path)
+    if reused is not None:
+        return reused
+
+    with _capture_worktree(repo_root, base_branch, base_commit) as tmp_worktree:
         if tmp_worktree is None:
             return _make_sentinel(wp_id, base_branch, base_commit)
-        raw = _run_command_for_baseline(command, cwd=tmp_worktree)
+        raw = _run_command_for_baseline([*command, *scope_targets], cwd=tmp_worktree)
         failures = tuple(scope_source.parse_results(raw))
         source_identity = scope_source_identity(scope_source, raw)
 
@@ -628,6 +698,10 @@ def _capture_baseline_via_scope_source(
         source_identity=source_identity,
     )
     result.save(artifact_path)
+    # A run that never completed (timeout, cancel, launch failure) surfaces as
+    # a synthetic failure for THIS capture; it is not a fact about the commit.
+    if raw.returncode != -1:
+        store(cache_key, result)
     return result
 
 
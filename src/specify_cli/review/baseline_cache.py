@@ -0,0 +1,374 @@
+"""Shared, commit-keyed baseline result cache and the warm baseline worktree.
+
+:func:`specify_cli.review.baseline.capture_baseline` runs the base branch's
+test suite once per WP. Every WP branched from the same base commit runs the
+SAME command against the SAME tree, so ten WPs (across any number of lanes)
+used to pay for ten identical runs of several minutes each. This module lets
+them share one:
+
+* :class:`BaselineCacheKey` names a run by (repository, base commit SHA,
+  ``ScopeSource`` class, resolved test command, scope targets). The command
+  is normalised first: the per-instance temp-file path a ``ScopeSource``
+  injects for its JUnit artifact is replaced by ``{output_file}``, so two
+  instances of one source produce the same key.
+* :func:`lookup` answers a key from an exact entry, or from a WIDER entry of
+  the same run (whole suite, or a superset of targets) by keeping only the
+  failures that fall under the requested targets -- so a narrow scope never
+  re-runs tests a wider run already covered.
+* :func:`store` records a completed, non-sentinel capture.
+* :func:`warm_baseline_worktree` keeps one detached worktree per repository
+  and re-points it at the requested commit, instead of a fresh
+  ``git worktree add`` in a temporary directory for every capture.
+
+File locations (runtime state, outside any repository)::
+
+    {runtime_root}/cache/baseline-tests/{run_digest}/{targets_digest}.json
+    {runtime_root}/baseline-worktrees/{repo_digest}/
+
+The repository component is the git COMMON dir, so every lane worktree of
+one checkout shares entries. The cache is advisory: a missing, corrupt or
+version-mismatched entry is a miss and a write failure is logged and
+swallowed, so a capture behaves exactly as before without it.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any
+
+from kernel.atomic import atomic_write
+from specify_cli.paths import get_runtime_root
+from specify_cli.review.baseline import BaselineFailure, BaselineTestResult
+
+__all__ = [
+    "BaselineCacheKey",
+    "lookup",
+    "store",
+    "warm_baseline_worktree",
+]
+
+logger = logging.getLogger(__name__)
+
+BASELINE_CACHE_DIR = "baseline-tests"
+BASELINE_WORKTREES_DIR = "baseline-worktrees"
+
+# Bump when the shape or meaning of a cache entry (or of the key) changes.
+BASELINE_CACHE_SCHEMA_VERSION = 1
+
+# Distinct (repo, commit, source, command) runs kept; older ones are pruned on write.
+_MAX_RUNS = 64
+
+#: Key source for the config-driven capture path (no ``ScopeSource`` injected).
+CONFIG_SOURCE = "review.test_command"
+
+_OUTPUT_FILE_PLACEHOLDER = "{output_file}"
+
+# A ScopeSource allocates its artifact in a fresh ``tempfile.mkdtemp(prefix="spec-kitty-...")``
+# per instance (``GateCoverageScopeSource._junit_output_path``,
+# ``DeclaredCommandScopeSource._output_file``); the path differs on every
+# capture but says nothing about WHICH tests run.
+_INSTANCE_ARTIFACT_RE = re.compile(re.escape(str(Path(tempfile.gettempdir()) / "spec-kitty-")) + r"[^\s'\"]+")
+
+
+def _sha256_hex(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()  # noqa: TID251 - production raw SHA-256 owner (baseline-cache key, non-security)
+
+
+def git_common_dir(repo_root: Path) -> Path:
+    """The git common dir shared by ``repo_root`` and all of its worktrees.
+
+    Read from the ``.git`` file/``commondir`` pointer rather than a
+    ``git rev-parse`` subprocess: it is called on every capture, including the
+    cache-hit path that otherwise spawns no git at all.
+    """
+    dot_git = repo_root / ".git"
+    if not dot_git.is_file():
+        return dot_git.resolve()
+    try:
+        pointer = dot_git.read_text(encoding="utf-8").strip()
+    except OSError:
+        return dot_git.resolve()
+    if not pointer.startswith("gitdir:"):
+        return dot_git.resolve()
+    git_dir = Path(pointer.split(":", 1)[1].strip())
+    if not git_dir.is_absolute():
+        git_dir = repo_root / git_dir
+    commondir = git_dir / "commondir"
+    try:
+        return (git_dir / commondir.read_text(encoding="utf-8").strip()).resolve()
+    except OSError:
+        return git_dir.resolve()
+
+
+def repo_digest(repo_root: Path) -> str:
+    """A short, stable directory-name token for ``repo_root``'s repository (all lanes share it)."""
+    return _sha256_hex(str(git_common_dir(repo_root)))[:16]
+
+
+def normalise_command(command: Sequence[str]) -> tuple[str, ...]:
+    """``command`` with per-instance artifact paths replaced by ``{output_file}``."""
+    return tuple(_INSTANCE_ARTIFACT_RE.sub(_OUTPUT_FILE_PLACEHOLDER, part) for part in command)
+
+
+def _normalise_target(target: str) -> str:
+    return target.replace("\\", "/").rstrip("/")
+
+
+@dataclass(frozen=True)
+class BaselineCacheKey:
+    """Everything that decides a baseline run's outcome.
+
+    ``targets`` is empty for a whole-suite run. ``source`` is the
+    ``ScopeSource`` class name (or :data:`CONFIG_SOURCE`); the parse-mode half
+    of the ``source_identity`` is only known after the run and is kept on the
+    stored result instead.
+    """
+
+    repo: str
+    base_commit: str
+    source: str
+    command: tuple[str, ...]
+    targets: tuple[str, ...] = ()
+
+    @classmethod
+    def build(
+        cls,
+        repo_root: Path,
+        *,
+        base_commit: str,
+        source: str,
+        command: Sequence[str],
+        targets: Sequence[str] = (),
+    ) -> BaselineCacheKey:
+        return cls(
+            repo=str(git_common_dir(repo_root)),
+            base_commit=base_commit,
+            source=source,
+            command=normalise_command(command),
+            targets=tuple(sorted({_normalise_target(t) for t in targets})),
+        )
+
+    @property
+    def run_digest(self) -> str:
+        """Digest of the run, ignoring targets -- the directory wider entries share."""
+        return _sha256_hex(json.dumps([BASELINE_CACHE_SCHEMA_VERSION, self.repo, self.base_commit, self.source, list(self.command)]))
+
+    @property
+    def targets_digest(self) -> str:
+        return _sha256_hex(json.dumps(list(self.targets)))[:16]
+
+
+def _cache_root() -> Path:
+    cache_dir: Path = get_runtime_root().cache_dir
+    return cache_dir / BASELINE_CACHE_DIR
+
+
+def _entry_path(key: BaselineCacheKey) -> Path:
+    return _cache_root() / key.run_digest / f"{key.targets_digest}.json"
+
+
+def _covers(target: str, wider: str) -> bool:
+    """True when pytest target ``target`` runs only tests that ``wider`` runs."""
+    return target == wider or target.startswith(f"{wider}/") or target.startswith(f"{wider}::")
+
+
+def owning_target(test: str, file: str, targets: Sequence[str]) -> str | None:
+    """The first of ``targets`` a test result belongs to, or ``None``.
+
+    A result is matched by its ``file`` (``path:line``) when the runner
+    recorded one, otherwise by its dotted JUnit ``classname.name`` identity
+    (``tests.status.test_x.TestY.test_z`` for ``tests/status/test_x.py``).
+    """
+    result_path = file.rsplit(":", 1)[0].replace("\\", "/")
+    for target in targets:
+        path = _normalise_target(target.split("::", 1)[0])
+        if result_path not in ("", "unknown") and (result_path == path or result_path.startswith(f"{path}/")):
+            return target
+        dotted = path.removesuffix(".py").replace("/", ".")
+        if test == dotted or test.startswith(f"{dotted}."):
+            return target
+    return None
+
+
+def _failure_in_targets(failure: BaselineFailure, targets: Sequence[str]) -> bool:
+    return owning_target(failure.test, failure.file, targets) is not None
+
+
+def _read_entry(path: Path) -> tuple[tuple[str, ...], BaselineTestResult] | None:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if data.get("schema_version") != BASELINE_CACHE_SCHEMA_VERSION:
+            return None
+        return tuple(data["targets"]), BaselineTestResult.from_dict(data["result"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _narrow(result: BaselineTestResult, targets: tuple[str, ...]) -> BaselineTestResult:
+    failures = tuple(f for f in result.failures if _failure_in_targets(f, targets))
+    # Suite counts are not recorded per target, so a narrowed result carries
+    # derived counts -- the same shape ``_capture_baseline_via_scope_source`` stores.
+    return replace(result, total=len(failures), passed=0, failed=len(failures), skipped=0, failures=failures)
+
+
+def lookup(key: BaselineCacheKey) -> BaselineTestResult | None:
+    """The cached result for ``key``, narrowed from a wider run if needed.
+
+    The returned result still carries the ``wp_id``/``base_branch`` of the
+    capture that produced it; callers re-label it for their own WP.
+    """
+    exact = _read_entry(_entry_path(key))
+    if exact is not None:
+        return exact[1]
+    run_dir = _cache_root() / key.run_digest
+    if not key.targets or not run_dir.is_dir():
+        return None
+    wider_entries = (_read_entry(path) for path in sorted(run_dir.glob("*.json")))
+    for entry in wider_entries:
+        if entry is None:
+            continue
+        entry_targets, result = entry
+        # A synthetic whole-run failure ("<declared-command>", "<gate-coverage-junit>")
+        # belongs to no target, so narrowing would silently drop it.
+        if any(f.test.startswith("<") for f in result.failures):
+            continue
+        if not entry_targets or all(any(_covers(t, w) for w in entry_targets) for t in key.targets):
+            return _narrow(result, key.targets)
+    return None
+
+
+def store(key: BaselineCacheKey, result: BaselineTestResult) -> None:
+    """Record ``result`` under ``key``; sentinel results are never stored."""
+    if result.failed == -1:
+        return
+    payload: dict[str, Any] = {
+        "schema_version": BASELINE_CACHE_SCHEMA_VERSION,
+        "base_commit": key.base_commit,
+        "source": key.source,
+        "command": list(key.command),
+        "targets": list(key.targets),
+        "result": result.to_dict(),
+    }
+    path = _entry_path(key)
+    try:
+        atomic_write(path, json.dumps(payload, indent=2), mkdir=True)
+        _prune(keep=path.parent)
+    except OSError as exc:
+        logger.warning("Could not write baseline cache entry %s: %s", path, exc)
+
+
+def _prune(*, keep: Path) -> None:
+    """Drop the oldest runs beyond :data:`_MAX_RUNS` (never ``keep``)."""
+    runs = [p for p in _cache_root().iterdir() if p.is_dir()]
+    if len(runs) <= _MAX_RUNS:
+        return
+    runs.sort(key=lambda p: p.stat().st_mtime, reverse=True)
+    for stale in runs[_MAX_RUNS:]:
+        if stale != keep:
+            shutil.rmtree(stale, ignore_errors=True)
+
+
+# ---------------------------------------------------------------------------
+# Warm baseline worktree
+# ---------------------------------------------------------------------------
+
+
+def _git(args: Sequence[str], *, cwd: Path) -> subprocess.CompletedProcess[str] | None:
+    try:
+        return subprocess.run(["git", *args], cwd=str(cwd), capture_output=True, text=True, check=False)
+    except OSError as exc:
+        logger.warning("git %s failed: %s", args[0], exc)
+        return None
+
+
+def _ok(result: subprocess.CompletedProcess[str] | None) -> bool:
+    return result is not None and result.returncode == 0
+
+
+def _repoint(worktree: Path, base_commit: str) -> bool:
+    """Re-point an existing warm worktree at ``base_commit`` with a clean tree.
+
+    ``clean -x`` also drops ignored files, so a previous run's report cannot be
+    mistaken for this run's; only files that differ between the two commits
+    are rewritten, which is the saving over a fresh checkout.
+    """
+    if not (worktree / ".git").is_file():
+        return False
+    checked_out = _ok(_git(["checkout", "--quiet", "--force", "--detach", base_commit], cwd=worktree))
+    return checked_out and _ok(_git(["clean", "-fdxq"], cwd=worktree))
+
+
+def _prepare(repo_root: Path, worktree: Path, base_commit: str) -> bool:
+    if worktree.exists():
+        if _repoint(worktree, base_commit):
+            return True
+        logger.info("Recreating baseline worktree %s", worktree)
+        shutil.rmtree(worktree, ignore_errors=True)
+    _git(["worktree", "prune"], cwd=repo_root)
+    result = _git(["worktree", "add", "--detach", str(worktree), base_commit], cwd=repo_root)
+    if not _ok(result):
+        logger.warning("Could not create baseline worktree for %s: %s", base_commit, result.stderr if result else "")
+        return False
+    return True
+
+
+@contextlib.contextmanager
+def _exclusive(lock_path: Path) -> Iterator[bool]:
+    """Non-blocking exclusive ``flock`` on ``lock_path``; yields whether it was taken.
+
+    Same scoped ``fcntl.flock`` shape as ``pre_review_gate._scoped_run_lock``.
+    A busy warm worktree means another capture is using it right now; the
+    caller falls back to a private worktree rather than waiting minutes.
+    """
+    if sys.platform == "win32":  # pragma: no cover - platform-specific
+        yield False
+        return
+
+    import fcntl  # POSIX-only; local import keeps this module importable on Windows.
+
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(str(lock_path), os.O_CREAT | os.O_RDWR)
+    try:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            with contextlib.suppress(OSError):
+                fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
+
+
+@contextlib.contextmanager
+def warm_baseline_worktree(repo_root: Path, base_commit: str) -> Iterator[Path | None]:
+    """Hold this repository's reusable baseline worktree, checked out at ``base_commit``.
+
+    Yields ``None`` -- without touching git -- when the worktree is in use by
+    another capture (or the platform has no ``flock``), and ``None`` when it
+    could not be prepared; either way the caller falls back to its own
+    temporary worktree. The worktree is left in place on exit for the next
+    capture.
+    """
+    root = get_runtime_root().base / BASELINE_WORKTREES_DIR / repo_digest(repo_root)
+    worktree = root / "worktree"
+    with _exclusive(root / ".lock") as held:
+        if not held or not _prepare(repo_root, worktree, base_commit):
+            yield None
+            return
+        yield worktree
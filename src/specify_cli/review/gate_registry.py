@@ -60,8 +60,9 @@ class TransitionGateContext:
     they never redeclare it. Carries the shared inputs a handler needs so it
     resolves nothing itself (NFR-005) — the changed-files SSOT, the
     activation-selected :class:`~specify_cli.review.scope_source.ScopeSource`,
-    the captured baseline, the repo root, the ``--force`` flag, and the lane
-    edge being gated.
+    the captured baseline, the repo root, the ``--force`` flag, the lane
+    edge being gated, and how many worker processes a handler's head run may
+    shard into (``review.pre_review_shards``; ``1`` runs unsharded).
     """
 
     changed_files: tuple[str, ...]
@@ -71,6 +72,7 @@ class TransitionGateContext:
     force: bool
     from_lane: Lane
     to_lane: Lane
+    shards: int = 1
 
 
 @dataclass(frozen=True)
@@ -89,6 +91,10 @@ class GateHandler:
     returns a :class:`~specify_cli.review.pre_review_gate.GateVerdict`, even
     for a blocking-shaped outcome; deciding whether that outcome blocks the
     transition is the hook's job, not the handler's.
+
+    When several handlers are bound to one edge the hook dispatches them
+    concurrently (one thread each), so ``run`` must not rely on state shared
+    with another handler.
     """
 
     name: str
@@ -111,6 +117,7 @@ def _spec_kitty_pre_review_handler(ctx: TransitionGateContext) -> GateVerdict:
         repo_root=ctx.repo_root,
         baseline=ctx.baseline,
         scope_source=ctx.scope_source,
+        shards=ctx.shards,
     )
 
 
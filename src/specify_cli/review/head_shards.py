@@ -0,0 +1,137 @@
+"""Shard planning for the pre-review head run, driven by historical per-target timings.
+
+:func:`specify_cli.review.pre_review_gate.run_scoped_tests_at_head` used to
+run a WP's whole derived scope as ONE subprocess. With ``shards > 1`` it now
+splits the scope's test targets across that many concurrent worker
+subprocesses. This module owns the two halves of that split that are not
+process management:
+
+* :func:`plan_shards` partitions the targets into balanced groups -- longest
+  expected duration first, each onto the currently lightest shard -- so one
+  slow target does not leave the other workers idle. The plan is a pure
+  function of (targets, shard count, timings), so the same inputs always
+  produce the same commands.
+* :func:`load_target_timings` / :func:`record_target_durations` keep the
+  timings that drive it: after every completed head run the JUnit
+  ``testcase`` times are summed per target and the latest value per target is
+  kept. A target with no history is costed at the median of the known ones.
+
+File location (runtime state, outside any repository)::
+
+    {runtime_root}/cache/gate-timings/{repo_digest}.json
+
+Keyed by the git common dir (:func:`~specify_cli.review.baseline_cache.repo_digest`),
+so every lane worktree of one checkout feeds and reads the same history. Like
+the baseline cache it is advisory: a missing or corrupt file means "no
+history" and a write failure is logged and swallowed.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import statistics
+import xml.etree.ElementTree as ET
+from collections.abc import Iterable, Mapping, Sequence
+from pathlib import Path
+from typing import Any
+
+from kernel.atomic import atomic_write
+from specify_cli.paths import get_runtime_root
+from specify_cli.review.baseline_cache import owning_target, repo_digest
+
+__all__ = [
+    "load_target_timings",
+    "plan_shards",
+    "record_target_durations",
+]
+
+logger = logging.getLogger(__name__)
+
+GATE_TIMINGS_DIR = "gate-timings"
+
+# Bump when the shape or meaning of a timings file changes.
+GATE_TIMINGS_SCHEMA_VERSION = 1
+
+# Cost of a target when no target in the scope has any history yet (seconds).
+_UNKNOWN_TARGET_COST = 1.0
+
+
+def _timings_path(repo_root: Path) -> Path:
+    cache_dir: Path = get_runtime_root().cache_dir
+    return cache_dir / GATE_TIMINGS_DIR / f"{repo_digest(repo_root)}.json"
+
+
+def load_target_timings(repo_root: Path) -> dict[str, float]:
+    """Last observed duration (seconds) per test target for ``repo_root``'s repository."""
+    try:
+        data = json.loads(_timings_path(repo_root).read_text(encoding="utf-8"))
+        if data.get("schema_version") != GATE_TIMINGS_SCHEMA_VERSION:
+            return {}
+        return {str(target): float(seconds) for target, seconds in data["targets"].items()}
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return {}
+
+
+def _durations_by_target(junit_paths: Iterable[Path], targets: Sequence[str]) -> dict[str, float]:
+    durations: dict[str, float] = {}
+    for junit_path in junit_paths:
+        root = ET.parse(str(junit_path)).getroot()  # noqa: S314  # nosec B314 - local test-runner output, not network input
+        for testcase in root.iter("testcase"):
+            classname = testcase.get("classname", "") or ""
+            name = testcase.get("name", "") or ""
+            target = owning_target(f"{classname}.{name}" if classname else name, testcase.get("file", "") or "", targets)
+            if target is None:
+                continue
+            try:
+                seconds = float(testcase.get("time", "0") or 0)
+            except ValueError:
+                continue
+            durations[target] = durations.get(target, 0.0) + seconds
+    return durations
+
+
+def record_target_durations(repo_root: Path, junit_paths: Iterable[Path], targets: Sequence[str]) -> None:
+    """Fold a completed head run's per-target JUnit times into the timing history."""
+    try:
+        observed = _durations_by_target(junit_paths, targets)
+    except (OSError, ET.ParseError) as exc:
+        logger.debug("Could not read head-run timings: %s", exc)
+        return
+    if not observed:
+        return
+    timings = load_target_timings(repo_root)
+    timings.update(observed)
+    payload: dict[str, Any] = {"schema_version": GATE_TIMINGS_SCHEMA_VERSION, "targets": dict(sorted(timings.items()))}
+    path = _timings_path(repo_root)
+    try:
+        atomic_write(path, json.dumps(payload, indent=2), mkdir=True)
+    except OSError as exc:
+        logger.warning("Could not write gate timings %s: %s", path, exc)
+
+
+def plan_shards(targets: Sequence[str], shards: int, timings: Mapping[str, float]) -> list[tuple[str, ...]]:
+    """Partition ``targets`` into at most ``shards`` non-empty, time-balanced groups.
+
+    Each group keeps the targets' original relative order, and ties are
+    broken by target name and shard index, so the plan (and therefore the
+    merged result) is deterministic for a given timing history. ``shards <= 1``
+    (or a single target) returns ``[tuple(targets)]`` unchanged.
+    """
+    unique = list(dict.fromkeys(targets))
+    count = min(max(shards, 1), len(unique))
+    if count <= 1:
+        return [tuple(targets)]
+    known = [timings[target] for target in unique if target in timings]
+    default_cost = statistics.median(known) if known else _UNKNOWN_TARGET_COST
+
+    loads = [0.0] * count
+    sizes = [0] * count
+    assignment: dict[str, int] = {}
+    for target in sorted(unique, key=lambda t: (-timings.get(t, default_cost), t)):
+        # Size breaks load ties so zero-cost targets still spread over every shard.
+        lightest = min(range(count), key=lambda index: (loads[index], sizes[index], index))
+        assignment[target] = lightest
+        loads[lightest] += timings.get(target, default_cost)
+        sizes[lightest] += 1
+    return [tuple(target for target in unique if assignment[target] == index) for index in range(count)]
@@ -41,8 +41,10 @@ import signal
 import subprocess
 import sys
 import tempfile
+import threading
 import time
 from collections.abc import Callable, Iterator, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import StrEnum
 from pathlib import Path
@@ -58,6 +60,8 @@ from specify_cli.review.baseline import (
     _parse_junit_xml,
     diff_baseline,
 )
+from specify_cli.review.baseline_cache import repo_digest
+from specify_cli.review.head_shards import load_target_timings, plan_shards, record_target_durations
 from specify_cli.review.scope_source import (
     _JUNIT_ARTIFACT_FILENAME,
     UNKNOWN_SOURCE_IDENTITY,
@@ -258,8 +262,8 @@ _LOCK_RETRY_SLEEP_S: float = 0.05
 
 
 @contextlib.contextmanager
-def _scoped_run_lock(*, acquire_timeout: float | None = None) -> Iterator[None]:
-    """Advisory lock serializing concurrent scoped subprocess runs (#2493).
+def _scoped_run_lock(repo_root: Path | None = None, *, acquire_timeout: float | None = None) -> Iterator[None]:
+    """Advisory lock serializing concurrent scoped subprocess runs of one repository (#2493).
 
     Uses a scoped ``fcntl.flock`` rather than the canonical
     :class:`specify_cli.core.file_lock.MachineFileLock`: that helper is an
@@ -279,6 +283,12 @@ def _scoped_run_lock(*, acquire_timeout: float | None = None) -> Iterator[None]:
     preferable to a gate that blocks indefinitely or trips a false timeout.
     On Windows (no ``fcntl``) this is a no-op — advisory contention
     protection is a POSIX-only nicety here, not a correctness requirement.
+
+    The lock is per REPOSITORY: ``repo_root`` is keyed by its git common dir
+    (:func:`~specify_cli.review.baseline_cache.repo_digest`), so every lane
+    worktree of one checkout still serializes on the same lock while runs in
+    unrelated repositories no longer queue behind each other. ``None`` keeps
+    the single machine-wide lock file.
     """
     if sys.platform == "win32":  # pragma: no cover - platform-specific, advisory-only nicety
         yield
@@ -288,11 +298,11 @@ def _scoped_run_lock(*, acquire_timeout: float | None = None) -> Iterator[None]:
 
     timeout = _LOCK_ACQUIRE_TIMEOUT_DEFAULT if acquire_timeout is None else acquire_timeout
     # Lock lives under the canonical runtime root (FR-010: no hand-rolled
-    # ``.spec-kitty`` home literal). One machine-wide lock is the right scope
-    # for CPU contention: concurrent gate runs across lanes/worktrees on the
-    # same machine serialize on it (a per-repo_root lock would not, since each
-    # worktree has a distinct root).
-    lock_path = get_runtime_root().base / "gate-locks" / _SCOPED_RUN_LOCK_FILENAME
+    # ``.spec-kitty`` home literal). Keyed by the git COMMON dir rather than
+    # ``repo_root`` itself: each lane worktree has a distinct root, and lanes
+    # of one checkout must still serialize (they share the CPU and the tree).
+    lock_name = _SCOPED_RUN_LOCK_FILENAME if repo_root is None else f"{repo_digest(repo_root)}.lock"
+    lock_path = get_runtime_root().base / "gate-locks" / lock_name
     lock_path.parent.mkdir(parents=True, exist_ok=True)
     fd = os.open(str(lock_path), os.O_CREAT | os.O_RDWR)
     acquired = False
@@ -391,6 +401,27 @@ def _terminate_and_reap(
             return "", ""
 
 
+# Every runner-owned process currently being observed, across threads. A
+# ``KeyboardInterrupt`` only reaches the main thread, so when gate handlers or
+# shards are observed from worker threads the interrupted caller stops them
+# through :func:`cancel_scoped_runs` instead.
+_LIVE_PROCESSES: set[subprocess.Popen[str]] = set()
+_LIVE_PROCESSES_GUARD = threading.Lock()
+
+
+def cancel_scoped_runs() -> None:
+    """Ask every runner-owned process still being observed to terminate.
+
+    The observing threads then see their process exit and return normally;
+    the caller that cancelled is responsible for reporting ``CANCELLED``.
+    """
+    with _LIVE_PROCESSES_GUARD:
+        live = list(_LIVE_PROCESSES)
+    for process in live:
+        with contextlib.suppress(OSError):
+            _signal_owned_process_tree(process, force=False)
+
+
 def _observe_process(
     process: subprocess.Popen[str],
     *,
@@ -399,7 +430,34 @@ def _observe_process(
     monotonic: Callable[[], float],
     wait: _ProcessWait,
 ) -> tuple[HeadRunState, str, str]:
-    """Drain, observe, and clean up one runner-owned process."""
+    """Drain, observe, and clean up one runner-owned process.
+
+    The process is listed in the live-run registry while it is observed, so
+    :func:`cancel_scoped_runs` can stop it from another thread.
+    """
+    with _LIVE_PROCESSES_GUARD:
+        _LIVE_PROCESSES.add(process)
+    try:
+        return _observe_until_done(
+            process,
+            timeout=timeout,
+            progress_callback=progress_callback,
+            monotonic=monotonic,
+            wait=wait,
+        )
+    finally:
+        with _LIVE_PROCESSES_GUARD:
+            _LIVE_PROCESSES.discard(process)
+
+
+def _observe_until_done(
+    process: subprocess.Popen[str],
+    *,
+    timeout: float,
+    progress_callback: _ProgressCallback | None,
+    monotonic: Callable[[], float],
+    wait: _ProcessWait,
+) -> tuple[HeadRunState, str, str]:
     started_at = monotonic()
     deadline = started_at + timeout
     while True:
@@ -455,6 +513,132 @@ def _launch_scoped_process(
     )
 
 
+@dataclass(frozen=True)
+class _ShardRun:
+    """One observed shard process: its completion state, exit code, and output."""
+
+    state: HeadRunState
+    returncode: int | None
+    stdout: str
+    stderr: str
+
+
+def _observe_shards(
+    processes: Sequence[subprocess.Popen[str]],
+    *,
+    timeout: float,
+    progress_callback: _ProgressCallback | None,
+    monotonic: Callable[[], float],
+    wait: _ProcessWait,
+) -> list[tuple[HeadRunState, str, str]]:
+    """Observe several shard processes at once, one thread each, in launch order.
+
+    Only the first shard reports progress (the heartbeat is per run, not per
+    shard). A ``KeyboardInterrupt`` lands in this (main) thread, never in an
+    observer: it terminates every shard, lets the observers reap them, and
+    reports each one ``CANCELLED``.
+    """
+    if len(processes) == 1:
+        return [_observe_process(processes[0], timeout=timeout, progress_callback=progress_callback, monotonic=monotonic, wait=wait)]
+    with ThreadPoolExecutor(max_workers=len(processes), thread_name_prefix="spec-kitty-shard") as pool:
+        futures = [
+            pool.submit(
+                _observe_process,
+                process,
+                timeout=timeout,
+                progress_callback=progress_callback if index == 0 else None,
+                monotonic=monotonic,
+                wait=wait,
+            )
+            for index, process in enumerate(processes)
+        ]
+        try:
+            return [future.result() for future in futures]
+        except KeyboardInterrupt:
+            for process in processes:
+                with contextlib.suppress(OSError):
+                    _signal_owned_process_tree(process, force=True)
+            return [(HeadRunState.CANCELLED, *future.result()[1:]) for future in futures]
+
+
+def _run_shard_processes(
+    commands: Sequence[Sequence[str]],
+    *,
+    repo_root: Path,
+    timeout: float,
+    progress_callback: _ProgressCallback | None,
+    monotonic: Callable[[], float],
+    wait: _ProcessWait,
+) -> list[_ShardRun]:
+    """Launch and observe one process per command, all under ONE repo lock hold.
+
+    A single command is exactly the incumbent one-process run. Every shard
+    gets the full ``timeout`` (they run side by side, so the wall-clock bound
+    is unchanged). A launch failure part-way terminates the shards already
+    started and re-raises the ``OSError``.
+    """
+    env = _gate_run_env()
+    with _scoped_run_lock(repo_root=repo_root):
+        processes: list[subprocess.Popen[str]] = []
+        try:
+            for command in commands:
+                processes.append(_launch_scoped_process(list(command), repo_root=repo_root, env=env))
+        except OSError:
+            for process in processes:
+                _terminate_and_reap(process, wait=wait)
+            raise
+        observed = _observe_shards(
+            processes,
+            timeout=timeout,
+            progress_callback=progress_callback,
+            monotonic=monotonic,
+            wait=wait,
+        )
+    return [
+        _ShardRun(state=state, returncode=process.returncode, stdout=stdout, stderr=stderr)
+        for process, (state, stdout, stderr) in zip(processes, observed, strict=True)
+    ]
+
+
+def _merge_shard_runs(runs: Sequence[_ShardRun]) -> _ShardRun:
+    """Fold shard runs into one run-level outcome, in shard order.
+
+    A timed-out shard makes the whole run ``TIMED_OUT``; otherwise a cancelled
+    one makes it ``CANCELLED``. The exit code is the first non-zero one.
+    """
+    if len(runs) == 1:
+        return runs[0]
+    states = {run.state for run in runs}
+    state = next(
+        (candidate for candidate in (HeadRunState.TIMED_OUT, HeadRunState.CANCELLED) if candidate in states),
+        HeadRunState.COMPLETED,
+    )
+    returncode = next((run.returncode for run in runs if run.returncode), runs[0].returncode)
+    return _ShardRun(
+        state=state,
+        returncode=returncode,
+        stdout="".join(run.stdout for run in runs),
+        stderr="".join(run.stderr for run in runs),
+    )
+
+
+def _shard_artifact_paths(directory: Path, count: int) -> list[Path]:
+    """One JUnit artifact path per shard (the incumbent single name when unsharded)."""
+    if count == 1:
+        return [directory / _JUNIT_ARTIFACT_FILENAME]
+    return [directory / f"shard-{index}-{_JUNIT_ARTIFACT_FILENAME}" for index in range(count)]
+
+
+def _sorted_failures(failures: Sequence[BaselineFailure], *, sharded: bool) -> tuple[BaselineFailure, ...]:
+    """Merged shard failures in a shard-plan-independent order.
+
+    Which shard a target lands on moves with its timing history, so a sharded
+    run's concatenated failures are sorted to keep the verdict byte-stable; an
+    unsharded run keeps the runner's own order.
+    """
+    return tuple(sorted(failures, key=lambda f: (f.test, f.file))) if sharded else tuple(failures)
+
+
 def run_scoped_tests_at_head(
     test_targets: Sequence[str],
     *,
@@ -463,6 +647,7 @@ def run_scoped_tests_at_head(
     progress_callback: _ProgressCallback | None = None,
     monotonic: Callable[[], float] = time.monotonic,
     wait: _ProcessWait = _default_process_wait,
+    shards: int = 1,
 ) -> HeadRunResult:
     """Run ``test_targets`` at head and parse JUnit into ``current_failures``.
 
@@ -474,7 +659,12 @@ def run_scoped_tests_at_head(
     The subprocess command is built via :func:`resolve_pytest_command`
     (#2570.3) so it runs under whichever interpreter actually has ``pytest``
     installed, and the subprocess itself is serialized against concurrent
-    scoped runs via :func:`_scoped_run_lock` (#2493).
+    scoped runs of the same repository via :func:`_scoped_run_lock` (#2493).
+
+    ``shards > 1`` splits the targets across up to that many concurrent
+    pytest processes (:func:`~specify_cli.review.head_shards.plan_shards`,
+    balanced on the repository's recorded per-target timings) and merges
+    their JUnit output; every completed run feeds those timings back.
     """
     if not test_targets:
         return HeadRunResult(
@@ -483,60 +673,61 @@ def run_scoped_tests_at_head(
             state=HeadRunState.INCOMPLETE_OUTPUT,
         )
 
-    env = _gate_run_env()
+    plan = plan_shards(test_targets, shards, load_target_timings(repo_root) if shards > 1 else {})
 
     with tempfile.TemporaryDirectory() as tmp_dir:
-        junit_path = Path(tmp_dir) / _JUNIT_ARTIFACT_FILENAME
-        command = resolve_pytest_command(
-            [*test_targets, f"--junitxml={junit_path}", "-q"],
-            repo_root=repo_root,
-        )
+        junit_paths = _shard_artifact_paths(Path(tmp_dir), len(plan))
+        commands = [
+            resolve_pytest_command(
+                [*targets, f"--junitxml={junit_path}", "-q"],
+                repo_root=repo_root,
+            )
+            for targets, junit_path in zip(plan, junit_paths, strict=True)
+        ]
         try:
-            with _scoped_run_lock():
-                process = _launch_scoped_process(
-                    command,
+            run = _merge_shard_runs(
+                _run_shard_processes(
+                    commands,
                     repo_root=repo_root,
-                    env=env,
-                )
-                state, stdout, stderr = _observe_process(
-                    process,
                     timeout=timeout,
                     progress_callback=progress_callback,
                     monotonic=monotonic,
                     wait=wait,
                 )
+            )
         except OSError as exc:
             return HeadRunResult(
                 ran=False,
                 error=_launch_failed_error(exc),
                 state=HeadRunState.LAUNCH_FAILED,
             )
+        stdout, stderr = run.stdout, run.stderr
 
-        if state is HeadRunState.TIMED_OUT:
+        if run.state is HeadRunState.TIMED_OUT:
             return HeadRunResult(
                 ran=False,
-                returncode=process.returncode,
+                returncode=run.returncode,
                 error=_timed_out_error(timeout, stderr),
-                state=state,
+                state=run.state,
                 stdout=stdout,
                 stderr=stderr,
             )
-        if state is HeadRunState.CANCELLED:
+        if run.state is HeadRunState.CANCELLED:
             return HeadRunResult(
                 ran=False,
-                returncode=process.returncode,
+                returncode=run.returncode,
                 error=_cancelled_error(stderr),
-                state=state,
+                state=run.state,
                 stdout=stdout,
                 stderr=stderr,
             )
 
-        if not junit_path.exists():
+        if not all(junit_path.exists() for junit_path in junit_paths):
             return HeadRunResult(
                 ran=False,
-                returncode=process.returncode,
+                returncode=run.returncode,
                 error=(
-                    f"no JUnit XML produced by the scoped run (exit={process.returncode}); "
+                    f"no JUnit XML produced by the scoped run (exit={run.returncode}); "
                     f"stderr tail: {stderr[-_STDERR_TAIL_CHARS:]}"
                 ),
                 state=HeadRunState.INCOMPLETE_OUTPUT,
@@ -544,24 +735,27 @@ def run_scoped_tests_at_head(
                 stderr=stderr,
             )
 
+        failures: list[BaselineFailure] = []
         try:
             # Broad catch mirrors baseline.py's own handling around this exact parse
             # call: a malformed-XML runner bug degrades to a warn (error=...), never a crash.
-            _total, _passed, _failed, _skipped, failures = _parse_junit_xml(junit_path)
+            for junit_path in junit_paths:
+                failures.extend(_parse_junit_xml(junit_path)[4])
         except Exception as exc:
             return HeadRunResult(
                 ran=False,
-                returncode=process.returncode,
+                returncode=run.returncode,
                 error=f"failed to parse scoped-run JUnit XML: {exc}",
                 state=HeadRunState.INCOMPLETE_OUTPUT,
                 stdout=stdout,
                 stderr=stderr,
             )
+        record_target_durations(repo_root, junit_paths, test_targets)
 
     return HeadRunResult(
         ran=True,
-        current_failures=tuple(failures),
-        returncode=process.returncode,
+        current_failures=_sorted_failures(failures, sharded=len(plan) > 1),
+        returncode=run.returncode,
         state=HeadRunState.COMPLETED,
         stdout=stdout,
         stderr=stderr,
@@ -661,30 +855,84 @@ def _run_raw_command(
     the exact false-``SOURCE_MISMATCH`` shape T024's parity suite exists to
     catch.
     """
-    env = _gate_run_env()
+    state, raws, error = _run_raw_commands(
+        [command],
+        repo_root=repo_root,
+        timeout=timeout,
+        progress_callback=progress_callback,
+        monotonic=monotonic,
+        wait=wait,
+    )
+    return state, raws[0] if raws else None, error
+
+
+def _run_raw_commands(
+    commands: Sequence[Sequence[str]],
+    *,
+    repo_root: Path,
+    timeout: int,
+    progress_callback: _ProgressCallback | None,
+    monotonic: Callable[[], float],
+    wait: _ProcessWait,
+) -> tuple[HeadRunState, list[RawRunResult] | None, str | None]:
+    """:func:`_run_raw_command` for several shard commands run side by side.
+
+    Returns one :class:`RawRunResult` per command, in command order, or
+    ``None`` when any shard did not complete (the merged state says why).
+    """
     try:
-        with _scoped_run_lock():
-            process = _launch_scoped_process(list(command), repo_root=repo_root, env=env)
-            state, stdout, stderr = _observe_process(
-                process,
-                timeout=timeout,
-                progress_callback=progress_callback,
-                monotonic=monotonic,
-                wait=wait,
-            )
+        runs = _run_shard_processes(
+            commands,
+            repo_root=repo_root,
+            timeout=timeout,
+            progress_callback=progress_callback,
+            monotonic=monotonic,
+            wait=wait,
+        )
     except OSError as exc:
         return HeadRunState.LAUNCH_FAILED, None, _launch_failed_error(exc)
 
-    if state is HeadRunState.TIMED_OUT:
-        return state, None, _timed_out_error(timeout, stderr)
-    if state is HeadRunState.CANCELLED:
-        return state, None, _cancelled_error(stderr)
+    merged = _merge_shard_runs(runs)
+    if merged.state is HeadRunState.TIMED_OUT:
+        return merged.state, None, _timed_out_error(timeout, merged.stderr)
+    if merged.state is HeadRunState.CANCELLED:
+        return merged.state, None, _cancelled_error(merged.stderr)
+
+    raws: list[RawRunResult] = []
+    for command, run in zip(commands, runs, strict=True):
+        artifact_path = _extract_junit_output_path(command)
+        if artifact_path is not None and not artifact_path.is_absolute():
+            artifact_path = repo_root / artifact_path
+        raws.append(RawRunResult(returncode=run.returncode, stdout=run.stdout, stderr=run.stderr, output_artifact_path=artifact_path))
+    return merged.state, raws, None
 
-    artifact_path = _extract_junit_output_path(command)
-    if artifact_path is not None and not artifact_path.is_absolute():
-        artifact_path = repo_root / artifact_path
-    raw = RawRunResult(returncode=process.returncode, stdout=stdout, stderr=stderr, output_artifact_path=artifact_path)
-    return state, raw, None
+
+def _scope_source_shard_commands(
+    command: Sequence[str],
+    scope: ScopeResult,
+    *,
+    scope_source: ScopeSource,
+    repo_root: Path,
+    shards: int,
+    directory: Path,
+) -> list[list[str]]:
+    """The head-run argv per shard for an injected ``ScopeSource``.
+
+    Only a census-narrowing source (whose targets are pytest node paths) whose
+    command writes a ``--junitxml=`` artifact can be sharded: each shard gets
+    its own artifact under ``directory`` and its slice of the targets. Anything
+    else -- or ``shards == 1`` -- is the single incumbent command.
+    """
+    single = [[*command, *scope.test_targets]]
+    if shards <= 1 or not exposes_scope_breakdown(scope_source) or _extract_junit_output_path(command) is None:
+        return single
+    plan = plan_shards(scope.test_targets, shards, load_target_timings(repo_root))
+    if len(plan) == 1:
+        return single
+    return [
+        [*(f"--junitxml={artifact}" if arg.startswith("--junitxml=") else arg for arg in command), *targets]
+        for targets, artifact in zip(plan, _shard_artifact_paths(directory, len(plan)), strict=True)
+    ]
 
 
 _NO_TEST_COMMAND_REASON = "no test command configured for the injected ScopeSource — review proceeds without it"
@@ -700,6 +948,7 @@ def _evaluate_via_scope_source(
     monotonic: Callable[[], float],
     wait: _ProcessWait,
     scope_source: ScopeSource,
+    shards: int = 1,
 ) -> GateVerdict:
     """T011/FR-010/FR-011/FR-012: drive the head run + parse through the
     injected port instead of the hardcoded pytest/JUnit path
@@ -740,28 +989,41 @@ def _evaluate_via_scope_source(
     if command is None:
         return GateVerdict(outcome=GateOutcome.NO_COVERAGE, scope=scope, reason=_NO_TEST_COMMAND_REASON)
 
-    state, raw, error = _run_raw_command(
-        [*command, *scope.test_targets],
-        repo_root=repo_root,
-        timeout=timeout,
-        progress_callback=progress_callback,
-        monotonic=monotonic,
-        wait=wait,
-    )
-    if state is HeadRunState.TIMED_OUT:
-        return GateVerdict(outcome=GateOutcome.TIMED_OUT, scope=scope, reason=error, run_state=state)
-    if state is HeadRunState.CANCELLED:
-        return GateVerdict(outcome=GateOutcome.CANCELLED, scope=scope, reason=error, run_state=state)
-    if raw is None:
-        return GateVerdict(
-            outcome=GateOutcome.NO_COVERAGE,
-            scope=scope,
-            reason=f"scoped test run did not complete: {error}",
-            run_state=state,
+    with tempfile.TemporaryDirectory(prefix="spec-kitty-gate-shards-") as shard_dir:
+        commands = _scope_source_shard_commands(
+            command,
+            scope,
+            scope_source=scope_source,
+            repo_root=repo_root,
+            shards=shards,
+            directory=Path(shard_dir),
         )
+        state, raws, error = _run_raw_commands(
+            commands,
+            repo_root=repo_root,
+            timeout=timeout,
+            progress_callback=progress_callback,
+            monotonic=monotonic,
+            wait=wait,
+        )
+        if state is HeadRunState.TIMED_OUT:
+            return GateVerdict(outcome=GateOutcome.TIMED_OUT, scope=scope, reason=error, run_state=state)
+        if state is HeadRunState.CANCELLED:
+            return GateVerdict(outcome=GateOutcome.CANCELLED, scope=scope, reason=error, run_state=state)
+        if not raws:
+            return GateVerdict(
+                outcome=GateOutcome.NO_COVERAGE,
+                scope=scope,
+                reason=f"scoped test run did not complete: {error}",
+                run_state=state,
+            )
 
-    failures = scope_source.parse_results(raw)
-    head_identity = scope_source_identity(scope_source, raw)
+        failures = _sorted_failures([f for raw in raws for f in scope_source.parse_results(raw)], sharded=len(raws) > 1)
+        if exposes_scope_breakdown(scope_source):
+            artifacts = [raw.output_artifact_path for raw in raws if raw.output_artifact_path is not None and raw.output_artifact_path.exists()]
+            record_target_durations(repo_root, artifacts, scope.test_targets)
+    # Every shard runs the same command shape, so the first one speaks for the run.
+    head_identity = scope_source_identity(scope_source, raws[0])
     if (
         baseline is not None
         and baseline.source_identity != UNKNOWN_SOURCE_IDENTITY
@@ -788,6 +1050,7 @@ def evaluate_with_scope(
     monotonic: Callable[[], float] = time.monotonic,
     wait: _ProcessWait = _default_process_wait,
     scope_source: ScopeSource | None = None,
+    shards: int = 1,
 ) -> GateVerdict:
     """The shared verdict tail: run ``scope`` at head, diff vs. ``baseline``.
 
@@ -822,6 +1085,10 @@ def evaluate_with_scope(
     (``tasks_move_task._mt_pre_review_gate_with_override_scope``) — it never
     injects a ``scope_source``, by design, since an override IS the test
     scope.
+
+    ``shards`` (``review.pre_review_shards``) splits the head run across up to
+    that many concurrent worker processes on either path; ``1`` is the
+    incumbent single-process run.
     """
     if scope_source is None:
         if scope.is_empty:
@@ -834,6 +1101,7 @@ def evaluate_with_scope(
             progress_callback=progress_callback,
             monotonic=monotonic,
             wait=wait,
+            shards=shards,
         )
         if run_result.state is HeadRunState.TIMED_OUT:
             return GateVerdict(
@@ -867,6 +1135,7 @@ def evaluate_with_scope(
         monotonic=monotonic,
         wait=wait,
         scope_source=scope_source,
+        shards=shards,
     )
 
 
@@ -943,6 +1212,7 @@ def evaluate_pre_review_gate(
     monotonic: Callable[[], float] = time.monotonic,
     wait: _ProcessWait = _default_process_wait,
     scope_source: ScopeSource,
+    shards: int = 1,
 ) -> GateVerdict:
     """Compose scope derivation + the shared head-run/verdict tail.
 
@@ -969,4 +1239,5 @@ def evaluate_pre_review_gate(
         monotonic=monotonic,
         wait=wait,
         scope_source=scope_source,
+        shards=shards,
     )
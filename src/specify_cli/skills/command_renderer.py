@@ -22,6 +22,7 @@ Three invariants are enforced by this module:
 
 from __future__ import annotations
 
+import functools
 import hashlib
 import re
 from dataclasses import dataclass
@@ -376,6 +377,62 @@ def _build_frontmatter(
     }
 
 
+@functools.lru_cache(maxsize=256)
+def _render_skill_text(
+    raw_text: str,
+    template_path: Path,
+    agent_key: str,
+) -> tuple[str, tuple[tuple[str, Any], ...], str]:
+    """Return ``(name, frontmatter items, body)`` for SPDD-processed template text.
+
+    Memoised on its inputs: installing command skills for several agents, or
+    re-running ``init``/``upgrade``, renders the same templates repeatedly and
+    gets the cached result back.  Errors are raised afresh on every call.
+    """
+    # Strip existing YAML frontmatter (templates carry metadata for the
+    # command-file pipeline that is not relevant to skills rendering).
+    stripped_body = _strip_frontmatter(raw_text)
+
+    # Rewrite the User-Input block.  Raises SkillRenderError on missing block.
+    body = _rewrite_user_input(stripped_body)
+
+    # Guard: no $ARGUMENTS token should survive the rewrite.
+    for lineno, line in enumerate(body.splitlines(), start=1):
+        if "$ARGUMENTS" in line:
+            raise SkillRenderError(
+                "stray_arguments_token",
+                path=str(template_path),
+                line=lineno,
+                excerpt=line,
+            )
+
+    # Derive the skill name from the template path.
+    # New doctrine layout: .../mission-steps/<mission_type>/<step_id>/prompt.md
+    # → step_id is the parent directory name.
+    # Legacy fallback: .../command-templates/<command>.md
+    # → command is the stem.
+    command = template_path.parent.name if template_path.name == "prompt.md" else template_path.stem
+    name = f"spec-kitty.{command}"
+
+    # Build a version of the stripped body with the User-Input section removed
+    # for prose-based description extraction.  This prevents the $ARGUMENTS
+    # code block and its surrounding boilerplate from being selected as the
+    # description text.
+    from specify_cli.skills._user_input_block import identify as _identify_block  # noqa: PLC0415
+
+    desc_body = stripped_body
+    span = _identify_block(stripped_body)
+    if span is not None:
+        start, end = span
+        desc_body = stripped_body[:start] + stripped_body[end:]
+
+    # Pass both the prose-extraction body and the raw text (for frontmatter
+    # description extraction).
+    frontmatter = _build_frontmatter(desc_body, raw_text, name, agent_key)
+
+    return name, tuple(frontmatter.items()), prepend_agent_upgrade_check(body)
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
@@ -442,51 +499,12 @@ def render(
 
     raw_text = apply_spdd_blocks_for_project(raw_text, repo_root)
 
-    # Strip existing YAML frontmatter (templates carry metadata for the
-    # command-file pipeline that is not relevant to skills rendering).
-    stripped_body = _strip_frontmatter(raw_text)
-
-    # Rewrite the User-Input block.  Raises SkillRenderError on missing block.
-    body = _rewrite_user_input(stripped_body)
-
-    # Guard: no $ARGUMENTS token should survive the rewrite.
-    for lineno, line in enumerate(body.splitlines(), start=1):
-        if "$ARGUMENTS" in line:
-            raise SkillRenderError(
-                "stray_arguments_token",
-                path=str(template_path),
-                line=lineno,
-                excerpt=line,
-            )
-
-    # Derive the skill name from the template path.
-    # New doctrine layout: .../mission-steps/<mission_type>/<step_id>/prompt.md
-    # → step_id is the parent directory name.
-    # Legacy fallback: .../command-templates/<command>.md
-    # → command is the stem.
-    command = template_path.parent.name if template_path.name == "prompt.md" else template_path.stem
-    name = f"spec-kitty.{command}"
-
-    # Build a version of the stripped body with the User-Input section removed
-    # for prose-based description extraction.  This prevents the $ARGUMENTS
-    # code block and its surrounding boilerplate from being selected as the
-    # description text.
-    from specify_cli.skills._user_input_block import identify as _identify_block  # noqa: PLC0415
-
-    desc_body = stripped_body
-    span = _identify_block(stripped_body)
-    if span is not None:
-        start, end = span
-        desc_body = stripped_body[:start] + stripped_body[end:]
-
-    # Pass both the prose-extraction body and the raw text (for frontmatter
-    # description extraction).
-    frontmatter = _build_frontmatter(desc_body, raw_text, name, agent_key)
+    name, frontmatter_items, body = _render_skill_text(raw_text, template_path, agent_key)
 
     return RenderedSkill(
         name=name,
-        frontmatter=frontmatter,
-        body=prepend_agent_upgrade_check(body),
+        frontmatter=dict(frontmatter_items),
+        body=body,
         source_template=template_path.resolve(),
         source_hash=source_hash,
         agent_key=agent_key,
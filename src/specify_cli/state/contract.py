@@ -261,6 +261,23 @@ STATE_SURFACES: tuple[StateSurface, ...] = (
             "(#2369). Collapses to the .kittify/derived/ gitignore entry."
         ),
     ),
+    StateSurface(
+        name="derived_repo_status_index",
+        path_pattern=".kittify/derived/index.sqlite",
+        root=StateRoot.PROJECT,
+        format=StateFormat.SQLITE,
+        authority=AuthorityClass.DERIVED,
+        git_class=GitClass.IGNORED,
+        owner_module="status/repo_index",
+        creation_trigger="dashboard mission scan",
+        notes=(
+            "Cross-mission status index (one row per mission and per WP) "
+            "refreshed incrementally from each status.events.jsonl tail; "
+            "deleted and rebuilt whenever it is corrupt or its schema version "
+            "changes. SQLite WAL sidecars live beside it. Collapses to the "
+            ".kittify/derived/ gitignore entry."
+        ),
+    ),
     StateSurface(
         name="migration_state_ledger",
         path_pattern=".kittify/migrations/mission-state/<run_id>.json",
@@ -355,6 +372,23 @@ STATE_SURFACES: tuple[StateSurface, ...] = (
             "exclusion instead; see test_contract_runtime_entries_include_ops_index."
         ),
     ),
+    StateSurface(
+        name="op_invocation_segment",
+        path_pattern="kitty-ops/segments/<first_op_id>-<last_op_id>.jsonl",
+        root=StateRoot.PROJECT,
+        format=StateFormat.JSONL,
+        authority=AuthorityClass.AUTHORITATIVE,
+        git_class=GitClass.TRACKED,
+        owner_module="invocation/trail_store",
+        creation_trigger="spec-kitty invocations compact",
+        notes=(
+            "Closed Op records rolled out of kitty-ops/<op_id>.jsonl; the "
+            "first line is a header indexing every invocation in the segment "
+            "(profile, action, status, completion, byte span), followed by the "
+            "original event lines verbatim. Committed like the loose records "
+            "it replaces."
+        ),
+    ),
     StateSurface(
         name="op_invocation_index",
         path_pattern="kitty-ops/ops-index.jsonl",
@@ -143,10 +143,12 @@ from .wp_view import (
     reconstruct_wp_view,
 )
 from .wp_metadata import (
+    MissionWPMetadata,
     WPMetadata,
     _Builder,
     read_authored_wp_frontmatter,
     read_authored_wp_frontmatter_lenient,
+    read_mission_wp_metadata,
     read_wp_frontmatter,
 )
 from .wp_status_metadata import (
@@ -178,6 +180,15 @@ from .progress import (
     compute_weighted_progress,
     generate_progress_json,
 )
+from .repo_index import (
+    INDEX_FILENAME,
+    IndexedMission,
+    IndexedWorkPackage,
+    RepoStatusIndex,
+    refresh_repo_status_index,
+    repo_status_index_key,
+    repo_status_index_path,
+)
 from .adapters import (
     fire_dossier_sync,
     fire_resolved_binding_fanout,
@@ -437,6 +448,13 @@ __all__ = [
     "PROGRESS_SEMANTICS",
     "compute_done_percentage",
     "compute_weighted_progress",
+    "INDEX_FILENAME",
+    "IndexedMission",
+    "IndexedWorkPackage",
+    "RepoStatusIndex",
+    "refresh_repo_status_index",
+    "repo_status_index_key",
+    "repo_status_index_path",
     "derive_mission_lifecycle",
     "generate_lifecycle_json",
     "generate_progress_json",
@@ -465,6 +483,7 @@ __all__ = [
     "WORKTREES_DIRNAME",
     "RegisteredWorktreePaths",
     "WorkspaceHuskRegistrationError",
+    "MissionWPMetadata",
     "WPMetadata",
     "_Builder",
     "BootstrapResult",
@@ -509,6 +528,7 @@ __all__ = [
     "read_events",
     "read_events_from_text",
     "read_events_raw",
+    "read_mission_wp_metadata",
     "read_wp_frontmatter",
     "reduce",
     "resolve_lane_alias",
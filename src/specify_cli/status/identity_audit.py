@@ -265,7 +265,11 @@ def summarize(states: list[IdentityState]) -> dict[str, object]:
 # ---------------------------------------------------------------------------
 
 
-def find_duplicate_prefixes(repo_root: Path) -> dict[str, list[IdentityState]]:
+def find_duplicate_prefixes(
+    repo_root: Path,
+    *,
+    states: list[IdentityState] | None = None,
+) -> dict[str, list[IdentityState]]:
     """Report every 3-digit numeric prefix shared by ≥ 2 mission directories.
 
     Walks ``kitty-specs/`` and groups directories by their leading ``NNN-``
@@ -277,13 +281,23 @@ def find_duplicate_prefixes(repo_root: Path) -> dict[str, list[IdentityState]]:
 
     Args:
         repo_root: Path to the repository root.
+        states: Output of :func:`audit_repo` for the same *repo_root*.  When
+            given, the prefixes are grouped from these states instead of
+            walking ``kitty-specs/`` and re-reading every ``meta.json``.
 
     Returns:
         ``{"NNN": [<IdentityState>, ...]}`` for every duplicated prefix.
         Empty dict when no duplicates exist.
     """
-    specs_dir = repo_root / KITTY_SPECS_DIR
     groups: dict[str, list[IdentityState]] = {}
+    if states is not None:
+        for state in states:
+            m = _PREFIX_RE.match(state.slug)
+            if m:
+                groups.setdefault(m.group(1), []).append(state)
+        return {prefix: items for prefix, items in groups.items() if len(items) >= 2}
+
+    specs_dir = repo_root / KITTY_SPECS_DIR
     try:
         if not safe_is_dir(specs_dir):
             return {}
@@ -4,20 +4,89 @@ Serializes access to feature-level status artifacts that are written on the
 planning checkout (`status.events.jsonl`, `status.json`, and `tasks.md`).
 Parallel agents may run from separate worktrees, but they still converge on
 the same planning repo paths, so these writes need an inter-process lock.
+
+Only writers take it: readers of ``status.events.jsonl`` use the lock-free
+snapshot read in :mod:`specify_cli.status.store`. Wait and hold times of every
+acquisition are recorded per lock file (:func:`feature_status_lock_metrics`)
+so contention between concurrent agents is measurable.
 """
 
 from __future__ import annotations
 
+import logging
 import subprocess
 import threading
+import time
 from contextlib import contextmanager
+from dataclasses import dataclass, replace
 from pathlib import Path
 from collections.abc import Iterator
 
 from filelock import FileLock, Timeout
 
+from kernel.tracing import span
+
+logger = logging.getLogger(__name__)
+
 _thread_state = threading.local()
 
+# Resolved git common dirs keyed by the repo root they were probed from. Only
+# successful probes are cached; the ``.git`` fallback is re-probed next time.
+_common_dir_cache: dict[Path, Path] = {}
+_common_dir_cache_lock = threading.Lock()
+
+# A wait shorter than this is an uncontended acquisition (filelock's own
+# polling granularity is 50 ms, so anything below it never actually waited).
+_CONTENDED_WAIT_S = 0.005
+
+
+@dataclass(frozen=True)
+class FeatureLockMetrics:
+    """Cumulative wait/hold timings for one lock file in this process.
+
+    Re-entrant acquisitions are not counted: only the outermost acquisition
+    touches the file lock, so only it can wait or hold.
+    """
+
+    acquisitions: int = 0
+    contended: int = 0
+    total_wait_s: float = 0.0
+    max_wait_s: float = 0.0
+    total_hold_s: float = 0.0
+    max_hold_s: float = 0.0
+
+
+_lock_metrics: dict[str, FeatureLockMetrics] = {}
+_lock_metrics_lock = threading.Lock()
+
+
+def _record_lock_timing(lock_key: str, wait_s: float, hold_s: float) -> None:
+    """Fold one outermost acquisition into the metrics for ``lock_key``."""
+    with _lock_metrics_lock:
+        current = _lock_metrics.get(lock_key, FeatureLockMetrics())
+        _lock_metrics[lock_key] = replace(
+            current,
+            acquisitions=current.acquisitions + 1,
+            contended=current.contended + (1 if wait_s >= _CONTENDED_WAIT_S else 0),
+            total_wait_s=current.total_wait_s + wait_s,
+            max_wait_s=max(current.max_wait_s, wait_s),
+            total_hold_s=current.total_hold_s + hold_s,
+            max_hold_s=max(current.max_hold_s, hold_s),
+        )
+    logger.debug("status lock %s waited %.3fs, held %.3fs", lock_key, wait_s, hold_s)
+
+
+def feature_status_lock_metrics() -> dict[str, FeatureLockMetrics]:
+    """Return a snapshot of the wait/hold metrics keyed by lock file path."""
+    with _lock_metrics_lock:
+        return dict(_lock_metrics)
+
+
+def reset_feature_status_lock_metrics() -> None:
+    """Forget every recorded lock timing (test and benchmark helper)."""
+    with _lock_metrics_lock:
+        _lock_metrics.clear()
+
 
 class FeatureStatusLockTimeoutError(RuntimeError):
     """Raised when the feature status lock cannot be acquired."""
@@ -33,7 +102,17 @@ def _get_thread_locks() -> dict[str, tuple[FileLock, int]]:
 
 
 def _git_common_dir(repo_root: Path) -> Path:
-    """Resolve the git common dir shared by the repo and its worktrees."""
+    """Resolve the git common dir shared by the repo and its worktrees.
+
+    The probe forks ``git rev-parse``, so a successful answer is cached per
+    repo root for the life of the process; every acquisition after the first
+    resolves the lock path without a subprocess.
+    """
+    with _common_dir_cache_lock:
+        cached = _common_dir_cache.get(repo_root)
+    if cached is not None:
+        return cached
+
     result = subprocess.run(
         ["git", "rev-parse", "--git-common-dir"],
         cwd=repo_root,
@@ -53,6 +132,8 @@ def _git_common_dir(repo_root: Path) -> Path:
     resolved = Path(common_dir)
     if not resolved.is_absolute():
         resolved = (repo_root / resolved).resolve()
+    with _common_dir_cache_lock:
+        _common_dir_cache[repo_root] = resolved
     return resolved
 
 
@@ -92,12 +173,15 @@ def feature_status_lock(
         return
 
     lock = FileLock(str(lock_path), timeout=timeout)
+    wait_started = time.perf_counter()
     try:
-        lock.acquire()
+        with span("status.lock.wait", mission=mission_slug):
+            lock.acquire()
     except Timeout as exc:
         raise FeatureStatusLockTimeoutError(
             f"Timed out acquiring feature status lock for {mission_slug}: {lock_path}"
         ) from exc
+    acquired = time.perf_counter()
 
     held_locks[lock_key] = (lock, 1)
     try:
@@ -105,3 +189,45 @@ def feature_status_lock(
     finally:
         del held_locks[lock_key]
         lock.release()
+        _record_lock_timing(lock_key, acquired - wait_started, time.perf_counter() - acquired)
+
+
+def feature_status_lock_depth(lock_path: Path) -> int:
+    """Return how many times this thread currently holds the lock at ``lock_path``.
+
+    ``0`` means not held. A transaction that may release the lock early (group
+    commit) checks for ``1`` so it never drops a lock an outer caller still
+    relies on.
+    """
+    held = _get_thread_locks().get(str(lock_path))
+    return held[1] if held is not None else 0
+
+
+@contextmanager
+def feature_commit_lock(
+    status_lock_path: Path,
+    *,
+    timeout: float = -1,
+) -> Iterator[Path]:
+    """Acquire the per-feature group-commit lock beside ``status_lock_path``.
+
+    Held by whichever bookkeeping transaction is committing on behalf of the
+    group. It is always taken *without* the status lock held (the committer
+    re-acquires the status lock inside it), so the two never deadlock.
+    """
+    lock_path = status_lock_path.with_name(status_lock_path.name.replace(".status.lock", ".commit.lock"))
+    lock = FileLock(str(lock_path), timeout=timeout)
+    wait_started = time.perf_counter()
+    try:
+        with span("status.commit_lock.wait", lock=lock_path.name):
+            lock.acquire()
+    except Timeout as exc:
+        raise FeatureStatusLockTimeoutError(
+            f"Timed out acquiring feature commit lock: {lock_path}"
+        ) from exc
+    acquired = time.perf_counter()
+    try:
+        yield lock_path
+    finally:
+        lock.release()
+        _record_lock_timing(str(lock_path), acquired - wait_started, time.perf_counter() - acquired)
@@ -18,6 +18,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Literal, cast
 
+from kernel.tracing import traced
 from specify_cli.core.paths import safe_mission_slug
 from specify_cli.mission_metadata import resolve_mission_identity
 
@@ -385,6 +386,7 @@ def _should_apply_event(
     return True
 
 
+@traced("status.reduce")
 def reduce(
     events: list[StatusEvent],
     annotations: list[InnerStateChanged] | None = None,
@@ -787,6 +789,7 @@ def materialize_snapshot(feature_dir: Path) -> StatusSnapshot:
     return snapshot
 
 
+@traced("status.materialize")
 def materialize(feature_dir: Path) -> StatusSnapshot:
     """Read events, reduce to snapshot, and write status.json atomically.
 
@@ -0,0 +1,534 @@
+"""Repo-level status index: one SQLite row per mission and per WP.
+
+Repo-wide views (the dashboard mission list, doctor/sync summaries) used to
+rediscover every mission by reading and reducing each ``status.events.jsonl``
+in full on every request. This module keeps a derived, regenerable index at
+``.kittify/derived/index.sqlite`` holding, per mission, the reduced lane of
+every WP, the display-lane counts, the weighted progress, the last event id,
+and the byte offset the log was consumed up to.
+
+Refresh is incremental:
+
+* A log whose ``(size, mtime_ns, inode)`` is unchanged is not opened.
+* A log that only grew is read from the recorded offset. The bytes just
+  before that offset are re-hashed and compared first, so a log rewritten in
+  place (dup-key repair, a merge driver) is never mistaken for an append.
+* The tail is folded onto the indexed state only when every new transition
+  sorts strictly after the last indexed one. That is the normal append
+  case, and there the reducer's ``(at, event_id)`` order and its rollback
+  precedence give the same result as a full replay. Any other tail
+  (back-dated or same-instant events, an ``event_id`` already indexed)
+  triggers a full reduce of that mission.
+
+The index is never authoritative. A missing, corrupt, or version-mismatched
+database is deleted and rebuilt from the event logs. A mission whose log is
+absent or unreadable simply has no row, so callers fall back to their
+uncached read and surface the same error they always did.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import logging
+import sqlite3
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import TracebackType
+from typing import Any
+
+from .models import NON_DISPLAY_LANES, Lane, StatusSnapshot
+from .progress import compute_weighted_progress
+from .reducer import reduce
+from .store import EVENTS_FILENAME, StoreError, read_event_stream_from_text
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILENAME = "index.sqlite"
+
+# Bump when the meaning of an indexed row changes; a mismatched database is
+# dropped and rebuilt from the event logs.
+INDEX_SCHEMA_VERSION = 1
+
+# Bytes immediately before the consumed offset that must be unchanged for a
+# grown log to be treated as an append.
+_ANCHOR_BYTES = 4096
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS index_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS missions (
+    feature_dir TEXT PRIMARY KEY,
+    mission_slug TEXT NOT NULL,
+    event_count INTEGER NOT NULL,
+    last_event_id TEXT,
+    last_event_at TEXT NOT NULL,
+    wp_total INTEGER NOT NULL,
+    summary_json TEXT NOT NULL,
+    weighted_percentage REAL NOT NULL,
+    log_size INTEGER NOT NULL,
+    log_mtime_ns INTEGER NOT NULL,
+    log_inode INTEGER NOT NULL,
+    log_offset INTEGER NOT NULL,
+    anchor_digest TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS work_packages (
+    feature_dir TEXT NOT NULL,
+    wp_id TEXT NOT NULL,
+    lane TEXT NOT NULL,
+    last_event_id TEXT,
+    last_transition_at TEXT,
+    PRIMARY KEY (feature_dir, wp_id)
+);
+CREATE INDEX IF NOT EXISTS work_packages_by_lane ON work_packages (lane);
+CREATE TABLE IF NOT EXISTS transition_ids (
+    feature_dir TEXT NOT NULL,
+    event_id TEXT NOT NULL,
+    PRIMARY KEY (feature_dir, event_id)
+) WITHOUT ROWID;
+"""
+
+
+def repo_status_index_path(repo_root: Path) -> Path:
+    """Return ``<repo_root>/.kittify/derived/index.sqlite``."""
+    return repo_root / ".kittify" / "derived" / INDEX_FILENAME
+
+
+def repo_status_index_key(repo_root: Path, feature_dir: Path) -> str:
+    """Return the index key of *feature_dir*: its repo-relative POSIX path."""
+    resolved = feature_dir.resolve()
+    try:
+        return resolved.relative_to(repo_root.resolve()).as_posix()
+    except ValueError:
+        return resolved.as_posix()
+
+
+@dataclass(frozen=True)
+class IndexedWorkPackage:
+    """The reduced lane state of one WP as recorded in the index."""
+
+    wp_id: str
+    lane: str
+    last_event_id: str | None
+    last_transition_at: str | None
+
+
+@dataclass(frozen=True)
+class IndexedMission:
+    """One mission's indexed status, equal to reducing its full event log."""
+
+    feature_dir: str
+    mission_slug: str
+    event_count: int
+    last_event_id: str | None
+    last_event_at: str
+    log_offset: int
+    summary: dict[str, int]
+    weighted_percentage: float
+    work_packages: dict[str, IndexedWorkPackage] = field(default_factory=dict)
+
+    @property
+    def wp_lanes(self) -> dict[str, Lane]:
+        """``{wp_id: Lane}`` for every indexed WP (annotation-only WPs included)."""
+        return {wp_id: Lane(wp.lane) for wp_id, wp in self.work_packages.items()}
+
+
+@dataclass(frozen=True)
+class _LogSignature:
+    size: int
+    mtime_ns: int
+    inode: int
+
+    @classmethod
+    def of(cls, path: Path) -> _LogSignature | None:
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        return cls(size=st.st_size, mtime_ns=st.st_mtime_ns, inode=st.st_ino)
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()  # noqa: TID251 - append-anchor fingerprint, not a content hash
+
+
+def _consumed_offset(data: bytes, base: int) -> int:
+    """Offset just past the last complete line of ``data`` (read from ``base``).
+
+    A trailing partial line (a writer mid-append) is parsed like every other
+    reader does, but is not counted as consumed. If it is re-read later, its
+    timestamp is no longer strictly newer, so the mission falls back to a
+    full reduce rather than double-applying it.
+    """
+    if data.endswith(b"\n"):
+        return base + len(data)
+    return base + data.rfind(b"\n") + 1
+
+
+def _display_summary(work_packages: dict[str, IndexedWorkPackage]) -> dict[str, int]:
+    summary = {lane.value: 0 for lane in Lane if lane not in NON_DISPLAY_LANES}
+    for wp in work_packages.values():
+        if wp.lane in summary:
+            summary[wp.lane] += 1
+    return summary
+
+
+def _weighted_percentage(mission_slug: str, work_packages: dict[str, IndexedWorkPackage]) -> float:
+    snapshot = StatusSnapshot(
+        mission_slug=mission_slug,
+        materialized_at="",
+        event_count=0,
+        last_event_id=None,
+        work_packages={wp_id: {"lane": wp.lane} for wp_id, wp in work_packages.items()},
+        summary={},
+    )
+    return float(compute_weighted_progress(snapshot).percentage)
+
+
+def _indexed_wps(snapshot: StatusSnapshot) -> dict[str, IndexedWorkPackage]:
+    return {
+        wp_id: IndexedWorkPackage(
+            wp_id=wp_id,
+            lane=str(state.get("lane", Lane.GENESIS)),
+            last_event_id=state.get("last_event_id"),
+            last_transition_at=state.get("last_transition_at"),
+        )
+        for wp_id, state in snapshot.work_packages.items()
+    }
+
+
+class RepoStatusIndex:
+    """SQLite-backed cross-mission status index for one repository.
+
+    Typical use::
+
+        with RepoStatusIndex.open(repo_root) as index:
+            missions = index.refresh(feature_dirs, prune=True)
+    """
+
+    def __init__(self, repo_root: Path, connection: sqlite3.Connection) -> None:
+        self.repo_root = repo_root
+        self.path = repo_status_index_path(repo_root)
+        self._connection = connection
+
+    @classmethod
+    def open(cls, repo_root: Path) -> RepoStatusIndex:
+        """Open (creating or rebuilding as needed) the index for *repo_root*."""
+        path = repo_status_index_path(repo_root)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            return cls(repo_root, cls._connect(path))
+        except sqlite3.DatabaseError as exc:
+            logger.warning("Rebuilding corrupt status index %s: %s", path, exc)
+            cls._unlink(path)
+            return cls(repo_root, cls._connect(path))
+
+    @staticmethod
+    def _connect(path: Path) -> sqlite3.Connection:
+        connection = sqlite3.connect(path, timeout=5.0)
+        try:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(_SCHEMA)
+            row = connection.execute("SELECT value FROM index_meta WHERE key = 'schema_version'").fetchone()
+            if row is None or row[0] != str(INDEX_SCHEMA_VERSION):
+                with connection:
+                    for table in ("missions", "work_packages", "transition_ids"):
+                        connection.execute(f"DELETE FROM {table}")  # noqa: S608 - fixed table names
+                    connection.execute(
+                        "INSERT OR REPLACE INTO index_meta (key, value) VALUES ('schema_version', ?)",
+                        (str(INDEX_SCHEMA_VERSION),),
+                    )
+        except sqlite3.DatabaseError:
+            connection.close()
+            raise
+        return connection
+
+    @staticmethod
+    def _unlink(path: Path) -> None:
+        for candidate in (path, path.with_name(path.name + "-wal"), path.with_name(path.name + "-shm")):
+            with contextlib.suppress(FileNotFoundError):
+                candidate.unlink()
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def __enter__(self) -> RepoStatusIndex:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    # ------------------------------------------------------------------
+    # Refresh
+    # ------------------------------------------------------------------
+
+    def refresh(self, feature_dirs: Iterable[Path], *, prune: bool = False) -> dict[str, IndexedMission]:
+        """Bring the rows for *feature_dirs* up to date and return them by key.
+
+        Missions without a readable event log are dropped from the index and
+        omitted from the result. With ``prune=True`` every row whose feature
+        dir is not in *feature_dirs* is removed as well.
+
+        A database error mid-refresh deletes the index and rebuilds it from
+        scratch once.
+        """
+        dirs = list(feature_dirs)
+        try:
+            return self._refresh(dirs, prune=prune)
+        except sqlite3.DatabaseError as exc:
+            logger.warning("Rebuilding corrupt status index %s: %s", self.path, exc)
+            self._connection.close()
+            self._unlink(self.path)
+            self._connection = self._connect(self.path)
+            return self._refresh(dirs, prune=prune)
+
+    def _refresh(self, feature_dirs: list[Path], *, prune: bool) -> dict[str, IndexedMission]:
+        current = {mission.feature_dir: mission for mission in self.missions()}
+        stored_rows = {
+            row[0]: row[1:] for row in self._connection.execute("SELECT feature_dir, log_size, log_mtime_ns, log_inode, log_offset, anchor_digest FROM missions")
+        }
+        refreshed: dict[str, IndexedMission] = {}
+        with self._connection:
+            for feature_dir in feature_dirs:
+                key = repo_status_index_key(self.repo_root, feature_dir)
+                mission = self._refresh_one(feature_dir, key, current.get(key), stored_rows.get(key))
+                if mission is not None:
+                    refreshed[key] = mission
+            if prune:
+                for stale in set(current) - set(refreshed):
+                    self._delete(stale)
+        return refreshed
+
+    def _refresh_one(
+        self,
+        feature_dir: Path,
+        key: str,
+        indexed: IndexedMission | None,
+        stored: tuple[Any, ...] | None,
+    ) -> IndexedMission | None:
+        events_path = feature_dir / EVENTS_FILENAME
+        signature = _LogSignature.of(events_path)
+        if signature is None:
+            self._delete(key)
+            return None
+        if indexed is not None and stored is not None and _LogSignature(*stored[:3]) == signature:
+            return indexed
+        try:
+            mission = None
+            if indexed is not None and stored is not None:
+                mission = self._fold_tail(feature_dir, key, indexed, events_path, signature, stored[3], stored[4])
+            if mission is None:
+                mission = self._reduce_full(feature_dir, key, events_path, signature)
+        except (OSError, UnicodeDecodeError, StoreError) as exc:
+            logger.debug("Status index skipping unreadable log %s: %s", events_path, exc)
+            self._delete(key)
+            return None
+        return mission
+
+    def _reduce_full(self, feature_dir: Path, key: str, events_path: Path, signature: _LogSignature) -> IndexedMission:
+        data = events_path.read_bytes()
+        stream = read_event_stream_from_text(feature_dir, data.decode("utf-8"))
+        snapshot = reduce(stream.transitions, stream.annotations)
+        offset = _consumed_offset(data, 0)
+        self._delete(key)
+        mission = self._store(
+            key,
+            mission_slug=snapshot.mission_slug,
+            event_count=snapshot.event_count,
+            last_event_id=snapshot.last_event_id,
+            last_event_at=snapshot.materialized_at,
+            work_packages=_indexed_wps(snapshot),
+            signature=signature,
+            offset=offset,
+            anchor=data[max(0, offset - _ANCHOR_BYTES) : offset],
+        )
+        self._add_transition_ids(key, {event.event_id for event in stream.transitions})
+        return mission
+
+    def _fold_tail(
+        self,
+        feature_dir: Path,
+        key: str,
+        indexed: IndexedMission,
+        events_path: Path,
+        signature: _LogSignature,
+        offset: int,
+        anchor_digest: str,
+    ) -> IndexedMission | None:
+        """Apply only the appended bytes, or return ``None`` to force a full reduce."""
+        if signature.size < offset:
+            return None
+        anchor_start = max(0, offset - _ANCHOR_BYTES)
+        with events_path.open("rb") as handle:
+            handle.seek(anchor_start)
+            data = handle.read()
+        anchor, tail = data[: offset - anchor_start], data[offset - anchor_start :]
+        if _digest(anchor) != anchor_digest:
+            return None
+
+        stream = read_event_stream_from_text(feature_dir, tail.decode("utf-8"))
+        if any(event.at <= indexed.last_event_at for event in stream.transitions):
+            return None
+        tail_ids = {event.event_id for event in stream.transitions}
+        if self._any_indexed(key, tail_ids):
+            return None
+        tail_snapshot = reduce(stream.transitions, stream.annotations)
+
+        work_packages = dict(indexed.work_packages)
+        for wp_id, wp in _indexed_wps(tail_snapshot).items():
+            if wp.last_event_id is not None or wp_id not in work_packages:
+                work_packages[wp_id] = wp
+        new_offset = _consumed_offset(tail, offset)
+        window = data[: new_offset - anchor_start]
+        mission = self._store(
+            key,
+            mission_slug=indexed.mission_slug or tail_snapshot.mission_slug,
+            event_count=indexed.event_count + tail_snapshot.event_count,
+            last_event_id=tail_snapshot.last_event_id or indexed.last_event_id,
+            last_event_at=tail_snapshot.materialized_at or indexed.last_event_at,
+            work_packages=work_packages,
+            signature=signature,
+            offset=new_offset,
+            anchor=window[max(0, len(window) - _ANCHOR_BYTES) :],
+        )
+        self._add_transition_ids(key, tail_ids)
+        return mission
+        return mission
+
+    def _store(
+        self,
+        key: str,
+        *,
+        mission_slug: str,
+        event_count: int,
+        last_event_id: str | None,
+        last_event_at: str,
+        work_packages: dict[str, IndexedWorkPackage],
+        signature: _LogSignature,
+        offset: int,
+        anchor: bytes,
+    ) -> IndexedMission:
+        mission = IndexedMission(
+            feature_dir=key,
+            mission_slug=mission_slug,
+            event_count=event_count,
+            last_event_id=last_event_id,
+            last_event_at=last_event_at,
+            log_offset=offset,
+            summary=_display_summary(work_packages),
+            weighted_percentage=_weighted_percentage(mission_slug, work_packages),
+            work_packages=work_packages,
+        )
+        self._connection.execute("DELETE FROM missions WHERE feature_dir = ?", (key,))
+        self._connection.execute("DELETE FROM work_packages WHERE feature_dir = ?", (key,))
+        self._connection.execute(
+            "INSERT INTO missions (feature_dir, mission_slug, event_count, last_event_id, last_event_at, wp_total, "
+            "summary_json, weighted_percentage, log_size, log_mtime_ns, log_inode, log_offset, anchor_digest) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                key,
+                mission.mission_slug,
+                mission.event_count,
+                mission.last_event_id,
+                mission.last_event_at,
+                len(work_packages),
+                json.dumps(mission.summary, sort_keys=True),
+                mission.weighted_percentage,
+                signature.size,
+                signature.mtime_ns,
+                signature.inode,
+                offset,
+                _digest(anchor),
+            ),
+        )
+        self._connection.executemany(
+            "INSERT INTO work_packages (feature_dir, wp_id, lane, last_event_id, last_transition_at) VALUES (?, ?, ?, ?, ?)",
+            [(key, wp.wp_id, wp.lane, wp.last_event_id, wp.last_transition_at) for wp in work_packages.values()],
+        )
+        return mission
+
+    def _any_indexed(self, key: str, event_ids: set[str]) -> bool:
+        return any(
+            self._connection.execute(
+                "SELECT 1 FROM transition_ids WHERE feature_dir = ? AND event_id = ?",
+                (key, event_id),
+            ).fetchone()
+            for event_id in event_ids
+        )
+
+    def _add_transition_ids(self, key: str, event_ids: set[str]) -> None:
+        self._connection.executemany(
+            "INSERT OR IGNORE INTO transition_ids (feature_dir, event_id) VALUES (?, ?)",
+            [(key, event_id) for event_id in event_ids],
+        )
+
+    def _delete(self, key: str) -> None:
+        for table in ("missions", "work_packages", "transition_ids"):
+            self._connection.execute(f"DELETE FROM {table} WHERE feature_dir = ?", (key,))  # noqa: S608 - fixed table names
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def missions(self) -> list[IndexedMission]:
+        """Every indexed mission with its WP lanes, ordered by feature dir."""
+        wps_by_mission: dict[str, dict[str, IndexedWorkPackage]] = {}
+        for feature_dir, wp_id, lane, last_event_id, last_transition_at in self._connection.execute(
+            "SELECT feature_dir, wp_id, lane, last_event_id, last_transition_at FROM work_packages ORDER BY feature_dir, wp_id"
+        ):
+            wps_by_mission.setdefault(feature_dir, {})[wp_id] = IndexedWorkPackage(wp_id, lane, last_event_id, last_transition_at)
+        return [
+            IndexedMission(
+                feature_dir=row[0],
+                mission_slug=row[1],
+                event_count=row[2],
+                last_event_id=row[3],
+                last_event_at=row[4],
+                summary=json.loads(row[5]),
+                weighted_percentage=row[6],
+                log_offset=row[7],
+                work_packages=wps_by_mission.get(row[0], {}),
+            )
+            for row in self._connection.execute(
+                "SELECT feature_dir, mission_slug, event_count, last_event_id, last_event_at, summary_json, "
+                "weighted_percentage, log_offset FROM missions ORDER BY feature_dir"
+            )
+        ]
+
+    def lane_totals(self) -> dict[str, int]:
+        """Repo-wide ``{lane: wp_count}`` across every indexed mission."""
+        return dict(self._connection.execute("SELECT lane, COUNT(*) FROM work_packages GROUP BY lane ORDER BY lane"))
+
+
+def refresh_repo_status_index(repo_root: Path, feature_dirs: Iterable[Path], *, prune: bool = False) -> dict[str, IndexedMission] | None:
+    """Open, refresh, and close the repo index; ``None`` when it is unusable.
+
+    For best-effort callers that fall back to reducing event logs directly:
+    any filesystem or SQLite failure is logged and reported as ``None``.
+    """
+    try:
+        with RepoStatusIndex.open(repo_root) as index:
+            return index.refresh(feature_dirs, prune=prune)
+    except (OSError, sqlite3.Error) as exc:
+        logger.debug("Repo status index unavailable under %s: %s", repo_root, exc)
+        return None
+
+
+__all__ = [
+    "INDEX_FILENAME",
+    "IndexedMission",
+    "IndexedWorkPackage",
+    "RepoStatusIndex",
+    "refresh_repo_status_index",
+    "repo_status_index_key",
+    "repo_status_index_path",
+]
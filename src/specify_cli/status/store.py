@@ -22,10 +22,12 @@ import logging
 import os
 import re
 import tempfile
+import time
 from collections.abc import Mapping
 from pathlib import Path
 from typing import Any
 
+from kernel.tracing import span, traced
 from specify_cli.core.constants import KITTY_SPECS_DIR
 from specify_cli.core.paths import (
     MissionMetaReadError,
@@ -47,6 +49,11 @@ logger = logging.getLogger(__name__)
 
 EVENTS_FILENAME = "status.events.jsonl"
 
+# Lock-free snapshot reads retry this many times when the log changes under
+# them (or ends in a torn line), backing off from the base delay.
+_SNAPSHOT_READ_ATTEMPTS = 5
+_SNAPSHOT_RETRY_DELAY_S = 0.005
+
 # Regex patterns for identity classification (T024)
 _ULID_PATTERN = re.compile(r"^[0-9A-HJKMNP-TV-Z]{26}$")
 _MISSION_SLUG_PATTERN = re.compile(r"^\d{3}-[a-z0-9-]+$")
@@ -366,35 +373,36 @@ def _append_serialized_atomic(feature_dir: Path, rows: list[dict[str, Any]]) ->
     if not rows:
         return
 
-    path = _events_path(feature_dir)
-    path.parent.mkdir(parents=True, exist_ok=True)
+    with span("status.store.append", mission=feature_dir.name, rows=len(rows)):
+        path = _events_path(feature_dir)
+        path.parent.mkdir(parents=True, exist_ok=True)
 
-    existing = _read_text_without_following_symlinks(path)
-    if existing and not existing.endswith("\n"):
-        existing += "\n"
+        existing = _read_text_without_following_symlinks(path)
+        if existing and not existing.endswith("\n"):
+            existing += "\n"
 
-    additions = "".join(
-        json.dumps(sanitize_event_for_log(row), sort_keys=True) + "\n" for row in rows
-    )
-    fd, raw_tmp_path = tempfile.mkstemp(
-        prefix=f".{path.name}.",
-        suffix=".tmp",
-        dir=path.parent,
-    )
-    tmp_path = Path(raw_tmp_path)
-    replaced = False
-    try:
-        with os.fdopen(fd, "w", encoding="utf-8") as fh:
-            fh.write(existing)
-            fh.write(additions)
-            fh.flush()
-            os.fsync(fh.fileno())
-        os.replace(tmp_path, path)
-        replaced = True
-        _fsync_directory(path.parent)
-    finally:
-        if not replaced:
-            tmp_path.unlink(missing_ok=True)
+        additions = "".join(
+            json.dumps(sanitize_event_for_log(row), sort_keys=True) + "\n" for row in rows
+        )
+        fd, raw_tmp_path = tempfile.mkstemp(
+            prefix=f".{path.name}.",
+            suffix=".tmp",
+            dir=path.parent,
+        )
+        tmp_path = Path(raw_tmp_path)
+        replaced = False
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                fh.write(existing)
+                fh.write(additions)
+                fh.flush()
+                os.fsync(fh.fileno())
+            os.replace(tmp_path, path)
+            replaced = True
+            _fsync_directory(path.parent)
+        finally:
+            if not replaced:
+                tmp_path.unlink(missing_ok=True)
 
 
 def _fsync_directory(directory: Path) -> None:
@@ -428,6 +436,68 @@ def _read_text_without_following_symlinks(path: Path) -> str:
         return fh.read()
 
 
+def _file_generation(stat: os.stat_result) -> tuple[int, int, int, int]:
+    """Identify one version of a file: a replace changes the inode, an append the size."""
+    return (stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+
+def _has_torn_tail(data: bytes) -> bool:
+    """Return True when ``data`` ends mid-line, i.e. an append is still landing.
+
+    A final line without its newline is accepted when it already parses as
+    JSON (hand-edited logs often lack the trailing newline), so only a
+    genuinely partial record triggers a re-read.
+    """
+    if not data or data.endswith(b"\n"):
+        return False
+    last_line = data.rsplit(b"\n", 1)[-1].strip()
+    if not last_line:
+        return False
+    try:
+        json.loads(last_line)
+    except ValueError:
+        return True
+    return False
+
+
+@traced("status.store.read")
+def _read_events_snapshot(path: Path) -> str | None:
+    """Read a consistent snapshot of the event log without the status lock.
+
+    Writers either ``os.replace`` a complete file or append whole lines, so a
+    reader only needs to detect that the file changed while it was being read:
+    the generation (device, inode, size, mtime) is taken from the open
+    descriptor before reading and from the path afterwards, and the read is
+    retried when they differ, when fewer bytes than the size arrived, or when
+    the text ends in a torn line. After the last attempt the final read is
+    returned as-is and the parser reports any damage with its line number.
+
+    Returns ``None`` when the file does not exist.
+    """
+    data = b""
+    for attempt in range(_SNAPSHOT_READ_ATTEMPTS):
+        try:
+            with path.open("rb") as fh:
+                before = os.fstat(fh.fileno())
+                data = fh.read()
+        except FileNotFoundError:
+            return None
+        try:
+            after = os.stat(path)
+        except FileNotFoundError:
+            after = None
+        stable = (
+            after is not None
+            and _file_generation(before) == _file_generation(after)
+            and len(data) == before.st_size
+        )
+        if stable and not _has_torn_tail(data):
+            break
+        if attempt + 1 < _SNAPSHOT_READ_ATTEMPTS:
+            time.sleep(_SNAPSHOT_RETRY_DELAY_S * (attempt + 1))
+    return data.decode("utf-8")
+
+
 def append_events_atomic(feature_dir: Path, events: list[StatusEvent]) -> None:
     """Atomically persist a batch of StatusEvents as JSONL lines.
 
@@ -538,25 +608,24 @@ def read_events_raw(feature_dir: Path) -> list[dict[str, Any]]:
     Raises :class:`StoreError` on invalid JSON, including the 1-based
     line number in the message.
     """
-    path = _events_path(feature_dir)
-    if not path.exists():
+    content = _read_events_snapshot(_events_path(feature_dir))
+    if content is None:
         return []
 
     results: list[dict[str, Any]] = []
-    with path.open("r", encoding="utf-8") as fh:
-        for line_number, raw_line in enumerate(fh, start=1):
-            stripped = raw_line.strip()
-            if not stripped:
-                continue
-            try:
-                obj = json.loads(stripped)
-            except json.JSONDecodeError as exc:
-                raise StoreError(f"Invalid JSON on line {line_number}: {exc}") from exc
-            if not isinstance(obj, dict):
-                raise StoreError(
-                    f"Invalid event structure on line {line_number}: expected JSON object"
-                )
-            results.append(obj)
+    for line_number, raw_line in enumerate(content.splitlines(), start=1):
+        stripped = raw_line.strip()
+        if not stripped:
+            continue
+        try:
+            obj = json.loads(stripped)
+        except json.JSONDecodeError as exc:
+            raise StoreError(f"Invalid JSON on line {line_number}: {exc}") from exc
+        if not isinstance(obj, dict):
+            raise StoreError(
+                f"Invalid event structure on line {line_number}: expected JSON object"
+            )
+        results.append(obj)
     return results
 
 
@@ -621,6 +690,7 @@ def is_non_lane_event(obj: dict[str, Any]) -> bool:
     return "event_type" in obj
 
 
+@traced("status.store.parse")
 def _partition_event_stream_from_text(feature_dir: Path, content: str) -> EventStream:
     """Deserialize JSONL text into an :class:`EventStream`.
 
@@ -727,16 +797,20 @@ def read_events(feature_dir: Path) -> list[StatusEvent]:
     ``mission_id`` is resolved from the corresponding ``meta.json`` via
     the slug resolver (cached per call).
 
+    Never takes the feature status lock: the file is read as a validated
+    snapshot (see :func:`_read_events_snapshot`), so readers do not contend
+    with writers.
+
     Returns an empty list when the file does not exist.
     Blank lines are silently skipped.
     Raises :class:`StoreError` on invalid JSON **or** invalid event
     structure, including the 1-based line number in the message.
     """
-    path = _events_path(feature_dir)
-    if not path.exists():
+    content = _read_events_snapshot(_events_path(feature_dir))
+    if content is None:
         return []
 
-    return read_events_from_text(feature_dir, path.read_text(encoding="utf-8"))
+    return read_events_from_text(feature_dir, content)
 
 
 def read_event_stream(feature_dir: Path) -> EventStream:
@@ -747,8 +821,8 @@ def read_event_stream(feature_dir: Path) -> EventStream:
     changing the on-disk file. Returns an empty stream when the file does not
     exist.
     """
-    path = _events_path(feature_dir)
-    if not path.exists():
+    content = _read_events_snapshot(_events_path(feature_dir))
+    if content is None:
         return EventStream(transitions=[], annotations=[])
 
-    return read_event_stream_from_text(feature_dir, path.read_text(encoding="utf-8"))
+    return read_event_stream_from_text(feature_dir, content)
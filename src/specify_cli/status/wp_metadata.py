@@ -1,9 +1,10 @@
 """Typed Pydantic v2 model for WP frontmatter metadata.
 
 Provides :class:`WPMetadata` — a frozen, validated value object for every
-field observed in ``kitty-specs/*/tasks/WP*.md`` frontmatter — and a
-convenience loader :func:`read_wp_frontmatter` that wraps
-:class:`~specify_cli.frontmatter.FrontmatterManager`.
+field observed in ``kitty-specs/*/tasks/WP*.md`` frontmatter — a
+convenience loader :func:`read_wp_frontmatter` that wraps the read-only
+:func:`~specify_cli.frontmatter.read_frontmatter_readonly`, and its bulk form
+:func:`read_mission_wp_metadata` for callers that read every WP of a mission.
 
 Uses ``extra="forbid"`` to reject unrecognised fields at parse time.
 If a new frontmatter key appears in the wild, add it to the model
@@ -14,13 +15,18 @@ from __future__ import annotations
 
 import logging
 import re
+from collections.abc import Mapping
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, ClassVar
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 from specify_cli.status.models import NON_DISPLAY_LANES, AgentAssignment, Lane
 
+if TYPE_CHECKING:
+    from specify_cli.status.models import StatusSnapshot
+
 logger = logging.getLogger(__name__)
 
 
@@ -619,13 +625,17 @@ def _resolve_runtime_fields_from_snapshot(path: Path, metadata: WPMetadata) -> W
 
     from specify_cli.status.reducer import wp_snapshot_state  # noqa: PLC0415
 
-    wp_state = wp_snapshot_state(feature_dir, metadata.work_package_id) or {}
+    return _apply_runtime_state(metadata, wp_snapshot_state(feature_dir, metadata.work_package_id))
+
 
+def _apply_runtime_state(metadata: WPMetadata, wp_state: Mapping[str, Any] | None) -> WPMetadata:
+    """Overwrite the four runtime fields from one reduced WP entry (``None`` = absent)."""
+    state = wp_state or {}
     return metadata.update(
-        shell_pid=wp_state.get("shell_pid"),
-        shell_pid_created_at=wp_state.get("shell_pid_created_at"),
-        agent=wp_state.get("agent"),
-        assignee=wp_state.get("assignee"),
+        shell_pid=state.get("shell_pid"),
+        shell_pid_created_at=state.get("shell_pid_created_at"),
+        agent=state.get("agent"),
+        assignee=state.get("assignee"),
     )
 
 
@@ -637,9 +647,9 @@ def read_authored_wp_frontmatter(path: Path) -> tuple[WPMetadata, str]:
     mode. Runtime consumers should use :func:`read_wp_frontmatter` or the
     reconstructed WP view as appropriate.
     """
-    from specify_cli.frontmatter import FrontmatterManager
+    from specify_cli.frontmatter import read_frontmatter_readonly
 
-    frontmatter_dict, body = FrontmatterManager().read(path)
+    frontmatter_dict, body = read_frontmatter_readonly(path)
     return WPMetadata.model_validate(frontmatter_dict, strict=False), body
 
 
@@ -664,9 +674,9 @@ def read_authored_wp_frontmatter_lenient(path: Path) -> tuple[WPMetadata, str]:
 
     FR-011 of the first-sync preflight mission (#3406).
     """
-    from specify_cli.frontmatter import FrontmatterManager
+    from specify_cli.frontmatter import read_frontmatter_readonly
 
-    frontmatter_dict, body = FrontmatterManager().read(path)
+    frontmatter_dict, body = read_frontmatter_readonly(path)
     if isinstance(frontmatter_dict, dict):
         known = set(WPMetadata.model_fields)
         dropped = sorted(key for key in frontmatter_dict if key not in known)
@@ -708,9 +718,82 @@ def read_wp_frontmatter(path: Path) -> tuple[WPMetadata, str]:
     return metadata, body
 
 
+@dataclass(frozen=True)
+class MissionWPMetadata:
+    """Every WP of one mission, read by :func:`read_mission_wp_metadata`.
+
+    ``work_packages`` holds ``(path, metadata, body)`` in file-name order with
+    the runtime fields already re-pointed exactly as
+    :func:`read_wp_frontmatter` would; ``snapshot`` is the reduced event log
+    they were joined against, for callers that need more runtime state than
+    the four re-pointed fields. ``unreadable`` lists the files skipped with
+    ``strict=False`` together with the error each raised.
+    """
+
+    work_packages: tuple[tuple[Path, WPMetadata, str], ...]
+    snapshot: StatusSnapshot
+    unreadable: tuple[tuple[Path, Exception], ...] = ()
+
+
+def read_mission_wp_metadata(
+    feature_dir: Path,
+    *,
+    event_log_dir: Path | None = None,
+    strict: bool = True,
+) -> MissionWPMetadata:
+    """Read every ``tasks/WP*.md`` of a mission against ONE reduction of its log.
+
+    Looping :func:`read_wp_frontmatter` over a mission reads and reduces
+    ``status.events.jsonl`` once per WP; this reads it once, parses each WP's
+    frontmatter once, and joins the two. Per WP the result is identical to
+    :func:`read_wp_frontmatter`.
+
+    Args:
+        feature_dir: Mission directory whose ``tasks/`` holds the WP files.
+        event_log_dir: Directory carrying the event log when it is not
+            *feature_dir* (the coordination status surface); defaults to
+            *feature_dir*, the directory :func:`read_wp_frontmatter` uses.
+        strict: Re-raise the first frontmatter failure (the
+            :func:`read_wp_frontmatter` contract). ``False`` records failing
+            files in ``unreadable`` and keeps going, for tolerant renderers.
+
+    Raises:
+        StoreError: When the event log is corrupt, regardless of *strict*.
+        FrontmatterError: On I/O or YAML parse failures (``strict`` only).
+        ValidationError: If frontmatter fails validation (``strict`` only).
+    """
+    from specify_cli.status.reducer import reduce  # noqa: PLC0415
+    from specify_cli.status.store import read_event_stream  # noqa: PLC0415
+
+    stream = read_event_stream(event_log_dir or feature_dir)
+    snapshot = reduce(stream.transitions, stream.annotations)
+
+    tasks_dir = feature_dir / "tasks"
+    wp_files = sorted(tasks_dir.glob("WP*.md")) if tasks_dir.is_dir() else []
+    work_packages: list[tuple[Path, WPMetadata, str]] = []
+    unreadable: list[tuple[Path, Exception]] = []
+    for wp_file in wp_files:
+        try:
+            metadata, body = read_authored_wp_frontmatter(wp_file)
+        except Exception as exc:
+            if strict:
+                raise
+            unreadable.append((wp_file, exc))
+            continue
+        wp_state = snapshot.work_packages.get(metadata.work_package_id)
+        work_packages.append((wp_file, _apply_runtime_state(metadata, wp_state), body))
+    return MissionWPMetadata(
+        work_packages=tuple(work_packages),
+        snapshot=snapshot,
+        unreadable=tuple(unreadable),
+    )
+
+
 __all__ = [
+    "MissionWPMetadata",
     "WPMetadata",
     "read_authored_wp_frontmatter",
     "read_authored_wp_frontmatter_lenient",
+    "read_mission_wp_metadata",
     "read_wp_frontmatter",
 ]
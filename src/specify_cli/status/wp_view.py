@@ -42,6 +42,7 @@ from typing import Any
 
 from specify_cli.core.subtask_rows import normalize_authored_subtask_roster
 
+from .models import StatusSnapshot
 from .reducer import wp_snapshot_state
 from .resolved_binding import (
     RESOLVED_MODEL_ABSENT,
@@ -156,14 +157,23 @@ def _opt_str(value: Any) -> str | None:
     return text or None
 
 
-def _resolved_group(feature_dir: Path, wp_id: str) -> ResolvedGroup:
+def _resolved_group(
+    feature_dir: Path,
+    wp_id: str,
+    snapshot: StatusSnapshot | None = None,
+) -> ResolvedGroup:
     """Assemble the resolved (event-sourced) group for *wp_id*.
 
     Unconditional against the snapshot (no phase-flag branch): reads the shared
-    ``wp_snapshot_state`` accessor and degrades every field to empty when there
+    ``wp_snapshot_state`` accessor — or the entry of an already-reduced
+    *snapshot* of the same log — and degrades every field to empty when there
     is no reduced entry (``None``) — the authored value is never substituted.
     """
-    state = wp_snapshot_state(feature_dir, wp_id)
+    state = (
+        snapshot.work_packages.get(wp_id)
+        if snapshot is not None
+        else wp_snapshot_state(feature_dir, wp_id)
+    )
     if state is None:
         return ResolvedGroup()
 
@@ -244,10 +254,10 @@ def _locate_wp_metadata(feature_dir: Path, wp_id: str) -> WPMetadata | None:
     if len(matches) != 1:
         return None
 
-    from specify_cli.frontmatter import FrontmatterManager
+    from specify_cli.frontmatter import read_frontmatter_readonly
 
     try:
-        frontmatter_dict, _body = FrontmatterManager().read(matches[0])
+        frontmatter_dict, _body = read_frontmatter_readonly(matches[0])
         return WPMetadata.model_validate(frontmatter_dict, strict=False)
     except Exception:
         return None
@@ -258,6 +268,7 @@ def reconstruct_wp_view(
     wp_id: str,
     *,
     metadata: WPMetadata | None = None,
+    snapshot: StatusSnapshot | None = None,
 ) -> WPView:
     """Reconstruct the canonical view for *wp_id* — resolved actual + authored.
 
@@ -278,6 +289,10 @@ def reconstruct_wp_view(
             ``feature_dir/tasks`` itself. Only frontmatter-canonical fields are
             read from it, so a snapshot-re-pointed ``agent``/``assignee`` on the
             passed metadata never contaminates the authored group.
+        snapshot: Optional reduced snapshot of *feature_dir*'s event log. A
+            consumer reconstructing every WP of a mission reduces the log once
+            (e.g. via :func:`~specify_cli.status.wp_metadata.read_mission_wp_metadata`)
+            and passes it here instead of paying one read + reduce per WP.
 
     Returns:
         A :class:`WPView` whose ``resolved`` and ``authored`` groups are
@@ -287,6 +302,6 @@ def reconstruct_wp_view(
     authored_metadata = metadata if metadata is not None else _locate_wp_metadata(feature_dir, wp_id)
     return WPView(
         wp_id=wp_id,
-        resolved=_resolved_group(feature_dir, wp_id),
+        resolved=_resolved_group(feature_dir, wp_id, snapshot),
         authored=_authored_group(authored_metadata),
     )
@@ -19,6 +19,7 @@ before clearing the state file (see ``_kill_and_cleanup``).
 from __future__ import annotations
 
 import errno
+import http.client
 import importlib
 import json
 import logging
@@ -36,7 +37,7 @@ import urllib.request
 from dataclasses import dataclass
 from enum import Enum
 from functools import cache
-from http.server import BaseHTTPRequestHandler, HTTPServer
+from http.server import BaseHTTPRequestHandler, HTTPServer, ThreadingHTTPServer
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Callable, Optional, Tuple, cast
 
@@ -51,9 +52,12 @@ if TYPE_CHECKING:
 
 import psutil
 
+from kernel.tracing import span
 from specify_cli.core.atomic import atomic_write
 from specify_cli.core.env import first_set_sync_disable_env, is_truthy
 from specify_cli.core.loopback_http import (
+    LOOPBACK_HOST,
+    LOOPBACK_URL_HOST,
     build_loopback_base_url,
     build_loopback_url,
     create_loopback_server,
@@ -205,6 +209,15 @@ _HEALTH_ENDPOINT_PATH = "/api/health"
 # ``serve_forever`` poll interval is 0.5s, which is user-visible on restart.
 DAEMON_SERVE_FOREVER_POLL_SECONDS: float = 0.05
 
+# The control plane is threaded and speaks HTTP/1.1, so a client may hold one
+# connection open across many requests. Each open connection parks one handler
+# thread; an idle connection is closed by the daemon after this many seconds.
+DAEMON_CONNECTION_IDLE_SECONDS: float = 5.0
+
+# Upper bound on the number of events accepted by one batched
+# ``/api/sync/publish`` request (``{"token": ..., "events": [...]}``).
+DAEMON_PUBLISH_BATCH_MAX_EVENTS = 500
+
 # Self-retirement tick interval (seconds).  Each running daemon re-checks
 # DAEMON_STATE_FILE this often; if the recorded port is held by a different
 # live process, the daemon retires itself.  See FR-008 / FR-010.
@@ -395,6 +408,131 @@ def _daemon_version_matches(port: int, expected_token: str | None, timeout: floa
     return True
 
 
+# ---------------------------------------------------------------------------
+# Keep-alive control-plane client
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class DaemonLoopbackResponse:
+    """A fully-read control-plane response (``urlopen``-shaped for callers)."""
+
+    status: int
+    body: bytes
+
+    def read(self) -> bytes:
+        return self.body
+
+    def __enter__(self) -> DaemonLoopbackResponse:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        return None
+
+
+class DaemonLoopbackClient:
+    """Per-process HTTP/1.1 keep-alive client for the sync daemon's control plane.
+
+    ``urllib.request.urlopen`` opens (and closes) a fresh TCP connection per
+    call, so a CLI invocation that emits many events paid a connect/teardown
+    for every publish and trigger. This client keeps one persistent
+    connection per daemon port and reuses it for every request the process
+    makes. A connection the daemon closed while idle (see
+    ``DAEMON_CONNECTION_IDLE_SECONDS``) is detected on reuse and the request
+    is retried once on a fresh connection.
+
+    Only ``http://127.0.0.1:<port>`` / ``http://localhost:<port>`` URLs are
+    accepted, and the connection always targets ``127.0.0.1``. Requests are
+    serialized by a lock so the client is safe to share between threads.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._connections: dict[int, http.client.HTTPConnection] = {}
+
+    def urlopen(self, request: urllib.request.Request | str, *, timeout: float) -> DaemonLoopbackResponse:
+        """Send *request* over the pooled connection and return the read response."""
+        if isinstance(request, str):
+            request = urllib.request.Request(request)
+        parsed = urllib.parse.urlsplit(request.full_url)
+        if parsed.scheme != "http" or parsed.hostname not in {LOOPBACK_HOST, LOOPBACK_URL_HOST} or parsed.port is None:
+            raise ValueError(f"Not a loopback sync daemon URL: {request.full_url!r}")
+        path = parsed.path or "/"
+        if parsed.query:
+            path = f"{path}?{parsed.query}"
+        body = request.data if isinstance(request.data, bytes) else None
+        headers = dict(request.header_items())
+        with span("sync.daemon.request", method=request.get_method(), path=parsed.path), self._lock:
+            return self._send(parsed.port, request.get_method(), path, body, headers, timeout)
+
+    def close(self) -> None:
+        """Close every pooled connection."""
+        with self._lock:
+            for connection in self._connections.values():
+                connection.close()
+            self._connections.clear()
+
+    def _send(
+        self,
+        port: int,
+        method: str,
+        path: str,
+        body: bytes | None,
+        headers: dict[str, str],
+        timeout: float,
+    ) -> DaemonLoopbackResponse:
+        while True:
+            connection = self._connections.get(port)
+            reused = connection is not None
+            if connection is None:
+                connection = http.client.HTTPConnection(LOOPBACK_HOST, port, timeout=timeout)
+                self._connections[port] = connection
+            connection.timeout = timeout
+            if connection.sock is not None:
+                connection.sock.settimeout(timeout)
+            try:
+                connection.request(method, path, body=body, headers=headers)
+                response = connection.getresponse()
+                payload = response.read()
+            except ConnectionError:
+                self._discard(port)
+                if reused:
+                    # The daemon closed the idle connection before reading
+                    # this request; retry exactly once on a fresh socket.
+                    continue
+                raise
+            except Exception:
+                self._discard(port)
+                raise
+            if response.will_close:
+                self._discard(port)
+            return DaemonLoopbackResponse(status=response.status, body=payload)
+
+    def _discard(self, port: int) -> None:
+        connection = self._connections.pop(port, None)
+        if connection is not None:
+            connection.close()
+
+
+_loopback_client: DaemonLoopbackClient | None = None
+_loopback_client_pid: int | None = None
+_loopback_client_lock = threading.Lock()
+
+
+def daemon_loopback_client() -> DaemonLoopbackClient:
+    """Return this process's shared keep-alive control-plane client.
+
+    A forked child gets its own client rather than sharing the parent's
+    sockets.
+    """
+    global _loopback_client, _loopback_client_pid
+    with _loopback_client_lock:
+        if _loopback_client is None or _loopback_client_pid != os.getpid():
+            _loopback_client = DaemonLoopbackClient()
+            _loopback_client_pid = os.getpid()
+        return _loopback_client
+
+
 # ---------------------------------------------------------------------------
 # HTTP control plane
 # ---------------------------------------------------------------------------
@@ -402,9 +540,26 @@ def _daemon_version_matches(port: int, expected_token: str | None, timeout: floa
 _SENTINEL_BAD_TOKEN = object()
 
 
+class SyncDaemonServer(ThreadingHTTPServer):
+    """Threaded control-plane server: one handler thread per client connection.
+
+    A slow publish (which waits for the WebSocket ack) no longer blocks health
+    probes or other CLIs' requests. Handler threads are daemonic so shutdown
+    never waits on an idle keep-alive connection.
+    """
+
+    daemon_threads = True
+
+
 class SyncDaemonHandler(BaseHTTPRequestHandler):
-    """Localhost-only HTTP control plane for the machine-global sync daemon."""
+    """Localhost-only HTTP control plane for the machine-global sync daemon.
+
+    Speaks HTTP/1.1 so clients can keep one connection open across requests;
+    every response therefore carries an explicit ``Content-Length``.
+    """
 
+    protocol_version = "HTTP/1.1"
+    timeout = DAEMON_CONNECTION_IDLE_SECONDS
     daemon_token: str | None = None
     daemon_owner_record: DaemonOwnerRecord | None = None
 
@@ -412,11 +567,22 @@ class SyncDaemonHandler(BaseHTTPRequestHandler):
         del format, args
 
     def _send_json(self, status_code: int, payload: dict[str, Any]) -> None:
+        body = json.dumps(payload).encode()
         self.send_response(status_code)
         self.send_header("Content-type", "application/json")
         self.send_header("Cache-Control", "no-cache")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_not_found(self) -> None:
+        # An unknown route's request body is never read, so the connection
+        # cannot be reused: the unread bytes would parse as the next request.
+        self.close_connection = True
+        self.send_response(404)
+        self.send_header("Content-Length", "0")
+        self.send_header("Connection", "close")
         self.end_headers()
-        self.wfile.write(json.dumps(payload).encode())
 
     def _read_json_body(self) -> dict[str, Any]:
         content_length = int(self.headers.get("Content-Length") or 0)
@@ -470,8 +636,7 @@ class SyncDaemonHandler(BaseHTTPRequestHandler):
         if parsed_path.path == "/api/sync/trigger":
             self.handle_sync_trigger()
             return
-        self.send_response(404)
-        self.end_headers()
+        self._send_not_found()
 
     def do_POST(self) -> None:  # noqa: N802
         parsed_path = urllib.parse.urlparse(self.path)
@@ -484,8 +649,7 @@ class SyncDaemonHandler(BaseHTTPRequestHandler):
         if parsed_path.path == "/api/shutdown":
             self.handle_shutdown()
             return
-        self.send_response(404)
-        self.end_headers()
+        self._send_not_found()
 
     def handle_health(self) -> None:
         from specify_cli.sync.owner import redact_token
@@ -548,6 +712,9 @@ class SyncDaemonHandler(BaseHTTPRequestHandler):
             return
 
         _touch_last_activity()
+        if "events" in payload:
+            self._handle_sync_publish_batch(payload.get("events"))
+            return
         raw_event = payload.get("event")
         if not isinstance(raw_event, dict):
             self._send_json(400, {"error": "invalid_event"})
@@ -564,11 +731,40 @@ class SyncDaemonHandler(BaseHTTPRequestHandler):
             return
         self._send_json(202, {"status": "queued"})
 
+    def _handle_sync_publish_batch(self, raw_events: Any) -> None:
+        """Publish ``{"events": [...]}`` in order with one background wake.
+
+        Every event goes through ``SyncRuntime.publish_event`` individually,
+        so each keeps its own consent refusal. The reply is 200 when all were
+        published and 202 when any was left for the queue drain.
+        """
+        if (
+            not isinstance(raw_events, list)
+            or not raw_events
+            or len(raw_events) > DAEMON_PUBLISH_BATCH_MAX_EVENTS
+            or not all(isinstance(raw_event, dict) for raw_event in raw_events)
+        ):
+            self._send_json(400, {"error": "invalid_events"})
+            return
+
+        from specify_cli.sync.runtime import get_runtime
+
+        runtime = get_runtime()
+        published = sum(1 for raw_event in raw_events if runtime.publish_event(raw_event))
+        if runtime.background_service is not None:
+            runtime.background_service.wake()
+        queued = len(raw_events) - published
+        self._send_json(
+            202 if queued else 200,
+            {"status": "queued" if queued else "published", "published": published, "queued": queued},
+        )
+
     def handle_shutdown(self) -> None:
         if self._require_token() is None:
             return
 
         _touch_last_activity()
+        self.close_connection = True
         self._send_json(200, {"status": "stopping"})
 
         def shutdown_server(server: HTTPServer) -> None:
@@ -844,7 +1040,7 @@ def run_sync_daemon(port: int, daemon_token: str | None) -> None:
         {"daemon_token": daemon_token, "daemon_owner_record": None},
     )
     handler_type = cast("type[SyncDaemonHandler]", handler_class)
-    server = create_loopback_server(port, handler_class)
+    server = create_loopback_server(port, handler_class, server_factory=SyncDaemonServer)
 
     # Bind succeeded — record ownership BEFORE accepting traffic so any
     # health probe that arrives in the first scheduling slice already sees
@@ -357,8 +357,9 @@ def sync_feature_dossier(
     try:
         # #3525 Fold C: thread repo_root through so a configured org-pack
         # expected-artifacts.yaml override is honored by the dossier
-        # completeness index, not just the governance gate.
-        indexer = Indexer(ManifestRegistry(), repo_root=repo_root)
+        # completeness index, not just the governance gate. The pipeline runs
+        # on every sync tick, so reuse content hashes for unchanged files.
+        indexer = Indexer(ManifestRegistry(), repo_root=repo_root, use_hash_cache=True)
         dossier = indexer.index_feature(feature_dir, mission_type, step_id)
     except ManifestSchemaError as e:
         # #3542-B / adversarial-review MAJOR fix: a schema-invalid
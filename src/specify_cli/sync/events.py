@@ -110,7 +110,7 @@ def _request_dashboard_sync(repo_root: Path | None) -> None:
         return
 
     try:
-        from .daemon import get_sync_daemon_status
+        from .daemon import daemon_loopback_client, get_sync_daemon_status
 
         status = get_sync_daemon_status(timeout=0.2)
         if not status.healthy or not status.url:
@@ -120,7 +120,8 @@ def _request_dashboard_sync(repo_root: Path | None) -> None:
         if status.token:
             trigger_url = f"{trigger_url}?token={urllib.parse.quote(status.token)}"
 
-        with urllib.request.urlopen(trigger_url, timeout=0.2) as response:  # nosec B310 — trigger_url is always the localhost dashboard endpoint
+        client = daemon_loopback_client()
+        with client.urlopen(trigger_url, timeout=0.2) as response:
             if response.status not in {200, 202}:
                 logger.debug("Dashboard sync trigger returned HTTP %s", response.status)
     except Exception as exc:
@@ -188,7 +189,7 @@ def _publish_event_via_sync_daemon(event: dict[str, Any], repo_root: Path | None
         return
 
     try:
-        from .daemon import get_sync_daemon_status
+        from .daemon import daemon_loopback_client, get_sync_daemon_status
 
         status = get_sync_daemon_status(timeout=0.2)
         if not status.healthy or not status.url or not status.token:
@@ -200,7 +201,10 @@ def _publish_event_via_sync_daemon(event: dict[str, Any], repo_root: Path | None
             headers={"Content-Type": "application/json"},
             method="POST",
         )
-        with urllib.request.urlopen(request, timeout=0.5) as response:  # nosec B310 — request URL is localhost sync daemon endpoint
+        # One keep-alive loopback connection per process, shared with the
+        # trigger below, instead of a fresh socket per emitted event.
+        client = daemon_loopback_client()
+        with client.urlopen(request, timeout=0.5) as response:
             if response.status not in {200, 202}:
                 logger.debug("Sync daemon publish returned HTTP %s", response.status)
     except Exception as exc:
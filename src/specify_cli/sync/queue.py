@@ -12,6 +12,7 @@ from typing import Any, Protocol, cast
 import toml
 
 from kernel.clock import UTC, datetime, now_utc, now_utc_iso, timedelta
+from kernel.tracing import traced
 from specify_cli.event_journal.journal import EventJournal
 from specify_cli.event_journal.models import Event
 from specify_cli.paths import get_runtime_root
@@ -386,6 +387,7 @@ class OfflineQueue:
         if not self.queue_event(event):
             raise RuntimeError("project outbox rejected the event")
 
+    @traced("sync.queue.queue_event")
     def queue_event(
         self,
         event: dict[str, Any],
@@ -452,6 +454,7 @@ class OfflineQueue:
         )
         return True
 
+    @traced("sync.queue.drain")
     def drain_queue(self, limit: int = 1000) -> list[ProjectOutboxTask]:
         tasks: list[ProjectOutboxTask] = []
         for row in self._pending_rows()[:limit]:
@@ -475,6 +478,7 @@ class OfflineQueue:
             )
         return tasks
 
+    @traced("sync.queue.update_tasks")
     def _update_tasks(self, event_ids: Iterable[str], *, state: str, retry: bool = False) -> int:
         ids = list(event_ids)
         if not ids:
@@ -520,6 +524,7 @@ class OfflineQueue:
             elif result.status in {"failed_permanent", "terminal_failed"}:
                 self._update_tasks([result.event_id], state="terminal_failed")
 
+    @traced("sync.queue.size")
     def size(self) -> int:
         row = self._unit.execute(
             "SELECT COUNT(*) FROM outbox_tasks WHERE project_uuid = ? AND task_kind = 'event' AND state NOT IN ('synced', 'terminal_failed')",
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from collections.abc import Mapping
 
@@ -12,7 +14,16 @@ import yaml
 
 from specify_cli.core.config import AGENT_COMMAND_CONFIG
 from specify_cli.agent_upgrade_prompt import prepend_agent_upgrade_check
-from specify_cli.template.renderer import parse_frontmatter, render_template_text, rewrite_paths
+from specify_cli.template.renderer import (
+    glossary_index_version,
+    parse_frontmatter,
+    render_template_text,
+    rewrite_paths,
+)
+
+# Command files are small; a handful of threads hides per-file fsync/metadata
+# latency without contending on the directory.
+_WRITE_WORKERS = 8
 
 
 def _get_cli_version() -> str:
@@ -82,16 +93,21 @@ def prepare_command_templates(
 
 
 def generate_agent_assets(command_templates_dir: Path, project_path: Path, agent_key: str, script_type: str) -> None:
-    """Render every command template for the selected agent."""
+    """Render every command template for the selected agent.
+
+    The agent's command directory ends up holding exactly the rendered files.
+    Files whose bytes already match are left untouched and the rest are
+    written concurrently, so re-running ``init``/``upgrade`` over an
+    up-to-date project rewrites nothing.
+    """
     config = AGENT_COMMAND_CONFIG[agent_key]
     output_dir = project_path / config["dir"]
-    if output_dir.exists():
-        shutil.rmtree(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
 
     if not command_templates_dir.exists():
         _raise_template_discovery_error(command_templates_dir)
 
+    outputs: dict[Path, str] = {}
     for template_path in sorted(command_templates_dir.glob("*.md")):
         rendered = render_command_template(
             template_path,
@@ -104,7 +120,19 @@ def generate_agent_assets(command_templates_dir: Path, project_path: Path, agent
         ext = config["ext"]
         stem = template_path.stem
         filename = f"spec-kitty.{stem}.{ext}" if ext else f"spec-kitty.{stem}"
-        (output_dir / filename).write_text(rendered, encoding="utf-8")
+        outputs[output_dir / filename] = rendered
+
+    for existing in output_dir.iterdir():
+        if existing in outputs:
+            continue
+        if existing.is_dir() and not existing.is_symlink():
+            shutil.rmtree(existing)
+        else:
+            existing.unlink()
+
+    if outputs:
+        with ThreadPoolExecutor(max_workers=min(_WRITE_WORKERS, len(outputs))) as pool:
+            list(pool.map(_write_if_changed, outputs.keys(), outputs.values()))
 
     if agent_key == "copilot":
         vscode_settings = command_templates_dir.parent / "vscode-settings.json"
@@ -114,6 +142,17 @@ def generate_agent_assets(command_templates_dir: Path, project_path: Path, agent
             shutil.copy2(vscode_settings, vscode_dest / "settings.json")
 
 
+def _write_if_changed(path: Path, content: str) -> bool:
+    """Write *content* to *path* unless the file already holds those bytes."""
+    data = content.encode("utf-8")
+    if path.is_file() and not path.is_symlink() and path.read_bytes() == data:
+        return False
+    if path.is_symlink():
+        path.unlink()
+    path.write_bytes(data)
+    return True
+
+
 def render_command_template(
     template_path: Path,
     script_type: str,
@@ -142,6 +181,38 @@ def render_command_template(
 
     template_text = template_path.read_text(encoding="utf-8-sig").replace("\r", "")
     template_text = apply_spdd_blocks_for_project(template_text, repo_root)
+    return _render_command_text(
+        template_text,
+        template_path,
+        script_type,
+        agent_key,
+        arg_format,
+        extension,
+        version or _get_cli_version(),
+        glossary_index_version(template_path),
+    )
+
+
+@functools.lru_cache(maxsize=512)
+def _render_command_text(
+    template_text: str,
+    template_path: Path,
+    script_type: str,
+    agent_key: str,
+    arg_format: str,
+    extension: str,
+    version: str,
+    glossary_version: str,
+) -> str:
+    """Render prepared command template text; memoised on every input.
+
+    ``init``/``upgrade`` render the same templates for many agents and
+    projects, so identical ``(template, agent, version, glossary)`` inputs
+    return the cached string instead of re-parsing and re-annotating.
+    ``glossary_version`` is not read here: it is part of the cache key so an
+    edited glossary seed invalidates earlier renders.
+    """
+    del glossary_version
     requires_script = "{SCRIPT}" in template_text
 
     def build_variables(metadata: dict[str, object]) -> Mapping[str, str]:
@@ -173,7 +244,7 @@ def render_command_template(
     if frontmatter_clean:
         frontmatter_clean = rewrite_paths(frontmatter_clean)
 
-    version_marker = f"<!-- spec-kitty-command-version: {version or _get_cli_version()} -->\n"
+    version_marker = f"<!-- spec-kitty-command-version: {version} -->\n"
 
     if agent_key in AGENT_COMMAND_CONFIG:
         rendered_body = prepend_agent_upgrade_check(rendered_body)
@@ -102,6 +102,49 @@ def render_template_text(
     return metadata, rendered, raw_frontmatter
 
 
+class _GlossaryAnnotator:
+    """Single-pass glossary annotator compiled once from a surface → URN map.
+
+    All surfaces are folded into one alternation (longest first, so
+    "deployment target" wins over "target" where both start at the same
+    offset) and the document is scanned once, whatever the number of terms.
+    Only the first occurrence of each surface is annotated; text already
+    consumed by a longer surface is not re-scanned for shorter ones.
+    """
+
+    def __init__(self, term_surfaces: Mapping[str, str]) -> None:
+        ordered = sorted(term_surfaces.items(), key=lambda item: -len(item[0]))
+        self._term_ids = [term_id for _surface, term_id in ordered]
+        self._pattern = (
+            re.compile(
+                "|".join(rf"(\b{re.escape(surface)}\b)" for surface, _term_id in ordered),
+                re.IGNORECASE,
+            )
+            if ordered
+            else None
+        )
+
+    def annotate(self, content: str) -> str:
+        """Return *content* with ``<!-- glossary:<term-id> -->`` anchors added."""
+        if self._pattern is None:
+            return content
+        annotated: set[int] = set()
+
+        def _annotate_match(match: re.Match[str]) -> str:
+            index = match.lastindex
+            if index is None or index in annotated:
+                return match.group(0)
+            annotated.add(index)
+            return match.group(0) + f"<!-- glossary:{self._term_ids[index - 1]} -->"
+
+        return self._pattern.sub(_annotate_match, content)
+
+
+# Compiled annotators per project root, with the seed-file signature they were
+# built from; a changed signature rebuilds the entry on the next render.
+_ANNOTATOR_CACHE: dict[Path, tuple[tuple[tuple[str, int, int], ...], _GlossaryAnnotator | None]] = {}
+
+
 def _annotate_glossary_refs(content: str, term_surfaces: dict[str, str]) -> str:
     """Inject ``<!-- glossary:<term-id> -->`` after the first occurrence of each
     known term surface in *content*.
@@ -116,47 +159,50 @@ def _annotate_glossary_refs(content: str, term_surfaces: dict[str, str]) -> str:
         HTML comments are inserted.  Never raises — callers must wrap in
         ``try/except`` for additional safety.
     """
-    # Process longest surfaces first so "deployment target" wins over "target"
-    def _surface_sort_key(item: tuple[str, str]) -> int:
-        return -len(item[0])
-
-    for surface_lower, term_id in sorted(term_surfaces.items(), key=_surface_sort_key):
-        pattern = re.compile(r"\b" + re.escape(surface_lower) + r"\b", re.IGNORECASE)
-        # Capture term_id in the default arg to avoid the late-binding closure bug (B023)
-        def _annotate_match(match: re.Match[str], _tid: str = term_id) -> str:
-            return match.group(0) + f"<!-- glossary:{_tid} -->"
-
-        content = pattern.sub(
-            _annotate_match,
-            content,
-            count=1,
-        )
-    return content
+    return _GlossaryAnnotator(term_surfaces).annotate(content)
 
 
-def _annotate_glossary_refs_from_store(content: str, template_path: Path | None = None) -> str:
-    """Load term surfaces from ``GlossaryStore`` and call ``_annotate_glossary_refs``.
+def _find_glossary_root(template_path: Path | None) -> Path | None:
+    """Return the nearest ancestor of *template_path* (or cwd) holding ``.kittify/``."""
+    candidates = list(template_path.parents) if template_path is not None else list(Path.cwd().parents)
+    for candidate in candidates:
+        if (candidate / ".kittify").is_dir():
+            return candidate
+    return None
 
-    This is the integration point called by ``render_template``.  It is
-    intentionally isolated so that any import error, missing glossary, or
-    slow I/O raises an exception that the caller can swallow without
-    affecting the primary render pipeline.
 
-    If the glossary package is unavailable or the store is empty the original
-    *content* is returned unchanged.
-    """
-    # Resolve repo root: walk upward from template_path (or cwd as fallback)
-    from pathlib import Path as _Path
+def _seed_signature(repo_root: Path) -> tuple[tuple[str, int, int], ...]:
+    """Return ``(scope, mtime_ns, size)`` for every glossary seed file present."""
+    from glossary.scope import GlossaryScope
+
+    signature: list[tuple[str, int, int]] = []
+    for scope in GlossaryScope:
+        try:
+            stat = (repo_root / ".kittify" / "glossaries" / f"{scope.value}.yaml").stat()
+        except OSError:
+            continue
+        signature.append((scope.value, stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
 
-    candidates = list(template_path.parents) if template_path is not None else list(_Path.cwd().parents)
 
-    repo_root: _Path | None = None
-    for candidate in candidates:
-        if (candidate / ".kittify").is_dir():
-            repo_root = candidate
-            break
+def glossary_index_version(template_path: Path | None = None) -> str:
+    """Return a token that changes whenever the glossary annotating *template_path* does.
+
+    Render caches include it in their key so an edited seed file invalidates
+    previously rendered output.  Empty when no project glossary applies.
+    """
+    repo_root = _find_glossary_root(template_path)
     if repo_root is None:
-        return content
+        return ""
+    return f"{repo_root}:{_seed_signature(repo_root)}"
+
+
+def _load_glossary_annotator(repo_root: Path) -> _GlossaryAnnotator | None:
+    """Return the compiled annotator for *repo_root*, rebuilding it when seeds change."""
+    signature = _seed_signature(repo_root)
+    cached = _ANNOTATOR_CACHE.get(repo_root)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
 
     # Import lazily to avoid hard dependency at module load time
     from glossary.store import GlossaryStore
@@ -183,10 +229,32 @@ def _annotate_glossary_refs_from_store(content: str, template_path: Path | None
                 term_id = f"glossary:{slug}"
                 term_surfaces[surface_lower] = term_id
 
-    if not term_surfaces:
+    annotator = _GlossaryAnnotator(term_surfaces) if term_surfaces else None
+    _ANNOTATOR_CACHE[repo_root] = (signature, annotator)
+    return annotator
+
+
+def _annotate_glossary_refs_from_store(content: str, template_path: Path | None = None) -> str:
+    """Annotate *content* with the project glossary's compiled annotator.
+
+    This is the integration point called by ``render_template``.  It is
+    intentionally isolated so that any import error, missing glossary, or
+    slow I/O raises an exception that the caller can swallow without
+    affecting the primary render pipeline.
+
+    The seed files are loaded and compiled once per project root and reused
+    across renders until one of them changes.  If the glossary package is
+    unavailable or the store is empty the original *content* is returned
+    unchanged.
+    """
+    repo_root = _find_glossary_root(template_path)
+    if repo_root is None:
         return content
 
-    return _annotate_glossary_refs(content, term_surfaces)
+    annotator = _load_glossary_annotator(repo_root)
+    if annotator is None:
+        return content
+    return annotator.annotate(content)
 
 
 def _resolve_variables(variables: VariablesResolver | None, metadata: dict[str, Any]) -> Mapping[str, str]:
@@ -207,6 +275,7 @@ __all__ = [
     "DEFAULT_PATH_PATTERNS",
     # _annotate_glossary_refs: demoted — private helper with no cross-module
     # src/ callers (WP01 harden-dead-symbol-gate-01KW0RJR).
+    "glossary_index_version",
     "parse_frontmatter",
     "render_template",
     "render_template_text",
@@ -1615,6 +1615,7 @@ _WP09_SINK_CLASSIFICATIONS = (
     _wp09_sink("specify_cli/sync/client.py", "WebSocketClient._flush_pending_project_events", "emitter_websocket"),
     _wp09_sink("specify_cli/sync/client.py", "WebSocketClient._send_wire", "emitter_websocket", "daemon_publish", "reconnect_local_commit"),
     _wp09_sink("specify_cli/sync/client.py", "WebSocketClient._handle_ping", rationale="WebSocket pong carries no project payload"),
+    _wp09_sink("specify_cli/sync/daemon.py", "DaemonLoopbackClient._send", "event_relay"),
     _wp09_sink("specify_cli/sync/daemon.py", "_fetch_health_payload", rationale="loopback daemon health control"),
     _wp09_sink("specify_cli/sync/daemon.py", "_stop_daemon_by_http", rationale="loopback daemon shutdown control"),
     _wp09_sink(
@@ -1968,10 +1969,11 @@ specify_cli/sync/body_transport.py::_send_content_request::transport-call::reque
 specify_cli/sync/client.py::WebSocketClient._flush_pending_project_events::send-event::self.send_event
 specify_cli/sync/client.py::WebSocketClient._handle_ping::websocket-send::self.ws.send
 specify_cli/sync/client.py::WebSocketClient._send_wire::websocket-send::self.ws.send
+specify_cli/sync/daemon.py::DaemonLoopbackClient._send::http-verb::connection.request
 specify_cli/sync/daemon.py::_fetch_health_payload::urlopen::urllib.request.urlopen
 specify_cli/sync/daemon.py::_stop_daemon_by_http::urlopen::urllib.request.urlopen
-specify_cli/sync/events.py::_publish_event_via_sync_daemon::urlopen::urllib.request.urlopen
-specify_cli/sync/events.py::_request_dashboard_sync::urlopen::urllib.request.urlopen
+specify_cli/sync/events.py::_publish_event_via_sync_daemon::urlopen::client.urlopen
+specify_cli/sync/events.py::_request_dashboard_sync::urlopen::client.urlopen
 specify_cli/sync/history_import/upload.py::_deliver_chunks::receiver-deliver::receiver.deliver
 specify_cli/sync/history_import/upload.py::_post_server_preflight::transport-call::poster
 specify_cli/sync/orphan_sweep.py::_http_shutdown_no_token::urlopen::urllib.request.urlopen
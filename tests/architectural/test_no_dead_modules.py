@@ -491,10 +491,11 @@ _CATEGORY_8_DISPATCHED_GOVERNED_OPS: frozenset[str] = frozenset(
 # auto-discovery seam as category 1's migrations, so there is no static
 # importer. Introduced by mission operator-config-ergonomics (#3506). The
 # eventual root fix is a structural auto-exempt for this seam (mirroring the
-# migration handling), tracked in #3508; until then the three siblings are
+# migration handling), tracked in #3508; until then the siblings are
 # enumerated here.
 _CATEGORY_9_AUTO_DISCOVERED_DOCTOR_SIBLINGS: frozenset[str] = frozenset(
     {
+        "specify_cli.cli.commands._all_doctor",
         "specify_cli.cli.commands._channel_doctor",
         "specify_cli.cli.commands._env_file_doctor",
         "specify_cli.cli.commands._provenance_doctor",
@@ -566,11 +567,23 @@ def _collect_import_targets(
 
     We walk the FULL tree (including nested / function-level imports) so
     that lazy import patterns -- common in this codebase for keeping CLI
-    startup fast -- still count as callers.
+    startup fast -- still count as callers. For the same reason a
+    ``CommandSpec("<dotted.module>", ...)`` entry in a CLI command table
+    (``specify_cli.cli.commands._lazy``) counts as a plain ``import`` of its
+    literal module: the table is how command modules are wired in.
     """
     out: list[tuple[str, str, tuple[str, ...] | None]] = []
     for node in ast.walk(tree):
-        if isinstance(node, ast.ImportFrom):
+        if (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Name)
+            and node.func.id == "CommandSpec"
+            and node.args
+            and isinstance(node.args[0], ast.Constant)
+            and isinstance(node.args[0].value, str)
+        ):
+            out.append(("import", node.args[0].value, None))
+        elif isinstance(node, ast.ImportFrom):
             resolved = _resolve_import_from(node, containing_pkg)
             names = tuple(alias.name for alias in node.names)
             out.append(("from", resolved, names))
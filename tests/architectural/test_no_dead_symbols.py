@@ -1050,7 +1050,7 @@ _CATEGORY_C_OPERATOR_CONFIG_PUBLIC_API: frozenset[SymbolKey] = frozenset(
 
 
 # ---------- C. doctor auto-discovery seam (mission operator-config-ergonomics) ----------
-# All six symbols are LIVE, not dead -- the gate only counts cross-file src/
+# All these symbols are LIVE, not dead -- the gate only counts cross-file src/
 # ``__all__`` importers, and both reach-paths here are invisible to it:
 #   * each ``register(app)`` is invoked by doctor.py's ``_auto_discover_doctor_
 #     siblings()`` via ``getattr(module, "register")`` (a dynamic string
@@ -1064,6 +1064,8 @@ _CATEGORY_C_OPERATOR_CONFIG_PUBLIC_API: frozenset[SymbolKey] = frozenset(
 
 _CATEGORY_C_DOCTOR_AUTO_DISCOVERY_SEAM: frozenset[SymbolKey] = frozenset(
     {
+        # specify_cli.cli.commands._all_doctor::register
+        SymbolKey("register", "8a52aa146789f11f47f7321002ac6cfb429dfaa118af32bbbd4c8d7f26acea4c", source_module="specify_cli.cli.commands._all_doctor"),
         # specify_cli.cli.commands._channel_doctor::register
         SymbolKey("register", "3e40fc6641735900c4b86d367c7daf205425df768e6a63e9be1e789ee6fb3da7", source_module="specify_cli.cli.commands._channel_doctor"),
         # specify_cli.cli.commands._channel_doctor::run_channel_report
@@ -2212,6 +2214,35 @@ def _record_getattr_str_edges(
             per_symbol.setdefault(resolved, set()).add(attr_arg.value)
 
 
+def _record_command_spec_edges(
+    tree: ast.Module,
+    per_symbol: dict[str, set[str]],
+    known_modules: frozenset[str],
+) -> None:
+    """Record caller-edges from CLI command-table entries (detector f).
+
+    ``specify_cli.cli.commands._lazy.CommandSpec("<module>", "<attr>", ...,
+    lazy_factory="<fn>")`` names the module and attribute a command resolves
+    to, so the lazily-registered command tree imports them without an
+    ``import`` statement. For every such call whose first argument is a
+    string literal naming a *real module* (in ``known_modules``), records
+    ``per_symbol[module].add(attr)`` and, when given, the ``lazy_factory``
+    name.
+    """
+    for node in ast.walk(tree):
+        if not (isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id == "CommandSpec" and len(node.args) >= 2):
+            continue
+        module_arg, attr_arg = node.args[0], node.args[1]
+        if not (isinstance(module_arg, ast.Constant) and isinstance(module_arg.value, str) and module_arg.value in known_modules):
+            continue
+        names = per_symbol.setdefault(module_arg.value, set())
+        if isinstance(attr_arg, ast.Constant) and isinstance(attr_arg.value, str):
+            names.add(attr_arg.value)
+        for keyword in node.keywords:
+            if keyword.arg == "lazy_factory" and isinstance(keyword.value, ast.Constant) and isinstance(keyword.value.value, str):
+                names.add(keyword.value.value)
+
+
 def _find_facade_lazy_dict_name(tree: ast.Module) -> str | None:
     """Return the lazy-imports dict variable referenced in a ``__getattr__`` facade.
 
@@ -2392,6 +2423,7 @@ def _imports_by_target(
         _record_module_attr_edges(tree, alias_map, per_symbol, known_modules)
         _record_getattr_str_edges(tree, alias_map, per_symbol, known_modules)
         _record_facade_edges(tree, containing, str_consts, per_symbol, known_modules)
+        _record_command_spec_edges(tree, per_symbol, known_modules)
     _record_dynamic_call_accessor_edges(path_to_dotted, path_to_tree, per_symbol)
     return per_symbol, star_targets
 
@@ -2951,6 +2983,25 @@ def test_no_false_negative_facade_detector() -> None:
     assert not _symbol_has_caller("Cls", "mypkg.unrelated", ps, sub_idx), "mypkg.unrelated::Cls must NOT be rescued"
 
 
+def test_no_false_negative_command_spec_detector() -> None:
+    """Detector (f) must rescue only the literal module a command-table entry names."""
+    src = (
+        'CommandSpec("pkg.cmds.merge", "merge", help="Merge")\n'
+        'CommandSpec("pkg.cmds.agent", "app", group=True, lazy_factory="build_lazy_app")\n'
+        'CommandSpec("pkg.cmds.missing", "gone")\n'
+    )
+    tree = ast.parse(src)
+    ps: dict[str, set[str]] = {}
+    _record_command_spec_edges(tree, ps, frozenset({"pkg.cmds.merge", "pkg.cmds.agent"}))
+    sub_idx = _submodule_index(ps)
+
+    assert _symbol_has_caller("merge", "pkg.cmds.merge", ps, sub_idx)
+    assert _symbol_has_caller("app", "pkg.cmds.agent", ps, sub_idx)
+    assert _symbol_has_caller("build_lazy_app", "pkg.cmds.agent", ps, sub_idx)
+    assert not _symbol_has_caller("Merge", "pkg.cmds.merge", ps, sub_idx), "help text is not a symbol"
+    assert "pkg.cmds.missing" not in ps, "an entry naming an unknown module must record nothing"
+
+
 def test_no_false_negative_aliased_symbol_import_does_not_reblind() -> None:
     """T004 regression: ``from M import Cls as C; C.NAME`` must NOT rescue ``M::NAME``.
 
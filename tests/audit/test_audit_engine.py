@@ -186,6 +186,33 @@ def test_json_stable_across_checkout_roots(tmp_path: Path) -> None:
     assert str(tmp_path) not in json_a
 
 
+def test_process_pool_report_matches_inline(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Fanning missions out across a process pool leaves the JSON byte-identical."""
+    from specify_cli.audit import engine
+
+    specs_dir = tmp_path / "kitty-specs"
+    _make_mission(specs_dir, "001-alpha", _ULID_A, mission_number=1)
+    _make_mission(specs_dir, "001-beta", _ULID_B)
+    _make_mission(specs_dir, "002-gamma", _ULID_A, mission_number=2)
+    (specs_dir / "002-gamma" / "status.events.jsonl").write_text("not json\n", encoding="utf-8")
+    (specs_dir / "003-orphan").mkdir()
+    for i in range(8):
+        _make_mission(specs_dir, f"mission-{i:02d}", _ULID_C if i % 2 else _ULID_D, mission_number=10 + i)
+
+    inline = build_report_json(run_audit(AuditOptions(repo_root=tmp_path, max_workers=1)))
+
+    monkeypatch.setattr(engine, "_PARALLEL_MIN_MISSIONS", 2)
+    pooled = build_report_json(run_audit(AuditOptions(repo_root=tmp_path, max_workers=3)))
+
+    assert pooled == inline
+    payload = json.loads(pooled)
+    assert [m["mission_slug"] for m in payload["missions"]] == sorted(
+        p.name for p in specs_dir.iterdir()
+    )
+    assert payload["shape_counters"]["DUPLICATE_PREFIX"] == 2
+    assert payload["shape_counters"]["DUPLICATE_MISSION_ID"] == 10
+
+
 # ---------------------------------------------------------------------------
 # Test 5: test_corrupt_jsonl_does_not_crash_engine
 # ---------------------------------------------------------------------------
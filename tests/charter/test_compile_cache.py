@@ -0,0 +1,165 @@
+"""Scope: content-addressed compiled-charter cache (``charter.compile_cache``).
+
+``compile_charter`` itself is replaced by a counting stub so these tests
+exercise only the keying and storage; the compiled output is covered by
+``test_compiler.py``.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import subprocess
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from charter import compiler
+from charter.compile_cache import (
+    CHARTER_COMPILE_CACHE_DIR,
+    compile_charter_cached,
+    compile_inputs_manifest,
+    hash_inputs,
+)
+from charter.compiler import CharterReference, CompiledCharter
+from charter.interview import CharterInterview, default_interview
+
+
+class _CountingCompiler:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __call__(self, *, mission: str, interview: CharterInterview, **_: Any) -> CompiledCharter:
+        self.calls += 1
+        return CompiledCharter(
+            mission=mission,
+            template_set=f"{mission}-default",
+            selected_paradigms=["p"],
+            selected_directives=["DIRECTIVE_001"],
+            available_tools=list(interview.available_tools),
+            markdown=f"# Charter {self.calls}\n",
+            references=[CharterReference("DIRECTIVE:001", "directive", "Title", "Summary", "src", "local", "body")],
+            diagnostics=["note"],
+            active_languages=None,
+        )
+
+
+@pytest.fixture
+def counting_compiler(monkeypatch: pytest.MonkeyPatch) -> _CountingCompiler:
+    stub = _CountingCompiler()
+    monkeypatch.setattr(compiler, "compile_charter", stub)
+    return stub
+
+
+def _write_charter_yaml(repo_root: Path, text: str) -> None:
+    charter_dir = repo_root / ".kittify" / "charter"
+    charter_dir.mkdir(parents=True, exist_ok=True)
+    (charter_dir / "charter.yaml").write_text(text, encoding="utf-8")
+
+
+@pytest.fixture(scope="module")
+def interview() -> CharterInterview:
+    return default_interview(mission="software-dev")
+
+
+def _compile(repo_root: Path, interview: CharterInterview) -> CompiledCharter:
+    return compile_charter_cached(
+        repo_root=repo_root,
+        mission="software-dev",
+        interview=interview,
+        doctrine_service_factory=lambda _root: None,
+        pack_context_factory=lambda _root: None,
+    )
+
+
+def _inputs_hash(repo_root: Path, interview: CharterInterview) -> str:
+    manifest = compile_inputs_manifest(repo_root, mission="software-dev", interview=interview)
+    return hash_inputs(manifest)
+
+
+def test_unchanged_inputs_are_compiled_once(tmp_path: Path, interview: CharterInterview, counting_compiler: _CountingCompiler) -> None:
+    first = _compile(tmp_path, interview)
+    second = _compile(tmp_path, interview)
+
+    assert counting_compiler.calls == 1
+    assert second == first
+    assert isinstance(second.references[0], CharterReference)
+
+
+def test_factories_are_not_called_on_a_hit(tmp_path: Path, interview: CharterInterview, counting_compiler: _CountingCompiler) -> None:
+    _compile(tmp_path, interview)
+    built: list[Path] = []
+
+    def _factory(root: Path) -> None:
+        built.append(root)
+
+    compile_charter_cached(
+        repo_root=tmp_path,
+        mission="software-dev",
+        interview=interview,
+        doctrine_service_factory=_factory,
+        pack_context_factory=_factory,
+    )
+
+    assert built == []
+
+
+def test_interview_and_config_edits_change_the_key(tmp_path: Path, interview: CharterInterview) -> None:
+    baseline = _inputs_hash(tmp_path, interview)
+
+    edited = dataclasses.replace(interview, answers={**interview.answers, "testing_philosophy": "property-based"})
+    assert _inputs_hash(tmp_path, edited) != baseline
+
+    (tmp_path / ".kittify").mkdir()
+
+    (tmp_path / ".kittify" / "config.yaml").write_text("activated_kinds: [directive]\n", encoding="utf-8")
+    assert _inputs_hash(tmp_path, interview) != baseline
+
+
+def test_only_authored_charter_sections_are_keyed(tmp_path: Path, interview: CharterInterview) -> None:
+    _write_charter_yaml(tmp_path, "schema_version: 2.0.0\nactivated_directives: [DIRECTIVE_001]\ncatalog: {references: []}\n")
+    baseline = _inputs_hash(tmp_path, interview)
+
+    _write_charter_yaml(tmp_path, "schema_version: 2.0.0\nactivated_directives: [DIRECTIVE_001]\ncatalog: {references: [x]}\nmetadata: {}\n")
+    assert _inputs_hash(tmp_path, interview) == baseline
+
+    _write_charter_yaml(tmp_path, "schema_version: 2.0.0\nactivated_directives: [DIRECTIVE_002]\ncatalog: {references: []}\n")
+    assert _inputs_hash(tmp_path, interview) != baseline
+
+
+def test_project_doctrine_edits_change_the_key(tmp_path: Path, interview: CharterInterview) -> None:
+    doctrine = tmp_path / ".kittify" / "doctrine" / "directives"
+    doctrine.mkdir(parents=True)
+    (doctrine / "custom.directive.yaml").write_text("id: CUSTOM\n", encoding="utf-8")
+    baseline = _inputs_hash(tmp_path, interview)
+
+    (doctrine / "custom.directive.yaml").write_text("id: CUSTOM\ntitle: changed\n", encoding="utf-8")
+
+    assert _inputs_hash(tmp_path, interview) != baseline
+
+
+def test_worktrees_share_the_canonical_store(tmp_path: Path, interview: CharterInterview, counting_compiler: _CountingCompiler) -> None:
+    def git(*args: str) -> None:
+        subprocess.run(["git", "-C", str(tmp_path), *args], check=True, capture_output=True)
+
+    git("-c", "user.name=t", "-c", "user.email=t@example.com", "commit", "--allow-empty", "-q", "-m", "init")
+    worktree = tmp_path / "wt"
+    git("worktree", "add", "-q", str(worktree))
+
+    _compile(tmp_path, interview)
+    _compile(worktree, interview)
+
+    assert counting_compiler.calls == 1
+    assert list((tmp_path / ".kittify" / "runtime" / CHARTER_COMPILE_CACHE_DIR).glob("*.json"))
+    assert not (worktree / ".kittify" / "runtime").exists()
+
+
+def test_corrupt_entry_is_a_miss(tmp_path: Path, interview: CharterInterview, counting_compiler: _CountingCompiler) -> None:
+    _compile(tmp_path, interview)
+    for entry in (tmp_path / ".kittify" / "runtime" / CHARTER_COMPILE_CACHE_DIR).glob("*.json"):
+        entry.write_text("{not json", encoding="utf-8")
+
+    recompiled = _compile(tmp_path, interview)
+
+    assert counting_compiler.calls == 2
+    assert recompiled.markdown == "# Charter 2\n"
@@ -0,0 +1,115 @@
+"""Scope: on-disk memo of rendered charter context (``charter.context_memo``).
+
+The memo slots are exercised directly against a real ``context-state.json``;
+one end-to-end test checks that ``build_charter_context`` replays a memoised
+render without re-running its result builder.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+import charter.context as context_module
+from charter.context import CharterContextResult, build_charter_context
+from charter.context_memo import (
+    BRANCH_BOOTSTRAP,
+    BRANCH_NON_BOOTSTRAP,
+    CHARTER_CONTEXT_MEMO_DIR,
+    ContextMemo,
+)
+from charter.context_state import _prepare_context_state
+
+pytestmark = pytest.mark.fast
+
+
+def _open(repo_root: Path, action: str = "specify", effective_depth: int = 2) -> ContextMemo:
+    return ContextMemo.open(
+        repo_root,
+        action=action,
+        profile=None,
+        effective_depth=effective_depth,
+        org_root=None,
+        mission_type="software-dev",
+        feature_dir=None,
+        suppress_project_resolver=False,
+    )
+
+
+def _result(action: str = "specify", *, first_load: bool = True, depth: int = 2) -> CharterContextResult:
+    return CharterContextResult(action=action, mode="bootstrap", first_load=first_load, text="Charter Context\n", references_count=3, depth=depth)
+
+
+def test_replay_returns_the_recorded_render(tmp_path: Path) -> None:
+    _open(tmp_path).record(BRANCH_BOOTSTRAP, _result())
+
+    replayed = _open(tmp_path).replay(_prepare_context_state(tmp_path, "specify", None), depth=None, mark_loaded=False)
+
+    assert replayed == _result()
+
+
+def test_replay_marks_a_first_load_like_a_fresh_render(tmp_path: Path) -> None:
+    _open(tmp_path).record(BRANCH_BOOTSTRAP, _result())
+
+    replayed = _open(tmp_path).replay(_prepare_context_state(tmp_path, "specify", None), depth=None, mark_loaded=True)
+    after = _prepare_context_state(tmp_path, "specify", None)
+
+    assert replayed is not None and replayed.first_load
+    assert not after.first_load
+    assert after.effective_depth == 1
+
+
+def test_non_bootstrap_replay_is_never_a_first_load(tmp_path: Path) -> None:
+    memo = _open(tmp_path, action="review")
+    memo.record(BRANCH_NON_BOOTSTRAP, _result("review", first_load=False, depth=1))
+
+    replayed = memo.replay(_prepare_context_state(tmp_path, "review", 3), depth=3, mark_loaded=True)
+
+    assert replayed is not None
+    assert (replayed.first_load, replayed.depth) == (False, 3)
+    assert _prepare_context_state(tmp_path, "review", None).first_load
+
+
+def test_charter_and_doctrine_edits_change_the_slot(tmp_path: Path) -> None:
+    baseline = _open(tmp_path).path
+    charter_dir = tmp_path / ".kittify" / "charter"
+    charter_dir.mkdir(parents=True)
+
+    (charter_dir / "charter.md").write_text("# Charter\n", encoding="utf-8")
+    with_charter = _open(tmp_path).path
+    doctrine = tmp_path / ".kittify" / "doctrine" / "directives"
+    doctrine.mkdir(parents=True)
+    (doctrine / "custom.directive.yaml").write_text("id: CUSTOM\n", encoding="utf-8")
+    with_doctrine = _open(tmp_path).path
+
+    assert len({baseline, with_charter, with_doctrine}) == 3
+    assert _open(tmp_path).path == with_doctrine
+    assert _open(tmp_path, effective_depth=1).path != with_doctrine
+
+
+def test_corrupt_entry_is_a_miss(tmp_path: Path) -> None:
+    memo = _open(tmp_path)
+    memo.record(BRANCH_BOOTSTRAP, _result())
+    assert memo.path is not None
+    memo.path.write_text("{not json", encoding="utf-8")
+
+    assert memo.replay(_prepare_context_state(tmp_path, "specify", None), depth=None, mark_loaded=False) is None
+
+
+def test_build_charter_context_replays_the_memoised_render(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[str] = []
+    original = context_module._missing_charter_context_result
+
+    def _counting(action: str, *args: object, **kwargs: object) -> CharterContextResult:
+        calls.append(action)
+        return original(action, *args, **kwargs)  # type: ignore[arg-type]
+
+    monkeypatch.setattr(context_module, "_missing_charter_context_result", _counting)
+
+    first = build_charter_context(tmp_path, action="specify", mission_type="software-dev", mark_loaded=False)
+    second = build_charter_context(tmp_path, action="specify", mission_type="software-dev", mark_loaded=False)
+
+    assert calls == ["specify"]
+    assert second == first
+    assert list((tmp_path / ".kittify" / "runtime" / CHARTER_CONTEXT_MEMO_DIR).glob("*.json"))
@@ -240,6 +240,9 @@ def pytest_configure(config: pytest.Config) -> None:
     # Propagates to subprocesses too (e.g. dashboard CLI spawned by tests).
     os.environ["PWHEADLESS"] = "1"
 
+    # Never spawn the detached charter-context warm-up from `charter generate`.
+    os.environ["SPEC_KITTY_NO_CONTEXT_WARMUP"] = "1"
+
     # Block webbrowser.open() in the test process itself.
     import webbrowser
 
@@ -700,3 +700,115 @@ def test_coord_staging_keeps_matrices_but_skips_rehomed_analysis_report(
     assert not ana_dst.exists(), "analysis-report.md was copied to coord — copy-drop failed"
     assert ana_dst not in coord_files
     assert analysis not in coord_files
+
+
+def test_plumbing_commit_skips_materialisation_when_no_coord_worktree(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """``SPEC_KITTY_PLUMBING_COMMITS``: no coord worktree yet ⇒ none is created.
+
+    The coordination artifacts are plumbed onto the coord ref straight from the
+    primary checkout, with the same skips the worktree copy applies (the status
+    log is never taken from the primary), and ``safe_commit`` is not used.
+    """
+    monkeypatch.setenv("SPEC_KITTY_PLUMBING_COMMITS", "1")
+    specs = tmp_path / "kitty-specs" / "001-my-mission"
+    specs.mkdir(parents=True)
+    matrix = specs / "acceptance-matrix.json"
+    matrix.write_text("{}\n", encoding="utf-8")
+    events = specs / "status.events.jsonl"
+    events.write_text("", encoding="utf-8")
+    plumbed: list[dict[str, object]] = []
+
+    with (
+        _patch_topology(coord=True),
+        _patch_primary_target(),
+        patch(
+            "specify_cli.coordination.commit_router.resolve_placement_only",
+            return_value=_make_coord_target(),
+        ),
+        patch("specify_cli.coordination.commit_router._resolve_mid8", return_value="ABCD1234"),
+        patch(
+            "specify_cli.coordination.workspace.CoordinationWorkspace.is_present",
+            return_value=False,
+        ),
+        patch(
+            "specify_cli.coordination.commit_router._materialise_coord_worktree",
+            side_effect=AssertionError("coord worktree materialised"),
+        ),
+        patch(
+            "specify_cli.coordination.commit_router.safe_commit",
+            side_effect=AssertionError("safe_commit used"),
+        ),
+        patch(
+            "specify_cli.coordination.commit_router.plumbing_commit",
+            side_effect=lambda **kw: plumbed.append(kw) or _FakeCommitResult(),
+        ),
+    ):
+        from specify_cli.coordination.commit_router import commit_for_mission
+
+        result = commit_for_mission(
+            repo_root=tmp_path,
+            mission_slug="001-my-mission",
+            files=(matrix, events),
+            message="Add acceptance matrix",
+            policy=_make_policy(protected=True),
+            kind=MissionArtifactKind.ACCEPTANCE_MATRIX,
+        )
+
+    assert result.status == "committed"
+    assert result.commit_hash == _FakeCommitResult.sha
+    assert [(kw["source_root"], kw["paths"]) for kw in plumbed] == [(tmp_path, (matrix,))]
+
+
+def test_plumbing_commit_runs_from_an_existing_coord_worktree(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """An already-materialised coord worktree stays the source of the commit."""
+    monkeypatch.setenv("SPEC_KITTY_PLUMBING_COMMITS", "1")
+    artifact = tmp_path / "acceptance-matrix.json"
+    artifact.write_text("{}\n", encoding="utf-8")
+    coord_root = tmp_path / ".worktrees" / "coord"
+    coord_artifact = coord_root / "acceptance-matrix.json"
+    coord_artifact.parent.mkdir(parents=True)
+    coord_artifact.write_text("{}\n", encoding="utf-8")
+    plumbed: list[dict[str, object]] = []
+
+    with (
+        _patch_topology(coord=True),
+        _patch_primary_target(),
+        patch(
+            "specify_cli.coordination.commit_router.resolve_placement_only",
+            return_value=_make_coord_target(),
+        ),
+        patch("specify_cli.coordination.commit_router._resolve_mid8", return_value="ABCD1234"),
+        patch(
+            "specify_cli.coordination.workspace.CoordinationWorkspace.is_present",
+            return_value=True,
+        ),
+        patch(
+            "specify_cli.coordination.commit_router._materialise_coord_worktree",
+            return_value=(coord_root, (coord_artifact,)),
+        ),
+        patch(
+            "specify_cli.coordination.commit_router.safe_commit",
+            side_effect=AssertionError("safe_commit used"),
+        ),
+        patch(
+            "specify_cli.coordination.commit_router.plumbing_commit",
+            side_effect=lambda **kw: plumbed.append(kw) or _FakeCommitResult(),
+        ),
+    ):
+        from specify_cli.coordination.commit_router import commit_for_mission
+
+        result = commit_for_mission(
+            repo_root=tmp_path,
+            mission_slug="001-my-mission",
+            files=(artifact,),
+            message="Add acceptance matrix",
+            policy=_make_policy(protected=True),
+            kind=MissionArtifactKind.ACCEPTANCE_MATRIX,
+        )
+
+    assert result.status == "committed"
+    assert [(kw["source_root"], kw["paths"]) for kw in plumbed] == [(coord_root, (coord_artifact,))]
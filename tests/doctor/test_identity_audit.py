@@ -323,6 +323,21 @@ def test_find_duplicate_prefixes_no_duplicates(tmp_path: Path) -> None:
     assert dupes == {}
 
 
+def test_find_duplicate_prefixes_from_states_matches_rescan(tmp_path: Path) -> None:
+    """Grouping precomputed audit_repo() states equals the directory rescan."""
+    specs = tmp_path / "kitty-specs"
+    _mission_dir(specs, "080-alpha", _ULID_A, 80)
+    _mission_dir(specs, "080-beta", _ULID_B, None)
+    _mission_dir(specs, "081-gamma", _ULID_C, 81)
+    _mission_dir(specs, "no-prefix", None, None)
+
+    states = audit_repo(tmp_path)
+    from_states = find_duplicate_prefixes(tmp_path, states=states)
+
+    assert from_states == find_duplicate_prefixes(tmp_path)
+    assert [s.slug for s in from_states["080"]] == ["080-alpha", "080-beta"]
+
+
 def test_find_duplicate_prefixes_missing_specs_dir_returns_empty(tmp_path: Path) -> None:
     """Missing kitty-specs/ returns an empty duplicate-prefix report."""
     assert find_duplicate_prefixes(tmp_path) == {}
@@ -0,0 +1,167 @@
+"""Tests for the persistent dossier content-hash cache (incremental indexing).
+
+Covers:
+- Unchanged files are answered from the cache without rehashing
+- Modified / added / removed files invalidate exactly their own entries
+- Racily-modified files are never trusted from the cache
+- The stat-only no-change fast path (cached_parity_hash / drift detection)
+- Corrupt caches degrade to a full re-index with identical results
+"""
+
+import json
+import os
+import time
+import uuid
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from specify_cli.dossier.drift_detector import (
+    BaselineSnapshot,
+    compute_baseline_key,
+    detect_drift_without_reindex,
+    save_baseline,
+)
+from specify_cli.dossier.hash_cache import (
+    DossierHashCache,
+    cached_parity_hash,
+    hash_cache_path,
+)
+from specify_cli.dossier.indexer import Indexer
+from specify_cli.dossier.manifest import ManifestRegistry
+from specify_cli.dossier.snapshot import compute_snapshot
+from specify_cli.identity.project import ProjectIdentity
+
+pytestmark = [pytest.mark.unit, pytest.mark.fast]
+
+_OLD = time.time() - 3600
+
+
+def _write(path: Path, text: str, *, mtime: float = _OLD) -> None:
+    """Write *text* and back-date its mtime outside the racy window."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    os.utime(path, (mtime, mtime))
+
+
+@pytest.fixture
+def feature_dir(tmp_path: Path) -> Path:
+    feature = tmp_path / "042-cache-test"
+    _write(feature / "spec.md", "# Spec\n")
+    _write(feature / "plan.md", "# Plan\n")
+    _write(feature / "research" / "notes.md", "notes\n")
+    return feature
+
+
+def _index(feature: Path) -> tuple[Indexer, object]:
+    indexer = Indexer(ManifestRegistry(), use_hash_cache=True)
+    return indexer, indexer.index_feature(feature, "software-dev")
+
+
+def _present_hashes(dossier) -> dict[str, str]:
+    return {a.relative_path: a.content_hash_sha256 for a in dossier.artifacts if a.is_present}
+
+
+class TestIncrementalIndexing:
+    def test_second_scan_rehashes_nothing(self, feature_dir: Path) -> None:
+        _, first = _index(feature_dir)
+        assert hash_cache_path(feature_dir, feature_dir.name).exists()
+
+        with patch("specify_cli.dossier.indexer.hash_file_with_validation") as mock_hash:
+            _, second = _index(feature_dir)
+
+        mock_hash.assert_not_called()
+        assert _present_hashes(second) == _present_hashes(first)
+
+    def test_only_modified_file_is_rehashed(self, feature_dir: Path) -> None:
+        _index(feature_dir)
+        _write(feature_dir / "plan.md", "# Plan v2\n", mtime=_OLD + 10)
+
+        from specify_cli.dossier import indexer as indexer_module
+
+        real_hash = indexer_module.hash_file_with_validation
+        with patch.object(indexer_module, "hash_file_with_validation", side_effect=real_hash) as spy:
+            _, dossier = _index(feature_dir)
+
+        assert [call.args[0].name for call in spy.call_args_list] == ["plan.md"]
+        uncached = Indexer(ManifestRegistry()).index_feature(feature_dir, "software-dev")
+        assert _present_hashes(dossier) == _present_hashes(uncached)
+
+    def test_removed_file_is_pruned(self, feature_dir: Path) -> None:
+        _index(feature_dir)
+        (feature_dir / "research" / "notes.md").unlink()
+        _index(feature_dir)
+
+        data = json.loads(hash_cache_path(feature_dir, feature_dir.name).read_text(encoding="utf-8"))
+        assert "research/notes.md" not in data["entries"]
+
+    def test_racy_file_is_not_cached(self, feature_dir: Path) -> None:
+        _write(feature_dir / "fresh.md", "just written\n", mtime=time.time())
+        _index(feature_dir)
+
+        data = json.loads(hash_cache_path(feature_dir, feature_dir.name).read_text(encoding="utf-8"))
+        assert "fresh.md" not in data["entries"]
+        assert data["scan_fingerprint"] is None
+
+    def test_corrupt_cache_falls_back_to_full_index(self, feature_dir: Path) -> None:
+        _, first = _index(feature_dir)
+        hash_cache_path(feature_dir, feature_dir.name).write_text("{not json", encoding="utf-8")
+
+        _, second = _index(feature_dir)
+
+        assert _present_hashes(second) == _present_hashes(first)
+        assert DossierHashCache.load(feature_dir, feature_dir.name).scan_fingerprint is not None
+
+    def test_cache_disabled_by_default(self, feature_dir: Path) -> None:
+        Indexer(ManifestRegistry()).index_feature(feature_dir, "software-dev")
+        assert not hash_cache_path(feature_dir, feature_dir.name).exists()
+
+
+class TestNoChangeFastPath:
+    def test_cached_parity_hash_matches_snapshot(self, feature_dir: Path) -> None:
+        _, dossier = _index(feature_dir)
+        snapshot = compute_snapshot(dossier)
+
+        assert cached_parity_hash(feature_dir, feature_dir.name) == snapshot.parity_hash_sha256
+
+    def test_cached_parity_hash_none_after_change(self, feature_dir: Path) -> None:
+        _index(feature_dir)
+        _write(feature_dir / "new-contract.md", "contract\n")
+
+        assert cached_parity_hash(feature_dir, feature_dir.name) is None
+
+    def test_drift_without_reindex(self, feature_dir: Path, tmp_path: Path) -> None:
+        identity = ProjectIdentity(project_uuid=uuid.UUID("11111111-1111-1111-1111-111111111111"), node_id="node-a")
+        context = {
+            "target_branch": "main",
+            "mission_type": "software-dev",
+            "manifest_version": "1",
+        }
+        assert detect_drift_without_reindex(feature_dir.name, feature_dir, tmp_path, identity, **context) is None
+
+        _index(feature_dir)
+        key = compute_baseline_key(mission_slug=feature_dir.name, project_identity=identity, **context)
+        save_baseline(
+            feature_dir.name,
+            BaselineSnapshot(
+                baseline_key=key,
+                baseline_key_hash=key.compute_hash(),
+                parity_hash_sha256="sha256:stale",
+                captured_at=_now(),
+                captured_by="node-a",
+            ),
+            tmp_path,
+        )
+
+        result = detect_drift_without_reindex(feature_dir.name, feature_dir, tmp_path, identity, **context)
+        assert result is not None
+        has_drift, drift_info = result
+        assert has_drift is True
+        assert drift_info["baseline_parity_hash"] == "sha256:stale"
+
+
+def _now():
+    from kernel.clock import now_utc
+
+    return now_utc()
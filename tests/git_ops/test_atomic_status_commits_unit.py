@@ -41,7 +41,9 @@ def _unchanged_result(ref: str = "main") -> CommitRouterResult:
 from specify_cli.status.locking import (
     FeatureStatusLockTimeoutError,
     feature_status_lock,
+    feature_status_lock_metrics,
     feature_status_lock_path,
+    reset_feature_status_lock_metrics,
 )
 from specify_cli.status.models import Lane, StatusEvent
 from specify_cli.status.store import append_event, read_events
@@ -231,6 +233,38 @@ class TestFeatureStatusLock:
                 with feature_status_lock(repo, "017-test-feature", timeout=0):
                     pass
 
+    def test_common_dir_is_resolved_once_per_repo_root(self, tmp_path: Path) -> None:
+        """Repeated lock-path lookups must not fork ``git rev-parse`` again."""
+        repo = tmp_path / "test-repo"
+        repo.mkdir()
+
+        with patch(
+            "specify_cli.status.locking.subprocess.run",
+            return_value=Mock(returncode=0, stdout=".git\n"),
+        ) as run:
+            first = feature_status_lock_path(repo, "017-test-feature")
+            second = feature_status_lock_path(repo, "018-other-feature")
+
+        assert run.call_count == 1
+        assert first.parent == second.parent == (repo / ".git").resolve() / "spec-kitty-locks"
+
+    def test_lock_records_wait_and_hold_metrics(self, tmp_path: Path) -> None:
+        """Only the outermost acquisition is timed; re-entry is free."""
+        repo = tmp_path / "test-repo"
+        repo.mkdir()
+        subprocess.run(["git", "init", "-b", "main"], cwd=repo, check=True, capture_output=True)
+        reset_feature_status_lock_metrics()
+
+        with feature_status_lock(repo, "017-test-feature") as lock_path:
+            with feature_status_lock(repo, "017-test-feature"):
+                pass
+
+        metrics = feature_status_lock_metrics()[str(lock_path)]
+        assert metrics.acquisitions == 1
+        assert metrics.contended == 0
+        assert metrics.total_hold_s >= 0.0
+        assert metrics.max_wait_s == metrics.total_wait_s
+
     # test_lock_serializes_parallel_processes removed — pre-existing flaky
     # race condition dependent on OS scheduling (fails intermittently).
 
@@ -0,0 +1,185 @@
+"""``tests/kernel/`` coverage for :mod:`kernel.tracing` -- the opt-in span API.
+
+Pins the disabled path (one shared no-op context manager, decorated functions
+unchanged, nothing recorded), the recorded Chrome-trace event shape (``"X"``
+complete events with category, args, thread id and the exception type of a
+failing body) and the per-invocation file the trace is written to.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from kernel import tracing
+
+pytestmark = pytest.mark.fast
+
+
+@pytest.fixture(autouse=True)
+def _tracing_off() -> Iterator[None]:
+    tracing.reset()
+    yield
+    tracing.reset()
+
+
+def _spans() -> list[dict[str, object]]:
+    recorder = tracing._RECORDER
+    assert recorder is not None
+    return list(recorder.events)
+
+
+def test_disabled_span_is_a_shared_noop() -> None:
+    assert not tracing.is_enabled()
+    assert tracing.span("status.reduce") is tracing.span("git.run", args=["status"])
+    with tracing.span("status.reduce"):
+        pass
+    assert tracing.write_trace() is None
+
+
+def test_disabled_traced_function_passes_through() -> None:
+    @tracing.traced("status.reduce")
+    def double(value: int) -> int:
+        return value * 2
+
+    assert double(21) == 42
+    assert double.__name__ == "double"
+    assert tracing._RECORDER is None
+
+
+def test_install_if_requested_reads_the_env_var(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv(tracing.TRACE_ENV_VAR, raising=False)
+    assert tracing.install_if_requested() is False
+
+    monkeypatch.setenv(tracing.TRACE_ENV_VAR, "yes")
+    assert tracing.install_if_requested() is True
+    assert tracing.is_enabled()
+
+
+@pytest.mark.parametrize(("value", "expected"), [("1", True), ("On", True), ("0", False), ("", False)])
+def test_is_requested_truthiness(value: str, expected: bool) -> None:
+    assert tracing.is_requested({tracing.TRACE_ENV_VAR: value}) is expected
+
+
+def test_enabled_spans_record_complete_events() -> None:
+    tracing.enable()
+
+    @tracing.traced("status.reduce")
+    def fold() -> str:
+        with tracing.span("status.store.read", mission="001-demo"):
+            return "snapshot"
+
+    assert fold() == "snapshot"
+
+    inner, outer = _spans()
+    assert inner["name"] == "status.store.read"
+    assert inner["cat"] == "status"
+    assert inner["ph"] == "X"
+    assert inner["args"] == {"mission": "001-demo"}
+    assert outer["name"] == "status.reduce"
+    assert "args" not in outer
+    # The inner span nests inside the outer one on the same thread.
+    assert outer["ts"] <= inner["ts"]  # type: ignore[operator]
+    assert inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"] + 1  # type: ignore[operator]
+    assert inner["tid"] == outer["tid"] == threading.get_ident()
+
+
+def test_failing_body_records_the_exception_type() -> None:
+    tracing.enable()
+
+    with pytest.raises(ValueError), tracing.span("git.run"):
+        raise ValueError("boom")
+
+    (event,) = _spans()
+    assert event["args"] == {"error": "ValueError"}
+
+
+def test_spans_from_worker_threads_carry_their_thread_id() -> None:
+    tracing.enable()
+    worker_ids: list[int] = []
+
+    def work() -> None:
+        worker_ids.append(threading.get_ident())
+        with tracing.span("sync.queue.drain"):
+            pass
+
+    thread = threading.Thread(target=work)
+    thread.start()
+    thread.join()
+
+    (event,) = _spans()
+    assert event["tid"] == worker_ids[0]
+
+
+def test_write_trace_emits_a_chrome_trace_document(tmp_path: Path) -> None:
+    target = tmp_path / "out" / "trace.json"
+    tracing.enable(target)
+    with tracing.span("doctrine.load", kind="directive", layer="builtin"):
+        pass
+
+    assert tracing.write_trace() == target
+    document = json.loads(target.read_text(encoding="utf-8"))
+    assert document["displayTimeUnit"] == "ms"
+    metadata, event = document["traceEvents"]
+    assert metadata["ph"] == "M"
+    assert metadata["name"] == "process_name"
+    assert event["name"] == "doctrine.load"
+    assert event["args"] == {"kind": "directive", "layer": "builtin"}
+
+
+def test_trace_file_env_var_sets_the_output(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    target = tmp_path / "from-env.json"
+    monkeypatch.setenv(tracing.TRACE_FILE_ENV_VAR, str(target))
+    tracing.enable()
+
+    assert tracing.write_trace() == target
+    assert target.is_file()
+
+
+def test_default_output_is_per_invocation_under_kittify_home(canonical_home: None, monkeypatch: pytest.MonkeyPatch) -> None:
+    del canonical_home  # the ONE SPEC_KITTY_HOME owner (R1a #3121) pins the home
+    monkeypatch.delenv(tracing.TRACE_FILE_ENV_VAR, raising=False)
+    tracing.enable()
+
+    target = tracing.write_trace()
+
+    assert target is not None
+    assert target.parent.name == "traces"
+    assert target.name.startswith("trace-")
+    assert target.name.endswith(f"-{tracing._RECORDER.pid}.json")  # type: ignore[union-attr]
+
+
+def test_enable_twice_keeps_recording_and_updates_the_output(tmp_path: Path) -> None:
+    tracing.enable()
+    with tracing.span("event_journal.append"):
+        pass
+    tracing.enable(tmp_path / "later.json")
+
+    assert tracing.write_trace() == tmp_path / "later.json"
+    assert len(_spans()) == 1
+
+
+def test_unserialisable_args_are_written_as_strings(tmp_path: Path) -> None:
+    tracing.enable(tmp_path / "trace.json")
+    with tracing.span("git.run", cwd=tmp_path):
+        pass
+
+    tracing.write_trace()
+    document = json.loads((tmp_path / "trace.json").read_text(encoding="utf-8"))
+    assert document["traceEvents"][1]["args"] == {"cwd": str(tmp_path)}
+
+
+def test_write_at_exit_reports_an_unwritable_target(tmp_path: Path, capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch) -> None:
+    blocker = tmp_path / "file"
+    blocker.write_text("", encoding="utf-8")
+    tracing.enable(blocker / "trace.json")
+    monkeypatch.setattr(sys, "__stderr__", sys.stderr)
+
+    tracing._write_at_exit()
+
+    assert "could not write trace" in capsys.readouterr().err
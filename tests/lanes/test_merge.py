@@ -11,6 +11,7 @@ from specify_cli.lanes.merge import (
     _git_common_dir,
     _merge_branch_into,
     _remove_info_attributes,
+    consolidate_disjoint_lanes,
     consolidate_lane_into_mission,
     integrate_mission_into_target,
 )
@@ -219,6 +220,79 @@ class TestMergeLaneToMission:
         assert "git checkout release/3.1.1 && git merge kitty/mission-010-feat" in result.errors[0]
 
 
+class TestConsolidateDisjointLanes:
+    MISSION = "kitty/mission-010-feat"
+
+    def _lane(self, lane_id, scope):
+        return ExecutionLane(
+            lane_id=lane_id,
+            wp_ids=(),
+            write_scope=scope,
+            predicted_surfaces=(),
+            depends_on_lanes=(),
+            parallel_group=0,
+        )
+
+    def _setup(self, tmp_path, lane_files, scopes=None):
+        """Create one lane branch per entry of ``lane_files`` (lane_id -> path)."""
+        repo = _make_repo(tmp_path)
+        _run(["git", "branch", self.MISSION], repo)
+        for lane_id, path in lane_files.items():
+            _run(["git", "checkout", "-b", f"{self.MISSION}-{lane_id}", self.MISSION], repo)
+            _commit(repo, path, f"{lane_id}\n", f"{lane_id} work")
+        _run(["git", "checkout", "main"], repo)
+        scopes = scopes or {lane_id: (f"{path.rsplit('/', 1)[0]}/**",) for lane_id, path in lane_files.items()}
+        manifest = _make_manifest(lanes=[self._lane(lane_id, scope) for lane_id, scope in scopes.items()])
+        return repo, manifest
+
+    def test_disjoint_lanes_match_serial_result(self, tmp_path):
+        lane_files = {"lane-a": "src/a/x.py", "lane-b": "src/b/y.py", "lane-c": "docs/c/z.md"}
+        repo, manifest = self._setup(tmp_path, lane_files)
+        start = _git_stdout(repo, "rev-parse", self.MISSION)
+
+        results = consolidate_disjoint_lanes(repo, "010-feat", list(lane_files), manifest)
+
+        assert results is not None
+        assert [r.lane_id for r in results] == list(lane_files)
+        assert all(r.success and r.merged_into == self.MISSION for r in results)
+        fast_tree = _git_stdout(repo, "rev-parse", f"{self.MISSION}^{{tree}}")
+        # lane-a fast-forwards; lanes b and c are two-parent merge commits.
+        assert _git_stdout(repo, "log", "--format=%s", "--merges", self.MISSION).splitlines() == [
+            f"Merge {self.MISSION}-lane-c into {self.MISSION}",
+            f"Merge {self.MISSION}-lane-b into {self.MISSION}",
+        ]
+
+        _run(["git", "branch", "-f", self.MISSION, start], repo)
+        for lane_id in lane_files:
+            assert consolidate_lane_into_mission(repo, "010-feat", lane_id, manifest).success
+        assert _git_stdout(repo, "rev-parse", f"{self.MISSION}^{{tree}}") == fast_tree
+
+    def test_overlapping_write_scopes_fall_back(self, tmp_path):
+        lane_files = {"lane-a": "src/a/x.py", "lane-b": "src/b/y.py"}
+        repo, manifest = self._setup(tmp_path, lane_files, scopes={"lane-a": ("src/**",), "lane-b": ("src/b/**",)})
+        start = _git_stdout(repo, "rev-parse", self.MISSION)
+
+        assert consolidate_disjoint_lanes(repo, "010-feat", list(lane_files), manifest) is None
+        assert _git_stdout(repo, "rev-parse", self.MISSION) == start
+
+    def test_lanes_touching_same_file_fall_back(self, tmp_path):
+        lane_files = {"lane-a": "src/a/x.py", "lane-b": "src/b/y.py"}
+        repo, manifest = self._setup(tmp_path, lane_files)
+        _run(["git", "checkout", f"{self.MISSION}-lane-b"], repo)
+        _commit(repo, "src/a/x.py", "out of scope\n", "stray edit")
+        _run(["git", "checkout", "main"], repo)
+        start = _git_stdout(repo, "rev-parse", self.MISSION)
+
+        assert consolidate_disjoint_lanes(repo, "010-feat", list(lane_files), manifest) is None
+        assert _git_stdout(repo, "rev-parse", self.MISSION) == start
+
+    def test_merge_driver_paths_fall_back(self, tmp_path):
+        lane_files = {"lane-a": "kitty-specs/010-feat/status.events.jsonl", "lane-b": "src/b/y.py"}
+        repo, manifest = self._setup(tmp_path, lane_files)
+
+        assert consolidate_disjoint_lanes(repo, "010-feat", list(lane_files), manifest) is None
+
+
 class TestMergeMissionToTarget:
     def test_successful_mission_merge(self, tmp_path):
         repo = _make_repo(tmp_path)
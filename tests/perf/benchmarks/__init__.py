@@ -0,0 +1,22 @@
+"""Statistical benchmarks for the status, sync, doctrine, mission and review-gate hot paths.
+
+Every benchmark here uses the ``pytest-benchmark`` ``benchmark`` fixture with
+a per-domain ``group=`` and is marked ``performance``, so it only runs in the
+off-PR ``benchmarks`` leg of ``.github/workflows/performance.yml`` (ADR
+2026-08-22-1) or locally with ``SPEC_KITTY_RUN_PERFORMANCE=1``. Inputs come
+from the seeded, offline generators in :mod:`tests.perf.benchmarks.generators`
+-- nothing touches the network or a SaaS endpoint.
+
+Baselines are pytest-benchmark saved runs under
+``tests/performance/baselines/<machine tag>/`` (for example
+``Linux-CPython-3.11-64bit``). Run and compare locally with::
+
+    SPEC_KITTY_RUN_PERFORMANCE=1 uv run pytest tests/perf/benchmarks -m performance -n0 \\
+        --benchmark-storage=file://tests/performance/baselines \\
+        --benchmark-json=out/benchmarks.json
+    uv run python scripts/benchmarks/compare_baseline.py out/benchmarks.json
+
+``compare_baseline.py`` prints a markdown report and exits non-zero when a
+median regressed by more than 10% against the newest saved baseline for the
+same machine tag. Record a new baseline with ``--benchmark-save=benchmarks``.
+"""
@@ -0,0 +1,302 @@
+"""Seeded synthetic inputs for the hot-path benchmarks.
+
+Every generator is deterministic for its arguments, so two runs of a
+benchmark measure the same workload and a baseline compare is meaningful.
+Sizes are arguments rather than constants; the benchmark modules pick the
+scale they measure at.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import string
+from pathlib import Path
+from typing import Any
+
+from glossary.models import Provenance, SenseStatus, TermSense, TermSurface
+from glossary.scope import GlossaryScope
+from glossary.store import GlossaryStore
+from kernel.clock import UTC, datetime, timedelta
+from specify_cli.event_journal.journal import _event_document
+from specify_cli.event_journal.models import Event
+from specify_cli.ownership.models import OwnershipManifest, WorkProductKind
+from specify_cli.status.models import Lane, StatusEvent
+from specify_cli.status.store import append_events_atomic
+from specify_cli.sync.project_store import ProjectUnitOfWork
+from specify_cli.sync.queue import OfflineQueue, _task_metadata
+
+__all__ = [
+    "BENCH_PROJECT_UUID",
+    "coalesceable_event",
+    "drg_graph_yaml",
+    "glossary_store",
+    "glossary_text",
+    "lane_inputs",
+    "outbox_event",
+    "seed_outbox",
+    "slow_test_suite",
+    "status_events",
+    "write_mission",
+]
+
+BENCH_PROJECT_UUID = "bbbbbbbb-0000-0000-0000-0000000be4c0"
+
+_EPOCH = datetime(2026, 1, 1, tzinfo=UTC)
+
+# planned -> claimed -> in_progress, then review/rework cycles: the shape of
+# a long-running mission's event log.
+_OPENING = ((Lane.PLANNED, Lane.CLAIMED), (Lane.CLAIMED, Lane.IN_PROGRESS))
+_REWORK_CYCLE = (
+    (Lane.IN_PROGRESS, Lane.FOR_REVIEW),
+    (Lane.FOR_REVIEW, Lane.IN_REVIEW),
+    (Lane.IN_REVIEW, Lane.IN_PROGRESS),
+)
+
+
+def _wp_id(index: int) -> str:
+    return f"WP{index + 1:02d}"
+
+
+def status_events(
+    mission_slug: str,
+    *,
+    wp_count: int,
+    event_count: int,
+    collision_every: int = 7,
+) -> list[StatusEvent]:
+    """Return *event_count* lane transitions spread round-robin over *wp_count* WPs.
+
+    Every *collision_every*-th event reuses the previous event's timestamp,
+    exercising the reducer's ``(at, event_id)`` tie-break.
+    """
+    events: list[StatusEvent] = []
+    steps = [0] * wp_count
+    at = _EPOCH
+    for index in range(event_count):
+        if index % collision_every:
+            at += timedelta(seconds=1)
+        wp = index % wp_count
+        step = steps[wp]
+        steps[wp] += 1
+        from_lane, to_lane = _OPENING[step] if step < len(_OPENING) else _REWORK_CYCLE[(step - len(_OPENING)) % len(_REWORK_CYCLE)]
+        events.append(
+            StatusEvent(
+                event_id=f"01BENCH{index:019d}",
+                mission_slug=mission_slug,
+                wp_id=_wp_id(wp),
+                from_lane=from_lane,
+                to_lane=to_lane,
+                at=at.isoformat(),
+                actor="bench-agent",
+                force=False,
+                execution_mode="worktree",
+            )
+        )
+    return events
+
+
+def write_mission(
+    kitty_specs: Path,
+    number: int,
+    *,
+    wp_count: int,
+    event_count: int,
+) -> Path:
+    """Write a mission directory with WP prompts and a populated event log."""
+    slug = f"{number:03d}-bench-mission-{number:03d}"
+    feature_dir = kitty_specs / slug
+    tasks_dir = feature_dir / "tasks"
+    tasks_dir.mkdir(parents=True)
+    meta = {
+        "mission_slug": slug,
+        "mission_number": f"{number:03d}",
+        "friendly_name": f"Bench mission {number}",
+        "mission_type": "software-dev",
+        "target_branch": "main",
+        "created_at": (_EPOCH + timedelta(days=number)).isoformat(),
+    }
+    (feature_dir / "meta.json").write_text(json.dumps(meta, indent=2) + "\n", encoding="utf-8")
+    for name in ("spec.md", "plan.md", "tasks.md"):
+        (feature_dir / name).write_text(f"# {name.removesuffix('.md').title()}\n", encoding="utf-8")
+    for wp in range(wp_count):
+        wp_id = _wp_id(wp)
+        dependencies = [_wp_id(wp - 1)] if wp % 4 else []
+        (tasks_dir / f"{wp_id}-bench.md").write_text(
+            f"---\nwork_package_id: {wp_id}\ntitle: Bench {wp_id}\ndependencies: {json.dumps(dependencies)}\n"
+            f'subtasks: ["T{wp:03d}1", "T{wp:03d}2"]\n---\n# Work Package Prompt: Bench {wp_id}\n',
+            encoding="utf-8",
+        )
+    append_events_atomic(feature_dir, status_events(slug, wp_count=wp_count, event_count=event_count))
+    return feature_dir
+
+
+def outbox_event(index: int, *, project_uuid: str = BENCH_PROJECT_UUID) -> dict[str, Any]:
+    """Return one non-coalescing outbox event envelope."""
+    return {
+        "event_id": f"bench-{index:07d}",
+        "event_type": "WPStatusChanged",
+        "project_uuid": project_uuid,
+        "created_at": (_EPOCH + timedelta(milliseconds=index)).isoformat(),
+        "payload": {"wp_id": _wp_id(index % 50), "sequence": index},
+    }
+
+
+def seed_outbox(
+    queue: OfflineQueue,
+    unit: ProjectUnitOfWork,
+    count: int,
+    *,
+    written: int = 1_000,
+    project_uuid: str = BENCH_PROJECT_UUID,
+) -> None:
+    """Fill the outbox with *count* pending events.
+
+    The first *written* events go through ``OfflineQueue.queue_event`` (which
+    also opens the capture epoch); the rest are bulk-inserted as the same
+    journal and outbox rows. ``queue_event`` re-counts the outbox on every
+    call, so seeding 100k events through it alone is quadratic and takes far
+    longer than the drain being measured.
+    """
+    for index in range(min(written, count)):
+        queue.queue_event(outbox_event(index, project_uuid=project_uuid))
+    if count <= written:
+        return
+    epoch_row = unit.execute(
+        "SELECT epoch_id, capture_sequence FROM journal_entries WHERE project_uuid = ? ORDER BY capture_sequence DESC LIMIT 1",
+        (project_uuid,),
+    ).fetchone()
+    assert epoch_row is not None
+    epoch_id, sequence = int(epoch_row[0]), int(epoch_row[1])
+    for index in range(written, count):
+        envelope = outbox_event(index, project_uuid=project_uuid)
+        sequence += 1
+        event = Event(
+            event_id=envelope["event_id"],
+            event_type=envelope["event_type"],
+            payload=json.dumps(envelope, sort_keys=True, separators=(",", ":")).encode(),
+            occurred_at=envelope["created_at"],
+            created_at=envelope["created_at"],
+            project_uuid=project_uuid,
+        )
+        unit.execute(
+            "INSERT INTO journal_entries (entry_id, project_uuid, epoch_id, capture_sequence, payload_json, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+            (event.event_id, project_uuid, epoch_id, sequence, _event_document(event), event.created_at),
+        )
+        unit.execute(
+            "INSERT INTO outbox_tasks (task_id, project_uuid, epoch_id, journal_entry_id, task_kind, state, idempotency_identity, created_at) "
+            "VALUES (?, ?, ?, ?, 'event', 'pending', ?, ?)",
+            (f"event:{event.event_id}", project_uuid, epoch_id, event.event_id, _task_metadata(event.event_id), event.created_at),
+        )
+    unit.execute("UPDATE capture_sequences SET next_sequence = ? WHERE project_uuid = ?", (sequence, project_uuid))
+
+
+def coalesceable_event(index: int, *, key_count: int, project_uuid: str = BENCH_PROJECT_UUID) -> Event:
+    """Return a journal event whose coalesce key repeats every *key_count* events."""
+    key = f"{project_uuid}|bench-mission-{index % key_count:03d}"
+    stamp = (_EPOCH + timedelta(milliseconds=index)).isoformat()
+    return Event(
+        event_id=f"coalesce-{index:07d}",
+        event_type="MissionDossierSnapshotComputed",
+        payload=json.dumps({"sequence": index, "key": key}).encode(),
+        occurred_at=stamp,
+        created_at=stamp,
+        coalesce_key=key,
+        project_uuid=project_uuid,
+    )
+
+
+def drg_graph_yaml(*, action_count: int, artifacts_per_action: int) -> str:
+    """Return a DRG document: actions scoping directives that suggest tactics."""
+    nodes: list[str] = []
+    edges: list[str] = []
+    for action in range(action_count):
+        action_urn = f"action:software-dev/bench-step-{action:04d}"
+        nodes.append(f'  - urn: "{action_urn}"\n    kind: action\n    label: bench-step-{action:04d}')
+        for artifact in range(artifacts_per_action):
+            directive = f"directive:BENCH_{action:04d}_{artifact:02d}"
+            tactic = f"tactic:bench-{action:04d}-{artifact:02d}"
+            nodes.append(f'  - urn: "{directive}"\n    kind: directive\n    label: Bench directive {action}.{artifact}')
+            nodes.append(f'  - urn: "{tactic}"\n    kind: tactic\n    label: Bench tactic {action}.{artifact}')
+            edges.append(f'  - source: "{action_urn}"\n    target: "{directive}"\n    relation: scope')
+            edges.append(f'  - source: "{directive}"\n    target: "{tactic}"\n    relation: suggests')
+    header = 'schema_version: "1.0"\ngenerated_at: "2026-01-01T00:00:00+00:00"\ngenerated_by: "benchmark"\n'
+    return header + "nodes:\n" + "\n".join(nodes) + "\nedges:\n" + "\n".join(edges) + "\n"
+
+
+def _glossary_terms(term_count: int, seed: int) -> list[str]:
+    rng = random.Random(seed)
+    terms: dict[str, None] = {}
+    while len(terms) < term_count:
+        terms["".join(rng.choices(string.ascii_lowercase, k=rng.randint(6, 9)))] = None
+    return list(terms)
+
+
+def glossary_store(term_count: int, *, seed: int = 42) -> tuple[GlossaryStore, list[str]]:
+    """Return a store of *term_count* active core senses and the terms it holds."""
+    terms = _glossary_terms(term_count, seed)
+    store = GlossaryStore(Path("/dev/null"))
+    for term in terms:
+        store.add_sense(
+            TermSense(
+                surface=TermSurface(term),
+                scope=GlossaryScope.SPEC_KITTY_CORE.value,
+                definition=f"Synthetic definition for {term}.",
+                provenance=Provenance(actor_id="bench", timestamp=_EPOCH, source="benchmark"),
+                confidence=1.0,
+                status=SenseStatus.ACTIVE,
+            )
+        )
+    return store, terms
+
+
+def glossary_text(terms: list[str], *, word_count: int, hit_rate: float = 0.2, seed: int = 7) -> str:
+    """Return prose of *word_count* words, a *hit_rate* share of them glossary terms."""
+    rng = random.Random(seed)
+    words = [rng.choice(terms) if rng.random() < hit_rate else "".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 5))) for _ in range(word_count)]
+    return " ".join(words)
+
+
+def lane_inputs(
+    wp_count: int,
+    *,
+    files_per_wp: int = 6,
+    shared_every: int = 5,
+) -> tuple[dict[str, list[str]], dict[str, OwnershipManifest]]:
+    """Return a dependency graph and ownership manifests for *wp_count* WPs.
+
+    WPs depend on their predecessor in chains of four; every *shared_every*-th
+    WP also owns a file of the previous one, forcing lane unions.
+    """
+    graph: dict[str, list[str]] = {}
+    manifests: dict[str, OwnershipManifest] = {}
+    for wp in range(wp_count):
+        wp_id = _wp_id(wp)
+        graph[wp_id] = [_wp_id(wp - 1)] if wp % 4 else []
+        owned = [f"src/bench/module_{wp:03d}/file_{index}.py" for index in range(files_per_wp)]
+        if wp and wp % shared_every == 0:
+            owned.append(f"src/bench/module_{wp - 1:03d}/file_0.py")
+        manifests[wp_id] = OwnershipManifest(
+            execution_mode=WorkProductKind.CODE_CHANGE,
+            owned_files=tuple(owned),
+            authoritative_surface=f"src/bench/module_{wp:03d}/",
+        )
+    return graph, manifests
+
+
+def slow_test_suite(root: Path, *, target_count: int, tests_per_target: int, sleep_s: float) -> list[str]:
+    """Write a pytest suite of sleeping tests under *root*; return its test targets.
+
+    Target *i* holds ``tests_per_target * (i + 1)`` tests, so the targets have
+    uneven, known durations -- the shape the pre-review head-run sharding
+    balances on.
+    """
+    targets: list[str] = []
+    for index in range(target_count):
+        target = f"tests/target_{index:02d}"
+        package = root / target
+        package.mkdir(parents=True)
+        body = "".join(f"\n\ndef test_sleep_{test:03d}() -> None:\n    time.sleep({sleep_s!r})\n" for test in range(tests_per_target * (index + 1)))
+        (package / f"test_target_{index:02d}.py").write_text(f"import time{body}", encoding="utf-8")
+        targets.append(f"{target}/")
+    return targets
@@ -0,0 +1,51 @@
+"""Benchmarks: charter context rendering (``charter.context.build_charter_context``).
+
+Renders against a copy of this repository's own charter and config, so the
+workload tracks the real built-in doctrine. The cold benchmark clears the
+rendered-context memo before every round; the warm one measures a memo hit.
+"""
+
+from __future__ import annotations
+
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from charter.context import build_charter_context
+from charter.context_memo import CHARTER_CONTEXT_MEMO_DIR
+
+pytestmark = [pytest.mark.slow, pytest.mark.performance]
+
+_REPO_ROOT = Path(__file__).resolve().parents[3]
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    kittify = tmp_path / ".kittify"
+    shutil.copytree(_REPO_ROOT / ".kittify" / "charter", kittify / "charter")
+    shutil.copy2(_REPO_ROOT / ".kittify" / "config.yaml", kittify / "config.yaml")
+    subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+    return tmp_path
+
+
+def _render(project: Path) -> str:
+    return build_charter_context(project, action="implement", mission_type="software-dev", depth=2, mark_loaded=False).text
+
+
+@pytest.mark.benchmark(group="charter")
+def test_build_charter_context_cold(benchmark: BenchmarkFixture, project: Path) -> None:
+    memo_dir = project / ".kittify" / "runtime" / CHARTER_CONTEXT_MEMO_DIR
+
+    text = benchmark.pedantic(_render, args=(project,), setup=lambda: shutil.rmtree(memo_dir, ignore_errors=True), rounds=3)
+
+    assert text
+
+
+@pytest.mark.benchmark(group="charter", warmup=True, min_rounds=5)
+def test_build_charter_context_memo_hit(benchmark: BenchmarkFixture, project: Path) -> None:
+    expected = _render(project)
+
+    assert benchmark(_render, project) == expected
@@ -0,0 +1,61 @@
+"""Benchmarks: DRG loading and glossary term resolution (``doctrine.drg``, ``glossary``)."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from doctrine.drg.loader import load_built_in_graph, load_graph, merge_layers
+from glossary.chokepoint import DEFAULT_APPLICABLE_SCOPES, GlossaryChokepoint
+from glossary.drg_builder import build_index
+from tests.perf.benchmarks.generators import drg_graph_yaml, glossary_store, glossary_text
+
+pytestmark = [pytest.mark.slow, pytest.mark.performance]
+
+_ACTIONS = 250
+_ARTIFACTS_PER_ACTION = 8
+_GLOSSARY_TERMS = 2_000
+_GLOSSARY_WORDS = 5_000
+_SCOPES = [scope.value for scope in DEFAULT_APPLICABLE_SCOPES]
+
+
+@pytest.mark.benchmark(group="doctrine", warmup=True, min_rounds=5)
+def test_load_built_in_graph(benchmark: BenchmarkFixture) -> None:
+    graph = benchmark(load_built_in_graph)
+
+    assert graph.nodes
+
+
+@pytest.mark.benchmark(group="doctrine", warmup=True, min_rounds=5)
+def test_load_and_merge_synthetic_project_graph(benchmark: BenchmarkFixture, tmp_path: Path) -> None:
+    path = tmp_path / "graph.yaml"
+    path.write_text(drg_graph_yaml(action_count=_ACTIONS, artifacts_per_action=_ARTIFACTS_PER_ACTION), encoding="utf-8")
+    built_in = load_built_in_graph()
+
+    merged = benchmark(lambda: merge_layers(built_in, load_graph(path)))
+
+    assert len(merged.nodes) >= _ACTIONS * (1 + 2 * _ARTIFACTS_PER_ACTION)
+
+
+@pytest.mark.benchmark(group="glossary", warmup=True, min_rounds=5)
+def test_build_glossary_index(benchmark: BenchmarkFixture) -> None:
+    store, _terms = glossary_store(_GLOSSARY_TERMS)
+
+    index = benchmark(build_index, store, _SCOPES)
+
+    assert index.term_count == _GLOSSARY_TERMS
+
+
+@pytest.mark.benchmark(group="glossary", warmup=True, min_rounds=5)
+def test_glossary_chokepoint_scan(benchmark: BenchmarkFixture, tmp_path: Path) -> None:
+    store, terms = glossary_store(_GLOSSARY_TERMS)
+    chokepoint = GlossaryChokepoint(tmp_path)
+    chokepoint._index = build_index(store, _SCOPES)
+    text = glossary_text(terms, word_count=_GLOSSARY_WORDS)
+
+    bundle = benchmark(chokepoint.run, text)
+
+    assert bundle.error_msg is None
+    assert bundle.matched_urns
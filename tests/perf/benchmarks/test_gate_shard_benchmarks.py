@@ -0,0 +1,43 @@
+"""Benchmarks: sharded pre-review head run (``specify_cli.review.pre_review_gate``).
+
+The scoped suite is synthetic -- targets of sleeping tests with uneven sizes
+(see ``slow_test_suite``) -- so the measured wall clock is dominated by test
+time, not by pytest start-up, and the per-shard-count medians show how the
+run scales with ``shards``. The warmup round records the per-target timings
+that every measured round's shard plan balances on.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from specify_cli.review.pre_review_gate import HeadRunState, run_scoped_tests_at_head
+from tests.perf.benchmarks.generators import slow_test_suite
+
+pytestmark = [pytest.mark.slow, pytest.mark.performance]
+
+_TARGET_COUNT = 4
+_TESTS_PER_TARGET = 1
+_SLEEP_S = 0.5
+
+
+@pytest.fixture
+def suite(canonical_home: None, tmp_path: Path) -> tuple[Path, list[str]]:
+    del canonical_home  # the ONE SPEC_KITTY_HOME owner (R1a #3121) pins the home
+    repo = tmp_path / "repo"
+    (repo / ".git").mkdir(parents=True)
+    return repo, slow_test_suite(repo, target_count=_TARGET_COUNT, tests_per_target=_TESTS_PER_TARGET, sleep_s=_SLEEP_S)
+
+
+@pytest.mark.parametrize("shards", [1, 2, 4])
+@pytest.mark.benchmark(group="review", warmup=True, min_rounds=5)
+def test_scoped_head_run_by_shard_count(benchmark: BenchmarkFixture, suite: tuple[Path, list[str]], shards: int) -> None:
+    repo, targets = suite
+
+    result = benchmark(run_scoped_tests_at_head, targets, repo_root=repo, shards=shards)
+
+    assert result.state is HeadRunState.COMPLETED
+    assert result.current_failures == ()
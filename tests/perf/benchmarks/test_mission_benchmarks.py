@@ -0,0 +1,39 @@
+"""Benchmarks: dashboard mission scan and lane computation (``dashboard.scanner``, ``lanes``)."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from specify_cli.dashboard.scanner import scan_all_features
+from specify_cli.lanes.compute import compute_lanes
+from tests.perf.benchmarks.generators import lane_inputs, write_mission
+
+pytestmark = [pytest.mark.slow, pytest.mark.performance]
+
+_MISSIONS = 40
+_WPS_PER_MISSION = 12
+_EVENTS_PER_MISSION = 300
+_LANE_WPS = 200
+
+
+@pytest.mark.benchmark(group="dashboard", warmup=True, min_rounds=5)
+def test_scan_all_features(benchmark: BenchmarkFixture, tmp_path: Path) -> None:
+    (tmp_path / ".kittify").mkdir()
+    for number in range(1, _MISSIONS + 1):
+        write_mission(tmp_path / "kitty-specs", number, wp_count=_WPS_PER_MISSION, event_count=_EVENTS_PER_MISSION)
+
+    features = benchmark(scan_all_features, tmp_path)
+
+    assert len(features) == _MISSIONS
+
+
+@pytest.mark.benchmark(group="lanes", warmup=True, min_rounds=5)
+def test_compute_lanes(benchmark: BenchmarkFixture) -> None:
+    graph, manifests = lane_inputs(_LANE_WPS)
+
+    manifest = benchmark(compute_lanes, graph, manifests, "001-bench")
+
+    assert sum(len(lane.wp_ids) for lane in manifest.lanes) == _LANE_WPS
@@ -0,0 +1,36 @@
+"""Benchmarks: status event log fold and atomic append (``specify_cli.status``)."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from specify_cli.status.reducer import reduce
+from specify_cli.status.store import append_events_atomic, read_events
+from tests.perf.benchmarks.generators import status_events, write_mission
+
+pytestmark = [pytest.mark.slow, pytest.mark.performance]
+
+_WP_COUNT = 100
+_EVENT_COUNT = 20_000
+
+
+@pytest.mark.benchmark(group="status", warmup=True, min_rounds=5)
+def test_reduce_large_event_log(benchmark: BenchmarkFixture) -> None:
+    events = status_events("001-bench", wp_count=_WP_COUNT, event_count=_EVENT_COUNT)
+
+    snapshot = benchmark(reduce, events)
+
+    assert len(snapshot.work_packages) == _WP_COUNT
+
+
+@pytest.mark.benchmark(group="status", warmup=True, min_rounds=5)
+def test_append_events_atomic_to_large_log(benchmark: BenchmarkFixture, tmp_path: Path) -> None:
+    feature_dir = write_mission(tmp_path / "kitty-specs", 1, wp_count=_WP_COUNT, event_count=_EVENT_COUNT)
+    batch = status_events(feature_dir.name, wp_count=1, event_count=_EVENT_COUNT + 3)[-3:]
+
+    benchmark(append_events_atomic, feature_dir, batch)
+
+    assert len(read_events(feature_dir)) >= _EVENT_COUNT + len(batch)
@@ -0,0 +1,75 @@
+"""Benchmarks: project-store outbox drain and coalescing journal append (``specify_cli.sync``).
+
+The 100k-event outbox is seeded partly through ``OfflineQueue.queue_event``
+and partly by bulk row inserts (see ``seed_outbox``); only the drain is
+measured.
+"""
+
+from __future__ import annotations
+
+import itertools
+from collections.abc import Iterator
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from specify_cli.event_journal import coalesce
+from specify_cli.event_journal.journal import EventJournal, reset_coalesce_strategy
+from specify_cli.sync.project_store import ProjectSyncStore, ProjectUnitOfWork
+from specify_cli.sync.queue import OfflineQueue
+from tests.perf.benchmarks.generators import BENCH_PROJECT_UUID, coalesceable_event, seed_outbox
+
+pytestmark = [pytest.mark.slow, pytest.mark.performance]
+
+_OUTBOX_SIZE = 100_000
+_DRAIN_BATCH = 1_000
+_JOURNAL_SIZE = 2_000
+_COALESCE_KEYS = 50
+
+
+class _NothingDelivered:
+    def delivered_anywhere(self, event_id: str) -> bool:
+        del event_id
+        return False
+
+
+@pytest.fixture
+def store(canonical_home: None) -> ProjectSyncStore:
+    del canonical_home  # the ONE SPEC_KITTY_HOME owner (R1a #3121) pins the home
+    value = ProjectSyncStore(BENCH_PROJECT_UUID)
+    authority = value.layout_generation()
+    authority.begin_cutover("benchmark")
+    authority.publish_project_only("benchmark", verify_exact=lambda: True)
+    return value
+
+
+@pytest.fixture
+def unit(store: ProjectSyncStore) -> Iterator[ProjectUnitOfWork]:
+    with store.unit_of_work() as value:
+        yield value
+
+
+@pytest.mark.benchmark(group="sync", warmup=True, min_rounds=5)
+def test_drain_queue_from_full_outbox(benchmark: BenchmarkFixture, store: ProjectSyncStore, unit: ProjectUnitOfWork) -> None:
+    queue = OfflineQueue(unit, store.layout_generation())
+    seed_outbox(queue, unit, _OUTBOX_SIZE)
+
+    tasks = benchmark(queue.drain_queue, _DRAIN_BATCH)
+
+    assert len(tasks) == _DRAIN_BATCH
+
+
+@pytest.mark.benchmark(group="sync", warmup=True, min_rounds=5)
+def test_journal_append_with_coalescing(benchmark: BenchmarkFixture, store: ProjectSyncStore, unit: ProjectUnitOfWork) -> None:
+    journal = EventJournal(unit, store.layout_generation())
+    for index in range(_JOURNAL_SIZE):
+        journal.append(coalesceable_event(index, key_count=_COALESCE_KEYS))
+    coalesce.install(_NothingDelivered())
+    incoming = (coalesceable_event(index, key_count=_COALESCE_KEYS) for index in itertools.count(_JOURNAL_SIZE))
+    try:
+        receipt = benchmark(lambda: journal.append(next(incoming)))
+    finally:
+        reset_coalesce_strategy()
+
+    assert not receipt.inserted
+    assert journal.count() == _JOURNAL_SIZE
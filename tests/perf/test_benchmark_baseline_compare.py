@@ -0,0 +1,99 @@
+"""Unit guard for ``scripts/benchmarks/compare_baseline.py``.
+
+Feeds hand-written pytest-benchmark JSON documents through the comparison and
+asserts the >10% regression flagging, new-benchmark handling, newest-baseline
+selection and the missing-baseline exit code. No benchmark is executed.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import sys
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+import pytest
+
+pytestmark = [pytest.mark.slow]
+
+_SCRIPT_PATH = Path(__file__).resolve().parents[2] / "scripts" / "benchmarks" / "compare_baseline.py"
+_MACHINE_INFO = {"system": "Linux", "python_implementation": "CPython", "python_version": "3.11.9", "cpu": {"bits": 64}}
+_TAG = "Linux-CPython-3.11-64bit"
+
+
+@pytest.fixture(scope="module")
+def compare_baseline() -> ModuleType:
+    """Import the script by path (scripts/ is not a package)."""
+    spec = importlib.util.spec_from_file_location("compare_baseline", _SCRIPT_PATH)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        sys.modules.pop(spec.name, None)
+        raise
+    return module
+
+
+def _run(medians: dict[str, float]) -> dict[str, Any]:
+    return {
+        "machine_info": _MACHINE_INFO,
+        "benchmarks": [
+            {"group": "status", "name": name, "fullname": f"tests/perf/benchmarks/test_x.py::{name}", "stats": {"median": median}}
+            for name, median in medians.items()
+        ],
+    }
+
+
+def _write(path: Path, document: dict[str, Any]) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(document), encoding="utf-8")
+    return path
+
+
+def test_machine_tag_matches_pytest_benchmark_storage_layout(compare_baseline: ModuleType) -> None:
+    assert compare_baseline.machine_tag(_MACHINE_INFO) == _TAG
+
+
+def test_flags_only_regressions_above_threshold(compare_baseline: ModuleType, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    storage = tmp_path / "baselines"
+    _write(storage / _TAG / "0001_benchmarks.json", _run({"test_slow": 1.0, "test_steady": 1.0, "test_fast": 1.0}))
+    current = _write(tmp_path / "current.json", _run({"test_slow": 1.2, "test_steady": 1.05, "test_fast": 0.5, "test_added": 0.1}))
+    summary = tmp_path / "summary.md"
+
+    exit_code = compare_baseline.main([str(current), "--storage", str(storage), "--output", str(summary)])
+
+    report = capsys.readouterr().out
+    assert exit_code == 1
+    assert "| REGRESSION | status | `test_slow` | 1000.000 | 1200.000 | +20.0% |" in report
+    assert "| ok | status | `test_steady` |" in report
+    assert "| improved | status | `test_fast` |" in report
+    assert "| new | status | `test_added` | - |" in report
+    assert summary.read_text(encoding="utf-8") == report
+
+
+def test_newest_saved_run_is_the_baseline(compare_baseline: ModuleType, tmp_path: Path) -> None:
+    storage = tmp_path / "baselines"
+    _write(storage / _TAG / "0001_old.json", _run({"test_a": 1.0}))
+    _write(storage / _TAG / "0002_new.json", _run({"test_a": 2.0}))
+    current = _write(tmp_path / "current.json", _run({"test_a": 2.1}))
+
+    assert compare_baseline.main([str(current), "--storage", str(storage)]) == 0
+
+
+def test_threshold_is_configurable(compare_baseline: ModuleType, tmp_path: Path) -> None:
+    storage = tmp_path / "baselines"
+    _write(storage / _TAG / "0001_benchmarks.json", _run({"test_a": 1.0}))
+    current = _write(tmp_path / "current.json", _run({"test_a": 1.2}))
+
+    assert compare_baseline.main([str(current), "--storage", str(storage), "--threshold", "25"]) == 0
+
+
+def test_missing_baseline_reports_everything_as_new(compare_baseline: ModuleType, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    current = _write(tmp_path / "current.json", _run({"test_a": 1.0}))
+
+    assert compare_baseline.main([str(current), "--storage", str(tmp_path / "absent")]) == 0
+    assert "0 regressed" in capsys.readouterr().out
@@ -0,0 +1,93 @@
+"""Benchmark: round-trip vs read-only frontmatter parsing over 2,000 WP files.
+
+Read-only consumers (the WP metadata readers, dependency graph, dossier
+indexer, history-import scan, lane computation) parse frontmatter through
+:func:`~specify_cli.frontmatter.read_frontmatter_readonly` -- libyaml's C safe
+loader plus a per-process ``(path, mtime_ns, size)`` cache -- instead of
+round-trip ruamel, which is only needed when a write follows.
+
+The test asserts that both paths return identical frontmatter, that a cold
+read-only pass beats the round-trip pass, and that a warm (cached) pass beats
+the cold one. Run with ``-s`` to see the timings::
+
+    uv run pytest tests/perf/test_frontmatter_read_perf.py -q -s
+"""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+import pytest
+
+from specify_cli.frontmatter import FrontmatterManager, read_frontmatter_readonly
+
+pytestmark = [pytest.mark.slow, pytest.mark.performance]
+
+_FILE_COUNT = 2000
+
+
+def _write_wp_files(tmp_path: Path, count: int) -> list[Path]:
+    """Write *count* realistic WP prompt files and return their paths."""
+    tasks_dir = tmp_path / "tasks"
+    tasks_dir.mkdir()
+    files: list[Path] = []
+    for index in range(1, count + 1):
+        wp_id = f"WP{index:02d}"
+        deps = f"[WP{index - 1:02d}]" if index > 1 else "[]"
+        path = tasks_dir / f"{wp_id}-task-{index}.md"
+        path.write_text(
+            "---\n"
+            f"work_package_id: {wp_id}\n"
+            f'title: "Task {index}: implement the {index}th slice"\n'
+            f"dependencies: {deps}\n"
+            "requirement_refs:\n"
+            "- FR-001\n"
+            "- NFR-002\n"
+            "planning_base_branch: main\n"
+            "merge_target_branch: main\n"
+            "branch_strategy: Planning artifacts were generated on main; completed changes must merge back into main.\n"
+            "subtasks:\n"
+            f"- T{index:03d}\n"
+            f"- T{index:03d}b\n"
+            "phase: Phase 1 - Foundation\n"
+            "owned_files:\n"
+            f"- src/module_{index}/**\n"
+            f"- tests/module_{index}/**\n"
+            "authoritative_surface: src/\n"
+            "execution_mode: code_change\n"
+            "history:\n"
+            "- at: '2026-01-01T00:00:00Z'\n"
+            "  actor: system\n"
+            "  action: Prompt generated via /spec-kitty.tasks\n"
+            "---\n\n"
+            f"# Work Package Prompt: {wp_id}\n\nBody text for {wp_id}.\n",
+            encoding="utf-8",
+        )
+        files.append(path)
+    return files
+
+
+def test_readonly_path_beats_round_trip_on_2000_files(tmp_path: Path) -> None:
+    files = _write_wp_files(tmp_path, _FILE_COUNT)
+    manager = FrontmatterManager()
+
+    t0 = time.perf_counter()
+    round_trip = [manager.read(path) for path in files]
+    round_trip_s = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    cold = [read_frontmatter_readonly(path) for path in files]
+    cold_s = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    warm = [read_frontmatter_readonly(path) for path in files]
+    warm_s = time.perf_counter() - t0
+
+    print(
+        f"\n{_FILE_COUNT} WP files: round-trip {round_trip_s:.3f}s, read-only cold {cold_s:.3f}s "
+        f"({round_trip_s / cold_s:.1f}x), warm {warm_s:.3f}s ({round_trip_s / warm_s:.1f}x)"
+    )
+    assert [(dict(fm), body) for fm, body in round_trip] == cold == warm
+    assert cold_s < round_trip_s, f"read-only cold pass {cold_s:.3f}s is not faster than round-trip {round_trip_s:.3f}s"
+    assert warm_s < cold_s, f"cached pass {warm_s:.3f}s is not faster than the cold pass {cold_s:.3f}s"
@@ -0,0 +1,134 @@
+"""Benchmark: ``list-ready`` readiness on a 200-WP mission, uncached vs persisted.
+
+Before the persisted dependency graph, every ``orchestrator-api list-ready``
+poll parsed all WP frontmatter, reduced the whole event log and re-evaluated
+every WP. :func:`~specify_cli.core.dependency_graph_cache.load_mission_readiness`
+reuses the graph while the WP files' stat signatures match and folds only the
+events appended since the previous poll.
+
+The test checks that every poll agrees with the uncached computation, that a
+warm poll opens no WP file, and that warm and incremental polls beat the
+uncached path. Run with ``-s`` to see the timings::
+
+    uv run pytest tests/perf/test_list_ready_cache_perf.py -q -s
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from specify_cli import frontmatter
+from specify_cli.core.dependency_graph import build_dependency_graph, dependency_readiness_for_wp
+from specify_cli.core.dependency_graph_cache import dependency_graph_cache_path, load_mission_readiness
+from specify_cli.status import Lane, StatusEvent, read_events, reduce, wp_state_for
+from specify_cli.status.store import append_event
+
+pytestmark = [pytest.mark.slow, pytest.mark.performance]
+
+_WP_COUNT = 200
+_SLUG = "list-ready-perf-mission"
+
+
+def _build_mission(tmp_path: Path) -> Path:
+    """200 WPs in chains of four, the first half of them already approved."""
+    feature_dir = tmp_path / "kitty-specs" / _SLUG
+    tasks_dir = feature_dir / "tasks"
+    tasks_dir.mkdir(parents=True)
+    (feature_dir / "meta.json").write_text(json.dumps({"mission_slug": _SLUG}), encoding="utf-8")
+    aged = time.time() - 60
+    for index in range(1, _WP_COUNT + 1):
+        wp_id = f"WP{index:03d}"
+        deps = [f"WP{index - 1:03d}"] if index % 4 != 1 else []
+        path = tasks_dir / f"{wp_id}-task.md"
+        path.write_text(
+            f"---\nwork_package_id: {wp_id}\ntitle: Task {index}\ndependencies: {json.dumps(deps)}\n"
+            f"subtasks:\n- T{index:03d}\nphase: Phase 1\nexecution_mode: code_change\n---\n\n# {wp_id}\n",
+            encoding="utf-8",
+        )
+        os.utime(path, (aged, aged))
+        if index <= _WP_COUNT // 2:
+            _emit(feature_dir, wp_id, Lane.APPROVED, f"2026-01-01T00:{index // 60:02d}:{index % 60:02d}+00:00")
+    return feature_dir
+
+
+def _emit(feature_dir: Path, wp_id: str, lane: Lane, at: str) -> None:
+    append_event(
+        feature_dir,
+        StatusEvent(
+            event_id=f"perf-{wp_id}-{lane.value}",
+            mission_slug=_SLUG,
+            wp_id=wp_id,
+            from_lane=Lane.PLANNED,
+            to_lane=lane,
+            at=at,
+            actor="perf-fixture",
+            force=True,
+            execution_mode="worktree",
+        ),
+    )
+
+
+def _uncached_ready(feature_dir: Path) -> tuple[str, ...]:
+    snapshot = reduce(read_events(feature_dir))
+    graph = build_dependency_graph(feature_dir)
+    lanes = {wp_id: wp_state_for(state.get("lane", Lane.PLANNED)).lane for wp_id, state in snapshot.work_packages.items()}
+    return tuple(
+        wp_id
+        for wp_id, deps in graph.items()
+        if wp_state_for(snapshot.work_packages.get(wp_id, {}).get("lane", Lane.PLANNED)).progress_bucket() == "not_started"
+        and dependency_readiness_for_wp(wp_id, deps, lanes).satisfied
+    )
+
+
+def _best_of(count: int, fn: Callable[[], Any]) -> float:
+    timings = []
+    for _ in range(count):
+        t0 = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - t0)
+    return min(timings)
+
+
+def test_list_ready_polls_answer_from_the_persisted_graph(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    feature_dir = _build_mission(tmp_path)
+    cache_path = dependency_graph_cache_path(tmp_path, _SLUG)
+
+    def poll() -> tuple[str, ...]:
+        return load_mission_readiness(feature_dir, feature_dir, cache_path=cache_path).ready
+
+    frontmatter._readonly_cache.clear()
+    uncached_s = _best_of(1, lambda: _uncached_ready(feature_dir))
+    frontmatter._readonly_cache.clear()
+    t0 = time.perf_counter()
+    first = poll()
+    cold_s = time.perf_counter() - t0
+    assert first == _uncached_ready(feature_dir)
+
+    opened: list[Path] = []
+    real_read = frontmatter.read_frontmatter_readonly
+    monkeypatch.setattr(frontmatter, "read_frontmatter_readonly", lambda p: opened.append(p) or real_read(p))
+    warm_s = _best_of(5, poll)
+    assert opened == []
+
+    # One lane change: WP101 approved unblocks WP102.
+    _emit(feature_dir, "WP101", Lane.APPROVED, "2026-01-02T00:00:00+00:00")
+    t0 = time.perf_counter()
+    incremental = poll()
+    incremental_s = time.perf_counter() - t0
+    assert opened == []
+    assert incremental == _uncached_ready(feature_dir)
+    assert "WP102" in incremental
+
+    print(
+        f"\n{_WP_COUNT} WPs list-ready: uncached {uncached_s * 1000:.1f}ms, first poll {cold_s * 1000:.1f}ms, "
+        f"warm {warm_s * 1000:.1f}ms, after one event {incremental_s * 1000:.1f}ms"
+    )
+    assert warm_s < uncached_s
+    assert incremental_s < uncached_s
@@ -0,0 +1,124 @@
+"""Startup budget gate for hot ``spec-kitty`` commands.
+
+Agents invoke ``spec-kitty`` dozens of times per work package, so one heavy
+import creeping into a hot command costs every step. Each command listed in
+``tests/performance/baselines/startup/budgets.json`` is run in a fresh
+interpreter with ``SPEC_KITTY_PROFILE_STARTUP=1``
+(:mod:`specify_cli.bootstrap.startup_profile`) and its report is checked
+against the committed baseline:
+
+* imported module count within ``tolerance.modules`` of the baseline, and no
+  ``forbidden_subsystems`` (the SaaS transport stack) imported at all --
+  machine independent, so ``slow`` only;
+* median time to first output within ``tolerance.first_output_ms`` of the
+  baseline recorded for this machine tag -- ``performance``, run by the
+  ``startup`` leg of ``.github/workflows/performance.yml``.
+
+``--help`` on a leaf command resolves and imports that command exactly as
+dispatch does, without needing a project. Refresh the baselines after an
+intentional change with::
+
+    SPEC_KITTY_UPDATE_STARTUP_BUDGETS=1 SPEC_KITTY_RUN_PERFORMANCE=1 \\
+        uv run pytest tests/perf/test_startup_budget.py -m "slow or performance" -q
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+import platform
+import statistics
+import struct
+import subprocess
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+pytestmark = [pytest.mark.slow]
+
+_BUDGETS_PATH = Path(__file__).resolve().parents[1] / "performance" / "baselines" / "startup" / "budgets.json"
+_BUDGETS: dict[str, Any] = json.loads(_BUDGETS_PATH.read_text(encoding="utf-8"))
+_UPDATE = os.environ.get("SPEC_KITTY_UPDATE_STARTUP_BUDGETS") == "1"
+_TIMED_RUNS = 3
+
+# Same tag pytest-benchmark files its baselines under.
+_MACHINE_TAG = f"{platform.system()}-{platform.python_implementation()}-{'.'.join(platform.python_version_tuple()[:2])}-{struct.calcsize('P') * 8}bit"
+
+
+@pytest.fixture(scope="module")
+def startup_env(tmp_path_factory: pytest.TempPathFactory) -> Iterator[dict[str, str]]:
+    """An isolated HOME whose global runtime is already populated."""
+    root = tmp_path_factory.mktemp("startup")
+    env = os.environ.copy()
+    env.update(
+        {
+            "HOME": str(root / "home"),
+            "XDG_CONFIG_HOME": str(root / "config"),
+            "SPEC_KITTY_NO_UPGRADE_CHECK": "1",
+            "SPEC_KITTY_PROFILE_STARTUP": "1",
+            "SPEC_KITTY_PROFILE_STARTUP_FILE": str(root / "report.json"),
+        }
+    )
+    env.pop("SPEC_KITTY_ENABLE_SAAS_SYNC", None)
+    # The first run populates ~/.kittify; keep that one-off cost out of the
+    # measurements.
+    _profile(["agent", "tasks", "status", "--help"], env)
+    yield env
+    if _UPDATE:
+        _BUDGETS_PATH.write_text(json.dumps(_BUDGETS, indent=2) + "\n", encoding="utf-8")
+
+
+def _profile(argv: list[str], env: dict[str, str]) -> dict[str, Any]:
+    report_path = Path(env["SPEC_KITTY_PROFILE_STARTUP_FILE"])
+    report_path.unlink(missing_ok=True)
+    result = subprocess.run(
+        [sys.executable, "-m", "specify_cli", *argv],
+        cwd=report_path.parent,
+        env=env,
+        text=True,
+        capture_output=True,
+        timeout=120,
+    )
+    assert result.returncode == 0, result.stderr
+    report: dict[str, Any] = json.loads(report_path.read_text(encoding="utf-8"))
+    return report
+
+
+def _commands() -> list[str]:
+    return list(_BUDGETS["commands"])
+
+
+@pytest.mark.parametrize("command", _commands())
+def test_command_imports_stay_within_budget(command: str, startup_env: dict[str, str]) -> None:
+    report = _profile(command.split(), startup_env)
+    count = report["imports"]["count"]
+    subsystems = {bucket["subsystem"] for bucket in report["imports"]["by_subsystem"]}
+
+    assert not subsystems & set(_BUDGETS["forbidden_subsystems"]), report["imports"]["slowest"]
+    if _UPDATE:
+        _BUDGETS["commands"][command]["modules"] = count
+        return
+    baseline = _BUDGETS["commands"][command]["modules"]
+    budget = math.ceil(baseline * (1 + _BUDGETS["tolerance"]["modules"]))
+    assert count <= budget, (
+        f"`spec-kitty {command}` imported {count} modules (baseline {baseline}, budget {budget}); heaviest subsystems: {report['imports']['by_subsystem'][:10]}"
+    )
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("command", _commands())
+def test_command_first_output_stays_within_budget(command: str, startup_env: dict[str, str]) -> None:
+    elapsed = statistics.median(_profile(command.split(), startup_env)["marks_ms"]["first_output"] for _ in range(_TIMED_RUNS))
+
+    timings = _BUDGETS["commands"][command]["first_output_ms"]
+    if _UPDATE:
+        timings[_MACHINE_TAG] = round(elapsed)
+        return
+    if _MACHINE_TAG not in timings:
+        pytest.skip(f"no first-output baseline recorded for {_MACHINE_TAG}")
+    budget = timings[_MACHINE_TAG] * (1 + _BUDGETS["tolerance"]["first_output_ms"])
+    assert elapsed <= budget, f"`spec-kitty {command}` reached first output after {elapsed:.0f} ms (baseline {timings[_MACHINE_TAG]} ms, budget {budget:.0f} ms)"
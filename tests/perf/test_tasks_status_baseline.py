@@ -48,8 +48,10 @@ from click.testing import Result
 from typer.testing import CliRunner
 
 from specify_cli.cli.commands.agent.tasks import app
+from specify_cli.status import store
 from specify_cli.status.models import Lane, StatusEvent
 from specify_cli.status.store import append_event
+from specify_cli.status.wp_metadata import read_mission_wp_metadata, read_wp_frontmatter
 from tests.mocked_env import setup_mocked_env
 
 pytestmark = [pytest.mark.slow]
@@ -58,6 +60,9 @@ runner = CliRunner()
 
 _WP_COUNT = 120
 
+# Mission size for the bulk WP-metadata comparison below.
+_BULK_WP_COUNT = 100
+
 # Real profile ids (shipped built-ins) so the dashboard's HiC-marker lookup
 # (tasks_status_cmd.py:712/823's construction feeds ``_get_hic_marker``) does
 # real, non-trivial profile-repository work on every rendered row, not just a
@@ -222,3 +227,41 @@ def test_capture_raw_timing_series(
     print(f"\nraw series (s): {[round(t, 4) for t in times]}")
     print(f"p95 (s): {p95:.4f}")
     print(f"mean (s): {statistics.mean(times):.4f}")
+
+
+@pytest.mark.performance
+def test_bulk_wp_metadata_beats_per_wp_reads(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """``read_mission_wp_metadata`` vs a ``read_wp_frontmatter`` loop on 100 WPs.
+
+    The loop reads and reduces ``status.events.jsonl`` once per WP (100 reads
+    of a 100-event log); the bulk reader reads and reduces it once and joins.
+    Both must yield identical metadata; the bulk read must touch the log once
+    and be faster (best of 3, so one noisy sample cannot flip the verdict).
+    Run with ``-s`` to see both timings.
+    """
+    feature_dir = _build_large_mission(tmp_path, "bulk-fixture-mission", _BULK_WP_COUNT)
+    wp_files = sorted((feature_dir / "tasks").glob("WP*.md"))
+
+    reads: list[Path] = []
+    real_read = store.read_event_stream
+    monkeypatch.setattr(store, "read_event_stream", lambda d: reads.append(d) or real_read(d))
+    bulk = read_mission_wp_metadata(feature_dir)
+    assert reads == [feature_dir]
+    assert [(meta, body) for _path, meta, body in bulk.work_packages] == [read_wp_frontmatter(f) for f in wp_files]
+
+    loop_times: list[float] = []
+    bulk_times: list[float] = []
+    for _ in range(3):
+        t0 = time.perf_counter()
+        for wp_file in wp_files:
+            read_wp_frontmatter(wp_file)
+        loop_times.append(time.perf_counter() - t0)
+        t0 = time.perf_counter()
+        read_mission_wp_metadata(feature_dir)
+        bulk_times.append(time.perf_counter() - t0)
+
+    print(f"\nper-WP loop (s): {min(loop_times):.4f}  bulk (s): {min(bulk_times):.4f}")
+    assert min(bulk_times) < min(loop_times), (
+        f"bulk={min(bulk_times) * 1000:.1f}ms is not faster than the per-WP loop "
+        f"({min(loop_times) * 1000:.1f}ms)"
+    )
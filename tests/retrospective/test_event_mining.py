@@ -0,0 +1,115 @@
+"""Tests for the fused single-pass event-mining engine and batch generation.
+
+Test classes:
+    TestEventMiningEngine     — tallies, evidence ranges, wp_key routing, registration
+    TestStatusEventStreaming  — tolerant line-by-line reading of status.events.jsonl
+    TestBatchGeneration       — generate_retrospectives() matches per-mission generation
+
+Env-var invariant: NO SPEC_KITTY_RETROSPECTIVE or SPEC_KITTY_MODE env mutations in this file.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+from pathlib import Path
+
+import pytest
+
+from specify_cli.retrospective.event_mining import (
+    EventMiningEngine,
+    WpEventDetector,
+    iter_status_event_dicts,
+)
+from specify_cli.retrospective.generator import generate_retrospective, generate_retrospectives
+from specify_cli.retrospective.policy import default_policy
+from specify_cli.retrospective.schema import GenActor
+
+pytestmark = [pytest.mark.unit, pytest.mark.fast]
+
+FIXTURES_ROOT = Path(__file__).parent / "fixtures"
+_TS = "2026-05-19T12:00:00+00:00"
+_ACTOR = GenActor(kind="runtime", id="test-agent", display="Test Agent")
+
+
+def _is_forced(event: dict) -> bool:
+    return bool(event.get("force"))
+
+
+def _payload_wp_id(event: dict) -> str:
+    payload = event.get("payload")
+    return str(payload.get("wp_id", "")) if isinstance(payload, dict) else ""
+
+
+class TestEventMiningEngine:
+    def test_tallies_counts_and_ranges_in_one_pass(self) -> None:
+        events = [
+            {"event_id": "E1", "wp_id": "WP01", "force": True, "payload": {"n": 1}},
+            {"event_id": "E2", "wp_id": "WP02", "force": False},
+            {"event_id": "E3", "wp_id": "WP01", "force": True, "payload": {"n": 3}},
+            {"event_id": "E4", "wp_id": "WP02", "force": True},
+        ]
+        consumed: list[str] = []
+
+        def _stream():
+            for event in events:
+                consumed.append(event["event_id"])
+                yield event
+
+        result = EventMiningEngine([WpEventDetector("forced", _is_forced), WpEventDetector("all", lambda _e: True)]).run(_stream())
+
+        assert consumed == ["E1", "E2", "E3", "E4"]
+        assert result.event_count == 4
+        assert result.counts("forced") == {"WP01": 2, "WP02": 1}
+        assert result.counts("all") == {"WP01": 2, "WP02": 2}
+        assert result.tally("forced", "WP01").range_str == "E1..E3"
+        assert result.tally("forced", "WP01").first_payload == {"n": 1}
+        assert result.tally("forced", "WP02").range_str == "E4"
+        assert result.tally("forced", "WP09").range_str == ""
+
+    def test_wp_key_routes_and_empty_key_is_skipped(self) -> None:
+        events = [
+            {"event_id": "E1", "payload": {"wp_id": "WP03"}},
+            {"event_id": "E2", "wp_id": "WP01"},
+        ]
+        result = EventMiningEngine([WpEventDetector("payload", lambda _e: True, _payload_wp_id)]).run(events)
+
+        assert result.counts("payload") == {"WP03": 1}
+
+    def test_duplicate_detector_name_rejected(self) -> None:
+        engine = EventMiningEngine([WpEventDetector("forced", _is_forced)])
+        with pytest.raises(ValueError, match="Duplicate event detector"):
+            engine.register(WpEventDetector("forced", lambda _e: True))
+
+
+class TestStatusEventStreaming:
+    def test_skips_blank_invalid_and_non_object_lines(self, tmp_path: Path) -> None:
+        path = tmp_path / "status.events.jsonl"
+        path.write_text(
+            "\n".join([json.dumps({"event_id": "E1"}), "", "{broken", "[1, 2]", json.dumps({"event_id": "E2"})]) + "\n",
+            encoding="utf-8",
+        )
+
+        assert [e["event_id"] for e in iter_status_event_dicts(path)] == ["E1", "E2"]
+
+    def test_missing_file_yields_nothing(self, tmp_path: Path) -> None:
+        assert list(iter_status_event_dicts(tmp_path / "absent.jsonl")) == []
+
+
+class TestBatchGeneration:
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_batch_matches_single_generation_in_input_order(self, max_workers: int) -> None:
+        handles = ["large-with-gaps", "simple-clean", "mid-with-rejections"]
+        policy = default_policy()
+
+        batch = generate_retrospectives(handles, policy, FIXTURES_ROOT, max_workers=max_workers, invoked_at=_TS, actor=_ACTOR)
+
+        for handle, outcome in zip(handles, batch, strict=True):
+            expected = generate_retrospective(handle, policy, FIXTURES_ROOT, invoked_at=_TS, actor=_ACTOR)
+            assert json.dumps(dataclasses.asdict(outcome), sort_keys=True) == json.dumps(dataclasses.asdict(expected), sort_keys=True)
+
+    def test_per_mission_failure_is_returned_not_raised(self) -> None:
+        batch = generate_retrospectives(["simple-clean", "no-such-mission"], default_policy(), FIXTURES_ROOT, max_workers=1, invoked_at=_TS)
+
+        assert batch[0].mission_slug
+        assert isinstance(batch[1], FileNotFoundError)
@@ -0,0 +1,251 @@
+"""Shared, commit-keyed baseline cache + warm baseline worktree
+(:mod:`specify_cli.review.baseline_cache`).
+
+Pins the key (per-instance artifact paths normalised away, lanes share the
+git common dir), exact and wider-run lookups with per-target narrowing, the
+advisory miss paths, and -- against a real git repo and a real
+``DeclaredCommandScopeSource`` -- that a second WP on the same base commit
+reuses the first WP's run instead of running the suite again, in the SAME
+warm worktree re-pointed at a new commit on the next capture.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+import tempfile
+import textwrap
+from pathlib import Path
+
+import pytest
+
+from specify_cli.review import baseline_cache
+from specify_cli.review.baseline import BaselineFailure, BaselineTestResult, capture_baseline
+from specify_cli.review.baseline_cache import BaselineCacheKey, lookup, store, warm_baseline_worktree
+from specify_cli.review.scope_source import resolve_scope_source
+
+pytestmark = pytest.mark.git_repo
+
+
+def _git(repo: Path, *args: str) -> str:
+    return subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True, text=True).stdout.strip()
+
+
+def _init_repo(path: Path) -> Path:
+    path.mkdir(parents=True)
+    _git(path, "init", "-q", "-b", "main")
+    _git(path, "config", "user.email", "test@example.com")
+    _git(path, "config", "user.name", "Test")
+    (path / "README.md").write_text("base\n", encoding="utf-8")
+    _git(path, "add", "-A")
+    _git(path, "commit", "-q", "-m", "base")
+    return path
+
+
+def _key(repo: Path, *targets: str) -> BaselineCacheKey:
+    return BaselineCacheKey.build(repo, base_commit="a" * 40, source="GateCoverageScopeSource", command=["pytest", "-q"], targets=targets)
+
+
+def _result(*failures: BaselineFailure, wp_id: str = "WP01") -> BaselineTestResult:
+    return BaselineTestResult(
+        wp_id=wp_id,
+        captured_at="2026-10-01T00:00:00Z",
+        base_branch="main",
+        base_commit="a" * 40,
+        test_runner="pytest",
+        total=len(failures),
+        passed=0,
+        failed=len(failures),
+        skipped=0,
+        failures=failures,
+        source_identity="GateCoverageScopeSource/junit_xml",
+    )
+
+
+_STATUS_FAILURE = BaselineFailure(test="tests.status.test_store.test_append", error="boom", file="tests/status/test_store.py:12")
+_SYNC_FAILURE = BaselineFailure(test="tests.sync.test_queue.TestDrain.test_drain", error="boom", file="unknown")
+
+
+# ---------------------------------------------------------------------------
+# Key
+# ---------------------------------------------------------------------------
+
+
+def test_per_instance_artifact_paths_do_not_change_the_key(tmp_path: Path) -> None:
+    repo = _init_repo(tmp_path / "repo")
+    artifacts = [Path(tempfile.mkdtemp(prefix="spec-kitty-declared-cmd-")) / "output.xml" for _ in range(2)]
+    keys = [
+        BaselineCacheKey.build(repo, base_commit="a" * 40, source="DeclaredCommandScopeSource", command=["sh", "-c", f"run --junitxml='{artifact}'"])
+        for artifact in artifacts
+    ]
+
+    assert keys[0] == keys[1]
+    assert keys[0].command == ("sh", "-c", "run --junitxml='{output_file}'")
+
+
+def test_lane_worktrees_share_the_repository_component(tmp_path: Path) -> None:
+    repo = _init_repo(tmp_path / "repo")
+    lane = tmp_path / "lane-a"
+    _git(repo, "worktree", "add", "-q", "--detach", str(lane))
+
+    assert _key(lane) == _key(repo)
+    assert _key(repo).targets == ()
+
+
+# ---------------------------------------------------------------------------
+# Lookup / store
+# ---------------------------------------------------------------------------
+
+
+def test_store_then_lookup_returns_the_exact_entry(canonical_home: None, tmp_path: Path) -> None:
+    del canonical_home  # the ONE SPEC_KITTY_HOME owner (R1a #3121) pins the home
+    repo = _init_repo(tmp_path / "repo")
+    assert lookup(_key(repo)) is None
+
+    store(_key(repo), _result(_STATUS_FAILURE))
+
+    assert lookup(_key(repo)) == _result(_STATUS_FAILURE)
+
+
+def test_sentinel_results_are_never_stored(canonical_home: None, tmp_path: Path) -> None:
+    del canonical_home  # the ONE SPEC_KITTY_HOME owner (R1a #3121) pins the home
+    repo = _init_repo(tmp_path / "repo")
+    sentinel = _result()
+    store(_key(repo), BaselineTestResult.from_dict({**sentinel.to_dict(), "failed": -1}))
+
+    assert lookup(_key(repo)) is None
+
+
+def test_whole_suite_run_answers_a_narrower_scope(canonical_home: None, tmp_path: Path) -> None:
+    del canonical_home  # the ONE SPEC_KITTY_HOME owner (R1a #3121) pins the home
+    repo = _init_repo(tmp_path / "repo")
+    store(_key(repo), _result(_STATUS_FAILURE, _SYNC_FAILURE))
+
+    status_only = lookup(_key(repo, "tests/status/"))
+    sync_only = lookup(_key(repo, "tests/sync/test_queue.py::TestDrain"))
+
+    assert status_only is not None
+    assert status_only.failures == (_STATUS_FAILURE,)
+    assert (status_only.total, status_only.failed) == (1, 1)
+    assert sync_only is not None
+    assert sync_only.failures == (_SYNC_FAILURE,)
+
+
+def test_only_a_covering_target_set_answers_a_narrower_scope(canonical_home: None, tmp_path: Path) -> None:
+    del canonical_home  # the ONE SPEC_KITTY_HOME owner (R1a #3121) pins the home
+    repo = _init_repo(tmp_path / "repo")
+    store(_key(repo, "tests/status"), _result(_STATUS_FAILURE))
+
+    assert lookup(_key(repo, "tests/status/test_store.py")) is not None
+    assert lookup(_key(repo, "tests/status/test_store.py", "tests/sync")) is None
+    assert lookup(_key(repo)) is None
+
+
+def test_a_run_with_a_whole_run_failure_is_not_narrowed(canonical_home: None, tmp_path: Path) -> None:
+    del canonical_home  # the ONE SPEC_KITTY_HOME owner (R1a #3121) pins the home
+    repo = _init_repo(tmp_path / "repo")
+    whole_run = BaselineFailure(test="<gate-coverage-junit>", error="no JUnit XML artifact", file="unknown")
+    store(_key(repo), _result(whole_run))
+
+    assert lookup(_key(repo)) is not None
+    assert lookup(_key(repo, "tests/status")) is None
+
+
+def test_corrupt_or_stale_entries_are_misses(canonical_home: None, tmp_path: Path) -> None:
+    del canonical_home  # the ONE SPEC_KITTY_HOME owner (R1a #3121) pins the home
+    repo = _init_repo(tmp_path / "repo")
+    store(_key(repo), _result(_STATUS_FAILURE))
+    entry = baseline_cache._entry_path(_key(repo))
+
+    entry.write_text("{not json", encoding="utf-8")
+    assert lookup(_key(repo)) is None
+
+    entry.write_text('{"schema_version": 0, "targets": [], "result": {}}', encoding="utf-8")
+    assert lookup(_key(repo)) is None
+
+
+# ---------------------------------------------------------------------------
+# capture_baseline reuse + warm worktree (real git)
+# ---------------------------------------------------------------------------
+
+_COUNTING_SCRIPT = textwrap.dedent(
+    """\
+    import sys
+    from pathlib import Path
+
+    counter = Path(sys.argv[1])
+    counter.write_text(counter.read_text() + "run\\n" if counter.exists() else "run\\n")
+    print("FAIL tests.test_thing.test_boom: boom")
+    sys.exit(1)
+    """
+)
+
+
+def _declared_command_repo(tmp_path: Path, counter: Path) -> Path:
+    repo = _init_repo(tmp_path / "repo")
+    (repo / "run_tests.py").write_text(_COUNTING_SCRIPT, encoding="utf-8")
+    (repo / ".kittify").mkdir()
+    (repo / ".kittify" / "config.yaml").write_text(f"review:\n  test_command: {f'{sys.executable} run_tests.py {counter}'!r}\n", encoding="utf-8")
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", "declared test command")
+    return repo
+
+
+def _capture(repo: Path, tmp_path: Path, wp_id: str) -> BaselineTestResult | None:
+    return capture_baseline(
+        worktree_path=repo,
+        base_branch="main",
+        wp_id=wp_id,
+        mission_slug="001-cache",
+        feature_dir=tmp_path / "kitty-specs" / "001-cache",
+        wp_slug=f"{wp_id}-slug",
+        scope_source=resolve_scope_source(repo),
+    )
+
+
+def test_second_wp_on_the_same_base_commit_reuses_the_run(canonical_home: None, tmp_path: Path) -> None:
+    del canonical_home  # the ONE SPEC_KITTY_HOME owner (R1a #3121) pins the home
+    counter = tmp_path / "runs.txt"
+    repo = _declared_command_repo(tmp_path, counter)
+
+    first = _capture(repo, tmp_path, "WP01")
+    second = _capture(repo, tmp_path, "WP02")
+
+    assert counter.read_text(encoding="utf-8").count("run") == 1
+    assert first is not None and second is not None
+    assert second.wp_id == "WP02"
+    assert second.failures == first.failures
+    assert second.source_identity == first.source_identity == "DeclaredCommandScopeSource/text"
+    saved = BaselineTestResult.load(tmp_path / "kitty-specs" / "001-cache" / "tasks" / "WP02-slug" / "baseline-tests.json")
+    assert saved == second
+
+
+def test_a_new_base_commit_reruns_in_the_same_warm_worktree(canonical_home: None, tmp_path: Path) -> None:
+    del canonical_home  # the ONE SPEC_KITTY_HOME owner (R1a #3121) pins the home
+    counter = tmp_path / "runs.txt"
+    repo = _declared_command_repo(tmp_path, counter)
+    _capture(repo, tmp_path, "WP01")
+    (repo / "README.md").write_text("moved on\n", encoding="utf-8")
+    _git(repo, "commit", "-q", "-am", "advance main")
+    head = _git(repo, "rev-parse", "HEAD")
+
+    result = _capture(repo, tmp_path, "WP02")
+
+    assert result is not None and result.base_commit == head
+    assert counter.read_text(encoding="utf-8").count("run") == 2
+    worktrees = [line for line in _git(repo, "worktree", "list", "--porcelain").splitlines() if line.startswith("worktree ")]
+    assert len(worktrees) == 2  # the checkout itself + ONE warm baseline worktree
+    warm = Path(worktrees[1].removeprefix("worktree "))
+    assert _git(warm, "rev-parse", "HEAD") == head
+
+
+def test_a_busy_warm_worktree_yields_none(canonical_home: None, tmp_path: Path) -> None:
+    del canonical_home  # the ONE SPEC_KITTY_HOME owner (R1a #3121) pins the home
+    repo = _init_repo(tmp_path / "repo")
+    commit = _git(repo, "rev-parse", "HEAD")
+
+    with warm_baseline_worktree(repo, commit) as held:
+        assert held is not None
+        assert (held / "README.md").is_file()
+        with warm_baseline_worktree(repo, commit) as busy:
+            assert busy is None
@@ -769,7 +769,8 @@ def test_cancellation_releases_scoped_run_lock(
     waits = 0
 
     @contextlib.contextmanager
-    def _recording_lock() -> Iterator[None]:
+    def _recording_lock(repo_root: Path | None = None) -> Iterator[None]:
+        del repo_root
         lock_events.append("enter")
         try:
             yield
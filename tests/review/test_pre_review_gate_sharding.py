@@ -0,0 +1,303 @@
+"""Sharded, concurrent pre-review head runs and concurrent gate dispatch.
+
+Pins the shard planner (:mod:`specify_cli.review.head_shards`) and its
+timing history; that a sharded ``run_scoped_tests_at_head`` really runs its
+shards side by side (a filesystem barrier the shards only pass together)
+and merges their failures in a plan-independent order; that the scoped-run
+lock is per repository (lanes share it, unrelated repos do not); and that
+``_mt_dispatch_transition_gates`` runs independent handlers concurrently yet
+returns verdicts in binding order, cancelling the unfinished ones on Ctrl-C.
+"""
+
+from __future__ import annotations
+
+import os
+import signal
+import subprocess
+import sys
+import textwrap
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from specify_cli.cli.commands.agent import tasks_move_task as tmt
+from specify_cli.paths import get_runtime_root
+from specify_cli.review import head_shards, pre_review_gate
+from specify_cli.review.baseline_cache import repo_digest
+from specify_cli.review.head_shards import load_target_timings, plan_shards, record_target_durations
+from specify_cli.review.pre_review_gate import GateOutcome, GateVerdict, HeadRunState, ScopeResult
+
+pytestmark = pytest.mark.git_repo
+
+
+def _git(repo: Path, *args: str) -> str:
+    return subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True, text=True).stdout.strip()
+
+
+def _init_repo(path: Path) -> Path:
+    path.mkdir(parents=True)
+    _git(path, "init", "-q", "-b", "main")
+    _git(path, "config", "user.email", "test@example.com")
+    _git(path, "config", "user.name", "Test")
+    (path / "README.md").write_text("base\n", encoding="utf-8")
+    _git(path, "add", "-A")
+    _git(path, "commit", "-q", "-m", "base")
+    return path
+
+
+# ---------------------------------------------------------------------------
+# Shard planning
+# ---------------------------------------------------------------------------
+
+
+def test_a_single_shard_keeps_the_scope_unchanged() -> None:
+    targets = ["tests/b", "tests/a", "tests/c"]
+
+    assert plan_shards(targets, 1, {"tests/a": 9.0}) == [("tests/b", "tests/a", "tests/c")]
+    assert plan_shards(["tests/a"], 4, {}) == [("tests/a",)]
+
+
+def test_targets_are_balanced_longest_first_on_recorded_timings() -> None:
+    timings = {"tests/slow": 10.0, "tests/mid": 6.0, "tests/quick": 3.0, "tests/tiny": 1.0}
+
+    plan = plan_shards(["tests/mid", "tests/quick", "tests/slow", "tests/tiny"], 2, timings)
+
+    assert plan == [("tests/slow",), ("tests/mid", "tests/quick", "tests/tiny")]
+
+
+def test_unknown_targets_cost_the_median_and_every_shard_gets_work() -> None:
+    timings = {"tests/a": 4.0, "tests/b": 2.0, "tests/c": 0.0}
+
+    plan = plan_shards(["tests/a", "tests/b", "tests/c", "tests/new"], 3, timings)
+
+    assert len(plan) == 3
+    assert all(plan)
+    assert sorted(target for shard in plan for target in shard) == ["tests/a", "tests/b", "tests/c", "tests/new"]
+    assert plan == plan_shards(["tests/a", "tests/b", "tests/c", "tests/new"], 3, dict(timings))
+    assert len(plan_shards(["tests/x", "tests/y", "tests/z"], 3, {"tests/x": 0.0, "tests/y": 0.0, "tests/z": 0.0})) == 3
+
+
+def test_junit_times_are_recorded_per_target(canonical_home: None, tmp_path: Path) -> None:
+    del canonical_home  # the ONE SPEC_KITTY_HOME owner (R1a #3121) pins the home
+    repo = _init_repo(tmp_path / "repo")
+    junit = tmp_path / "junit.xml"
+    junit.write_text(
+        "<testsuite>"
+        '<testcase classname="tests.status.test_store" name="test_a" time="1.5" />'
+        '<testcase classname="tests.status.test_store" name="test_b" time="0.5" />'
+        '<testcase classname="tests.sync.test_queue.TestDrain" name="test_c" time="3" />'
+        '<testcase classname="elsewhere" name="test_d" time="9" />'
+        "</testsuite>",
+        encoding="utf-8",
+    )
+
+    record_target_durations(repo, [junit], ["tests/status/", "tests/sync/test_queue.py"])
+
+    assert load_target_timings(repo) == {"tests/status/": 2.0, "tests/sync/test_queue.py": 3.0}
+
+
+def test_missing_or_corrupt_timings_are_empty(canonical_home: None, tmp_path: Path) -> None:
+    del canonical_home  # the ONE SPEC_KITTY_HOME owner (R1a #3121) pins the home
+    repo = _init_repo(tmp_path / "repo")
+    assert load_target_timings(repo) == {}
+
+    record_target_durations(repo, [tmp_path / "missing.xml"], ["tests/status"])
+    assert load_target_timings(repo) == {}
+
+    timings = head_shards._timings_path(repo)
+    timings.parent.mkdir(parents=True, exist_ok=True)
+    timings.write_text("{not json", encoding="utf-8")
+    assert load_target_timings(repo) == {}
+
+    timings.write_text('{"schema_version": 0, "targets": {"tests/status": 1.0}}', encoding="utf-8")
+    assert load_target_timings(repo) == {}
+
+
+# ---------------------------------------------------------------------------
+# Sharded head run (real subprocesses)
+# ---------------------------------------------------------------------------
+
+# Stands in for pytest: waits until every shard has started (so shards that
+# ran one after another never get past the barrier), then writes one JUnit
+# testcase per target, failing the targets whose name contains "broken".
+_FAKE_PYTEST = textwrap.dedent(
+    """\
+    import os
+    import sys
+    import time
+    from pathlib import Path
+
+    started = Path(os.environ["FAKE_PYTEST_STARTED"])
+    started.mkdir(exist_ok=True)
+    (started / str(os.getpid())).touch()
+    deadline = time.monotonic() + float(os.environ.get("FAKE_PYTEST_BARRIER_S", "10"))
+    while len(list(started.iterdir())) < int(os.environ["FAKE_PYTEST_SHARDS"]):
+        if time.monotonic() > deadline:
+            sys.exit(3)
+        time.sleep(0.01)
+
+    junit = next(arg.split("=", 1)[1] for arg in sys.argv[1:] if arg.startswith("--junitxml="))
+    cases = []
+    for target in (arg for arg in sys.argv[1:] if not arg.startswith("-")):
+        classname = target.replace("/", ".") + ".test_mod"
+        failure = '<failure message="boom" />' if "broken" in target else ""
+        cases.append(f'<testcase classname="{classname}" name="test_it" time="0.25">{failure}</testcase>')
+    Path(junit).write_text("<testsuite>" + "".join(cases) + "</testsuite>", encoding="utf-8")
+    """
+)
+
+_TARGETS = ["tests/b_broken", "tests/a_broken", "tests/c", "tests/d"]
+
+
+@pytest.fixture()
+def fake_pytest(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    script = tmp_path / "fake_pytest.py"
+    script.write_text(_FAKE_PYTEST, encoding="utf-8")
+    monkeypatch.setattr(pre_review_gate, "resolve_pytest_command", lambda args, repo_root: [sys.executable, str(script), *args])
+    monkeypatch.setenv("FAKE_PYTEST_STARTED", str(tmp_path / "started"))
+    return tmp_path / "started"
+
+
+def test_sharded_head_run_runs_shards_concurrently_and_merges_deterministically(
+    canonical_home: None, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, fake_pytest: Path
+) -> None:
+    del canonical_home  # the ONE SPEC_KITTY_HOME owner (R1a #3121) pins the home
+    repo = _init_repo(tmp_path / "repo")
+    monkeypatch.setenv("FAKE_PYTEST_SHARDS", "2")
+
+    result = pre_review_gate.run_scoped_tests_at_head(_TARGETS, repo_root=repo, timeout=60, shards=2)
+
+    assert result.state is HeadRunState.COMPLETED, result.error
+    assert len(list(fake_pytest.iterdir())) == 2
+    assert [f.test for f in result.current_failures] == [
+        "tests.a_broken.test_mod.test_it",
+        "tests.b_broken.test_mod.test_it",
+    ]
+    assert load_target_timings(repo) == dict.fromkeys(_TARGETS, 0.25)
+
+
+def test_sharded_and_unsharded_runs_agree(canonical_home: None, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, fake_pytest: Path) -> None:
+    del canonical_home  # the ONE SPEC_KITTY_HOME owner (R1a #3121) pins the home
+    repo = _init_repo(tmp_path / "repo")
+    monkeypatch.setenv("FAKE_PYTEST_SHARDS", "1")
+    unsharded = pre_review_gate.run_scoped_tests_at_head(_TARGETS, repo_root=repo, timeout=60)
+    for marker in fake_pytest.iterdir():
+        marker.unlink()
+    monkeypatch.setenv("FAKE_PYTEST_SHARDS", "3")
+
+    sharded = pre_review_gate.run_scoped_tests_at_head(_TARGETS, repo_root=repo, timeout=60, shards=3)
+
+    assert unsharded.state is sharded.state is HeadRunState.COMPLETED
+    assert set(sharded.current_failures) == set(unsharded.current_failures)
+    assert len(sharded.current_failures) == 2
+
+
+def test_a_shard_without_junit_output_makes_the_run_incomplete(canonical_home: None, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, fake_pytest: Path) -> None:
+    del canonical_home, fake_pytest  # the ONE SPEC_KITTY_HOME owner (R1a #3121) pins the home
+    repo = _init_repo(tmp_path / "repo")
+    monkeypatch.setenv("FAKE_PYTEST_SHARDS", "3")  # only 2 shards start, so the barrier times out
+    monkeypatch.setenv("FAKE_PYTEST_BARRIER_S", "0.5")
+
+    result = pre_review_gate.run_scoped_tests_at_head(["tests/a", "tests/b"], repo_root=repo, timeout=60, shards=2)
+
+    assert result.ran is False
+    assert result.state is HeadRunState.INCOMPLETE_OUTPUT
+    assert result.returncode == 3
+
+
+# ---------------------------------------------------------------------------
+# Per-repository lock
+# ---------------------------------------------------------------------------
+
+
+def _acquire_seconds(repo_root: Path, *, acquire_timeout: float) -> float:
+    start = time.monotonic()
+    with pre_review_gate._scoped_run_lock(repo_root, acquire_timeout=acquire_timeout):
+        return time.monotonic() - start
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="advisory flock is POSIX-only")
+def test_scoped_run_lock_is_per_repository(canonical_home: None, tmp_path: Path) -> None:
+    del canonical_home  # the ONE SPEC_KITTY_HOME owner (R1a #3121) pins the home
+    repo = _init_repo(tmp_path / "repo")
+    lane = tmp_path / "lane-a"
+    _git(repo, "worktree", "add", "-q", "--detach", str(lane))
+    other = _init_repo(tmp_path / "other")
+
+    with pre_review_gate._scoped_run_lock(repo):
+        assert _acquire_seconds(other, acquire_timeout=5.0) < 2.0
+        assert _acquire_seconds(lane, acquire_timeout=0.3) >= 0.3
+
+    assert repo_digest(lane) == repo_digest(repo) != repo_digest(other)
+    lock_dir = get_runtime_root().base / "gate-locks"
+    assert (lock_dir / f"{repo_digest(repo)}.lock").is_file()
+    assert (lock_dir / f"{repo_digest(other)}.lock").is_file()
+
+
+# ---------------------------------------------------------------------------
+# Concurrent gate dispatch
+# ---------------------------------------------------------------------------
+
+
+def _verdict(reason: str) -> GateVerdict:
+    return GateVerdict(outcome=GateOutcome.NO_NEW_FAILURES, scope=ScopeResult.from_override(("tests/x",)), reason=reason)
+
+
+def _dispatch(runs: dict[str, Any]) -> list[GateVerdict]:
+    bindings: list[Any] = [SimpleNamespace(handler=name) for name in runs]
+    ctx: Any = SimpleNamespace(changed_files=("src/example.py",))
+    return tmt._mt_dispatch_transition_gates(bindings, ctx, handler_lookup=lambda name: SimpleNamespace(name=name, run=runs[name]))
+
+
+def test_independent_handlers_run_concurrently_and_keep_binding_order() -> None:
+    barrier = threading.Barrier(2, timeout=5)
+
+    def slow(_ctx: object) -> GateVerdict:
+        barrier.wait()
+        time.sleep(0.2)
+        return _verdict("slow")
+
+    def quick(_ctx: object) -> GateVerdict:
+        barrier.wait()
+        return _verdict("quick")
+
+    verdicts = _dispatch({"slow": slow, "quick": quick})
+
+    assert [v.reason for v in verdicts] == ["slow", "quick"]
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="delivers a real SIGINT to this process")
+def test_ctrl_c_cancels_only_the_unfinished_handlers(monkeypatch: pytest.MonkeyPatch) -> None:
+    first_done = threading.Event()
+    cancelled = threading.Event()
+    monkeypatch.setattr(pre_review_gate, "cancel_scoped_runs", cancelled.set)
+
+    def finishes(_ctx: object) -> GateVerdict:
+        first_done.set()
+        return _verdict("finished")
+
+    def interrupted(_ctx: object) -> GateVerdict:
+        first_done.wait(5)
+        time.sleep(0.2)
+        os.kill(os.getpid(), signal.SIGINT)
+        cancelled.wait(5)
+        return _verdict("too late")
+
+    verdicts = _dispatch({"finishes": finishes, "interrupted": interrupted})
+
+    assert cancelled.is_set()
+    assert verdicts[0].reason == "finished"
+    assert verdicts[1].outcome is GateOutcome.CANCELLED
+
+
+@pytest.mark.parametrize(("raw", "expected"), [(None, 1), ("3", 3), ("0", 1), ("-2", 1), ("many", 1), ("true", 1)])
+def test_pre_review_shards_config(tmp_path: Path, raw: str | None, expected: int) -> None:
+    (tmp_path / ".kittify").mkdir()
+    body = "review:\n" + (f"  pre_review_shards: {raw}\n" if raw is not None else "  fail_on_pre_review_regression: false\n")
+    (tmp_path / ".kittify" / "config.yaml").write_text(body, encoding="utf-8")
+
+    assert tmt._mt_pre_review_shards(tmp_path) == expected
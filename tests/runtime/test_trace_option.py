@@ -0,0 +1,37 @@
+"""Scope: the root ``--trace`` option turns on ``kernel.tracing`` for one invocation."""
+
+from __future__ import annotations
+
+import importlib
+from collections.abc import Iterator
+
+import pytest
+from typer.testing import CliRunner
+
+from kernel import tracing
+
+pytestmark = pytest.mark.fast
+
+cli_module = importlib.import_module("specify_cli.__init__")
+
+
+@pytest.fixture(autouse=True)
+def _tracing_off() -> Iterator[None]:
+    tracing.reset()
+    yield
+    tracing.reset()
+
+
+def test_trace_callback_enables_tracing_only_when_set() -> None:
+    cli_module.trace_callback(False)
+    assert not tracing.is_enabled()
+
+    cli_module.trace_callback(True)
+    assert tracing.is_enabled()
+
+
+def test_trace_option_is_accepted_before_other_root_options() -> None:
+    result = CliRunner().invoke(cli_module.app, ["--trace", "--version"])
+
+    assert result.exit_code == 0, result.output
+    assert tracing.is_enabled()
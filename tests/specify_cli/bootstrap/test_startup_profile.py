@@ -0,0 +1,144 @@
+"""Tests for ``specify_cli.bootstrap.startup_profile`` -- the opt-in
+``SPEC_KITTY_PROFILE_STARTUP`` import/dispatch profiler.
+
+The per-command budgets built on its report live in
+``tests/perf/test_startup_budget.py``; import purity (stdlib only) is covered
+by ``tests/architectural/test_bootstrap_import_purity.py``.
+"""
+
+from __future__ import annotations
+
+import importlib
+import io
+import sys
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from specify_cli.bootstrap import startup_profile
+from specify_cli.bootstrap.startup_profile import (
+    PROFILE_ENV_VAR,
+    _FirstWriteStream,
+    _Profile,
+    _TimingFinder,
+    build_report,
+    instrument_dispatch,
+    is_requested,
+    mark,
+    subsystem_for,
+)
+
+pytestmark = [pytest.mark.unit, pytest.mark.fast]
+
+
+@pytest.fixture
+def active_profile(monkeypatch: pytest.MonkeyPatch) -> _Profile:
+    profile = _Profile(started=0.0)
+    monkeypatch.setattr(startup_profile, "_PROFILE", profile)
+    return profile
+
+
+@pytest.mark.parametrize("value", ["1", "true", " YES ", "on"])
+def test_truthy_values_request_profiling(value: str) -> None:
+    assert is_requested({PROFILE_ENV_VAR: value})
+
+
+@pytest.mark.parametrize("environ", [{}, {PROFILE_ENV_VAR: ""}, {PROFILE_ENV_VAR: "0"}, {PROFILE_ENV_VAR: "off"}])
+def test_profiling_is_off_by_default(environ: dict[str, str]) -> None:
+    assert not is_requested(environ)
+
+
+def test_inactive_profiler_is_a_no_op(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(startup_profile, "_PROFILE", None)
+
+    class Command:
+        def invoke(self, ctx: Any) -> Any:
+            return ctx
+
+    original = Command.invoke
+    mark("main")
+    instrument_dispatch(Command)
+
+    assert Command.invoke is original
+
+
+@pytest.mark.parametrize(
+    ("module", "subsystem"),
+    [
+        ("specify_cli.status.reducer", "specify_cli.status"),
+        ("specify_cli", "specify_cli"),
+        ("charter.context_renderers.base", "charter.context_renderers"),
+        ("json.decoder", "stdlib"),
+        ("pydantic.main", "pydantic"),
+    ],
+)
+def test_subsystem_buckets(module: str, subsystem: str) -> None:
+    assert subsystem_for(module) == subsystem
+
+
+def test_finder_times_nested_imports(active_profile: _Profile, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    (tmp_path / "sp_outer_mod.py").write_text("import sp_inner_mod\nVALUE = sp_inner_mod.VALUE + 1\n", encoding="utf-8")
+    (tmp_path / "sp_inner_mod.py").write_text("VALUE = 41\n", encoding="utf-8")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    finder = _TimingFinder(active_profile)
+    monkeypatch.setattr(sys, "meta_path", [finder, *sys.meta_path])
+    for name in ("sp_outer_mod", "sp_inner_mod"):
+        monkeypatch.delitem(sys.modules, name, raising=False)
+
+    module = importlib.import_module("sp_outer_mod")
+
+    assert module.VALUE == 42
+    records = {record.module: record for record in active_profile.imports}
+    assert list(records) == ["sp_inner_mod", "sp_outer_mod"]
+    outer, inner = records["sp_outer_mod"], records["sp_inner_mod"]
+    assert outer.cumulative_s >= inner.cumulative_s
+    assert outer.self_s == pytest.approx(outer.cumulative_s - inner.cumulative_s)
+    assert not active_profile.stack
+
+
+def test_first_write_marks_first_output_once(active_profile: _Profile) -> None:
+    stream = _FirstWriteStream(io.StringIO())
+
+    stream.write("")
+    assert "first_output" not in active_profile.marks
+    stream.write("hello")
+    first = active_profile.marks["first_output"]
+    stream.write(" world")
+
+    assert active_profile.marks["first_output"] == first
+    assert stream.getvalue() == "hello world"
+
+
+def test_dispatch_is_marked_when_a_command_is_invoked(active_profile: _Profile) -> None:
+    class Command:
+        def invoke(self, ctx: Any) -> Any:
+            return ctx
+
+    instrument_dispatch(Command)
+
+    assert Command().invoke("ctx") == "ctx"
+    assert "dispatch" in active_profile.marks
+
+
+def test_report_aggregates_by_subsystem(active_profile: _Profile) -> None:
+    active_profile.imports.extend(
+        [
+            startup_profile._ImportRecord("specify_cli.status.store", 0.010, 0.030),
+            startup_profile._ImportRecord("specify_cli.status.models", 0.020, 0.020),
+            startup_profile._ImportRecord("json", 0.001, 0.001),
+        ]
+    )
+    active_profile.marks.update({"first_output": 0.5, "main": 0.1})
+
+    report = build_report(active_profile, finished=1.0, argv=["spec-kitty", "agent"])
+
+    assert report["total_ms"] == 1000.0
+    assert list(report["marks_ms"]) == ["main", "first_output"]
+    assert report["imports"]["count"] == 3
+    assert report["imports"]["total_ms"] == 31.0
+    assert report["imports"]["by_subsystem"] == [
+        {"subsystem": "specify_cli.status", "modules": 2, "self_ms": 30.0},
+        {"subsystem": "stdlib", "modules": 1, "self_ms": 1.0},
+    ]
+    assert report["imports"]["slowest"][0] == {"module": "specify_cli.status.models", "self_ms": 20.0, "cumulative_ms": 20.0}
@@ -0,0 +1,173 @@
+"""Parity tests for the compiled :class:`OccurrenceMatcher` and chunked assessment.
+
+The matcher and the process-pool split are pure performance work: every test
+here pins the compiled/parallel path to the linear reference (``assess_file``
+without a matcher, the original ``classify_path`` rule scan) on a map that
+exercises every rule kind and every first-match-wins tie-break.
+"""
+
+from __future__ import annotations
+
+import re
+from pathlib import Path
+
+import pytest
+
+from specify_cli.bulk_edit import diff_check
+from specify_cli.bulk_edit.diff_check import (
+    OccurrenceMatcher,
+    assess_file,
+    check_diff_compliance,
+    classify_path,
+)
+from specify_cli.bulk_edit.occurrence_map import (
+    FieldPathException,
+    MoveEntry,
+    OccurrenceMap,
+    StructuralTarget,
+)
+
+pytestmark = [pytest.mark.unit, pytest.mark.fast]
+
+_CATEGORIES = {
+    "code_symbols": {"action": "rename"},
+    "import_paths": {"action": "rename"},
+    "filesystem_paths": {"action": "manual_review"},
+    "serialized_keys": {"action": "do_not_change"},
+    "cli_commands": {"action": "do_not_change"},
+    "user_facing_strings": {"action": "rename_if_user_visible"},
+    "tests_fixtures": {"action": "rename"},
+    "logs_telemetry": {"action": "do_not_change"},
+}
+
+_EXCEPTIONS = [
+    {"path": "CHANGELOG.md", "action": "do_not_change", "reason": "history"},
+    {"path": "src/**/legacy/*.py", "action": "do_not_change", "reason": "legacy"},
+    {"path": "src/pkg/*.yaml", "action": "rename", "reason": "pkg yaml"},
+    # Shadowed by the entry above for src/pkg/*.yaml: first match must win.
+    {"path": "src/pkg/config.yaml", "action": "do_not_change", "reason": "shadowed"},
+    {"path": "docs/**", "action": "rename", "reason": "docs tree"},
+    {"path": "data/[ab]*.json", "action": "rename", "reason": "bracket glob"},
+    {"path": "agents/*.yaml", "field_path": "directive-references", "action": "do_not_change"},
+    {"path": "", "action": "rename"},
+]
+
+
+def _omap() -> OccurrenceMap:
+    return OccurrenceMap(
+        target_term="oldName",
+        target_replacement="newName",
+        target_operation="rename",
+        categories=_CATEGORIES,
+        exceptions=_EXCEPTIONS,
+        status=None,
+        raw={},
+        moves=[
+            MoveEntry(sources=["src/old_auth", "src/old/*.py"], destination="src/auth/", reason="auth move"),
+            MoveEntry(sources=["  "], destination="lib/new", reason=None),
+        ],
+        field_path_exceptions=[
+            FieldPathException(path="agents/*.yaml", field_path="directive-references", action="do_not_change"),
+            FieldPathException(path="agents/**", field_path="context-sources.tactics", action="do_not_change"),
+            FieldPathException(path="agents/reviewer.yaml", field_path="aaa", action="do_not_change"),
+        ],
+        structural_targets=[
+            StructuralTarget(path="src/specify_cli/bulk_edit/diff_check.py", reason="matcher"),
+            StructuralTarget(path="src/specify_cli/cli/*.py", reason=None),
+            # Too broad: must never grant an exemption, compiled or not.
+            StructuralTarget(path="src/**/*.py", reason="blanket"),
+            StructuralTarget(path="src/specify_cli", reason="directory"),
+        ],
+    )
+
+
+_PATHS = [
+    "CHANGELOG.md",
+    "src/pkg/inner/legacy/mod.py",
+    "src/pkg/config.yaml",
+    "src/pkg/other.yaml",
+    "docs/guide/intro.md",
+    "docs",
+    "data/a1.json",
+    "data/c1.json",
+    "agents/reviewer.yaml",
+    "agents/nested/implementer.yaml",
+    "src/old_auth/login.py",
+    "src/old_authority/login.py",
+    "src/old/helpers.py",
+    "src/auth/session.py",
+    "src/auth",
+    "lib/new/thing.py",
+    "src/specify_cli/bulk_edit/diff_check.py",
+    "src/specify_cli/cli/helpers.py",
+    "src/specify_cli/cli/commands/doctor.py",
+    "src/specify_cli/core/paths.py",
+    "tests/cli/commands/test_doctor.py",
+    "README",
+    "pyproject.toml",
+    "assets/logo.png",
+    "kitty-specs/demo-01ABC/status.events.jsonl",
+    "kitty-specs/demo-01ABC/notes.md",
+]
+
+
+def test_compiled_assessments_match_the_linear_reference() -> None:
+    omap = _omap()
+    matcher = OccurrenceMatcher.compile(omap)
+
+    for path in _PATHS:
+        expected = assess_file(path, omap, "kitty-specs/demo-01ABC")
+        assert assess_file(path, omap, "kitty-specs/demo-01ABC", matcher=matcher) == expected, path
+
+
+def test_first_match_wins_and_every_pin_is_collected() -> None:
+    matcher = OccurrenceMatcher.compile(_omap())
+
+    exception = matcher.exception_for("src/pkg/config.yaml")
+    assert exception is not None and exception["reason"] == "pkg yaml"
+    assert matcher.move_for("src/old_auth/login.py") == ("move-source", "auth move")
+    assert matcher.move_for("src/old_authority/login.py") is None
+    assert matcher.move_for("lib/new/thing.py") == ("move-destination", "declared move destination")
+    assert matcher.structural_target_for("src/specify_cli/core/paths.py") is None
+    assert matcher.field_path_pins_for("agents/reviewer.yaml") == (
+        "aaa",
+        "context-sources.tactics",
+        "directive-references",
+    )
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "src/specify_cli/cli/commands/tests/helper.py",
+        "cli/commands/test_x.py",
+        "docs/config.yaml",
+        "pkg/bin/tool",
+        "README.rst",
+        "a/b/c.d.ts",
+        "foo.test.tsx",
+        "module_test.py",
+        "weird\nname.py",
+        "no_extension",
+        "",
+    ],
+)
+def test_single_pass_category_regex_matches_the_ordered_rule_scan(path: str) -> None:
+    posix = Path(path).as_posix()
+    expected = next(
+        (category for category, patterns in diff_check._PATH_RULES if any(re.search(pattern, posix) for pattern in patterns)),
+        None,
+    )
+    assert classify_path(path) == expected
+
+
+def test_chunked_parallel_assessment_is_identical(monkeypatch: pytest.MonkeyPatch) -> None:
+    omap = _omap()
+    changed = _PATHS * 4
+    inline = check_diff_compliance(changed, omap, "kitty-specs/demo-01ABC", max_workers=1)
+
+    monkeypatch.setattr(diff_check, "_PARALLEL_MIN_FILES", 10)
+    parallel = check_diff_compliance(changed, omap, "kitty-specs/demo-01ABC", max_workers=3)
+
+    assert parallel == inline
+    assert [a.path for a in parallel.assessments] == changed
@@ -157,7 +157,8 @@ _TASKS_MOVE_TASK: tuple[str, ...] = (  # WP05 (wave2); grown to 75 via WP09, +1
     # (#2513/#2160: +uncheck/clear-markers/reset-rollback; #2573: +gate
     # skip-reason pair; WP07 #2649: +param-object + commit/uncheck degod helpers;
     # #2639: +complete-deferred-readiness + pre-review-dirty-paths;
-    # coord-commit-integrity #2861: +_binding_role_for_lane role-map dedup)
+    # coord-commit-integrity #2861: +_binding_role_for_lane role-map dedup;
+    # head-run sharding: +_mt_pre_review_shards = 80)
     "_binding_role_for_lane",
     # WP02 (verdict-seam-boundary-hardening-01KZG179, T007): campsite
     # extraction out of the cc=14 ``_mt_emit_runtime_state`` (78 -> 79).
@@ -272,6 +273,8 @@ _TASKS_MOVE_TASK: tuple[str, ...] = (  # WP05 (wave2); grown to 75 via WP09, +1
     "_mt_pre_review_gate_env_disable_reason",
     "_mt_pre_review_gate_skip_reason",
     "_mt_pre_review_scope_override",
+    # review.pre_review_shards: the head-run shard-count knob.
+    "_mt_pre_review_shards",
     "_pre_review_gate_filter_groups",
     "_pre_review_gate_composite_routing",
     # fix(review) (2026-08-05): the --reviewer resolution shared by the
@@ -536,7 +539,10 @@ def test_guard_covers_full_167_symbol_surface() -> None:
     162 -> 163. #3578 (M4 operator-signal sweep) added the four rollback-to-
     ``planned`` signal symbols — ``_RollbackResetSummary``,
     ``_mt_build_rollback_summary``, ``_mt_apply_rollback_signal`` and
-    ``_mt_rollback_signal_lines`` (tasks_move_task 75 -> 79): 163 -> 167."""
+    ``_mt_rollback_signal_lines`` (tasks_move_task 75 -> 79): 163 -> 167.
+    Head-run sharding added ``_mt_pre_review_shards`` — the
+    ``review.pre_review_shards`` config reader, a native move-task seam def
+    (tasks_move_task 79 -> 80): 167 -> 168."""
     # TODO(under-investigation, operator-flagged): the operator doubts this
     # consolidated compat guard earns its ROI. Every seam-local symbol addition
     # costs a three-part edit — register in the per-seam tuple, add an identity
@@ -544,4 +550,4 @@ def test_guard_covers_full_167_symbol_surface() -> None:
     # low incremental regression-catch value over the identity-re-export guard
     # alone. Revisit whether the golden-count ratchet should be relaxed or
     # dropped (see M4 #3578 integration, which paid this tax for 4 helpers).
-    assert len(SYMBOL_TO_MODULE) == 167  # golden-count: cardinality-is-contract
+    assert len(SYMBOL_TO_MODULE) == 168  # golden-count: cardinality-is-contract
@@ -306,8 +306,9 @@ def test_move_task_human_mode_emits_continuing_gate_liveness(tmp_path: Path) ->
         progress_callback: Any = None,
         monotonic: Any = None,
         wait: Any = None,
+        shards: int = 1,
     ) -> pre_review_gate.GateVerdict:
-        del repo_root, baseline, timeout, wait
+        del repo_root, baseline, timeout, wait, shards
         if progress_callback is not None:
             clock = monotonic or (lambda: next(fake_clock))
             progress_callback(clock())
@@ -0,0 +1,122 @@
+"""Tests for ``spec-kitty doctor all`` (the concurrent check runner).
+
+The runner is exercised against a synthetic Typer group so each check's timing,
+exit code, and output are controlled; the real subcommand set is pinned by the
+golden surface test and ``ALL_CHECKS`` is checked against it here.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+import pytest
+import typer
+from typer.main import get_command
+from typer.testing import CliRunner
+
+import specify_cli.cli.commands.doctor as doctor_module
+from specify_cli.cli.commands import _all_doctor
+from specify_cli.cli.commands._doctor_shared import console
+
+pytestmark = [pytest.mark.fast]
+
+runner = CliRunner()
+
+
+def _synthetic_app(barrier: threading.Barrier) -> typer.Typer:
+    app = typer.Typer(name="doctor")
+
+    @app.command(name="first")
+    def first(json_output: bool = typer.Option(False, "--json")) -> None:
+        barrier.wait()
+        console.print_json(json.dumps({"root": os.environ.get("SPECIFY_REPO_ROOT")}))
+        raise typer.Exit(0)
+
+    @app.command(name="second")
+    def second(json_output: bool = typer.Option(False, "--json")) -> None:
+        # Only passes the barrier if ``first`` is running at the same time.
+        barrier.wait()
+        time.sleep(0.3)
+        console.print_json(json.dumps({"findings": ["stale"]}))
+        raise typer.Exit(1)
+
+    @app.command(name="text")
+    def text() -> None:
+        print("plain text report")
+
+    @app.command(name="boom")
+    def boom(json_output: bool = typer.Option(False, "--json")) -> None:
+        raise RuntimeError("collector exploded")
+
+    _all_doctor.register(app)
+    return app
+
+
+_CHECKS = (
+    ("first", ("first", "--json")),
+    ("second", ("second", "--json")),
+    ("text", ("text",)),
+    ("boom", ("boom", "--json")),
+)
+
+
+def test_checks_run_concurrently_with_isolated_output(tmp_path: Path) -> None:
+    app = _synthetic_app(threading.Barrier(2, timeout=10))
+    previous_root = os.environ.get("SPECIFY_REPO_ROOT")
+
+    runs = _all_doctor.run_all_checks(app, tmp_path, budget=0.2, checks=_CHECKS)
+
+    assert [run.name for run in runs] == ["first", "second", "text", "boom"]
+    by_name = {run.name: run for run in runs}
+    # The shared project root is pinned for every check, then restored.
+    assert by_name["first"].report == {"root": str(tmp_path)}
+    assert os.environ.get("SPECIFY_REPO_ROOT") == previous_root
+    assert by_name["second"].report == {"findings": ["stale"]}
+    assert by_name["second"].exit_code == 1
+    assert by_name["text"].report is None
+    assert by_name["text"].output == "plain text report\n"
+    assert by_name["boom"].exit_code == 1
+    assert by_name["boom"].error == "RuntimeError: collector exploded"
+    # Only the check that exceeded its slice is marked.
+    assert [run.name for run in runs if run.over_budget] == ["second"]
+
+
+def test_all_json_merges_reports_with_timing(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    app = _synthetic_app(threading.Barrier(2, timeout=10))
+    monkeypatch.setattr(_all_doctor, "ALL_CHECKS", _CHECKS[:3])
+    monkeypatch.setattr(_all_doctor, "locate_project_root", lambda: tmp_path)
+
+    result = runner.invoke(app, ["all", "--json", "--budget", "0.2", "--jobs", "2"])
+
+    assert result.exit_code == 1
+    payload = json.loads(result.output)
+    assert payload["ok"] is False
+    assert payload["repo_root"] == str(tmp_path)
+    assert payload["jobs"] == 2
+    assert payload["failed"] == ["second"]
+    assert payload["over_budget"] == ["second"]
+    assert [check["name"] for check in payload["checks"]] == ["first", "second", "text"]
+    assert all(check["wall_time_s"] >= 0 for check in payload["checks"])
+    assert payload["checks"][1]["wall_time_s"] >= 0.3
+
+
+def test_all_outside_a_project_exits_1(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(_all_doctor, "locate_project_root", lambda: None)
+
+    result = runner.invoke(doctor_module.app, ["all", "--json"])
+
+    assert result.exit_code == 1
+    assert json.loads(result.output)["error"]["code"] == "not_in_project"
+
+
+def test_all_checks_name_real_read_only_subcommands() -> None:
+    commands = get_command(doctor_module.app).commands  # type: ignore[attr-defined]
+    for name, argv in _all_doctor.ALL_CHECKS:
+        assert argv[0] == name
+        assert name in commands
+        assert not {"--fix", "--close-stale"} & set(argv)
+    assert "restart-daemon" not in dict(_all_doctor.ALL_CHECKS)
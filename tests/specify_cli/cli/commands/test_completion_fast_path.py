@@ -73,7 +73,7 @@ def _real_command() -> object:
 
 
 def _fast_command(*, saas_enabled: bool) -> object:
-    return completion._build_command_tree(completion._load_manifest(), saas_enabled=saas_enabled)
+    return completion._build_command_tree(completion.load_command_manifest(), saas_enabled=saas_enabled)
 
 
 def _fast_command_for_env() -> object:
@@ -94,7 +94,7 @@ def test_manifest_matches_live_cli(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setenv("SPEC_KITTY_ENABLE_SAAS_SYNC", "1")
 
     live = completion.generate_manifest()
-    committed = completion._load_manifest()
+    committed = completion.load_command_manifest()
 
     assert live == committed, (
         "completion manifest is stale; regenerate with "
@@ -61,7 +61,7 @@ _apply_short_help_options(app)
 # 16 de-godding names (#2059) + ``contracts`` (#2441, Contract Registry validator).
 # operator-config-ergonomics adds ``provenance`` (WP03), ``channel`` (WP05), and
 # ``env-file`` (WP06) on top of main's ``mission-type`` (mission-type-guard-registry
-# WP02): 23 total.
+# WP02): 23 total. ``all`` (the concurrent sweep runner) makes 24.
 
 FROZEN_SUBCOMMANDS: frozenset[str] = frozenset(
     {
@@ -88,6 +88,7 @@ FROZEN_SUBCOMMANDS: frozenset[str] = frozenset(
         "provenance",
         "channel",
         "env-file",
+        "all",
     }
 )
 
@@ -138,6 +139,7 @@ EXPECTED_OPTIONS: dict[str, dict[str, str]] = {
     "provenance": {"--json": "flag"},
     "channel": {"--json": "flag"},
     "env-file": {"--json": "flag"},
+    "all": {"--json": "flag", "--budget": "value", "--jobs": "value"},
 }
 
 # Golden ``--help`` snapshots (whitespace-normalized) per subcommand.
@@ -544,6 +546,24 @@ EXPECTED_HELP: dict[str, list[str]] = {
         '--json Machine-readable JSON output',
         '--help -h Show this message and exit.',
     ],
+    'all': [
+        'Usage: doctor all [OPTIONS]',
+        'Run every read-only doctor check concurrently and merge the reports.',
+        "Resolves the project once, runs each check's --json form on a worker",
+        'thread, and reports per-check exit code and wall time. Never mutates',
+        'state: no --fix paths run.',
+        'Exit codes:',
+        '0 Every check passed.',
+        '1 At least one check failed (or not in a project).',
+        'Examples:',
+        'spec-kitty doctor all',
+        'spec-kitty doctor all --json --budget 5',
+        'Options',
+        '--json Machine-readable JSON output',
+        '--budget FLOAT Per-check time slice in seconds; slower checks are marked over budget',
+        '--jobs INTEGER Maximum number of checks run at once [default: 8]',
+        '--help -h Show this message and exit.',
+    ],
 }
 
 
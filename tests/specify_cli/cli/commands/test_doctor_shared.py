@@ -58,3 +58,28 @@ def test_json_output_guard_restores_logging_on_every_exit() -> None:
     with pytest.raises(RuntimeError), _doctor_shared._json_output_guard(True):
         raise RuntimeError("controlled failure")
     assert logging.root.manager.disable == previous
+
+
+def test_json_output_guard_is_reentrant_across_threads() -> None:
+    """Overlapping guards (``doctor all`` workers) restore only on the last exit."""
+    import threading
+
+    previous = logging.root.manager.disable
+    entered = threading.Event()
+    release = threading.Event()
+
+    def _worker() -> None:
+        with _doctor_shared._json_output_guard(True):
+            entered.set()
+            release.wait(timeout=10)
+
+    worker = threading.Thread(target=_worker)
+    worker.start()
+    assert entered.wait(timeout=10)
+    with _doctor_shared._json_output_guard(True):
+        assert logging.root.manager.disable == logging.CRITICAL
+    # The worker still holds its guard: the early exit must not restore.
+    assert logging.root.manager.disable == logging.CRITICAL
+    release.set()
+    worker.join(timeout=10)
+    assert logging.root.manager.disable == previous
@@ -0,0 +1,173 @@
+"""Tests for manifest-driven lazy command registration (``cli.commands._lazy``).
+
+The ``spec-kitty`` entry point registers every command as a placeholder built
+from ``_completion_manifest.json`` and imports a command's module only when it
+is resolved. These tests keep the command tables, the manifest and the real
+command tree in sync (the manifest itself is checked against the live CLI by
+``test_completion_fast_path.py::test_manifest_matches_live_cli``), and bound
+what a single nested invocation imports.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any
+
+import click
+import pytest
+import typer
+from typer.main import get_command
+from typer.testing import CliRunner
+
+from specify_cli import completion
+from specify_cli.cli.commands import _ROOT_COMMANDS
+from specify_cli.cli.commands._lazy import LazyCommand
+from specify_cli.cli.commands.agent import _AGENT_COMMANDS
+
+pytestmark = [pytest.mark.integration]
+
+# Registered by ``register_init_command`` only to force multi-command mode on
+# an otherwise empty app; the lazy root never needs it.
+_INIT_FILLER = "__force_multi_command_mode__"
+
+# Modules ``spec-kitty agent tasks status`` has no use for: the SaaS transport
+# stack and the pydantic-model modules of other command families.
+_UNNEEDED_MODULES = (
+    "httpx",
+    "websockets",
+    "requests",
+    "cryptography",
+    "specify_cli.auth",
+    "specify_cli.tracker",
+    "specify_cli.sync.daemon",
+    "specify_cli.sync.client",
+    "specify_cli.sync.background",
+    "specify_cli.sync.body_transport",
+    "specify_cli.sync.dossier_pipeline",
+    "specify_cli.decisions.models",
+    "specify_cli.core.wps_manifest",
+    "specify_cli.invocation.executor",
+    "specify_cli.doctrine_synthesizer",
+    "charter.synthesizer",
+)
+
+
+def _lazy_app(monkeypatch: pytest.MonkeyPatch) -> typer.Typer:
+    import specify_cli
+
+    # The committed manifest carries the SaaS-gated commands.
+    monkeypatch.setenv("SPEC_KITTY_ENABLE_SAAS_SYNC", "1")
+    monkeypatch.setattr(sys, "argv", ["spec-kitty"])
+    return specify_cli._build_app(lazy=True)
+
+
+def _lazy_root(monkeypatch: pytest.MonkeyPatch) -> Any:
+    return get_command(_lazy_app(monkeypatch))
+
+
+def _materialize(command: Any, *, resolve: bool) -> dict[str, Any]:
+    """Walk *command* like ``build_manifest_from_command``, resolving placeholders."""
+    if resolve and isinstance(command, LazyCommand):
+        command = command.resolve()
+    node: dict[str, Any] = {
+        "help": command.help or "",
+        "hidden": bool(getattr(command, "hidden", False)),
+        "deprecated": bool(getattr(command, "deprecated", False)),
+    }
+    if hasattr(command, "list_commands"):
+        ctx = click.Context(command, info_name=command.name)
+        names = command.list_commands(ctx)
+        if names:
+            node["commands"] = {name: _materialize(command.get_command(ctx, name), resolve=resolve) for name in names}
+    return node
+
+
+def _display_fields(node: dict[str, Any]) -> dict[str, Any]:
+    return {key: node[key] for key in ("help", "hidden", "deprecated")}
+
+
+def test_command_tables_cover_the_manifest() -> None:
+    manifest = completion.load_command_manifest()
+
+    assert set(_ROOT_COMMANDS) == set(manifest["commands"]) - {"init", _INIT_FILLER}
+    assert set(_AGENT_COMMANDS) == set(manifest["commands"]["agent"]["commands"])
+
+
+def test_placeholders_carry_the_manifest_metadata(monkeypatch: pytest.MonkeyPatch) -> None:
+    root = _lazy_root(monkeypatch)
+    manifest = completion.load_command_manifest()
+    ctx = click.Context(root, info_name="spec-kitty")
+
+    placeholders = {name: root.get_command(ctx, name) for name in root.list_commands(ctx)}
+
+    assert all(isinstance(command, LazyCommand) for command in placeholders.values())
+    assert set(placeholders) == set(manifest["commands"]) - {_INIT_FILLER}
+    for name, command in placeholders.items():
+        assert _materialize(command, resolve=False) == _display_fields(manifest["commands"][name]), name
+
+
+def test_materialized_lazy_tree_matches_the_manifest(monkeypatch: pytest.MonkeyPatch) -> None:
+    manifest = completion.load_command_manifest()
+
+    materialized = _materialize(_lazy_root(monkeypatch), resolve=True)
+
+    expected = {
+        **manifest,
+        "commands": {
+            name: {key: value for key, value in node.items() if key != "saas_gated"} for name, node in manifest["commands"].items() if name != _INIT_FILLER
+        },
+    }
+    assert materialized == expected
+
+
+def test_placeholders_resolve_once_and_independently(monkeypatch: pytest.MonkeyPatch) -> None:
+    root = _lazy_root(monkeypatch)
+    ctx = click.Context(root, info_name="spec-kitty")
+    placeholder = root.get_command(ctx, "merge")
+
+    assert isinstance(placeholder, LazyCommand)
+    assert placeholder.resolve() is placeholder.resolve()
+    assert isinstance(root.get_command(ctx, "doctor"), LazyCommand)
+    assert root.get_command(ctx, "doctor")._resolved is None
+
+
+def test_nested_help_runs_through_placeholders(monkeypatch: pytest.MonkeyPatch) -> None:
+    result = CliRunner().invoke(_lazy_app(monkeypatch), ["agent", "tasks", "status", "-h"], prog_name="spec-kitty")
+
+    assert result.exit_code == 0, result.output
+    assert "spec-kitty agent tasks status" in result.output
+    assert "--stale-threshold" in result.output
+
+
+def test_agent_tasks_status_stays_within_its_import_budget(tmp_path: Path) -> None:
+    script = (
+        "import sys\n"
+        "import specify_cli\n"
+        "sys.argv = ['spec-kitty', 'agent', 'tasks', 'status', '--help']\n"
+        "try:\n"
+        "    specify_cli.main()\n"
+        "except SystemExit as exc:\n"
+        "    rc = exc.code\n"
+        "else:\n"
+        "    rc = 0\n"
+        f"loaded = [m for m in {_UNNEEDED_MODULES!r} if m in sys.modules]\n"
+        "sys.stderr.write('RC=' + repr(rc) + ' LOADED=' + repr(loaded))\n"
+    )
+    env = os.environ.copy()
+    env.update(
+        {
+            "HOME": str(tmp_path / "home"),
+            "XDG_CONFIG_HOME": str(tmp_path / "config"),
+            "SPEC_KITTY_NO_UPGRADE_CHECK": "1",
+        }
+    )
+    env.pop("SPEC_KITTY_ENABLE_SAAS_SYNC", None)
+
+    result = subprocess.run([sys.executable, "-c", script], cwd=tmp_path, env=env, text=True, capture_output=True, timeout=60)
+
+    assert "RC=0" in result.stderr, result.stderr
+    assert "LOADED=[]" in result.stderr, result.stderr
+    assert "--stale-threshold" in result.stdout
@@ -1047,3 +1047,78 @@ def test_legacy_head_override_block_is_byte_unchanged() -> None:
         "charter directive; any change must go through an explicit, reviewed "
         "decision, not an incidental refactor."
     )
+
+
+# ---------------------------------------------------------------------------
+# Group commit
+# ---------------------------------------------------------------------------
+
+
+def _commit_count(repo: Path) -> int:
+    return int(_git(repo, "rev-list", "--count", COORD_BRANCH).stdout)
+
+
+def _acquire_group(repo: Path, operation: str) -> BookkeepingTransaction:
+    return BookkeepingTransaction.acquire(
+        repo_root=repo,
+        mission_id=MISSION_ID,
+        mission_slug=MISSION_SLUG,
+        mid8=MID8,
+        destination_ref=COORD_BRANCH,
+        operation=operation,
+        group_commit=True,
+    )
+
+
+def test_group_commit_joins_a_commit_that_already_carries_its_events(repo: Path) -> None:
+    """A transaction whose event was committed by a later writer makes no commit of its own."""
+    first_event = _make_event("WP01")
+    second_event = _make_event("WP02")
+    with _acquire_group(repo, "group_first") as first:
+        first.append_event(first_event)
+        # A nested acquire does not own the outermost lock, so it commits
+        # normally -- and that commit carries the first transaction's line too.
+        with _acquire_group(repo, "group_second") as second:
+            second.append_event(second_event)
+            second_receipt = second.commit("status: WP02 → claimed")
+        commits_before_join = _commit_count(repo)
+        first_receipt = first.commit("status: WP01 → claimed")
+
+    assert _commit_count(repo) == commits_before_join
+    assert first_receipt.commit_sha == second_receipt.commit_sha
+    assert first_receipt.event_ids == (first_event.event_id,)
+    assert [e.event_id for e in _store.read_events(first.feature_dir)] == [
+        first_event.event_id,
+        second_event.event_id,
+    ]
+
+
+def test_group_commit_failure_removes_only_its_own_events(
+    repo: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """After the status lock is released, rollback cannot truncate: other writers' lines survive."""
+    own_event = _make_event("WP01")
+    other_event = _make_event("WP02")
+
+    def _other_writer_appends_then_commit_fails(**kwargs: Any) -> Any:
+        _store.append_event(kwargs["worktree_root"] / "kitty-specs" / FEATURE_DIRNAME, other_event)
+        raise RuntimeError("simulated commit failure")
+
+    monkeypatch.setattr(transaction_module, "safe_commit", _other_writer_appends_then_commit_fails)
+
+    with pytest.raises(BookkeepingCommitFailed), _acquire_group(repo, "group_rollback") as txn:
+        txn.append_event(own_event)
+        txn.commit("status: should fail")
+
+    assert [e.event_id for e in _store.read_events(txn.feature_dir)] == [other_event.event_id]
+    status = (txn.feature_dir / "status.json").read_text(encoding="utf-8")
+    assert "WP02" in status
+    assert "WP01" not in status
+
+
+def test_group_commit_is_refused_for_appends_after_release(repo: Path) -> None:
+    with _acquire_group(repo, "group_append_after_commit") as txn:
+        txn.append_event(_make_event("WP01"))
+        txn.commit("status: WP01 → claimed")
+        with pytest.raises(BookkeepingError, match="released the status lock"):
+            txn.append_event(_make_event("WP02"))
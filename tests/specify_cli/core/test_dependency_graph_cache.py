@@ -0,0 +1,184 @@
+"""Tests for the persisted dependency graph and incremental readiness."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from specify_cli.core import dependency_graph_cache as cache_module
+from specify_cli.core.dependency_graph import build_dependency_graph, dependency_readiness_for_wp
+from specify_cli.core.dependency_graph_cache import (
+    dependency_graph_cache_path,
+    load_dependency_graph,
+    load_mission_readiness,
+)
+from specify_cli.status import Lane, StatusEvent, read_events, reduce, wp_state_for
+from specify_cli.status.store import append_event
+
+pytestmark = [pytest.mark.unit, pytest.mark.fast]
+
+_SLUG = "graph-cache-mission"
+# WP01 <- WP02 <- WP03, and WP04 independent.
+_DEPS = {"WP01": [], "WP02": ["WP01"], "WP03": ["WP02"], "WP04": []}
+
+
+def _age(path: Path) -> None:
+    """Move *path*'s mtime out of the racy window so its signature is trusted."""
+    old = path.stat().st_mtime - 60
+    os.utime(path, (old, old))
+
+
+def _write_wp(tasks_dir: Path, wp_id: str, deps: list[str]) -> None:
+    path = tasks_dir / f"{wp_id}-task.md"
+    path.write_text(f"---\nwork_package_id: {wp_id}\ntitle: {wp_id}\ndependencies: {json.dumps(deps)}\n---\n\n# {wp_id}\n", encoding="utf-8")
+    _age(path)
+
+
+@pytest.fixture
+def mission(tmp_path: Path) -> Path:
+    feature_dir = tmp_path / "kitty-specs" / _SLUG
+    tasks_dir = feature_dir / "tasks"
+    tasks_dir.mkdir(parents=True)
+    (feature_dir / "meta.json").write_text(json.dumps({"mission_slug": _SLUG}), encoding="utf-8")
+    for wp_id, deps in _DEPS.items():
+        _write_wp(tasks_dir, wp_id, deps)
+    return feature_dir
+
+
+def _emit(feature_dir: Path, wp_id: str, to_lane: Lane, at: str, event_id: str) -> None:
+    append_event(
+        feature_dir,
+        StatusEvent(
+            event_id=event_id,
+            mission_slug=_SLUG,
+            wp_id=wp_id,
+            from_lane=Lane.PLANNED,
+            to_lane=to_lane,
+            at=at,
+            actor="test",
+            force=True,
+            execution_mode="worktree",
+        ),
+    )
+
+
+def _reference_ready(feature_dir: Path) -> tuple[str, ...]:
+    """The uncached computation ``list-ready`` performed before the cache."""
+    snapshot = reduce(read_events(feature_dir))
+    graph = build_dependency_graph(feature_dir)
+    lanes = {wp_id: wp_state_for(state.get("lane", Lane.PLANNED)).lane for wp_id, state in snapshot.work_packages.items()}
+    ready = []
+    for wp_id, deps in graph.items():
+        lane = snapshot.work_packages.get(wp_id, {}).get("lane", Lane.PLANNED)
+        if wp_state_for(lane).progress_bucket() == "not_started" and dependency_readiness_for_wp(wp_id, deps, lanes).satisfied:
+            ready.append(wp_id)
+    return tuple(ready)
+
+
+def _load(feature_dir: Path) -> cache_module.MissionReadiness:
+    return load_mission_readiness(feature_dir, feature_dir, cache_path=dependency_graph_cache_path(feature_dir.parents[1], _SLUG))
+
+
+def test_warm_poll_rereads_no_frontmatter(mission: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    _emit(mission, "WP04", Lane.IN_PROGRESS, "2026-01-01T00:00:01+00:00", "e1")
+    cold = _load(mission)
+    assert (cold.graph_source, cold.lanes_source) == ("rebuilt", "rebuilt")
+    assert cold.ready == _reference_ready(mission) == ("WP01",)
+
+    monkeypatch.setattr(cache_module, "build_dependency_graph", lambda _d: pytest.fail("graph rebuilt"))
+    warm = _load(mission)
+
+    assert (warm.graph_source, warm.lanes_source) == ("cache", "cache")
+    assert warm.ready == cold.ready
+    assert warm.graph == _DEPS
+
+
+def test_appended_events_reevaluate_only_changed_wps_and_dependents(mission: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    _load(mission)
+    _emit(mission, "WP01", Lane.APPROVED, "2026-01-01T00:00:01+00:00", "e1")
+    evaluated: list[str] = []
+    real = cache_module.dependency_readiness_for_wp
+    monkeypatch.setattr(cache_module, "dependency_readiness_for_wp", lambda wp_id, *a: evaluated.append(wp_id) or real(wp_id, *a))
+
+    result = _load(mission)
+
+    assert result.lanes_source == "incremental"
+    assert result.lanes["WP01"] == "approved"
+    assert result.ready == _reference_ready(mission) == ("WP02", "WP04")
+    # WP01 itself is started (no readiness call); only its dependent WP02 is re-checked.
+    assert evaluated == ["WP02"]
+
+
+def test_out_of_order_event_falls_back_to_full_reduce(mission: Path) -> None:
+    _emit(mission, "WP01", Lane.APPROVED, "2026-01-01T00:00:05+00:00", "e5")
+    _load(mission)
+    # Sorts BEFORE the folded high-water mark, so it cannot be folded on top.
+    _emit(mission, "WP04", Lane.IN_PROGRESS, "2026-01-01T00:00:01+00:00", "e1")
+
+    result = _load(mission)
+
+    assert result.lanes_source == "rebuilt"
+    assert result.ready == _reference_ready(mission) == ("WP02",)
+
+
+def test_same_timestamp_transition_falls_back_to_full_reduce(mission: Path) -> None:
+    _emit(mission, "WP01", Lane.IN_PROGRESS, "2026-01-01T00:00:01+00:00", "e1")
+    _load(mission)
+    _emit(mission, "WP01", Lane.APPROVED, "2026-01-01T00:00:01+00:00", "e2")
+
+    result = _load(mission)
+
+    assert result.lanes_source == "rebuilt"
+    assert result.ready == _reference_ready(mission)
+
+
+def test_rewritten_log_falls_back_to_full_reduce(mission: Path) -> None:
+    _emit(mission, "WP01", Lane.APPROVED, "2026-01-01T00:00:01+00:00", "e1")
+    _load(mission)
+    events_path = mission / "status.events.jsonl"
+    events_path.unlink()
+    _emit(mission, "WP04", Lane.IN_PROGRESS, "2026-01-01T00:00:02+00:00", "e2")
+
+    result = _load(mission)
+
+    assert result.lanes_source == "rebuilt"
+    assert "WP01" not in result.lanes
+    assert result.ready == _reference_ready(mission) == ("WP01",)
+
+
+def test_wp_file_edit_rebuilds_graph(mission: Path) -> None:
+    _load(mission)
+    _write_wp(mission / "tasks", "WP04", ["WP03"])
+
+    result = _load(mission)
+
+    assert result.graph_source == "rebuilt"
+    assert result.graph["WP04"] == ["WP03"]
+    assert result.ready == _reference_ready(mission) == ("WP01",)
+
+
+def test_graph_only_load_drops_stale_ready_verdicts(mission: Path) -> None:
+    _load(mission)
+    _write_wp(mission / "tasks", "WP01", ["WP04"])
+    cache_path = dependency_graph_cache_path(mission.parents[1], _SLUG)
+
+    assert load_dependency_graph(mission, cache_path=cache_path)["WP01"] == ["WP04"]
+    result = _load(mission)
+
+    assert result.graph_source == "cache"
+    assert result.ready == _reference_ready(mission) == ("WP04",)
+
+
+def test_corrupt_cache_is_ignored(mission: Path) -> None:
+    cache_path = dependency_graph_cache_path(mission.parents[1], _SLUG)
+    cache_path.parent.mkdir(parents=True)
+    cache_path.write_text("{not json", encoding="utf-8")
+
+    result = _load(mission)
+
+    assert (result.graph_source, result.lanes_source) == ("rebuilt", "rebuilt")
+    assert result.ready == _reference_ready(mission)
+    assert json.loads(cache_path.read_text(encoding="utf-8"))["schema_version"] == 1
@@ -0,0 +1,146 @@
+"""Unit tests for ``plumbing_commit()`` and the ``swap_branch_ref`` CAS it uses.
+
+Every test commits to a real tmp git repo. The primary checkout stays on
+``main`` so the destination branch is either not checked out at all (the
+worktree-free case) or checked out in a linked worktree whose index must be
+resynced per path.
+"""
+
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from mission_runtime import CommitTarget
+from specify_cli.git import commit_helpers
+from specify_cli.git.commit_helpers import SafeCommitPathPolicyError, plumbing_commit
+from specify_cli.git.ref_advance import RefAdvanceDirtyWorktreeError, swap_branch_ref
+
+pytestmark = [pytest.mark.unit, pytest.mark.git_repo]
+
+_BRANCH = "kitty/mission-plumbing-01ABCDEF"
+_STATUS = "kitty-specs/plumbing-01ABCDEF/status.json"
+
+
+def _git(repo: Path, *args: str) -> str:
+    return subprocess.run(["git", *args], cwd=repo, capture_output=True, text=True, check=True).stdout
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _git(repo, "init", "-q", "-b", "main")
+    _git(repo, "config", "user.email", "test@example.com")
+    _git(repo, "config", "user.name", "Test User")
+    _git(repo, "config", "commit.gpgsign", "false")
+    (repo / "kitty-specs" / "plumbing-01ABCDEF").mkdir(parents=True)
+    (repo / _STATUS).write_text('{"v": 0}\n', encoding="utf-8")
+    (repo / "kitty-specs" / "plumbing-01ABCDEF" / "spec.md").write_text("# Spec\n", encoding="utf-8")
+    (repo / "seed.txt").write_text("seed\n", encoding="utf-8")
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-q", "-m", "initial commit")
+    _git(repo, "branch", _BRANCH)
+    return repo
+
+
+def _commit(repo: Path, source_root: Path, *relpaths: str) -> str:
+    result = plumbing_commit(
+        repo_root=repo,
+        source_root=source_root,
+        target=CommitTarget(ref=_BRANCH),
+        message="status: WP01 -> claimed",
+        paths=tuple(source_root / relpath for relpath in relpaths),
+    )
+    assert result.destination_ref == _BRANCH
+    return result.sha
+
+
+def test_commits_onto_a_branch_that_is_not_checked_out(repo: Path) -> None:
+    tip = _git(repo, "rev-parse", _BRANCH).strip()
+    (repo / _STATUS).write_text('{"v": 1}\n', encoding="utf-8")
+    tracked_before = _git(repo, "diff", "--name-status", "HEAD")
+
+    sha = _commit(repo, repo, _STATUS)
+
+    assert _git(repo, "rev-parse", _BRANCH).strip() == sha
+    assert _git(repo, "rev-parse", f"{sha}^").strip() == tip
+    assert _git(repo, "show", f"{sha}:{_STATUS}") == '{"v": 1}\n'
+    assert _git(repo, "diff", "--name-only", tip, sha).split() == [_STATUS]
+    # The primary checkout (on main) is untouched: same HEAD, nothing staged.
+    assert _git(repo, "symbolic-ref", "--short", "HEAD").strip() == "main"
+    assert _git(repo, "diff", "--cached", "--name-only") == ""
+    assert _git(repo, "diff", "--name-status", "HEAD") == tracked_before
+
+
+def test_checked_out_worktree_is_resynced_per_path(repo: Path) -> None:
+    coord = repo / ".worktrees" / "coord"
+    _git(repo, "worktree", "add", "-q", str(coord), _BRANCH)
+    (coord / _STATUS).write_text('{"v": 2}\n', encoding="utf-8")
+    (coord / "kitty-specs" / "plumbing-01ABCDEF" / "issue-matrix.md").write_text("| WP |\n", encoding="utf-8")
+
+    sha = _commit(repo, coord, _STATUS, "kitty-specs/plumbing-01ABCDEF/issue-matrix.md")
+
+    assert _git(coord, "rev-parse", "HEAD").strip() == sha
+    assert _git(coord, "status", "--porcelain") == ""
+
+
+def test_unchanged_content_is_an_empty_changeset(repo: Path) -> None:
+    tip = _git(repo, "rev-parse", _BRANCH).strip()
+
+    with pytest.raises(RuntimeError, match="plumbing_commit: nothing to commit"):
+        _commit(repo, repo, _STATUS)
+
+    assert _git(repo, "rev-parse", _BRANCH).strip() == tip
+
+
+def test_lost_swap_rebuilds_on_the_new_tip(repo: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[str] = []
+
+    def _racing_swap(repo_root: Path, branch: str, new_sha: str, **kwargs: object) -> None:
+        if not calls:
+            # Another writer lands a commit on the branch between our read of
+            # the tip and our compare-and-swap.
+            other = repo.parent / "other"
+            _git(repo, "worktree", "add", "-q", str(other), _BRANCH)
+            (other / "seed.txt").write_text("other writer\n", encoding="utf-8")
+            _git(other, "commit", "-q", "-am", "other writer")
+            _git(repo, "worktree", "remove", "--force", str(other))
+        calls.append(new_sha)
+        swap_branch_ref(repo_root, branch, new_sha, **kwargs)  # type: ignore[arg-type]
+
+    monkeypatch.setattr(commit_helpers, "swap_branch_ref", _racing_swap)
+    (repo / _STATUS).write_text('{"v": 3}\n', encoding="utf-8")
+
+    sha = _commit(repo, repo, _STATUS)
+
+    assert len(calls) == 2
+    assert sha == calls[1]
+    assert _git(repo, "log", "-1", "--format=%s", f"{sha}^").strip() == "other writer"
+    assert _git(repo, "show", f"{sha}:seed.txt") == "other writer\n"
+    assert _git(repo, "show", f"{sha}:{_STATUS}") == '{"v": 3}\n'
+
+
+def test_local_changes_in_a_checkout_refuse_the_swap(repo: Path) -> None:
+    coord = repo / ".worktrees" / "coord"
+    _git(repo, "worktree", "add", "-q", str(coord), _BRANCH)
+    (coord / _STATUS).write_text('{"local": true}\n', encoding="utf-8")
+    (repo / _STATUS).write_text('{"v": 4}\n', encoding="utf-8")
+    tip = _git(repo, "rev-parse", _BRANCH).strip()
+
+    with pytest.raises(RefAdvanceDirtyWorktreeError):
+        _commit(repo, repo, _STATUS)
+
+    assert _git(repo, "rev-parse", _BRANCH).strip() == tip
+    assert (coord / _STATUS).read_text(encoding="utf-8") == '{"local": true}\n'
+
+
+def test_paths_under_worktrees_are_refused(repo: Path) -> None:
+    stray = repo / ".worktrees" / "stray.txt"
+    stray.parent.mkdir()
+    stray.write_text("x\n", encoding="utf-8")
+
+    with pytest.raises(SafeCommitPathPolicyError):
+        _commit(repo, repo, ".worktrees/stray.txt")
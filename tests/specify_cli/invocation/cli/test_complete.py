@@ -368,7 +368,7 @@ def test_completion_manifest_entry_unchanged_by_epilog() -> None:
     back, never to regenerate the manifest.
     """
     live_node = completion.build_manifest_from_command(_resolve_group())
-    committed_node = completion._load_manifest()["commands"]["profile-invocation"]
+    committed_node = completion.load_command_manifest()["commands"]["profile-invocation"]
 
     assert live_node == committed_node
     assert "dispatch" not in json.dumps(live_node)
@@ -0,0 +1,196 @@
+"""Tests for the compacted invocation trail store (segments + indexed completions)."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from kernel.clock import UTC, datetime
+from specify_cli.cli.commands import invocations_cmd
+from specify_cli.doctor import ops as ops_module
+from specify_cli.invocation.errors import AlreadyClosedError
+from specify_cli.invocation.record import OpCompletedEvent, OpStartedEvent
+from specify_cli.invocation.trail_store import (
+    SEGMENT_KIND,
+    compact_invocations,
+    read_compacted_events,
+    read_indexed_completions,
+    read_segment_index,
+)
+from specify_cli.invocation.writer import EVENTS_DIR, InvocationWriter
+
+pytestmark = [pytest.mark.unit, pytest.mark.fast]
+
+runner = CliRunner()
+
+_NOW = datetime(2026, 6, 10, 12, 0, 0, tzinfo=UTC)
+_OLD_CLOSED = ["01JX0000000000000000000001", "01JX0000000000000000000002", "01JX0000000000000000000003"]
+_RECENT_CLOSED = "01JX0000000000000000000004"
+_OPEN = "01JX0000000000000000000005"
+
+
+def _start(writer: InvocationWriter, invocation_id: str, *, action: str = "implement") -> None:
+    writer.write_started(
+        OpStartedEvent(
+            invocation_id=invocation_id,
+            profile_id="implementer-fixture",
+            action=action,
+            request_text="do the thing",
+            actor="claude",
+            mode_of_work="task_execution",
+            governance_context_hash="abcdef0123456789",
+            governance_context_available=True,
+            started_at=f"2026-06-0{invocation_id[-1]}T00:00:00+00:00",
+        )
+    )
+
+
+def _complete(writer: InvocationWriter, invocation_id: str, completed_at: str) -> None:
+    writer.write_completed(
+        OpCompletedEvent(
+            invocation_id=invocation_id,
+            completed_at=completed_at,
+            outcome="done",
+            closed_by="agent",
+        )
+    )
+
+
+@pytest.fixture
+def trail(tmp_path: Path) -> Path:
+    writer = InvocationWriter(tmp_path)
+    for invocation_id in _OLD_CLOSED:
+        _start(writer, invocation_id)
+        _complete(writer, invocation_id, "2026-06-08T00:00:00+00:00")
+        writer.append_correlation_link(invocation_id, sha="abc123")
+    _start(writer, _RECENT_CLOSED, action="review")
+    _complete(writer, _RECENT_CLOSED, "2026-06-10T11:00:00+00:00")
+    _start(writer, _OPEN)
+    (tmp_path / EVENTS_DIR / "lifecycle.jsonl").write_text("{}\n", encoding="utf-8")
+    return tmp_path
+
+
+def test_compaction_rolls_only_old_closed_records_into_segments(trail: Path) -> None:
+    events_dir = trail / EVENTS_DIR
+    originals = {inv_id: (events_dir / f"{inv_id}.jsonl").read_text(encoding="utf-8") for inv_id in _OLD_CLOSED}
+
+    report = compact_invocations(events_dir, now=_NOW, min_age_hours=24, segment_size=2)
+
+    assert report.compacted == 3
+    assert report.skipped_open == 1
+    assert report.skipped_recent == 1
+    assert report.segments == [f"{_OLD_CLOSED[0]}-{_OLD_CLOSED[1]}.jsonl", f"{_OLD_CLOSED[2]}-{_OLD_CLOSED[2]}.jsonl"]
+    remaining = sorted(path.name for path in events_dir.glob("*.jsonl"))
+    assert remaining == sorted([f"{_RECENT_CLOSED}.jsonl", f"{_OPEN}.jsonl", "lifecycle.jsonl", "ops-index.jsonl"])
+
+    # Self-describing: the header alone answers status and action.
+    header = json.loads((events_dir / "segments" / report.segments[0]).read_text(encoding="utf-8").splitlines()[0])
+    assert header["kind"] == SEGMENT_KIND
+    assert header["count"] == 2
+    assert {entry["status"] for entry in header["invocations"]} == {"closed"}
+    assert {entry["action"] for entry in header["invocations"]} == {"implement"}
+
+    # Event lines (including the post-completion commit link) survive verbatim.
+    for inv_id, text in originals.items():
+        events = read_compacted_events(events_dir, inv_id)
+        assert events == [json.loads(line) for line in text.splitlines()]
+    assert read_compacted_events(events_dir, _OPEN) is None
+
+    # A second run finds nothing left to do.
+    again = compact_invocations(events_dir, now=_NOW, min_age_hours=24)
+    assert again.compacted == 0
+    assert again.segments == []
+
+
+def test_dry_run_writes_nothing(trail: Path) -> None:
+    events_dir = trail / EVENTS_DIR
+
+    report = compact_invocations(events_dir, now=_NOW, min_age_hours=24, dry_run=True)
+
+    assert report.compacted == 3
+    assert not (events_dir / "segments").exists()
+    assert all((events_dir / f"{inv_id}.jsonl").exists() for inv_id in _OLD_CLOSED)
+
+
+def test_interrupted_compaction_is_finished_without_duplicating_segments(trail: Path) -> None:
+    events_dir = trail / EVENTS_DIR
+    compact_invocations(events_dir, now=_NOW, min_age_hours=24)
+    # Simulate a crash after the segment rename but before the loose file unlink.
+    survivor = events_dir / f"{_OLD_CLOSED[0]}.jsonl"
+    survivor.write_bytes(b"".join(json.dumps(event).encode() + b"\n" for event in read_compacted_events(events_dir, _OLD_CLOSED[0]) or []))
+
+    report = compact_invocations(events_dir, now=_NOW, min_age_hours=24)
+
+    assert report.compacted == 1
+    assert report.segments == []
+    assert not survivor.exists()
+    assert len(list((events_dir / "segments").glob("*.jsonl"))) == 1
+
+
+def test_completion_is_indexed_and_compacted_ids_refuse_a_second_close(trail: Path) -> None:
+    events_dir = trail / EVENTS_DIR
+    completions = read_indexed_completions(events_dir)
+    assert set(completions) == {*_OLD_CLOSED, _RECENT_CLOSED}
+    assert completions[_RECENT_CLOSED]["action"] == "review"
+
+    compact_invocations(events_dir, now=_NOW, min_age_hours=24)
+
+    with pytest.raises(AlreadyClosedError):
+        _complete(InvocationWriter(trail), _OLD_CLOSED[0], "2026-06-10T12:00:00+00:00")
+
+
+def test_list_resolves_closed_records_without_opening_their_files(trail: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    events_dir = trail / EVENTS_DIR
+    compact_invocations(events_dir, now=_NOW, min_age_hours=24)
+    opened: list[str] = []
+    real_read_first_line = invocations_cmd._read_first_line
+    monkeypatch.setattr(invocations_cmd, "_read_first_line", lambda path: opened.append(path.stem) or real_read_first_line(path))
+
+    records = {record["invocation_id"]: record for record in invocations_cmd._iter_records(events_dir, None, 10, repo_root=trail)}
+
+    assert opened == [_OPEN]
+    assert records[_OPEN]["status"] == "open"
+    assert records[_RECENT_CLOSED]["status"] == "closed"
+    assert records[_RECENT_CLOSED]["action"] == "review"
+    for inv_id in _OLD_CLOSED:
+        assert records[inv_id]["status"] == "closed"
+        assert records[inv_id]["outcome"] == "done"
+        assert records[inv_id]["action"] == "implement"
+
+
+def test_list_without_index_merges_segment_headers(trail: Path) -> None:
+    events_dir = trail / EVENTS_DIR
+    compact_invocations(events_dir, now=_NOW, min_age_hours=24)
+    (events_dir / "ops-index.jsonl").unlink()
+    (events_dir / "lifecycle.jsonl").unlink()
+
+    records = list(invocations_cmd._iter_records(events_dir, None, 10, repo_root=trail))
+
+    assert [record["invocation_id"] for record in records] == [_OPEN, _RECENT_CLOSED, *reversed(_OLD_CLOSED)]
+    assert set(read_segment_index(events_dir)) == set(_OLD_CLOSED)
+
+
+def test_doctor_ops_skips_files_closed_in_the_index(trail: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    scanned: list[str] = []
+    real_has_completed = ops_module._has_completed_event
+    monkeypatch.setattr(ops_module, "_has_completed_event", lambda path: scanned.append(path.stem) or real_has_completed(path))
+
+    orphans = ops_module.list_orphan_ops(trail)
+
+    assert [path.stem for path in orphans] == [_OPEN]
+    assert scanned == [_OPEN]
+
+
+def test_compact_cli_reports_json(trail: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(invocations_cmd, "find_repo_root", lambda: trail)
+
+    result = runner.invoke(invocations_cmd.app, ["compact", "--older-than", "0", "--json"])
+
+    assert result.exit_code == 0, result.output
+    payload = json.loads(result.output)
+    assert payload["compacted"] == 4
+    assert payload["skipped_open"] == 1
+    assert payload["dry_run"] is False
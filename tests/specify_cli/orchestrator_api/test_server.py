@@ -0,0 +1,193 @@
+"""Tests for ``orchestrator-api serve`` (newline-delimited JSON-RPC dispatch)."""
+
+from __future__ import annotations
+
+import io
+import json
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import typer
+from typer.testing import CliRunner
+
+from specify_cli.orchestrator_api.commands import app
+from specify_cli.orchestrator_api.envelope import CONTRACT_VERSION
+from specify_cli.orchestrator_api.server import (
+    INVALID_PARAMS,
+    INVALID_REQUEST,
+    METHOD_NOT_FOUND,
+    PARSE_ERROR,
+    OrchestratorServer,
+    _Connection,
+    _params_to_args,
+)
+from specify_cli.status import Lane, StatusEvent
+from specify_cli.status.store import append_event
+
+pytestmark = [pytest.mark.unit, pytest.mark.fast]
+
+runner = CliRunner()
+
+_SLUG = "099-serve-mission"
+_VOLATILE_KEYS = ("timestamp", "correlation_id")
+
+
+@pytest.fixture
+def repo_root(tmp_path: Path) -> Iterator[Path]:
+    """A repo with one mission: WP02 depends on WP01."""
+    root = tmp_path / "repo"
+    mission_dir = root / "kitty-specs" / _SLUG
+    tasks_dir = mission_dir / "tasks"
+    tasks_dir.mkdir(parents=True)
+    for wp_id, deps in (("WP01", []), ("WP02", ["WP01"])):
+        (tasks_dir / f"{wp_id}.md").write_text(
+            f"---\nwork_package_id: {wp_id}\ntitle: Test {wp_id}\ndependencies: {json.dumps(deps)}\n---\n\n# {wp_id}\n",
+            encoding="utf-8",
+        )
+    meta = {"mission_number": "099", "slug": _SLUG, "mission_slug": _SLUG, "mission_type": "software-dev", "target_branch": "main"}
+    (mission_dir / "meta.json").write_text(json.dumps(meta), encoding="utf-8")
+    with patch("specify_cli.orchestrator_api.commands._get_main_repo_root", return_value=root):
+        yield root
+
+
+@pytest.fixture
+def server() -> OrchestratorServer:
+    return OrchestratorServer(typer.main.get_group(app))
+
+
+def _request(method: str, request_id: int | None = 1, **params: object) -> dict[str, object]:
+    request: dict[str, object] = {"jsonrpc": "2.0", "method": method, "params": params}
+    if request_id is not None:
+        request["id"] = request_id
+    return request
+
+
+def _call(server: OrchestratorServer, payload: object, connection: _Connection | None = None) -> object:
+    return server.handle_line(json.dumps(payload), connection or _Connection(io.StringIO()))
+
+
+def _stable(envelope: dict) -> dict:
+    return {key: value for key, value in envelope.items() if key not in _VOLATILE_KEYS}
+
+
+def _emit_event(repo_root: Path, wp_id: str, lane: Lane, event_id: str) -> None:
+    append_event(
+        repo_root / "kitty-specs" / _SLUG,
+        StatusEvent(
+            event_id=event_id,
+            mission_slug=_SLUG,
+            wp_id=wp_id,
+            from_lane=Lane.PLANNED,
+            to_lane=lane,
+            at=f"2026-01-01T00:00:0{event_id[-1]}+00:00",
+            actor="test",
+            force=True,
+            execution_mode="worktree",
+        ),
+    )
+
+
+def test_result_is_the_envelope_the_subcommand_prints(server: OrchestratorServer, repo_root: Path) -> None:
+    cli = json.loads(runner.invoke(app, ["list-ready", "--mission", _SLUG]).output.splitlines()[0])
+
+    response = _call(server, _request("list-ready", mission=_SLUG))
+
+    assert response["id"] == 1
+    assert response["result"]["contract_version"] == CONTRACT_VERSION
+    assert _stable(response["result"]) == _stable(cli)
+    assert [wp["wp_id"] for wp in response["result"]["data"]["ready_work_packages"]] == ["WP01"]
+
+
+def test_failure_envelopes_are_results_not_rpc_errors(server: OrchestratorServer, repo_root: Path) -> None:
+    missing = _call(server, _request("mission-state", mission="999-nope"))
+    bad_option = _call(server, _request("mission-state", bogus=1))
+
+    assert missing["result"]["success"] is False
+    assert missing["result"]["error_code"] == "MISSION_NOT_FOUND"
+    assert bad_option["result"]["error_code"] == "USAGE_ERROR"
+
+
+def test_batch_answers_requests_in_order_and_skips_notifications(server: OrchestratorServer) -> None:
+    response = _call(
+        server,
+        [
+            _request("contract-version", 1),
+            _request("contract-version", None),
+            _request("contract-version", 2, provider_version="0.0.1"),
+            _request("no-such-command", 3),
+        ],
+    )
+
+    assert [item["id"] for item in response] == [1, 2, 3]
+    assert response[0]["result"]["success"] is True
+    assert response[1]["result"]["error_code"] == "CONTRACT_VERSION_MISMATCH"
+    assert response[2]["error"]["code"] == METHOD_NOT_FOUND
+
+
+@pytest.mark.parametrize(
+    ("line", "code"),
+    [
+        ("{not json", PARSE_ERROR),
+        ("[]", INVALID_REQUEST),
+        ('{"id": 1, "method": "contract-version"}', INVALID_REQUEST),
+        ('{"jsonrpc": "2.0", "id": 1, "method": "contract-version", "params": ["x"]}', INVALID_PARAMS),
+        ('{"jsonrpc": "2.0", "id": 1, "method": "serve"}', METHOD_NOT_FOUND),
+    ],
+)
+def test_protocol_faults_are_jsonrpc_errors(server: OrchestratorServer, line: str, code: int) -> None:
+    response = server.handle_line(line, _Connection(io.StringIO()))
+
+    assert response["error"]["code"] == code
+
+
+def test_params_translate_to_cli_options() -> None:
+    args = _params_to_args({"wp": "WP01", "review_ref": "PR #1", "force": True, "push": False, "note": None, "policy": {"a": 1}})
+
+    assert args == ["--wp", "WP01", "--review-ref", "PR #1", "--force", "--policy", '{"a": 1}']
+
+
+def test_watch_pushes_lane_changes(server: OrchestratorServer, repo_root: Path) -> None:
+    stream = io.StringIO()
+    connection = _Connection(stream)
+
+    watched = _call(server, _request("watch", mission=_SLUG), connection)
+    server.poll_watches()
+
+    assert watched["result"]["command"] == "orchestrator-api.watch"
+    assert watched["result"]["data"]["lanes"] == {}
+    assert stream.getvalue() == ""
+
+    _emit_event(repo_root, "WP01", Lane.APPROVED, "e1")
+    server.poll_watches()
+
+    notification = json.loads(stream.getvalue())
+    assert notification["method"] == "lane-changed"
+    assert "id" not in notification
+    data = notification["params"]["data"]
+    assert data["changes"] == [{"wp_id": "WP01", "from_lane": None, "to_lane": "approved"}]
+    assert [wp["wp_id"] for wp in data["ready_work_packages"]] == ["WP02"]
+
+    unwatched = _call(server, _request("unwatch", mission=_SLUG), connection)
+    _emit_event(repo_root, "WP02", Lane.IN_PROGRESS, "e2")
+    server.poll_watches()
+
+    assert unwatched["result"]["data"]["removed"] == 1
+    assert len(stream.getvalue().splitlines()) == 1
+
+
+def test_watch_unknown_mission_fails_with_envelope(server: OrchestratorServer, repo_root: Path) -> None:
+    response = _call(server, _request("watch", mission="999-nope"))
+
+    assert response["result"]["command"] == "orchestrator-api.watch"
+    assert response["result"]["error_code"] == "MISSION_NOT_FOUND"
+
+
+def test_serve_stdio_answers_one_line_per_request(server: OrchestratorServer) -> None:
+    reader = io.StringIO(json.dumps(_request("contract-version", 1)) + "\n\n" + json.dumps(_request("contract-version", 2)) + "\n")
+    writer = io.StringIO()
+
+    server.serve_stdio(reader, writer)
+
+    assert [json.loads(line)["id"] for line in writer.getvalue().splitlines()] == [1, 2]
@@ -14,7 +14,7 @@ from pydantic import ValidationError
 
 from specify_cli.status.emit import build_claim_policy_metadata, emit_status_transition
 from specify_cli.status.models import AgentAssignment
-from specify_cli.status.wp_metadata import WPMetadata, read_wp_frontmatter
+from specify_cli.status.wp_metadata import WPMetadata, read_mission_wp_metadata, read_wp_frontmatter
 
 from tests.status.conftest import seed_wp_to_planned
 
@@ -652,6 +652,60 @@ class TestReadWpFrontmatter:
         assert meta.agent_profile == "python-implementer"
 
 
+class TestReadMissionWpMetadata:
+    """The bulk reader joins every WP against ONE reduction of the event log."""
+
+    @staticmethod
+    def _mission(tmp_path: Path) -> Path:
+        feature_dir = tmp_path / "kitty-specs" / "bulk-read"
+        tasks_dir = feature_dir / "tasks"
+        tasks_dir.mkdir(parents=True)
+        (feature_dir / "meta.json").write_text('{"status_phase": 0}', encoding="utf-8")
+        for wp_id in ("WP02", "WP01"):
+            (tasks_dir / f"{wp_id}-task.md").write_text(
+                f'---\nwork_package_id: {wp_id}\ntitle: {wp_id} task\nshell_pid: "111"\n---\n\n# {wp_id}\n',
+                encoding="utf-8",
+            )
+            seed_wp_to_planned(feature_dir, wp_id, slug="bulk-read")
+        return feature_dir
+
+    def test_matches_per_file_reader(self, tmp_path: Path) -> None:
+        feature_dir = self._mission(tmp_path)
+
+        mission = read_mission_wp_metadata(feature_dir)
+
+        assert [path.name for path, _meta, _body in mission.work_packages] == ["WP01-task.md", "WP02-task.md"]
+        for path, meta, body in mission.work_packages:
+            assert (meta, body) == read_wp_frontmatter(path)
+            # Runtime field re-pointed to the (empty) snapshot slot, never frontmatter.
+            assert meta.shell_pid is None
+        assert set(mission.snapshot.work_packages) == {"WP01", "WP02"}
+
+    def test_reads_the_event_log_once(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        from specify_cli.status import store
+
+        feature_dir = self._mission(tmp_path)
+        reads: list[Path] = []
+        real_read = store.read_event_stream
+        monkeypatch.setattr(store, "read_event_stream", lambda d: reads.append(d) or real_read(d))
+
+        read_mission_wp_metadata(feature_dir)
+
+        assert reads == [feature_dir]
+
+    def test_lenient_mode_collects_unreadable_files(self, tmp_path: Path) -> None:
+        feature_dir = self._mission(tmp_path)
+        broken = feature_dir / "tasks" / "WP03-broken.md"
+        broken.write_text("---\ntitle: No ID\n---\n\nBody\n", encoding="utf-8")
+
+        with pytest.raises(ValidationError):
+            read_mission_wp_metadata(feature_dir)
+        mission = read_mission_wp_metadata(feature_dir, strict=False)
+
+        assert [path.name for path, _meta, _body in mission.work_packages] == ["WP01-task.md", "WP02-task.md"]
+        assert [path for path, _exc in mission.unreadable] == [broken]
+
+
 # ─────────────────────────────────────────────────────────────
 # T013: CI validation — all kitty-specs WP files must validate
 # ─────────────────────────────────────────────────────────────
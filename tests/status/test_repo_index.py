@@ -0,0 +1,183 @@
+"""Tests for the repo-level status index (``.kittify/derived/index.sqlite``).
+
+Every test checks the indexed mission against a full ``materialize_snapshot``
+of the same log, so the incremental paths (stat fast path, tail fold, forced
+full reduce) are proven equivalent to the reducer rather than to themselves.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from specify_cli.status.models import InnerStateChanged, Lane, StatusEvent, WPInnerStateDelta
+from specify_cli.status.progress import compute_weighted_progress
+from specify_cli.status.reducer import materialize_snapshot
+from specify_cli.status.repo_index import (
+    RepoStatusIndex,
+    refresh_repo_status_index,
+    repo_status_index_key,
+    repo_status_index_path,
+)
+from specify_cli.status.store import EVENTS_FILENAME
+
+pytestmark = [pytest.mark.unit, pytest.mark.fast]
+
+_SLUG = "077-repo-index"
+
+
+def _event(n: int, wp_id: str, from_lane: Lane, to_lane: Lane, *, at: str | None = None) -> StatusEvent:
+    return StatusEvent(
+        event_id=f"01JTR{n:021d}",
+        mission_slug=_SLUG,
+        wp_id=wp_id,
+        from_lane=from_lane,
+        to_lane=to_lane,
+        at=at or f"2026-07-01T10:{n:02d}:00+00:00",
+        actor="tester",
+        force=False,
+        execution_mode="worktree",
+    )
+
+
+def _annotation(n: int, wp_id: str) -> InnerStateChanged:
+    return InnerStateChanged(
+        event_id=f"01JTS{n:021d}",
+        wp_id=wp_id,
+        at=f"2026-07-01T11:{n:02d}:00+00:00",
+        actor="tester",
+        delta=WPInnerStateDelta(agent="claude"),
+    )
+
+
+def _append(feature_dir: Path, *records: StatusEvent | InnerStateChanged) -> None:
+    with (feature_dir / EVENTS_FILENAME).open("a", encoding="utf-8") as handle:
+        for record in records:
+            handle.write(json.dumps(record.to_dict(), sort_keys=True) + "\n")
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    (tmp_path / ".kittify").mkdir()
+    return tmp_path
+
+
+def _mission(repo: Path, name: str = _SLUG) -> Path:
+    feature_dir = repo / "kitty-specs" / name
+    feature_dir.mkdir(parents=True)
+    _append(
+        feature_dir,
+        _event(1, "WP01", Lane.GENESIS, Lane.PLANNED),
+        _event(2, "WP02", Lane.GENESIS, Lane.PLANNED),
+        _event(3, "WP01", Lane.PLANNED, Lane.CLAIMED),
+    )
+    return feature_dir
+
+
+def _refresh(repo: Path, *feature_dirs: Path, prune: bool = False) -> dict:
+    with RepoStatusIndex.open(repo) as index:
+        return index.refresh(feature_dirs, prune=prune)
+
+
+def _assert_matches_full_reduce(repo: Path, feature_dir: Path) -> None:
+    indexed = _refresh(repo, feature_dir)[repo_status_index_key(repo, feature_dir)]
+    snapshot = materialize_snapshot(feature_dir)
+
+    assert indexed.mission_slug == snapshot.mission_slug
+    assert indexed.event_count == snapshot.event_count
+    assert indexed.last_event_id == snapshot.last_event_id
+    assert indexed.summary == snapshot.summary
+    assert indexed.wp_lanes == {wp_id: Lane(state["lane"]) for wp_id, state in snapshot.work_packages.items()}
+    assert indexed.weighted_percentage == compute_weighted_progress(snapshot).percentage
+    assert indexed.log_offset == (feature_dir / EVENTS_FILENAME).stat().st_size
+
+
+class TestIncrementalRefresh:
+    def test_first_refresh_matches_full_reduce(self, repo: Path) -> None:
+        feature_dir = _mission(repo)
+
+        _assert_matches_full_reduce(repo, feature_dir)
+        assert repo_status_index_path(repo).exists()
+
+    def test_unchanged_log_is_not_reread(self, repo: Path) -> None:
+        feature_dir = _mission(repo)
+        _refresh(repo, feature_dir)
+
+        with patch("specify_cli.status.repo_index.read_event_stream_from_text") as read:
+            _refresh(repo, feature_dir)
+
+        read.assert_not_called()
+
+    def test_appended_events_fold_without_full_reduce(self, repo: Path) -> None:
+        feature_dir = _mission(repo)
+        _refresh(repo, feature_dir)
+        _append(
+            feature_dir,
+            _event(4, "WP01", Lane.CLAIMED, Lane.IN_PROGRESS),
+            _event(5, "WP03", Lane.GENESIS, Lane.PLANNED),
+            _annotation(1, "WP09"),
+        )
+
+        with patch.object(RepoStatusIndex, "_reduce_full", side_effect=AssertionError("full reduce")):
+            _refresh(repo, feature_dir)
+        _assert_matches_full_reduce(repo, feature_dir)
+
+    @pytest.mark.parametrize(
+        "appended",
+        [
+            pytest.param(_event(6, "WP02", Lane.PLANNED, Lane.CLAIMED, at="2026-07-01T09:00:00+00:00"), id="back-dated"),
+            pytest.param(_event(2, "WP02", Lane.PLANNED, Lane.CLAIMED, at="2026-07-01T12:00:00+00:00"), id="duplicate-id"),
+        ],
+    )
+    def test_out_of_order_tail_falls_back_to_full_reduce(self, repo: Path, appended: StatusEvent) -> None:
+        feature_dir = _mission(repo)
+        _refresh(repo, feature_dir)
+        _append(feature_dir, appended)
+
+        _assert_matches_full_reduce(repo, feature_dir)
+
+    def test_rewritten_log_is_not_treated_as_append(self, repo: Path) -> None:
+        feature_dir = _mission(repo)
+        _refresh(repo, feature_dir)
+        events_path = feature_dir / EVENTS_FILENAME
+        rewritten = events_path.read_text(encoding="utf-8").replace('"to_lane": "claimed"', '"to_lane": "blocked"')
+        events_path.write_text(rewritten, encoding="utf-8")
+        _append(feature_dir, _event(7, "WP02", Lane.PLANNED, Lane.CLAIMED))
+
+        _assert_matches_full_reduce(repo, feature_dir)
+        assert _refresh(repo, feature_dir)[repo_status_index_key(repo, feature_dir)].wp_lanes["WP01"] == Lane.BLOCKED
+
+
+class TestRecovery:
+    def test_corrupt_database_is_rebuilt(self, repo: Path) -> None:
+        feature_dir = _mission(repo)
+        _refresh(repo, feature_dir)
+        repo_status_index_path(repo).write_bytes(b"not a sqlite database" * 100)
+
+        _assert_matches_full_reduce(repo, feature_dir)
+
+    def test_missing_or_unreadable_logs_have_no_row(self, repo: Path) -> None:
+        good = _mission(repo)
+        missing = repo / "kitty-specs" / "078-no-log"
+        missing.mkdir()
+        broken = _mission(repo, "079-broken")
+        (broken / EVENTS_FILENAME).write_text("{not json\n", encoding="utf-8")
+
+        refreshed = refresh_repo_status_index(repo, [good, missing, broken])
+
+        assert refreshed is not None
+        assert set(refreshed) == {repo_status_index_key(repo, good)}
+
+    def test_prune_drops_missions_no_longer_scanned(self, repo: Path) -> None:
+        first = _mission(repo)
+        second = _mission(repo, "080-second")
+        _refresh(repo, first, second)
+
+        _refresh(repo, first, prune=True)
+
+        with RepoStatusIndex.open(repo) as index:
+            assert [mission.feature_dir for mission in index.missions()] == [repo_status_index_key(repo, first)]
+            assert index.lane_totals() == {"claimed": 1, "planned": 1}
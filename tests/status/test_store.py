@@ -482,6 +482,44 @@ def test_blank_lines_skipped(tmp_path: Path) -> None:
     assert len(events) == 2
 
 
+# --- lock-free snapshot reads ---
+
+
+def test_read_retries_a_torn_tail_until_the_append_lands(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """A half-written last line is re-read instead of raising StoreError."""
+    from specify_cli.status import store
+
+    first = json.dumps(_make_event().to_dict(), sort_keys=True)
+    second = json.dumps(_make_event(event_id="01HXYZ0123456789ABCDEFGHJM", to_lane=Lane.IN_PROGRESS).to_dict(), sort_keys=True)
+    events_file = tmp_path / EVENTS_FILENAME
+    events_file.write_text(f"{first}\n{second[:20]}", encoding="utf-8")
+
+    sleeps: list[float] = []
+
+    def _finish_append(delay: float) -> None:
+        sleeps.append(delay)
+        events_file.write_text(f"{first}\n{second}\n", encoding="utf-8")
+
+    monkeypatch.setattr(store.time, "sleep", _finish_append)
+
+    events = read_events(tmp_path)
+
+    assert [e.to_lane for e in events] == [Lane.CLAIMED, Lane.IN_PROGRESS]
+    assert len(sleeps) == 1
+
+
+def test_read_accepts_a_complete_last_line_without_newline(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """A parseable final line missing its newline is not mistaken for a torn tail."""
+    from specify_cli.status import store
+
+    events_file = tmp_path / EVENTS_FILENAME
+    events_file.write_text(json.dumps(_make_event().to_dict(), sort_keys=True), encoding="utf-8")
+    monkeypatch.setattr(store.time, "sleep", lambda _delay: pytest.fail("unexpected retry"))
+
+    assert len(read_events(tmp_path)) == 1
+    assert len(read_events_raw(tmp_path)) == 1
+
+
 def test_slug_resolver_finds_kitty_specs_two_levels_up(tmp_path: Path) -> None:
     """Nested feature dirs still resolve via a kitty-specs root two levels up.
 
@@ -0,0 +1,73 @@
+"""Tracing spans at the status choke points (``kernel.tracing``).
+
+With tracing on, an append / read / reduce round trip under the feature
+status lock records one span per layer, named after the module that owns the
+work; with tracing off nothing is recorded.
+"""
+
+from __future__ import annotations
+
+import subprocess
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from kernel import tracing
+from specify_cli.status.locking import feature_status_lock
+from specify_cli.status.models import Lane, StatusEvent
+from specify_cli.status.reducer import reduce
+from specify_cli.status.store import append_events_atomic, read_events
+
+pytestmark = [pytest.mark.integration, pytest.mark.git_repo]
+
+_SLUG = "001-traced"
+
+
+@pytest.fixture(autouse=True)
+def _tracing_off() -> Iterator[None]:
+    tracing.reset()
+    yield
+    tracing.reset()
+
+
+def _round_trip(repo: Path) -> None:
+    feature_dir = repo / "kitty-specs" / _SLUG
+    feature_dir.mkdir(parents=True)
+    event = StatusEvent(
+        event_id="01TRACE0000000000000000001",
+        mission_slug=_SLUG,
+        wp_id="WP01",
+        from_lane=Lane.PLANNED,
+        to_lane=Lane.CLAIMED,
+        at="2026-01-01T00:00:00+00:00",
+        actor="tracer",
+        force=False,
+        execution_mode="worktree",
+    )
+    with feature_status_lock(repo, _SLUG):
+        append_events_atomic(feature_dir, [event])
+    snapshot = reduce(read_events(feature_dir))
+    assert snapshot.work_packages["WP01"]["lane"] == Lane.CLAIMED
+
+
+def test_status_choke_points_record_spans(tmp_path: Path) -> None:
+    subprocess.run(["git", "init", "-q", "-b", "main", str(tmp_path)], check=True, capture_output=True)
+    tracing.enable(tmp_path / "trace.json")
+
+    _round_trip(tmp_path)
+
+    recorder = tracing._RECORDER
+    assert recorder is not None
+    spans = {event["name"]: event for event in recorder.events}
+    assert {"status.lock.wait", "status.store.append", "status.store.read", "status.store.parse", "status.reduce"} <= spans.keys()
+    assert spans["status.lock.wait"]["args"] == {"mission": _SLUG}
+    assert spans["status.store.append"]["args"] == {"mission": _SLUG, "rows": 1}
+
+
+def test_nothing_is_recorded_while_tracing_is_off(tmp_path: Path) -> None:
+    subprocess.run(["git", "init", "-q", "-b", "main", str(tmp_path)], check=True, capture_output=True)
+
+    _round_trip(tmp_path)
+
+    assert tracing._RECORDER is None
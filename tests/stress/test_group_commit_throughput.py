@@ -0,0 +1,153 @@
+"""Stress test: group-commit throughput for concurrent bookkeeping writers.
+
+N writer processes each run several ``acquire → append_event → commit``
+rounds against one mission, once with the default per-transaction commit and
+once with group commit (``SPEC_KITTY_GROUP_COMMIT=1``). Both runs must land
+every event exactly once, committed on the coordination branch, with every
+caller holding a receipt whose commit carries its event. The default run makes
+exactly one commit per transition; the group-commit run never makes more.
+
+Transitions per second and commit counts for both modes are attached to the
+test report (``record_property``) rather than asserted, because how much the
+writers overlap depends on the runner's git and filesystem latency. The
+deterministic coalescing proof lives in
+``tests/coordination/test_group_commit.py``.
+
+``SPEC_KITTY_STRESS_EMITTER_COUNT`` (default 8) and
+``SPEC_KITTY_STRESS_ROUNDS`` (default 3) size the run.
+"""
+
+from __future__ import annotations
+
+import json
+import multiprocessing as mp
+import os
+import subprocess
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+pytestmark = [pytest.mark.stress, pytest.mark.slow, pytest.mark.git_repo]
+
+MISSION_SLUG = "group-commit-feature"
+MID8 = "01J6GRPCM"
+MISSION_ID = "01J6GRPCM00000000000000000"
+COORD_BRANCH = f"kitty/mission-{MISSION_SLUG}-{MID8}"
+FEATURE_DIRNAME = f"{MISSION_SLUG}-{MID8}"
+
+
+def _git(repo: Path, *args: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True, text=True)
+
+
+def _env_int(name: str, default: int, lo: int, hi: int) -> int:
+    try:
+        return max(lo, min(int(os.environ.get(name, default)), hi))
+    except ValueError:
+        return default
+
+
+def _writer(args: tuple[str, str, int, bool]) -> list[dict[str, Any]]:
+    """Run ``rounds`` transactions for one WP; return one result per round."""
+    repo_str, wp_id, rounds, group_commit = args
+    repo = Path(repo_str)
+
+    from specify_cli.coordination.transaction import BookkeepingTransaction  # noqa: PLC0415
+    from specify_cli.status.emit import build_status_event  # noqa: PLC0415
+
+    results: list[dict[str, Any]] = []
+    for round_no in range(rounds):
+        event = build_status_event(
+            mission_slug=MISSION_SLUG,
+            mission_id=MISSION_ID,
+            wp_id=wp_id,
+            from_lane="planned",
+            to_lane="claimed",
+            actor=f"stress-{wp_id}-{round_no}",
+        )
+        try:
+            with BookkeepingTransaction.acquire(
+                repo_root=repo,
+                mission_id=MISSION_ID,
+                mission_slug=MISSION_SLUG,
+                mid8=MID8,
+                destination_ref=COORD_BRANCH,
+                operation=f"group_commit_stress_{wp_id}",
+                timeout=120.0,
+                group_commit=group_commit,
+            ) as txn:
+                txn.append_event(event)
+                receipt = txn.commit(f"status: {wp_id} → claimed ({round_no})")
+        except Exception as exc:  # noqa: BLE001 — capture for aggregation
+            results.append({"ok": False, "error": f"{type(exc).__name__}: {exc}"})
+            continue
+        results.append({"ok": True, "event_id": event.event_id, "commit_sha": receipt.commit_sha})
+    return results
+
+
+def _make_repo(root: Path) -> Path:
+    repo = root / "repo"
+    repo.mkdir(parents=True)
+    _git(repo, "init", "-q", "-b", "main")
+    _git(repo, "config", "user.email", "stress@example.invalid")
+    _git(repo, "config", "user.name", "Stress")
+    _git(repo, "config", "commit.gpgsign", "false")
+    (repo / "seed.txt").write_text("seed\n")
+    _git(repo, "add", "seed.txt")
+    _git(repo, "commit", "-q", "-m", "initial")
+    _git(repo, "branch", COORD_BRANCH)
+
+    from specify_cli.coordination.workspace import CoordinationWorkspace  # noqa: PLC0415
+
+    CoordinationWorkspace.resolve(repo, MISSION_SLUG, MID8)
+    return repo
+
+
+def _run(repo: Path, writers: int, rounds: int, *, group_commit: bool) -> tuple[list[dict[str, Any]], float]:
+    args = [(str(repo), f"WP{i:02d}", rounds, group_commit) for i in range(1, writers + 1)]
+    started = time.monotonic()
+    with mp.get_context("spawn").Pool(processes=writers) as pool:
+        per_writer = pool.map(_writer, args)
+    return [result for results in per_writer for result in results], time.monotonic() - started
+
+
+def _committed_event_ids(repo: Path, rev: str) -> list[str]:
+    relpath = f"kitty-specs/{FEATURE_DIRNAME}/status.events.jsonl"
+    shown = _git(repo, "show", f"{rev}:{relpath}").stdout
+    return [json.loads(line)["event_id"] for line in shown.splitlines() if line.strip()]
+
+
+@pytest.mark.timeout(300)
+@pytest.mark.parametrize("group_commit", [False, True], ids=["per-transaction", "group-commit"])
+def test_concurrent_writers_throughput(tmp_path: Path, group_commit: bool, record_property: pytest.RecordProperty) -> None:
+    writers = _env_int("SPEC_KITTY_STRESS_EMITTER_COUNT", 8, 2, 50)
+    rounds = _env_int("SPEC_KITTY_STRESS_ROUNDS", 3, 1, 20)
+    repo = _make_repo(tmp_path)
+    base_commits = int(_git(repo, "rev-list", "--count", COORD_BRANCH).stdout)
+
+    results, duration = _run(repo, writers, rounds, group_commit=group_commit)
+
+    failures = [r["error"] for r in results if not r["ok"]]
+    assert not failures, failures
+    transitions = writers * rounds
+    assert len(results) == transitions
+
+    # Every event is committed exactly once at the branch tip, and every
+    # caller's receipt names a commit that already carries its event.
+    committed = _committed_event_ids(repo, COORD_BRANCH)
+    assert sorted(committed) == sorted(r["event_id"] for r in results)
+    for result in results:
+        assert result["event_id"] in _committed_event_ids(repo, result["commit_sha"])
+    assert _git(repo, "-C", str(repo / ".worktrees" / f"{FEATURE_DIRNAME}-coord"), "status", "--porcelain").stdout == ""
+
+    commits = int(_git(repo, "rev-list", "--count", COORD_BRANCH).stdout) - base_commits
+    if group_commit:
+        assert commits <= transitions
+    else:
+        assert commits == transitions
+
+    record_property("transitions", transitions)
+    record_property("commits", commits)
+    record_property("transitions_per_second", round(transitions / duration, 2))
@@ -115,7 +115,7 @@ PRODUCTION_ADAPTER_CONTRACTS: tuple[ProductionAdapterContract, ...] = (
         "specify_cli.sync.events.emit_wp_status_changed",
         "specify_cli.sync.client.WebSocketClient._send_wire",
         "specify_cli.sync.client.WebSocketClient._flush_pending_project_events",
-        "urllib.request.urlopen",
+        "specify_cli.sync.daemon.DaemonLoopbackClient.urlopen",
     ),
     ProductionAdapterContract(
         "body_drain",
@@ -2104,6 +2104,7 @@ def _invoke_relay(
 
     from specify_cli.identity.project import ProjectIdentity
     from specify_cli.sync.clock import LamportClock
+    from specify_cli.sync.daemon import DaemonLoopbackClient
     from specify_cli.sync.emitter import EventEmitter
 
     class _GitResolver:
@@ -2138,7 +2139,7 @@ def _invoke_relay(
         def __exit__(self, *_args: object) -> None:
             return None
 
-    def _urlopen(request: Any, *, timeout: float) -> _Response:
+    def _urlopen(_client: Any, request: Any, *, timeout: float) -> _Response:
         del timeout
         data = getattr(request, "data", None)
         if not isinstance(data, bytes):
@@ -2180,7 +2181,7 @@ def _invoke_relay(
             ),
             patch.object(events, "_request_dashboard_sync", lambda _root: None),
             patch("specify_cli.sync.daemon.get_sync_daemon_status", lambda **_kwargs: status),
-            patch.object(events.urllib.request, "urlopen", _urlopen),
+            patch.object(DaemonLoopbackClient, "urlopen", _urlopen),
         ):
             # ``occurred_at`` now travels inside ``metadata=WPStatusChangeMetadata``
             # (main's S107 wrapper refactor); the flat kwarg raises TypeError.
@@ -0,0 +1,186 @@
+"""Threaded, keep-alive sync daemon control plane.
+
+Drives a real loopback ``SyncDaemonServer`` with a fake runtime and checks that
+the CLI-side ``DaemonLoopbackClient`` reuses one connection, that a slow
+publish does not stall other requests, and that ``/api/sync/publish`` accepts
+batches.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import urllib.request
+from collections.abc import Iterator
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from specify_cli.core.loopback_http import build_loopback_url, create_loopback_server
+from specify_cli.sync import daemon
+from specify_cli.sync.daemon import DaemonLoopbackClient, SyncDaemonHandler, SyncDaemonServer
+
+pytestmark = pytest.mark.fast
+
+_TOKEN = "control-plane-token"
+
+
+class _FakeRuntime:
+    def __init__(self) -> None:
+        self.published: list[dict[str, Any]] = []
+        self.wakes = 0
+        self.gate: threading.Event | None = None
+        self.background_service = SimpleNamespace(wake=self._wake)
+
+    def _wake(self) -> None:
+        self.wakes += 1
+
+    def publish_event(self, event: dict[str, Any]) -> bool:
+        if self.gate is not None:
+            self.gate.wait(timeout=5.0)
+        self.published.append(event)
+        return not event.get("queue")
+
+
+class _Harness:
+    def __init__(self, port: int, connections: list[int], runtime: _FakeRuntime) -> None:
+        self.port = port
+        self.connections = connections
+        self.runtime = runtime
+
+    def url(self, path: str) -> str:
+        return build_loopback_url(self.port, path)
+
+    def publish_request(self, body: dict[str, Any]) -> urllib.request.Request:
+        return urllib.request.Request(
+            self.url("/api/sync/publish"),
+            data=json.dumps({"token": _TOKEN, **body}).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+
+
+@pytest.fixture
+def control_plane(monkeypatch: pytest.MonkeyPatch) -> Iterator[_Harness]:
+    runtime = _FakeRuntime()
+    monkeypatch.setattr("specify_cli.sync.runtime.get_runtime", lambda: runtime)
+    connections: list[int] = []
+
+    class _CountingHandler(SyncDaemonHandler):
+        daemon_token = _TOKEN
+        timeout = 0.5
+
+        def setup(self) -> None:
+            connections.append(self.client_address[1])
+            super().setup()
+
+    server = create_loopback_server(0, _CountingHandler, server_factory=SyncDaemonServer)
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True)
+    thread.start()
+    try:
+        yield _Harness(server.server_address[1], connections, runtime)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_client_reuses_one_connection_across_requests(control_plane: _Harness) -> None:
+    client = DaemonLoopbackClient()
+    try:
+        for index in range(3):
+            with client.urlopen(control_plane.publish_request({"event": {"n": index}}), timeout=2.0) as response:
+                assert response.status == 200
+        with client.urlopen(control_plane.url(f"/api/sync/trigger?token={_TOKEN}"), timeout=2.0) as response:
+            assert response.status == 202
+    finally:
+        client.close()
+
+    assert [event["n"] for event in control_plane.runtime.published] == [0, 1, 2]
+    assert len(control_plane.connections) == 1
+
+
+def test_client_retries_once_after_the_daemon_closes_an_idle_connection(control_plane: _Harness) -> None:
+    client = DaemonLoopbackClient()
+    try:
+        with client.urlopen(control_plane.publish_request({"event": {"n": 1}}), timeout=2.0) as response:
+            assert response.status == 200
+        threading.Event().wait(1.0)  # outlive the handler's 0.5s idle timeout
+        with client.urlopen(control_plane.publish_request({"event": {"n": 2}}), timeout=2.0) as response:
+            assert response.status == 200
+    finally:
+        client.close()
+
+    assert [event["n"] for event in control_plane.runtime.published] == [1, 2]
+    assert len(control_plane.connections) == 2
+
+
+def test_slow_publish_does_not_block_other_requests(control_plane: _Harness) -> None:
+    control_plane.runtime.gate = threading.Event()
+    publisher = DaemonLoopbackClient()
+    results: list[int] = []
+
+    def _publish() -> None:
+        with publisher.urlopen(control_plane.publish_request({"event": {"n": 1}}), timeout=5.0) as response:
+            results.append(response.status)
+
+    worker = threading.Thread(target=_publish)
+    worker.start()
+    try:
+        with DaemonLoopbackClient().urlopen(control_plane.url("/api/health"), timeout=2.0) as response:
+            assert response.status == 200
+            assert json.loads(response.read())["status"] == "ok"
+        assert results == []
+    finally:
+        control_plane.runtime.gate.set()
+        worker.join(timeout=5.0)
+        publisher.close()
+
+    assert results == [200]
+
+
+def test_batched_publish_reports_published_and_queued_counts(control_plane: _Harness) -> None:
+    events = [{"n": 1}, {"n": 2, "queue": True}, {"n": 3}]
+
+    with DaemonLoopbackClient().urlopen(control_plane.publish_request({"events": events}), timeout=2.0) as response:
+        assert response.status == 202
+        assert json.loads(response.read()) == {"status": "queued", "published": 2, "queued": 1}
+
+    assert control_plane.runtime.published == events
+    assert control_plane.runtime.wakes == 1
+
+
+@pytest.mark.parametrize(
+    "events",
+    [[], "not-a-list", [{"n": 1}, "not-an-event"], [{"n": index} for index in range(daemon.DAEMON_PUBLISH_BATCH_MAX_EVENTS + 1)]],
+    ids=["empty", "not-a-list", "non-object", "oversized"],
+)
+def test_invalid_batches_are_rejected_whole(control_plane: _Harness, events: Any) -> None:
+    with DaemonLoopbackClient().urlopen(control_plane.publish_request({"events": events}), timeout=2.0) as response:
+        assert response.status == 400
+        assert json.loads(response.read()) == {"error": "invalid_events"}
+
+    assert control_plane.runtime.published == []
+
+
+def test_unknown_route_closes_the_connection(control_plane: _Harness) -> None:
+    client = DaemonLoopbackClient()
+    try:
+        missing = urllib.request.Request(control_plane.url("/api/nope"), data=b"{}", method="POST")
+        with client.urlopen(missing, timeout=2.0) as response:
+            assert response.status == 404
+        with client.urlopen(control_plane.url("/api/health"), timeout=2.0) as response:
+            assert response.status == 200
+    finally:
+        client.close()
+
+    assert len(control_plane.connections) == 2
+
+
+def test_client_refuses_non_loopback_urls() -> None:
+    with pytest.raises(ValueError, match="Not a loopback sync daemon URL"):
+        DaemonLoopbackClient().urlopen("http://example.com:9400/api/health", timeout=0.1)
+
+
+def test_process_client_is_shared() -> None:
+    assert daemon.daemon_loopback_client() is daemon.daemon_loopback_client()
@@ -371,7 +371,7 @@ def test_a_refused_publish_does_not_start_the_runtime(monkeypatch: pytest.Monkey
 
 
 class _RecordingUrlopen:
-    """Records every POST body handed to ``urllib.request.urlopen``."""
+    """Records every POST body handed to the relay's loopback ``urlopen``."""
 
     def __init__(self) -> None:
         self.posts: list[dict[str, Any]] = []
@@ -414,7 +414,7 @@ def relay_egress(monkeypatch: pytest.MonkeyPatch) -> _RecordingUrlopen:
         "specify_cli.sync.daemon.get_sync_daemon_status",
         lambda **_kw: SimpleNamespace(healthy=True, url="http://127.0.0.1:9401", token="daemon-token"),
     )
-    monkeypatch.setattr("urllib.request.urlopen", recorder)
+    monkeypatch.setattr("specify_cli.sync.daemon.DaemonLoopbackClient.urlopen", recorder)
     return recorder
 
 
@@ -1,7 +1,9 @@
 """Unit tests for FrontmatterManager.read() edge-cases — malformed input.
 
 Covers error paths: missing frontmatter, unclosed frontmatter, and None/empty
-YAML body.  All tests are pure in-memory (tmp_path only, no real WP files).
+YAML body, plus parity and caching of the read-only fast path
+(``read_frontmatter_readonly``).  All tests are pure in-memory (tmp_path only,
+no real WP files).
 """
 
 from __future__ import annotations
@@ -10,7 +12,7 @@ from pathlib import Path
 
 import pytest
 
-from specify_cli.frontmatter import FrontmatterError, FrontmatterManager
+from specify_cli.frontmatter import FrontmatterError, FrontmatterManager, read_frontmatter_readonly
 
 pytestmark = pytest.mark.fast
 
@@ -156,3 +158,68 @@ class TestReadValidInput:
 
         # Assert
         assert "dependencies" not in frontmatter
+
+
+class TestReadOnlyFastPath:
+    """read_frontmatter_readonly() agrees with FrontmatterManager.read() and caches per stat identity."""
+
+    @pytest.mark.parametrize(
+        "scalar",
+        [
+            *("yes", "on", "No", "true", "FALSE", "null", "~"),
+            *("017", "0o17", "0x1F", "1_000", "1e5", "+.5", "1:30"),
+            *("2026-01-02", "2026-01-02T03:04:05Z", "'017'", "WP01"),
+        ],
+    )
+    def test_scalars_resolve_like_round_trip(self, tmp_path: Path, fm: FrontmatterManager, scalar: str) -> None:
+        """Plain scalars follow the YAML 1.2 core schema on both paths (``yes`` stays a string)."""
+        f = tmp_path / "WP01.md"
+        f.write_text(f"---\nwork_package_id: WP01\nvalue: {scalar}\n---\nBody\n", encoding="utf-8")
+
+        expected, expected_body = fm.read(f)
+        actual, body = read_frontmatter_readonly(f)
+
+        assert actual == dict(expected)
+        assert type(actual["value"]) is type(expected["value"]) or isinstance(expected["value"], type(actual["value"]))
+        assert body == expected_body
+
+    def test_crlf_and_bom_match_round_trip(self, tmp_path: Path, fm: FrontmatterManager) -> None:
+        """Newline translation and BOM stripping match ``Path.read_text``."""
+        f = tmp_path / "WP01.md"
+        f.write_bytes(b"\xef\xbb\xbf---\r\nwork_package_id: WP01\r\ntitle: Setup\r\n---\r\nBody\r\n")
+
+        assert read_frontmatter_readonly(f) == fm.read(f)
+
+    def test_cache_hands_out_independent_copies(self, tmp_path: Path) -> None:
+        """Mutating a returned mapping never leaks into the next read."""
+        f = tmp_path / "WP01.md"
+        f.write_text("---\nwork_package_id: WP01\ndependencies: [WP02]\n---\nBody\n", encoding="utf-8")
+
+        first, _ = read_frontmatter_readonly(f)
+        first["dependencies"].append("WP03")
+        first["title"] = "mutated"
+        second, _ = read_frontmatter_readonly(f)
+
+        assert second == {"work_package_id": "WP01", "dependencies": ["WP02"]}
+
+    def test_rewrite_invalidates_cache(self, tmp_path: Path) -> None:
+        """A rewrite changes ``(mtime_ns, size)`` and is re-parsed."""
+        f = tmp_path / "WP01.md"
+        f.write_text("---\nwork_package_id: WP01\ntitle: Old\n---\nBody\n", encoding="utf-8")
+        assert read_frontmatter_readonly(f)[0]["title"] == "Old"
+
+        f.write_text("---\nwork_package_id: WP01\ntitle: Newer\n---\nBody\n", encoding="utf-8")
+
+        assert read_frontmatter_readonly(f)[0]["title"] == "Newer"
+
+    def test_missing_file_raises(self, tmp_path: Path) -> None:
+        """A missing file raises FrontmatterError, as on the round-trip path."""
+        with pytest.raises(FrontmatterError, match="File not found"):
+            read_frontmatter_readonly(tmp_path / "WP01.md")
+
+    def test_non_mapping_raises(self, tmp_path: Path) -> None:
+        """A scalar document is rejected, not returned."""
+        f = tmp_path / "spec.md"
+        f.write_text("---\njust a bare string\n---\nbody\n", encoding="utf-8")
+        with pytest.raises(FrontmatterError, match="not a mapping"):
+            read_frontmatter_readonly(f)
@@ -8,16 +8,24 @@ the generic ``except Exception`` wrap at ``frontmatter.py`` erased the key name
 behind a bare "Invalid YAML". These tests assert the key(s) survive into the
 raised :class:`FrontmatterError` message, and that every duplicate is enumerated
 (a single ruamel raise names only the first) via WP03's raw-text detector.
+The read-only fast path (``read_frontmatter_readonly``) must fail closed the
+same way, so the raising tests run against both readers.
 """
 
+from collections.abc import Callable
 from pathlib import Path
+from typing import Any
 
 import pytest
 
-from specify_cli.frontmatter import FrontmatterError, FrontmatterManager, read_frontmatter
+from specify_cli.frontmatter import FrontmatterError, FrontmatterManager, read_frontmatter, read_frontmatter_readonly
 
 pytestmark = pytest.mark.unit
 
+Reader = Callable[[Path], tuple[dict[str, Any], str]]
+
+both_readers = pytest.mark.parametrize("reader", [read_frontmatter, read_frontmatter_readonly], ids=["round_trip", "readonly"])
+
 
 def _write(tmp_path: Path, content: str, name: str = "WP01.md") -> Path:
     file_path = tmp_path / name
@@ -25,7 +33,8 @@ def _write(tmp_path: Path, content: str, name: str = "WP01.md") -> Path:
     return file_path
 
 
-def test_single_duplicate_key_names_the_key(tmp_path: Path) -> None:
+@both_readers
+def test_single_duplicate_key_names_the_key(tmp_path: Path, reader: Reader) -> None:
     """A dual-key artifact raises a FrontmatterError that NAMES the duplicate key."""
     path = _write(
         tmp_path,
@@ -33,7 +42,7 @@ def test_single_duplicate_key_names_the_key(tmp_path: Path) -> None:
     )
 
     with pytest.raises(FrontmatterError) as exc_info:
-        read_frontmatter(path)
+        reader(path)
 
     message = str(exc_info.value)
     assert "title" in message, message
@@ -41,7 +50,8 @@ def test_single_duplicate_key_names_the_key(tmp_path: Path) -> None:
     assert "Invalid YAML" not in message, message
 
 
-def test_all_duplicate_keys_are_enumerated(tmp_path: Path) -> None:
+@both_readers
+def test_all_duplicate_keys_are_enumerated(tmp_path: Path, reader: Reader) -> None:
     """Every duplicated key is named, not only the first ruamel would raise on."""
     path = _write(
         tmp_path,
@@ -54,14 +64,15 @@ def test_all_duplicate_keys_are_enumerated(tmp_path: Path) -> None:
     )
 
     with pytest.raises(FrontmatterError) as exc_info:
-        read_frontmatter(path)
+        reader(path)
 
     message = str(exc_info.value)
     assert "review_feedback" in message, message
     assert "status" in message, message
 
 
-def test_duplicate_key_message_includes_file_path(tmp_path: Path) -> None:
+@both_readers
+def test_duplicate_key_message_includes_file_path(tmp_path: Path, reader: Reader) -> None:
     """The legible error still points the reader at the offending file."""
     path = _write(
         tmp_path,
@@ -69,17 +80,18 @@ def test_duplicate_key_message_includes_file_path(tmp_path: Path) -> None:
     )
 
     with pytest.raises(FrontmatterError) as exc_info:
-        read_frontmatter(path)
+        reader(path)
 
     assert str(path) in str(exc_info.value)
 
 
-def test_nested_duplicate_key_falls_back_to_named_error(tmp_path: Path) -> None:
+@both_readers
+def test_nested_duplicate_key_falls_back_to_named_error(tmp_path: Path, reader: Reader) -> None:
     """A *nested* duplicate (not scanned by the top-level detector) still names the key.
 
     The raw-text detector only enumerates column-0 keys; a nested duplicate makes
-    ruamel raise while the detector finds nothing, so the guard falls back to
-    ruamel's own (key-naming) message rather than the opaque generic wrap.
+    the parser raise while the detector finds nothing, so the guard falls back
+    to the parser's own (key-naming) message rather than the opaque generic wrap.
     """
     path = _write(
         tmp_path,
@@ -87,7 +99,7 @@ def test_nested_duplicate_key_falls_back_to_named_error(tmp_path: Path) -> None:
     )
 
     with pytest.raises(FrontmatterError) as exc_info:
-        read_frontmatter(path)
+        reader(path)
 
     message = str(exc_info.value)
     assert "Duplicate frontmatter key" in message, message
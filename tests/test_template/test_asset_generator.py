@@ -182,6 +182,45 @@ def test_generate_agent_assets_creates_expected_files(tmp_path: Path) -> None:
     assert "Run echo hi $ARGUMENTS source env for claude." in content
 
 
+def test_generate_agent_assets_rerun_skips_unchanged_and_prunes_stale(tmp_path: Path) -> None:
+    commands_dir = tmp_path / "commands"
+    commands_dir.mkdir()
+    _write_template(commands_dir / "demo.md")
+    _write_template(commands_dir / "other.md", with_agent_script=False)
+    project_path = tmp_path / "project"
+    project_path.mkdir()
+
+    generate_agent_assets(commands_dir, project_path, "claude", "sh")
+    output_dir = project_path / ".claude" / "commands"
+    demo = output_dir / "spec-kitty.demo.md"
+    other = output_dir / "spec-kitty.other.md"
+    first_pass = {path: path.stat().st_mtime_ns for path in (demo, other)}
+    (output_dir / "spec-kitty.retired.md").write_text("stale", encoding="utf-8")
+    (output_dir / "leftover").mkdir()
+    other.write_text("edited by hand", encoding="utf-8")
+
+    generate_agent_assets(commands_dir, project_path, "claude", "sh")
+
+    assert sorted(p.name for p in output_dir.iterdir()) == ["spec-kitty.demo.md", "spec-kitty.other.md"]
+    assert demo.stat().st_mtime_ns == first_pass[demo]
+    assert "Run echo hi $ARGUMENTS  for claude." in other.read_text(encoding="utf-8")
+
+
+def test_render_command_template_cache_tracks_template_and_version(tmp_path: Path) -> None:
+    template_path = tmp_path / "demo.md"
+    _write_template(template_path)
+
+    def _render(version: str) -> str:
+        return render_command_template(template_path, "sh", "claude", "$ARGUMENTS", "md", version=version)
+
+    first = _render("1.0.0")
+    assert _render("1.0.0") == first
+    assert "spec-kitty-command-version: 2.0.0" in _render("2.0.0")
+
+    _write_template_with_body(template_path, "A changed body.")
+    assert "A changed body." in _render("1.0.0")
+
+
 def test_render_command_template_injects_agent_placeholder(tmp_path: Path) -> None:
     template_path = tmp_path / "workflow.md"
     template_path.write_text(
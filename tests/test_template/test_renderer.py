@@ -2,7 +2,9 @@ from __future__ import annotations
 
 from pathlib import Path
 
+from specify_cli.template import renderer
 from specify_cli.template.renderer import (
+    glossary_index_version,
     parse_frontmatter,
     render_template,
     render_template_text,
@@ -92,3 +94,43 @@ def test_rewrite_paths_accepts_custom_patterns() -> None:
 def test_rewrite_paths_keeps_source_template_paths() -> None:
     source_path = "packs/built-in/missions/software-dev/templates/spec-template.md"
     assert rewrite_paths(source_path) == source_path
+
+
+def test_glossary_annotator_marks_first_occurrence_of_each_surface_in_one_pass() -> None:
+    surfaces = {
+        "deployment target": "glossary:deployment-target",
+        "target": "glossary:target",
+        "lane": "glossary:lane",
+    }
+    content = "A Deployment Target and a lane. Another lane, then the target."
+
+    annotated = renderer._annotate_glossary_refs(content, surfaces)
+
+    assert annotated == (
+        "A Deployment Target<!-- glossary:glossary:deployment-target --> and a "
+        "lane<!-- glossary:glossary:lane -->. Another lane, then the "
+        "target<!-- glossary:glossary:target -->."
+    )
+    assert renderer._annotate_glossary_refs(content, {}) == content
+
+
+def test_glossary_seeds_are_loaded_once_per_seed_version(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    from glossary.scope import GlossaryScope
+
+    (tmp_path / ".kittify").mkdir()
+    template_path = tmp_path / "templates" / "cmd.md"
+    signature = [(("spec_kitty_core", 1, 10),)]
+    loads: list[str] = []
+    monkeypatch.setattr(renderer, "_ANNOTATOR_CACHE", {})
+    monkeypatch.setattr(renderer, "_seed_signature", lambda _root: signature[0])
+    monkeypatch.setattr("glossary.scope.load_seed_file", lambda scope, _root: loads.append(scope.value) or [])
+
+    for _ in range(3):
+        assert renderer._annotate_glossary_refs_from_store("body", template_path) == "body"
+    assert len(loads) == len(GlossaryScope)
+
+    signature[0] = (("spec_kitty_core", 2, 12),)
+    renderer._annotate_glossary_refs_from_store("body", template_path)
+    assert len(loads) == 2 * len(GlossaryScope)
+    assert glossary_index_version(template_path) == f"{tmp_path}:(('spec_kitty_core', 2, 12),)"
+    assert glossary_index_version(tmp_path.parent / "outside.md") != glossary_index_version(template_path)